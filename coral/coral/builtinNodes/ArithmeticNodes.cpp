@@ -34,6 +34,7 @@ using namespace coral;
 
 ArithmeticNode::ArithmeticNode(const std::string &name, Node *parent) : Node(name, parent){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_in0 = new NumericAttribute("in0", this);
 	_in1 = new NumericAttribute("in1", this);
@@ -98,13 +99,30 @@ void ArithmeticNode::attributeSpecializationChanged(Attribute *attribute){
 	}
 }
 
+bool ArithmeticNode::arrayFusionStage(Attribute *attribute, ArrayFusionStage &stage){
+	ArrayFusionKernel kernel = _numericOperation.selectedFusionKernel();
+	if(attribute != _out || kernel == 0){
+		return false;
+	}
+	
+	stage.inputA = _in0;
+	stage.inputB = _in1;
+	stage.kernel = kernel;
+	
+	return true;
+}
+
 void ArithmeticNode::updateSlice(Attribute *attribute, unsigned int slice){
 	if(_numericOperation.operationSelected()){
+		if(ArrayFusion::update(this, attribute)){
+			return;
+		}
+		
 		Numeric *in0 = _in0->value();
 		Numeric *in1 = _in1->value();
 		Numeric *out = _out->outValue();
 		
-		_numericOperation.executeSelectedOperation(in0, in1, out, slice);
+		_numericOperation.executeSelectedOperation(in0, in1, out, slice, arrayGrainSize());
 	}
 }
 
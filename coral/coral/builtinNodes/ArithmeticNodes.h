@@ -43,6 +43,7 @@ public:
 	void updateSlice(Attribute *attribute, unsigned int slice);
 	void updateSpecializationLink(Attribute *attributeA, Attribute *attributeB, std::vector<std::string> &specializationA, std::vector<std::string> &specializationB);
 	void attributeSpecializationChanged(Attribute *attribute);
+	bool arrayFusionStage(Attribute *attribute, ArrayFusionStage &stage);
 
 protected:
 	NumericAttribute *_in0;
@@ -91,6 +91,7 @@ void greaterOrLessUpdateSpecializationLink(Attribute *attributeA, Attribute *att
 
 IfGreaterThan::IfGreaterThan(const std::string &name, Node *parent): Node(name, parent){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_selectedOperation = 0;
 	
@@ -184,72 +185,72 @@ void IfGreaterThan::intGreaterThanInt_arrayToArray(Numeric *in0, Numeric *in1, s
 	int sizes[] = {in0->sizeSlice(slice), in1->sizeSlice(slice)};
 	int minorSize = mathUtils::findMinorInt(sizes, 2);
 	out.resize(minorSize);
-	conditionalOperation_greaterThan_arrayToArray<int, int>(in0->intValuesSlice(slice), in1->intValuesSlice(slice), minorSize, out);
+	conditionalOperation_greaterThan_arrayToArray<int, int>(in0->valuesSpanSlice<int>(slice), in1->valuesSpanSlice<int>(slice), minorSize, out);
 }
 
 void IfGreaterThan::intGreaterThanFloat_arrayToArray(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	int sizes[] = {in0->sizeSlice(slice), in1->sizeSlice(slice)};
 	int minorSize = mathUtils::findMinorInt(sizes, 2);
 	out.resize(minorSize);
-	conditionalOperation_greaterThan_arrayToArray<int, float>(in0->intValuesSlice(slice), in1->floatValuesSlice(slice), minorSize, out);
+	conditionalOperation_greaterThan_arrayToArray<int, float>(in0->valuesSpanSlice<int>(slice), in1->valuesSpanSlice<float>(slice), minorSize, out);
 }
 
 void IfGreaterThan::floatGreaterThanFloat_arrayToArray(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	int sizes[] = {in0->sizeSlice(slice), in1->sizeSlice(slice)};
 	int minorSize = mathUtils::findMinorInt(sizes, 2);
 	out.resize(minorSize);
-	conditionalOperation_greaterThan_arrayToArray<float, float>(in0->floatValuesSlice(slice), in1->floatValuesSlice(slice), minorSize, out);
+	conditionalOperation_greaterThan_arrayToArray<float, float>(in0->valuesSpanSlice<float>(slice), in1->valuesSpanSlice<float>(slice), minorSize, out);
 }
 
 void IfGreaterThan::floatGreaterThanInt_arrayToArray(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	int sizes[] = {in0->sizeSlice(slice), in1->sizeSlice(slice)};
 	int minorSize = mathUtils::findMinorInt(sizes, 2);
 	out.resize(minorSize);
-	conditionalOperation_greaterThan_arrayToArray<float, int>(in0->floatValuesSlice(slice), in1->intValuesSlice(slice), minorSize, out);
+	conditionalOperation_greaterThan_arrayToArray<float, int>(in0->valuesSpanSlice<float>(slice), in1->valuesSpanSlice<int>(slice), minorSize, out);
 }
 
 void IfGreaterThan::intGreaterThanInt_arrayToSingle(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	int size = in0->sizeSlice(slice);
 	out.resize(size);
-	conditionalOperation_greaterThan_arrayToSingle<int, int>(in0->intValuesSlice(slice), in1->intValueAtSlice(slice, 0), size, out);
+	conditionalOperation_greaterThan_arrayToSingle<int, int>(in0->valuesSpanSlice<int>(slice), in1->intValueAtSlice(slice, 0), size, out);
 }
 
 void IfGreaterThan::intGreaterThanFloat_arrayToSingle(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	int size = in0->sizeSlice(slice);
 	out.resize(size);
-	conditionalOperation_greaterThan_arrayToSingle<int, float>(in0->intValuesSlice(slice), in1->floatValueAtSlice(slice, 0), size, out);
+	conditionalOperation_greaterThan_arrayToSingle<int, float>(in0->valuesSpanSlice<int>(slice), in1->floatValueAtSlice(slice, 0), size, out);
 }
 
 void IfGreaterThan::floatGreaterThanFloat_arrayToSingle(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	int size = in0->sizeSlice(slice);
 	out.resize(size);
-	conditionalOperation_greaterThan_arrayToSingle<float, float>(in0->floatValuesSlice(slice), in1->floatValueAtSlice(slice, 0), size, out);
+	conditionalOperation_greaterThan_arrayToSingle<float, float>(in0->valuesSpanSlice<float>(slice), in1->floatValueAtSlice(slice, 0), size, out);
 }
 
 void IfGreaterThan::floatGreaterThanInt_arrayToSingle(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	int size = in0->sizeSlice(slice);
 	out.resize(size);
-	conditionalOperation_greaterThan_arrayToSingle<float, int>(in0->floatValuesSlice(slice), in1->intValueAtSlice(slice, 0), size, out);
+	conditionalOperation_greaterThan_arrayToSingle<float, int>(in0->valuesSpanSlice<float>(slice), in1->intValueAtSlice(slice, 0), size, out);
 }
 
 void IfGreaterThan::intGreaterThanInt_singleToArray(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	out.resize(1);
-	conditionalOperation_greaterThan_singleToArray<int, int>(in0->intValueAtSlice(slice, 0), in1->intValuesSlice(slice), out);
+	conditionalOperation_greaterThan_singleToArray<int, int>(in0->intValueAtSlice(slice, 0), in1->valuesSpanSlice<int>(slice), out);
 }
 
 void IfGreaterThan::intGreaterThanFloat_singleToArray(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	out.resize(1);
-	conditionalOperation_greaterThan_singleToArray<int, float>(in0->intValueAtSlice(slice, 0), in1->floatValuesSlice(slice), out);
+	conditionalOperation_greaterThan_singleToArray<int, float>(in0->intValueAtSlice(slice, 0), in1->valuesSpanSlice<float>(slice), out);
 }
 
 void IfGreaterThan::floatGreaterThanFloat_singleToArray(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	out.resize(1);
-	conditionalOperation_greaterThan_singleToArray<float, float>(in0->floatValueAtSlice(slice, 0), in1->floatValuesSlice(slice), out);
+	conditionalOperation_greaterThan_singleToArray<float, float>(in0->floatValueAtSlice(slice, 0), in1->valuesSpanSlice<float>(slice), out);
 }
 
 void IfGreaterThan::floatGreaterThanInt_singleToArray(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	out.resize(1);
-	conditionalOperation_greaterThan_singleToArray<float, int>(in0->floatValueAtSlice(slice, 0), in1->intValuesSlice(slice), out);
+	conditionalOperation_greaterThan_singleToArray<float, int>(in0->floatValueAtSlice(slice, 0), in1->valuesSpanSlice<int>(slice), out);
 }
 
 void IfGreaterThan::updateSlice(Attribute *attribute, unsigned int slice){
@@ -271,6 +272,7 @@ void IfGreaterThan::updateSlice(Attribute *attribute, unsigned int slice){
 // less than node
 IfLessThan::IfLessThan(const std::string &name, Node *parent): Node(name, parent){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_selectedOperation = 0;
 	
@@ -311,72 +313,72 @@ void IfLessThan::intLessThanInt_arrayToArray(Numeric *in0, Numeric *in1, std::ve
 	int sizes[] = {in0->sizeSlice(slice), in1->sizeSlice(slice)};
 	int minorSize = mathUtils::findMinorInt(sizes, 2);
 	out.resize(minorSize);
-	conditionalOperation_lessThan_arrayToArray<int, int>(in0->intValuesSlice(slice), in1->intValuesSlice(slice), minorSize, out);
+	conditionalOperation_lessThan_arrayToArray<int, int>(in0->valuesSpanSlice<int>(slice), in1->valuesSpanSlice<int>(slice), minorSize, out);
 }
 
 void IfLessThan::intLessThanFloat_arrayToArray(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	int sizes[] = {in0->sizeSlice(slice), in1->sizeSlice(slice)};
 	int minorSize = mathUtils::findMinorInt(sizes, 2);
 	out.resize(minorSize);
-	conditionalOperation_lessThan_arrayToArray<int, float>(in0->intValuesSlice(slice), in1->floatValuesSlice(slice), minorSize, out);
+	conditionalOperation_lessThan_arrayToArray<int, float>(in0->valuesSpanSlice<int>(slice), in1->valuesSpanSlice<float>(slice), minorSize, out);
 }
 
 void IfLessThan::floatLessThanFloat_arrayToArray(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	int sizes[] = {in0->sizeSlice(slice), in1->sizeSlice(slice)};
 	int minorSize = mathUtils::findMinorInt(sizes, 2);
 	out.resize(minorSize);
-	conditionalOperation_lessThan_arrayToArray<float, float>(in0->floatValuesSlice(slice), in1->floatValuesSlice(slice), minorSize, out);
+	conditionalOperation_lessThan_arrayToArray<float, float>(in0->valuesSpanSlice<float>(slice), in1->valuesSpanSlice<float>(slice), minorSize, out);
 }
 
 void IfLessThan::floatLessThanInt_arrayToArray(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	int sizes[] = {in0->sizeSlice(slice), in1->sizeSlice(slice)};
 	int minorSize = mathUtils::findMinorInt(sizes, 2);
 	out.resize(minorSize);
-	conditionalOperation_lessThan_arrayToArray<float, int>(in0->floatValuesSlice(slice), in1->intValuesSlice(slice), minorSize, out);
+	conditionalOperation_lessThan_arrayToArray<float, int>(in0->valuesSpanSlice<float>(slice), in1->valuesSpanSlice<int>(slice), minorSize, out);
 }
 
 void IfLessThan::intLessThanInt_arrayToSingle(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	int size = in0->sizeSlice(slice);
 	out.resize(size);
-	conditionalOperation_lessThan_arrayToSingle<int, int>(in0->intValuesSlice(slice), in1->intValueAtSlice(slice, 0), size, out);
+	conditionalOperation_lessThan_arrayToSingle<int, int>(in0->valuesSpanSlice<int>(slice), in1->intValueAtSlice(slice, 0), size, out);
 }
 
 void IfLessThan::intLessThanFloat_arrayToSingle(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	int size = in0->sizeSlice(slice);
 	out.resize(size);
-	conditionalOperation_lessThan_arrayToSingle<int, float>(in0->intValuesSlice(slice), in1->floatValueAtSlice(slice, 0), size, out);
+	conditionalOperation_lessThan_arrayToSingle<int, float>(in0->valuesSpanSlice<int>(slice), in1->floatValueAtSlice(slice, 0), size, out);
 }
 
 void IfLessThan::floatLessThanFloat_arrayToSingle(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	int size = in0->sizeSlice(slice);
 	out.resize(size);
-	conditionalOperation_lessThan_arrayToSingle<float, float>(in0->floatValuesSlice(slice), in1->floatValueAtSlice(slice, 0), size, out);
+	conditionalOperation_lessThan_arrayToSingle<float, float>(in0->valuesSpanSlice<float>(slice), in1->floatValueAtSlice(slice, 0), size, out);
 }
 
 void IfLessThan::floatLessThanInt_arrayToSingle(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	int size = in0->sizeSlice(slice);
 	out.resize(size);
-	conditionalOperation_lessThan_arrayToSingle<float, int>(in0->floatValuesSlice(slice), in1->intValueAtSlice(slice, 0), size, out);
+	conditionalOperation_lessThan_arrayToSingle<float, int>(in0->valuesSpanSlice<float>(slice), in1->intValueAtSlice(slice, 0), size, out);
 }
 
 void IfLessThan::intLessThanInt_singleToArray(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	out.resize(1);
-	conditionalOperation_lessThan_singleToArray<int, int>(in0->intValueAtSlice(slice, 0), in1->intValuesSlice(slice), out);
+	conditionalOperation_lessThan_singleToArray<int, int>(in0->intValueAtSlice(slice, 0), in1->valuesSpanSlice<int>(slice), out);
 }
 
 void IfLessThan::intLessThanFloat_singleToArray(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	out.resize(1);
-	conditionalOperation_lessThan_singleToArray<int, float>(in0->intValueAtSlice(slice, 0), in1->floatValuesSlice(slice), out);
+	conditionalOperation_lessThan_singleToArray<int, float>(in0->intValueAtSlice(slice, 0), in1->valuesSpanSlice<float>(slice), out);
 }
 
 void IfLessThan::floatLessThanFloat_singleToArray(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	out.resize(1);
-	conditionalOperation_lessThan_singleToArray<float, float>(in0->floatValueAtSlice(slice, 0), in1->floatValuesSlice(slice), out);
+	conditionalOperation_lessThan_singleToArray<float, float>(in0->floatValueAtSlice(slice, 0), in1->valuesSpanSlice<float>(slice), out);
 }
 
 void IfLessThan::floatLessThanInt_singleToArray(Numeric *in0, Numeric *in1, std::vector<bool> &out, unsigned int slice){
 	out.resize(1);
-	conditionalOperation_lessThan_singleToArray<float, int>(in0->floatValueAtSlice(slice, 0), in1->intValuesSlice(slice), out);
+	conditionalOperation_lessThan_singleToArray<float, int>(in0->floatValueAtSlice(slice, 0), in1->valuesSpanSlice<int>(slice), out);
 }
 
 void IfLessThan::attributeSpecializationChanged(Attribute *attribute){
@@ -449,6 +451,7 @@ void IfLessThan::updateSlice(Attribute *attribute, unsigned int slice){
 
 ConditionalValue::ConditionalValue(const std::string &name, Node *parent): Node(name, parent){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 	
 	_selectedOperation = 0;
 	
@@ -507,61 +510,61 @@ void ConditionalValue::updateSpecializationLink(Attribute *attributeA, Attribute
 
 void ConditionalValue::transferValuesInt(Bool *condition, Numeric *ifTrue, Numeric *ifFalse, Numeric *out, unsigned int slice){
 	std::vector<int> outValues;
-	conditionalValueTransfer<int>(condition->boolValueAtSlice(slice, 0), ifTrue->intValuesSlice(slice), ifFalse->intValuesSlice(slice), outValues);
+	conditionalValueTransfer<int>(condition->boolValueAtSlice(slice, 0), ifTrue->valuesSpanSlice<int>(slice), ifFalse->valuesSpanSlice<int>(slice), outValues);
 	out->setIntValuesSlice(slice, outValues);
 }
 
 void ConditionalValue::transferValuesFloat(Bool *condition, Numeric *ifTrue, Numeric *ifFalse, Numeric *out, unsigned int slice){
 	std::vector<float> outValues;
-	conditionalValueTransfer<float>(condition->boolValueAtSlice(slice, 0), ifTrue->floatValuesSlice(slice), ifFalse->floatValuesSlice(slice), outValues);
+	conditionalValueTransfer<float>(condition->boolValueAtSlice(slice, 0), ifTrue->valuesSpanSlice<float>(slice), ifFalse->valuesSpanSlice<float>(slice), outValues);
 	out->setFloatValuesSlice(slice, outValues);
 }
 
 void ConditionalValue::transferValuesVec3(Bool *condition, Numeric *ifTrue, Numeric *ifFalse, Numeric *out, unsigned int slice){
 	std::vector<Imath::V3f> outValues;
-	conditionalValueTransfer<Imath::V3f>(condition->boolValueAtSlice(slice, 0), ifTrue->vec3ValuesSlice(slice), ifFalse->vec3ValuesSlice(slice), outValues);
+	conditionalValueTransfer<Imath::V3f>(condition->boolValueAtSlice(slice, 0), ifTrue->valuesSpanSlice<Imath::V3f>(slice), ifFalse->valuesSpanSlice<Imath::V3f>(slice), outValues);
 	out->setVec3ValuesSlice(slice, outValues);
 }
 
 void ConditionalValue::transferValuesCol4(Bool *condition, Numeric *ifTrue, Numeric *ifFalse, Numeric *out, unsigned int slice){
 	std::vector<Imath::Color4f> outValues;
-	conditionalValueTransfer<Imath::Color4f>(condition->boolValueAtSlice(slice, 0), ifTrue->col4ValuesSlice(slice), ifFalse->col4ValuesSlice(slice), outValues);
+	conditionalValueTransfer<Imath::Color4f>(condition->boolValueAtSlice(slice, 0), ifTrue->valuesSpanSlice<Imath::Color4f>(slice), ifFalse->valuesSpanSlice<Imath::Color4f>(slice), outValues);
 	out->setCol4ValuesSlice(slice, outValues);
 }
 
 void ConditionalValue::transferValuesMatrix44(Bool *condition, Numeric *ifTrue, Numeric *ifFalse, Numeric *out, unsigned int slice){
 	std::vector<Imath::M44f> outValues;
-	conditionalValueTransfer<Imath::M44f>(condition->boolValueAtSlice(slice, 0), ifTrue->matrix44ValuesSlice(slice), ifFalse->matrix44ValuesSlice(slice), outValues);
+	conditionalValueTransfer<Imath::M44f>(condition->boolValueAtSlice(slice, 0), ifTrue->valuesSpanSlice<Imath::M44f>(slice), ifFalse->valuesSpanSlice<Imath::M44f>(slice), outValues);
 	out->setMatrix44ValuesSlice(slice, outValues);
 }
 
 void ConditionalValue::transferValuesIntBoolArray(Bool *condition, Numeric *ifTrue, Numeric *ifFalse, Numeric *out, unsigned int slice){
 	std::vector<int> outValues;
-	conditionalValueTransferBoolArray<int>(condition->boolValuesSlice(slice), ifTrue->intValuesSlice(slice), ifFalse->intValuesSlice(slice), outValues);
+	conditionalValueTransferBoolArray<int>(condition->boolValuesSlice(slice), ifTrue->valuesSpanSlice<int>(slice), ifFalse->valuesSpanSlice<int>(slice), outValues);
 	out->setIntValuesSlice(slice, outValues);
 }
 
 void ConditionalValue::transferValuesFloatBoolArray(Bool *condition, Numeric *ifTrue, Numeric *ifFalse, Numeric *out, unsigned int slice){
 	std::vector<float> outValues;
-	conditionalValueTransferBoolArray<float>(condition->boolValuesSlice(slice), ifTrue->floatValuesSlice(slice), ifFalse->floatValuesSlice(slice), outValues);
+	conditionalValueTransferBoolArray<float>(condition->boolValuesSlice(slice), ifTrue->valuesSpanSlice<float>(slice), ifFalse->valuesSpanSlice<float>(slice), outValues);
 	out->setFloatValuesSlice(slice, outValues);
 }
 
 void ConditionalValue::transferValuesVec3BoolArray(Bool *condition, Numeric *ifTrue, Numeric *ifFalse, Numeric *out, unsigned int slice){
 	std::vector<Imath::V3f> outValues;
-	conditionalValueTransferBoolArray<Imath::V3f>(condition->boolValuesSlice(slice), ifTrue->vec3ValuesSlice(slice), ifFalse->vec3ValuesSlice(slice), outValues);
+	conditionalValueTransferBoolArray<Imath::V3f>(condition->boolValuesSlice(slice), ifTrue->valuesSpanSlice<Imath::V3f>(slice), ifFalse->valuesSpanSlice<Imath::V3f>(slice), outValues);
 	out->setVec3ValuesSlice(slice, outValues);
 }
 
 void ConditionalValue::transferValuesCol4BoolArray(Bool *condition, Numeric *ifTrue, Numeric *ifFalse, Numeric *out, unsigned int slice){
 	std::vector<Imath::Color4f> outValues;
-	conditionalValueTransferBoolArray<Imath::Color4f>(condition->boolValuesSlice(slice), ifTrue->col4ValuesSlice(slice), ifFalse->col4ValuesSlice(slice), outValues);
+	conditionalValueTransferBoolArray<Imath::Color4f>(condition->boolValuesSlice(slice), ifTrue->valuesSpanSlice<Imath::Color4f>(slice), ifFalse->valuesSpanSlice<Imath::Color4f>(slice), outValues);
 	out->setCol4ValuesSlice(slice, outValues);
 }
 
 void ConditionalValue::transferValuesMatrix44BoolArray(Bool *condition, Numeric *ifTrue, Numeric *ifFalse, Numeric *out, unsigned int slice){
 	std::vector<Imath::M44f> outValues;
-	conditionalValueTransferBoolArray<Imath::M44f>(condition->boolValuesSlice(slice), ifTrue->matrix44ValuesSlice(slice), ifFalse->matrix44ValuesSlice(slice), outValues);
+	conditionalValueTransferBoolArray<Imath::M44f>(condition->boolValuesSlice(slice), ifTrue->valuesSpanSlice<Imath::M44f>(slice), ifFalse->valuesSpanSlice<Imath::M44f>(slice), outValues);
 	out->setMatrix44ValuesSlice(slice, outValues);
 }
 
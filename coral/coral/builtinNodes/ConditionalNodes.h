@@ -126,7 +126,7 @@ private:
 
 // greater than function
 template <class Type0, class Type1>
-void conditionalOperation_greaterThan_arrayToArray(const std::vector<Type0> &in0, const std::vector<Type1> &in1, unsigned int minorSize, std::vector<bool> &out){
+void conditionalOperation_greaterThan_arrayToArray(NumericSpan<const Type0> in0, NumericSpan<const Type1> in1, unsigned int minorSize, std::vector<bool> &out){
 	for(int i = 0; i < minorSize; ++i){
 		if(in0[i] > in1[i]){
 			out[i] = true;
@@ -138,7 +138,7 @@ void conditionalOperation_greaterThan_arrayToArray(const std::vector<Type0> &in0
 }
 
 template <class Type0, class Type1>
-void conditionalOperation_greaterThan_arrayToSingle(const std::vector<Type0> &in0, Type1 in1, unsigned int minorSize, std::vector<bool> &out){
+void conditionalOperation_greaterThan_arrayToSingle(NumericSpan<const Type0> in0, Type1 in1, unsigned int minorSize, std::vector<bool> &out){
 	for(int i = 0; i < minorSize; ++i){
 		if(in0[i] > in1){
 			out[i] = true;
@@ -150,7 +150,7 @@ void conditionalOperation_greaterThan_arrayToSingle(const std::vector<Type0> &in
 }
 
 template <class Type0, class Type1>
-void conditionalOperation_greaterThan_singleToArray(Type0 in0, const std::vector<Type1> &in1, std::vector<bool> &out){
+void conditionalOperation_greaterThan_singleToArray(Type0 in0, NumericSpan<const Type1> in1, std::vector<bool> &out){
 	out[0] = false;
 	
 	for(int i = 0; i > in1.size(); ++i){
@@ -163,7 +163,7 @@ void conditionalOperation_greaterThan_singleToArray(Type0 in0, const std::vector
 
 // less than function
 template <class Type0, class Type1>
-void conditionalOperation_lessThan_arrayToArray(const std::vector<Type0> &in0, const std::vector<Type1> &in1, unsigned int minorSize, std::vector<bool> &out){
+void conditionalOperation_lessThan_arrayToArray(NumericSpan<const Type0> in0, NumericSpan<const Type1> in1, unsigned int minorSize, std::vector<bool> &out){
 	for(int i = 0; i < minorSize; ++i){
 		if(in0[i] < in1[i]){
 			out[i] = true;
@@ -175,7 +175,7 @@ void conditionalOperation_lessThan_arrayToArray(const std::vector<Type0> &in0, c
 }
 
 template <class Type0, class Type1>
-void conditionalOperation_lessThan_arrayToSingle(const std::vector<Type0> &in0, Type1 in1, unsigned int minorSize, std::vector<bool> &out){
+void conditionalOperation_lessThan_arrayToSingle(NumericSpan<const Type0> in0, Type1 in1, unsigned int minorSize, std::vector<bool> &out){
 	for(int i = 0; i < minorSize; ++i){
 		if(in0[i] < in1){
 			out[i] = true;
@@ -187,7 +187,7 @@ void conditionalOperation_lessThan_arrayToSingle(const std::vector<Type0> &in0,
 }
 
 template <class Type0, class Type1>
-void conditionalOperation_lessThan_singleToArray(Type0 in0, const std::vector<Type1> &in1, std::vector<bool> &out){
+void conditionalOperation_lessThan_singleToArray(Type0 in0, NumericSpan<const Type1> in1, std::vector<bool> &out){
 	out[0] = false;
 	
 	for(int i = 0; i < in1.size(); ++i){
@@ -201,7 +201,7 @@ void conditionalOperation_lessThan_singleToArray(Type0 in0, const std::vector<Ty
 // generic
 
 template <class Type>
-void conditionalValueTransfer(bool condition, const std::vector<Type> &trueValues, const std::vector<Type> &falseValues, std::vector<Type> &out){
+void conditionalValueTransfer(bool condition, NumericSpan<const Type> trueValues, NumericSpan<const Type> falseValues, std::vector<Type> &out){
 	int sizes[] = {trueValues.size(), falseValues.size()};
 	int minorSize = mathUtils::findMinorInt(sizes, 2);
 	out.resize(minorSize);
@@ -217,7 +217,7 @@ void conditionalValueTransfer(bool condition, const std::vector<Type> &trueValue
 }
 
 template <class Type>
-void conditionalValueTransferBoolArray(const std::vector<bool> &conditions, const std::vector<Type> &trueValues, const std::vector<Type> &falseValues, std::vector<Type> &out){
+void conditionalValueTransferBoolArray(const std::vector<bool> &conditions, NumericSpan<const Type> trueValues, NumericSpan<const Type> falseValues, std::vector<Type> &out){
 	int sizes[] = {conditions.size(), trueValues.size(), falseValues.size()};
 	int minorSize = mathUtils::findMinorInt(sizes, 3);
 	out.resize(minorSize);
@@ -65,12 +65,12 @@ SkinWeightDeformer::SkinWeightDeformer(const std::string &name, Node *parent): N
 }
 
 void SkinWeightDeformer::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<int> &skinWeightVertices = _skinWeightVertices->value()->intValuesSlice(slice);
-	const std::vector<int> &skinWeightDeformers = _skinWeightDeformers->value()->intValuesSlice(slice);
-	const std::vector<float> &skinWeightValues = _skinWeightValues->value()->floatValuesSlice(slice);
-	const std::vector<Imath::V3f> &points = _points->value()->vec3ValuesSlice(slice);
-	const std::vector<Imath::M44f> &deformers = _deformers->value()->matrix44ValuesSlice(slice);
-	const std::vector<Imath::M44f> &bindPoseDeformers = _bindPoseDeformers->value()->matrix44ValuesSlice(slice);
+	NumericSpan<const int> skinWeightVertices = _skinWeightVertices->value()->valuesSpanSlice<int>(slice);
+	NumericSpan<const int> skinWeightDeformers = _skinWeightDeformers->value()->valuesSpanSlice<int>(slice);
+	NumericSpan<const float> skinWeightValues = _skinWeightValues->value()->valuesSpanSlice<float>(slice);
+	NumericSpan<const Imath::V3f> points = _points->value()->valuesSpanSlice<Imath::V3f>(slice);
+	NumericSpan<const Imath::M44f> deformers = _deformers->value()->valuesSpanSlice<Imath::M44f>(slice);
+	NumericSpan<const Imath::M44f> bindPoseDeformers = _bindPoseDeformers->value()->valuesSpanSlice<Imath::M44f>(slice);
 
 	NumericAttribute *attrs[] = {_skinWeightVertices, _skinWeightDeformers, _skinWeightValues};
 	int minorSize = findMinorNumericSize(attrs, 3);
@@ -99,7 +99,7 @@ void SkinWeightDeformer::updateSlice(Attribute *attribute, unsigned int slice){
 		}
 	}
 
-	std::vector<Imath::V3f> outPoints = points;
+	std::vector<Imath::V3f> outPoints(points.data(), points.data() + points.size());
 	for(std::map<int, std::map<int, Imath::V3f> >::iterator it = displaceMap.begin(); it != displaceMap.end(); ++it){
 		Imath::V3f &outPoint = outPoints[it->first];
 		outPoint = Imath::V3f(0.0, 0.0, 0.0);
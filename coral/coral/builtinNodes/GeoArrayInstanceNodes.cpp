@@ -37,8 +37,8 @@ void GeoInstanceGenerator::addInputGeo(){
 }
 
 void GeoInstanceGenerator::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<Imath::M44f> &locations = _locations->value()->matrix44ValuesSlice(slice);
-	const std::vector<int> &selector = _selector->value()->intValuesSlice(slice);
+	NumericSpan<const Imath::M44f> locations = _locations->value()->valuesSpanSlice<Imath::M44f>(slice);
+	NumericSpan<const int> selector = _selector->value()->valuesSpanSlice<int>(slice);
 
 	std::vector<Geo*> sourceGeos;
 	sourceGeos.push_back(_geo->value());
@@ -156,7 +156,7 @@ _contextualUpdate(0){
 	context->setCurrentIndex(0);
 }
 
-void GetGeoSubElements::updateVertexNeighbours(Geo *geo, const std::vector<int> &index, std::vector<int> &subElements){
+void GetGeoSubElements::updateVertexNeighbours(Geo *geo, NumericSpan<const int> index, std::vector<int> &subElements){
 	const std::vector<Vertex*> &vertices = geo->vertices();
 	int verticesSize = vertices.size();
 
@@ -172,7 +172,7 @@ void GetGeoSubElements::updateVertexNeighbours(Geo *geo, const std::vector<int>
 	}
 }
 
-void GetGeoSubElements::updateEdgeVertices(Geo *geo, const std::vector<int> &index, std::vector<int> &subElements){
+void GetGeoSubElements::updateEdgeVertices(Geo *geo, NumericSpan<const int> index, std::vector<int> &subElements){
 	const std::vector<Edge*> &edges = geo->edges();
 	int edgesSize = edges.size();
 
@@ -187,7 +187,7 @@ void GetGeoSubElements::updateEdgeVertices(Geo *geo, const std::vector<int> &ind
 	}
 }
 
-void GetGeoSubElements::updateFaceVertices(Geo *geo, const std::vector<int> &index, std::vector<int> &subElements){
+void GetGeoSubElements::updateFaceVertices(Geo *geo, NumericSpan<const int> index, std::vector<int> &subElements){
 	const std::vector<Face*> &faces = geo->faces();
 	int facesSize = faces.size();
 
@@ -206,7 +206,7 @@ void GetGeoSubElements::updateFaceVertices(Geo *geo, const std::vector<int> &ind
 void GetGeoSubElements::updateSlice(Attribute *attribute, unsigned int slice){
 	if(_contextualUpdate){
 		Geo *geo = _geo->value();
-		const std::vector<int> &index = _index->value()->intValuesSlice(slice);
+		NumericSpan<const int> index = _index->value()->valuesSpanSlice<int>(slice);
 
 		std::vector<int> subElements;
 		(this->*_contextualUpdate)(geo, index, subElements);
@@ -250,8 +250,9 @@ SetGeoPoints::SetGeoPoints(const std::string &name, Node *parent): Node(name, pa
 void SetGeoPoints::updateSlice(Attribute *attribute, unsigned int slice){
 	Geo *outGeoValue = _outGeo->outValue();
 	
+	NumericSpan<const Imath::V3f> points = _points->value()->valuesSpanSlice<Imath::V3f>(slice);
 	outGeoValue->copy(_inGeo->value());
-	outGeoValue->displacePoints(_points->value()->vec3ValuesSlice(slice));
+	outGeoValue->displacePoints(points.data(), points.size());
 }
 
 GetGeoNormals::GetGeoNormals(const std::string &name, Node *parent): Node(name, parent){
@@ -72,11 +72,11 @@ private:
 	NumericAttribute *_index;
 	NumericAttribute *_subElements;
 
-	void(GetGeoSubElements::*_contextualUpdate)(Geo *, const std::vector<int> &, std::vector<int>&);
+	void(GetGeoSubElements::*_contextualUpdate)(Geo *, NumericSpan<const int>, std::vector<int>&);
 
-	void updateVertexNeighbours(Geo *geo, const std::vector<int> &index, std::vector<int> &subElements);
-	void updateEdgeVertices(Geo *geo, const std::vector<int> &index, std::vector<int> &subElements);
-	void updateFaceVertices(Geo *geo, const std::vector<int> &index, std::vector<int> &subElements);
+	void updateVertexNeighbours(Geo *geo, NumericSpan<const int> index, std::vector<int> &subElements);
+	void updateEdgeVertices(Geo *geo, NumericSpan<const int> index, std::vector<int> &subElements);
+	void updateFaceVertices(Geo *geo, NumericSpan<const int> index, std::vector<int> &subElements);
 
 	static void contextChanged(Node *parentNode, Enum *enum_);
 };
@@ -41,13 +41,13 @@ FindPointsInRange::FindPointsInRange(const std::string &name, Node *parent): Nod
 }
 
 void FindPointsInRange::updateSlice(Attribute *attribute, unsigned int slice){
-	const Imath::V3f &point = _point->value()->vec3ValuesSlice(slice)[0];
-	float range = _range->value()->floatValuesSlice(slice)[0];
+	Imath::V3f point = _point->value()->vec3ValueAtSlice(slice, 0);
+	float range = _range->value()->floatValueAtSlice(slice, 0);
 	if(range < 0.0){
 		range = 0.0;
 	}
 
-	const std::vector<Imath::V3f> &points = _points->value()->vec3ValuesSlice(slice);
+	NumericSpan<const Imath::V3f> points = _points->value()->valuesSpanSlice<Imath::V3f>(slice);
 
 	int dimentions = 3;
 	kdtree *tree = kd_create(dimentions);
@@ -7,6 +7,30 @@
 
 using namespace coral;
 
+namespace {
+	// each slice of the loop reads its own element of the global array
+	template<class T>
+	void scatterSlice(unsigned int slice, Numeric *globalArray, Numeric *localElement){
+		NumericSpan<const T> globalValues = globalArray->valuesSpanSlice<T>(0);
+		NumericSpan<T> localValues = localElement->resizeValuesSpanSlice<T>(slice, 1);
+		if(slice < globalValues.size() && localValues.size()){
+			localValues[0] = globalValues[slice];
+		}
+	}
+
+	// the elements computed by each slice of the loop are gathered back in a single array
+	template<class T>
+	void gatherSlices(unsigned int slices, Numeric *localElement, Numeric *globalArray){
+		NumericSpan<T> globalValues = globalArray->resizeValuesSpanSlice<T>(0, slices);
+		for(int i = 0; i < globalValues.size(); ++i){
+			NumericSpan<const T> localValues = localElement->valuesSpanSlice<T>(i);
+			if(localValues.size()){
+				globalValues[i] = localValues[0];
+			}
+		}
+	}
+}
+
 LoopInputNode::LoopInputNode(const std::string &name, Node *parent):
 Node(name, parent),
 _selectedOperation(0){
@@ -83,23 +107,23 @@ void LoopInputNode::attributeSpecializationChanged(Attribute *attribute){
 }
 
 void LoopInputNode::updateInt(unsigned int slice, Numeric *globalArray, Numeric *localElement){
-	localElement->setIntValueAtSlice(slice, 0, globalArray->intValueAtSlice(0, slice));
+	scatterSlice<int>(slice, globalArray, localElement);
 }
 
 void LoopInputNode::updateFloat(unsigned int slice, Numeric *globalArray, Numeric *localElement){
-	localElement->setFloatValueAtSlice(slice, 0, globalArray->floatValueAtSlice(0, slice));
+	scatterSlice<float>(slice, globalArray, localElement);
 }
 
 void LoopInputNode::updateVec3(unsigned int slice, Numeric *globalArray, Numeric *localElement){
-	localElement->setVec3ValueAtSlice(slice, 0, globalArray->vec3ValueAtSlice(0, slice));
+	scatterSlice<Imath::V3f>(slice, globalArray, localElement);
 }
 
 void LoopInputNode::updateCol4(unsigned int slice, Numeric *globalArray, Numeric *localElement){
-	localElement->setCol4ValueAtSlice(slice, 0, globalArray->col4ValueAtSlice(0, slice));
+	scatterSlice<Imath::Color4f>(slice, globalArray, localElement);
 }
 
 void LoopInputNode::updateMatrix44(unsigned int slice, Numeric *globalArray, Numeric *localElement){
-	localElement->setMatrix44ValueAtSlice(slice, 0, globalArray->matrix44ValueAtSlice(0, slice));
+	scatterSlice<Imath::M44f>(slice, globalArray, localElement);
 }
 
 void LoopInputNode::updateSlice(Attribute *attribute, unsigned int slice){
@@ -185,33 +209,23 @@ void LoopOutputNode::attributeSpecializationChanged(Attribute *attribute){
 }
 
 void LoopOutputNode::updateInt(unsigned int slices, Numeric *element, Numeric *array){
-	for(int i = 0; i < slices; ++i){
-		array->setIntValueAtSlice(0, i, element->intValueAtSlice(i, 0));
-	}
+	gatherSlices<int>(slices, element, array);
 }
 
 void LoopOutputNode::updateFloat(unsigned int slices, Numeric *element, Numeric *array){
-	for(int i = 0; i < slices; ++i){
-		array->setFloatValueAtSlice(0, i, element->floatValueAtSlice(i, 0));
-	}
+	gatherSlices<float>(slices, element, array);
 }
 
 void LoopOutputNode::updateVec3(unsigned int slices, Numeric *element, Numeric *array){
-	for(int i = 0; i < slices; ++i){
-		array->setVec3ValueAtSlice(0, i, element->vec3ValueAtSlice(i, 0));
-	}
+	gatherSlices<Imath::V3f>(slices, element, array);
 }
 
 void LoopOutputNode::updateCol4(unsigned int slices, Numeric *element, Numeric *array){
-	for(int i = 0; i < slices; ++i){
-		array->setCol4ValueAtSlice(0, i, element->col4ValueAtSlice(i, 0));
-	}
+	gatherSlices<Imath::Color4f>(slices, element, array);
 }
 
 void LoopOutputNode::updateMatrix44(unsigned int slices, Numeric *element, Numeric *array){
-	for(int i = 0; i < slices; ++i){
-		array->setMatrix44ValueAtSlice(0, i, element->matrix44ValueAtSlice(i, 0));
-	}
+	gatherSlices<Imath::M44f>(slices, element, array);
 }
 
 void LoopOutputNode::update(Attribute *attribute){
@@ -220,7 +234,6 @@ void LoopOutputNode::update(Attribute *attribute){
 		Numeric *array = _globalArray->outValue();
 
 		unsigned int slices = element->slices();
-		array->resizeSlice(0, slices);
 		(this->*_selectedOperation)(slices, element, array);
 	}
 }
@@ -30,6 +30,8 @@
 #include "../src/Numeric.h"
 #include "../src/containerUtils.h"
 #include "../src/mathUtils.h"
+#include "../src/ParallelArrays.h"
+#include "../src/ArrayFusion.h"
 
 #include <ImathVec.h>
 #include <ImathMatrix.h>
@@ -39,10 +41,275 @@
 
 using namespace coral;
 
+namespace{
+	// Element wise kernels, each Function computes one output element from the input elements at the same index.
+	template<class TypeIn, class TypeOut, class Function>
+	class mathNodes_unaryKernel{
+	public:
+		mathNodes_unaryKernel(const TypeIn *in, TypeOut *out, const Function &function): 
+			_in(in), 
+			_out(out), 
+			_function(function){
+		}
+		
+		void operator() (unsigned int begin, unsigned int end) const{
+			const TypeIn *CORAL_RESTRICT in = _in;
+			TypeOut *CORAL_RESTRICT out = _out;
+			for(unsigned int i = begin; i < end; ++i){
+				out[i] = _function(in[i]);
+			}
+		}
+	
+	private:
+		const TypeIn *_in;
+		TypeOut *_out;
+		Function _function;
+	};
+	
+	template<class TypeA, class TypeB, class TypeOut, class Function>
+	class mathNodes_binaryKernel{
+	public:
+		mathNodes_binaryKernel(const TypeA *inA, const TypeB *inB, TypeOut *out, const Function &function): 
+			_inA(inA), 
+			_inB(inB), 
+			_out(out), 
+			_function(function){
+		}
+		
+		void operator() (unsigned int begin, unsigned int end) const{
+			const TypeA *CORAL_RESTRICT inA = _inA;
+			const TypeB *CORAL_RESTRICT inB = _inB;
+			TypeOut *CORAL_RESTRICT out = _out;
+			for(unsigned int i = begin; i < end; ++i){
+				out[i] = _function(inA[i], inB[i]);
+			}
+		}
+	
+	private:
+		const TypeA *_inA;
+		const TypeB *_inB;
+		TypeOut *_out;
+		Function _function;
+	};
+	
+	class mathNodes_slerpKernel{
+	public:
+		mathNodes_slerpKernel(const Imath::Quatf *q1, const Imath::Quatf *q2, const float *t, Imath::Quatf *out): 
+			_q1(q1), 
+			_q2(q2), 
+			_t(t), 
+			_out(out){
+		}
+		
+		void operator() (unsigned int begin, unsigned int end) const{
+			for(unsigned int i = begin; i < end; ++i){
+				_out[i] = Imath::slerp(_q1[i], _q2[i], _t[i]);
+			}
+		}
+	
+	private:
+		const Imath::Quatf *_q1;
+		const Imath::Quatf *_q2;
+		const float *_t;
+		Imath::Quatf *_out;
+	};
+	
+	template<class TypeIn, class TypeOut, class Function>
+	void updateElementWise(Numeric *in, Numeric *out, unsigned int slice, unsigned int grainSize, const Function &function){
+		NumericSpan<const TypeIn> inValues = in->valuesSpanSlice<TypeIn>(slice);
+		NumericSpan<TypeOut> outValues = out->resizeValuesSpanSlice<TypeOut>(slice, inValues.size());
+		
+		mathNodes_unaryKernel<TypeIn, TypeOut, Function> kernel(inValues.data(), outValues.data(), function);
+		ParallelArrays::forEachRange(outValues.size(), grainSize, kernel);
+	}
+	
+	// the output gets as many elements as the shortest input
+	template<class TypeA, class TypeB, class TypeOut, class Function>
+	void updateElementWise(Numeric *inA, Numeric *inB, Numeric *out, unsigned int slice, unsigned int grainSize, const Function &function){
+		NumericSpan<const TypeA> valuesA = inA->valuesSpanSlice<TypeA>(slice);
+		NumericSpan<const TypeB> valuesB = inB->valuesSpanSlice<TypeB>(slice);
+		
+		unsigned int size = valuesA.size();
+		if(valuesB.size() < size){
+			size = valuesB.size();
+		}
+		
+		NumericSpan<TypeOut> outValues = out->resizeValuesSpanSlice<TypeOut>(slice, size);
+		
+		mathNodes_binaryKernel<TypeA, TypeB, TypeOut, Function> kernel(valuesA.data(), valuesB.data(), outValues.data(), function);
+		ParallelArrays::forEachRange(outValues.size(), grainSize, kernel);
+	}
+	
+	template<class T>
+	struct lengthOf{
+		float operator()(const T &value) const{
+			return value.length();
+		}
+	};
+	
+	template<class T>
+	struct normalizedOf{
+		T operator()(const T &value) const{
+			return value.normalized();
+		}
+	};
+	
+	template<class T>
+	struct inverseOf{
+		T operator()(const T &value) const{
+			return value.inverse();
+		}
+	};
+	
+	template<class T>
+	struct negatedOf{
+		T operator()(const T &value) const{
+			T negated = value;
+			negated.negate();
+			
+			return negated;
+		}
+	};
+	
+	struct absOf{
+		int operator()(int value) const{
+			return abs(value);
+		}
+		
+		float operator()(float value) const{
+			return fabs(value);
+		}
+	};
+	
+	struct crossOf{
+		Imath::V3f operator()(const Imath::V3f &vector0, const Imath::V3f &vector1) const{
+			return vector0.cross(vector1);
+		}
+	};
+	
+	struct dotOf{
+		float operator()(const Imath::V3f &vector0, const Imath::V3f &vector1) const{
+			return vector0.dot(vector1);
+		}
+		
+		float operator()(const Imath::Quatf &quat0, const Imath::Quatf &quat1) const{
+			return quat0 ^ quat1;
+		}
+	};
+	
+	struct quatRotationOf{
+		Imath::Quatf operator()(const Imath::Quatf &q0, const Imath::Quatf &q1) const{
+			return q1 * q0 * (~q1);
+		}
+	};
+	
+	struct trigonometricFunctionOf{
+		trigonometricFunctionOf(int function): function(function){
+		}
+		
+		float operator()(float value) const{
+			switch(function)
+			{
+			case 0:
+				return cos(value);
+			case 1:
+				return sin(value);
+			case 2:
+				return tan(value);
+			case 3:
+				return acos(value);
+			case 4:
+				return asin(value);
+			case 5:
+				return atan(value);
+			case 6:
+				return cosh(value);
+			case 7:
+				return sinh(value);
+			case 8:
+				return tanh(value);
+			}
+			
+			return 0.0;
+		}
+		
+		int function;
+	};
+	
+	struct radiansOf{
+		float operator()(float value) const{
+			return value*M_PI/180.0f;
+		}
+	};
+	
+	struct degreesOf{
+		float operator()(float value) const{
+			return value*180.0f/float(M_PI);
+		}
+	};
+	
+	struct floorOf{
+		float operator()(float value) const{
+			return std::floor(value);
+		}
+	};
+	
+	struct ceilOf{
+		float operator()(float value) const{
+			return std::ceil(value);
+		}
+	};
+	
+	struct roundOf{
+		float operator()(float value) const{
+			return std::floor(value+0.5);
+		}
+	};
+	
+	struct expOf{
+		float operator()(float value) const{
+			return std::exp(value);
+		}
+	};
+	
+	struct logOf{
+		float operator()(float value) const{
+			return std::log(value);
+		}
+	};
+	
+	struct sqrtOf{
+		float operator()(float value) const{
+			return std::sqrt(value);
+		}
+	};
+	
+	// the fusion stage of a node computing its output element wise from a single input
+	bool mathNodes_unaryFusionStage(Attribute *input, ArrayFusionKernel kernel, ArrayFusionStage &stage){
+		stage.inputA = input;
+		stage.kernel = kernel;
+		
+		return true;
+	}
+	
+	struct powOf{
+		float operator()(float base, float exponent) const{
+			return std::pow(base, exponent);
+		}
+	};
+	
+	struct atan2Of{
+		float operator()(float y, float x) const{
+			return std::atan2(y, x);
+		}
+	};
+}
+
 Length::Length(const std::string &name, Node *parent): 
 Node(name, parent),
 _selectedOperation(0){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_element = new NumericAttribute("element", this);
 	_length = new NumericAttribute("length", this);
@@ -105,33 +372,35 @@ void Length::attributeSpecializationChanged(Attribute *attribute){
 }
 
 void Length::updateVec3(Numeric *element, Numeric *length, unsigned int slice){
-	const std::vector<Imath::V3f> &elementValues = element->vec3ValuesSlice(slice);
-	unsigned int size = elementValues.size();
-
-	std::vector<float> lengthValues(size);
-	for(int i = 0; i < size; ++i){
-		float lengthValue = elementValues[i].length();
-		lengthValues[i] = lengthValue;
-	}
-
-	length->setFloatValuesSlice(slice, lengthValues);
+	updateElementWise<Imath::V3f, float>(element, length, slice, arrayGrainSize(), lengthOf<Imath::V3f>());
 }
 
 void Length::updateQuat(Numeric *element, Numeric *length, unsigned int slice){
-	const std::vector<Imath::Quatf> &elementValues = element->quatValuesSlice(slice);
-	unsigned int size = elementValues.size();
+	updateElementWise<Imath::Quatf, float>(element, length, slice, arrayGrainSize(), lengthOf<Imath::Quatf>());
+}
 
-	std::vector<float> lengthValues(size);
-	for(int i = 0; i < size; ++i){
-		float lengthValue = elementValues[i].length();
-		lengthValues[i] = lengthValue;
+bool Length::arrayFusionStage(Attribute *attribute, ArrayFusionStage &stage){
+	if(attribute != _length){
+		return false;
 	}
-
-	length->setFloatValuesSlice(slice, lengthValues);
+	
+	Numeric::Type type = _element->outValue()->type();
+	if(type == Numeric::numericTypeVec3Array){
+		return mathNodes_unaryFusionStage(_element, &arrayFusion_unaryKernel<Imath::V3f, float, lengthOf<Imath::V3f> >, stage);
+	}
+	else if(type == Numeric::numericTypeQuatArray){
+		return mathNodes_unaryFusionStage(_element, &arrayFusion_unaryKernel<Imath::Quatf, float, lengthOf<Imath::Quatf> >, stage);
+	}
+	
+	return false;
 }
 
 void Length::updateSlice(Attribute *attribute, unsigned int slice){
 	if(_selectedOperation){
+		if(ArrayFusion::update(this, attribute)){
+			return;
+		}
+		
 		(this->*_selectedOperation)(_element->value(), _length->outValue(), slice);
 	}
 }
@@ -140,6 +409,7 @@ Inverse::Inverse(const std::string &name, Node *parent):
 Node(name, parent),
 _selectedOperation(0){	
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_element = new NumericAttribute("element", this);
 	_inverse = new NumericAttribute("inverse", this);
@@ -175,27 +445,11 @@ void Inverse::attributeSpecializationChanged(Attribute *attribute){
 }
 
 void Inverse::updateMatrix44(Numeric *element, Numeric *inverse, unsigned int slice){
-	std::vector<Imath::M44f> elementValues = element->matrix44ValuesSlice(slice);
-
-	unsigned int size = elementValues.size();
-	std::vector<Imath::M44f> inverseValues(size);
-	for(int i = 0; i < size ;++i){
-		inverseValues[i] = elementValues[i].inverse();
-	}
-	
-	inverse->setMatrix44ValuesSlice(slice, inverseValues);
+	updateElementWise<Imath::M44f, Imath::M44f>(element, inverse, slice, arrayGrainSize(), inverseOf<Imath::M44f>());
 }
 
 void Inverse::updateQuat(Numeric *element, Numeric *inverse, unsigned int slice){
-	std::vector<Imath::Quatf> elementValues = element->quatValuesSlice(slice);
-	
-	unsigned int size = elementValues.size();
-	std::vector<Imath::Quatf> inverseValues(size);
-	for(int i = 0; i < size ;++i){
-		inverseValues[i] = elementValues[i].inverse();
-	}
-	
-	inverse->setQuatValuesSlice(slice, inverseValues);
+	updateElementWise<Imath::Quatf, Imath::Quatf>(element, inverse, slice, arrayGrainSize(), inverseOf<Imath::Quatf>());
 }
 
 void Inverse::updateSlice(Attribute *attribute, unsigned int slice){
@@ -208,6 +462,7 @@ Abs::Abs(const std::string &name, Node *parent):
 	Node(name, parent),
 	_selectedOperation(0){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 	
 	_inNumber = new NumericAttribute("inNumber", this);
 	_outNumber = new NumericAttribute("ouNumber", this);
@@ -243,29 +498,35 @@ void Abs::attributeSpecializationChanged(Attribute *attribute){
 }
 
 void Abs::abs_int(Numeric *inNumber, Numeric *outNumber, unsigned int slice){
-	std::vector<int> inValues = inNumber->intValuesSlice(slice);
-	std::vector<int> outValues(inValues.size());
-	
-	for(int i = 0; i < inValues.size(); ++i){
-		outValues[i] = abs(inValues[i]);
-	}
-	
-	outNumber->setIntValuesSlice(slice, outValues);
+	updateElementWise<int, int>(inNumber, outNumber, slice, arrayGrainSize(), absOf());
 }
 
 void Abs::abs_float(Numeric *inNumber, Numeric *outNumber, unsigned int slice){
-	std::vector<float> inValues = inNumber->floatValuesSlice(slice);
-	std::vector<float> outValues(inValues.size());
+	updateElementWise<float, float>(inNumber, outNumber, slice, arrayGrainSize(), absOf());
+}
+
+bool Abs::arrayFusionStage(Attribute *attribute, ArrayFusionStage &stage){
+	if(attribute != _outNumber){
+		return false;
+	}
 	
-	for(int i = 0; i < inValues.size(); ++i){
-		outValues[i] = fabs(inValues[i]);
+	Numeric::Type type = _inNumber->outValue()->type();
+	if(type == Numeric::numericTypeIntArray){
+		return mathNodes_unaryFusionStage(_inNumber, &arrayFusion_unaryKernel<int, int, absOf>, stage);
+	}
+	else if(type == Numeric::numericTypeFloatArray){
+		return mathNodes_unaryFusionStage(_inNumber, &arrayFusion_unaryKernel<float, float, absOf>, stage);
 	}
 	
-	outNumber->setFloatValuesSlice(slice, outValues);
+	return false;
 }
 
 void Abs::updateSlice(Attribute *attribute, unsigned int slice){
 	if(_selectedOperation){
+		if(ArrayFusion::update(this, attribute)){
+			return;
+		}
+		
 		(this->*_selectedOperation)(_inNumber->value(), _outNumber->outValue(), slice);
 	}
 }
@@ -273,6 +534,7 @@ void Abs::updateSlice(Attribute *attribute, unsigned int slice){
 CrossProduct::CrossProduct(const std::string &name, Node *parent): 
 Node(name, parent){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_vector0 = new NumericAttribute("vector0", this);
 	_vector1 = new NumericAttribute("vector1", this);
@@ -297,30 +559,14 @@ Node(name, parent){
 }
 
 void CrossProduct::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<Imath::V3f> &vectorValues0 = _vector0->value()->vec3ValuesSlice(slice);
-	const std::vector<Imath::V3f> &vectorValues1 = _vector1->value()->vec3ValuesSlice(slice);
-	
-	int size0 = vectorValues0.size();
-	int size1 = vectorValues1.size();
-	
-	int minSize = size0;
-	if(size0 < size1){
-		minSize = size1;
-	}
-	
-	std::vector<Imath::V3f> crossedValues(minSize);
-	
-	for(int i = 0; i < minSize; ++i){
-		crossedValues[i] = vectorValues0[i].cross(vectorValues1[i]);
-	}
-	
-	_crossProduct->outValue()->setVec3ValuesSlice(slice, crossedValues);
+	updateElementWise<Imath::V3f, Imath::V3f, Imath::V3f>(_vector0->value(), _vector1->value(), _crossProduct->outValue(), slice, arrayGrainSize(), crossOf());
 }
 
 DotProduct::DotProduct(const std::string &name, Node *parent): 
 Node(name, parent),
 _selectedOperation(0){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_element0 = new NumericAttribute("element0", this);
 	_element1 = new NumericAttribute("element1", this);
@@ -354,7 +600,7 @@ _selectedOperation(0){
 void DotProduct::attributeSpecializationChanged(Attribute *attribute){
 	_selectedOperation = 0;
 
-	Numeric::Type type = _dotProduct->outValue()->type();
+	Numeric::Type type = _element0->outValue()->type();
 	
 	if(type == Numeric::numericTypeVec3 || type == Numeric::numericTypeVec3Array){
 		_selectedOperation = &DotProduct::updateVec3;
@@ -365,45 +611,11 @@ void DotProduct::attributeSpecializationChanged(Attribute *attribute){
 }
 
 void DotProduct::updateVec3(Numeric *element0, Numeric *element1, Numeric *dotProduct, unsigned int slice){
-	const std::vector<Imath::V3f> &elementValues0 = element0->vec3ValuesSlice(slice);
-	const std::vector<Imath::V3f> &elementValues1 = element1->vec3ValuesSlice(slice);
-
-	int size0 = elementValues0.size();
-	int size1 = elementValues1.size();
-
-	int minSize = size0;
-	if(size0 < size1){
-		minSize = size1;
-	}
-
-	std::vector<float> dotValues(minSize);
-
-	for(int i = 0; i < minSize; ++i){
-		dotValues[i] = elementValues0[i].dot(elementValues1[i]);
-	}
-
-	dotProduct->setFloatValuesSlice(slice, dotValues);
+	updateElementWise<Imath::V3f, Imath::V3f, float>(element0, element1, dotProduct, slice, arrayGrainSize(), dotOf());
 }
 
 void DotProduct::updateQuat(Numeric *element0, Numeric *element1, Numeric *dotProduct, unsigned int slice){
-	const std::vector<Imath::Quatf> &elementValues0 = element0->quatValuesSlice(slice);
-	const std::vector<Imath::Quatf> &elementValues1 = element1->quatValuesSlice(slice);
-
-	int size0 = elementValues0.size();
-	int size1 = elementValues1.size();
-
-	int minSize = size0;
-	if(size0 < size1){
-		minSize = size1;
-	}
-
-	std::vector<float> dotValues(minSize);
-
-	for(int i = 0; i < minSize; ++i){
-		dotValues[i] = elementValues0[i] ^ elementValues1[i];
-	}
-
-	dotProduct->setFloatValuesSlice(slice, dotValues);
+	updateElementWise<Imath::Quatf, Imath::Quatf, float>(element0, element1, dotProduct, slice, arrayGrainSize(), dotOf());
 }
 
 void DotProduct::updateSpecializationLink(Attribute *attributeA, Attribute *attributeB, std::vector<std::string> &specializationA, std::vector<std::string> &specializationB){
@@ -423,6 +635,9 @@ void DotProduct::updateSpecializationLink(Attribute *attributeA, Attribute *attr
 			}
 		}
 	}
+
+	specializationA = newSpecA;
+	specializationB = newSpecB;
 }
 
 void DotProduct::updateSlice(Attribute *attribute, unsigned int slice){
@@ -435,6 +650,7 @@ Normalize::Normalize(const std::string &name, Node *parent):
 Node(name, parent),
 _selectedOperation(0){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_element = new NumericAttribute("element", this);
 	_normalized = new NumericAttribute("normalized", this);
@@ -468,37 +684,42 @@ void Normalize::attributeSpecializationChanged(Attribute *attribute){
 }
 
 void Normalize::updateVec3(Numeric *element, Numeric *normalized, unsigned int slice){
-	const std::vector<Imath::V3f> &elementValues = element->vec3ValuesSlice(slice);
-	int size = elementValues.size();
-	
-	std::vector<Imath::V3f> normalizedValues(size);
-	for(int i = 0; i < size; ++i){
-		normalizedValues[i] = elementValues[i].normalized();
-	}
-	
-	normalized->setVec3ValuesSlice(slice, normalizedValues);
+	updateElementWise<Imath::V3f, Imath::V3f>(element, normalized, slice, arrayGrainSize(), normalizedOf<Imath::V3f>());
 }
 
 void Normalize::updateQuat(Numeric *element, Numeric *normalized, unsigned int slice){
-	const std::vector<Imath::Quatf> &elementValues = element->quatValuesSlice(slice);
-	int size = elementValues.size();
+	updateElementWise<Imath::Quatf, Imath::Quatf>(element, normalized, slice, arrayGrainSize(), normalizedOf<Imath::Quatf>());
+}
+
+bool Normalize::arrayFusionStage(Attribute *attribute, ArrayFusionStage &stage){
+	if(attribute != _normalized){
+		return false;
+	}
 	
-	std::vector<Imath::Quatf> normalizedValues(size);
-	for(int i = 0; i < size; ++i){
-		normalizedValues[i] = elementValues[i].normalized();
+	Numeric::Type type = _element->outValue()->type();
+	if(type == Numeric::numericTypeVec3Array){
+		return mathNodes_unaryFusionStage(_element, &arrayFusion_unaryKernel<Imath::V3f, Imath::V3f, normalizedOf<Imath::V3f> >, stage);
+	}
+	else if(type == Numeric::numericTypeQuatArray){
+		return mathNodes_unaryFusionStage(_element, &arrayFusion_unaryKernel<Imath::Quatf, Imath::Quatf, normalizedOf<Imath::Quatf> >, stage);
 	}
 	
-	normalized->setQuatValuesSlice(slice, normalizedValues);
+	return false;
 }
 
 void Normalize::updateSlice(Attribute *attribute, unsigned int slice){
 	if(_selectedOperation){
+		if(ArrayFusion::update(this, attribute)){
+			return;
+		}
+		
 		(this->*_selectedOperation)(_element->value(), _normalized->outValue(), slice);
 	}
 }
 
 TrigonometricFunctions::TrigonometricFunctions(const std::string &name, Node *parent): Node(name, parent){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_inNumber = new NumericAttribute("inNumber", this);
 	_outNumber = new NumericAttribute("outNumber", this);
@@ -536,48 +757,13 @@ TrigonometricFunctions::TrigonometricFunctions(const std::string &name, Node *pa
 }
 
 void TrigonometricFunctions::updateSlice(Attribute *attribute, unsigned int slice){
-	std::vector<float> inValues = _inNumber->value()->floatValuesSlice(slice);
 	int inFunction = _function->value()->currentIndex();
-	std::vector<float> outValues(inValues.size());
-
-	for(int i = 0; i < inValues.size(); ++i){
-		switch(inFunction)
-		{
-		case 0:
-			outValues[i] = cos(inValues[i]);
-			break;
-		case 1:
-			outValues[i] = sin(inValues[i]);
-			break;
-		case 2:
-			outValues[i] = tan(inValues[i]);
-			break;
-		case 3:
-			outValues[i] = acos(inValues[i]);
-			break;
-		case 4:
-			outValues[i] = asin(inValues[i]);
-			break;
-		case 5:
-			outValues[i] = atan(inValues[i]);
-			break;
-		case 6:
-			outValues[i] = cosh(inValues[i]);
-			break;
-		case 7:
-			outValues[i] = sinh(inValues[i]);
-			break;
-		case 8:
-			outValues[i] = tanh(inValues[i]);
-			break;
-		}
-	}
-
-	_outNumber->outValue()->setFloatValuesSlice(slice, outValues);
+	updateElementWise<float, float>(_inNumber->value(), _outNumber->outValue(), slice, arrayGrainSize(), trigonometricFunctionOf(inFunction));
 }
 
 Radians::Radians(const std::string &name, Node *parent): Node(name, parent){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_inNumber = new NumericAttribute("in", this);
 	_outNumber = new NumericAttribute("out", this);
@@ -597,19 +783,12 @@ Radians::Radians(const std::string &name, Node *parent): Node(name, parent){
 }
 
 void Radians::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<float> &in = _inNumber->value()->floatValuesSlice(slice);
-	int size = in.size();
-
-	std::vector<float> outValues(size);
-	for(int i = 0; i < size; ++i){
-		outValues[i] = in[i]*M_PI/180.0f;
-	}
-
-	_outNumber->outValue()->setFloatValuesSlice(slice, outValues);
+	updateElementWise<float, float>(_inNumber->value(), _outNumber->outValue(), slice, arrayGrainSize(), radiansOf());
 }
 
 Degrees::Degrees(const std::string &name, Node *parent): Node(name, parent){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_inNumber = new NumericAttribute("in", this);
 	_outNumber = new NumericAttribute("out", this);
@@ -629,19 +808,12 @@ Degrees::Degrees(const std::string &name, Node *parent): Node(name, parent){
 }
 
 void Degrees::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<float> &in = _inNumber->value()->floatValuesSlice(slice);
-	int size = in.size();
-
-	std::vector<float> outValues(size);
-	for(int i = 0; i < size; ++i){
-		outValues[i] = in[i]*180.0f/float(M_PI);
-	}
-
-	_outNumber->outValue()->setFloatValuesSlice(slice, outValues);
+	updateElementWise<float, float>(_inNumber->value(), _outNumber->outValue(), slice, arrayGrainSize(), degreesOf());
 }
 
 Floor::Floor(const std::string &name, Node *parent): Node(name, parent){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_inNumber = new NumericAttribute("in", this);
 	_outNumber = new NumericAttribute("out", this);
@@ -661,19 +833,12 @@ Floor::Floor(const std::string &name, Node *parent): Node(name, parent){
 }
 
 void Floor::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<float> &in = _inNumber->value()->floatValuesSlice(slice);
-	int size = in.size();
-
-	std::vector<float> outValues(size);
-	for(int i = 0; i < size; ++i){
-		outValues[i] = std::floor(in[i]);
-	}
-
-	_outNumber->outValue()->setFloatValuesSlice(slice, outValues);
+	updateElementWise<float, float>(_inNumber->value(), _outNumber->outValue(), slice, arrayGrainSize(), floorOf());
 }
 
 Ceil::Ceil(const std::string &name, Node *parent): Node(name, parent){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_inNumber = new NumericAttribute("in", this);
 	_outNumber = new NumericAttribute("out", this);
@@ -693,19 +858,12 @@ Ceil::Ceil(const std::string &name, Node *parent): Node(name, parent){
 }
 
 void Ceil::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<float> &in = _inNumber->value()->floatValuesSlice(slice);
-	int size = in.size();
-
-	std::vector<float> outValues(size);
-	for(int i = 0; i < size; ++i){
-		outValues[i] = std::ceil(in[i]);
-	}
-
-	_outNumber->outValue()->setFloatValuesSlice(slice, outValues);
+	updateElementWise<float, float>(_inNumber->value(), _outNumber->outValue(), slice, arrayGrainSize(), ceilOf());
 }
 
 Round::Round(const std::string &name, Node *parent): Node(name, parent){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_inNumber = new NumericAttribute("in", this);
 	_outNumber = new NumericAttribute("out", this);
@@ -725,19 +883,12 @@ Round::Round(const std::string &name, Node *parent): Node(name, parent){
 }
 
 void Round::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<float> &in = _inNumber->value()->floatValuesSlice(slice);
-	int size = in.size();
-
-	std::vector<float> outValues(size);
-	for(int i = 0; i < size; ++i){
-		outValues[i] = std::floor(in[i]+0.5);
-	}
-
-	_outNumber->outValue()->setFloatValuesSlice(slice, outValues);
+	updateElementWise<float, float>(_inNumber->value(), _outNumber->outValue(), slice, arrayGrainSize(), roundOf());
 }
 
 Exp::Exp(const std::string &name, Node *parent): Node(name, parent){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_inNumber = new NumericAttribute("in", this);
 	_outNumber = new NumericAttribute("out", this);
@@ -757,19 +908,12 @@ Exp::Exp(const std::string &name, Node *parent): Node(name, parent){
 }
 
 void Exp::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<float> &in = _inNumber->value()->floatValuesSlice(slice);
-	int size = in.size();
-
-	std::vector<float> outValues(size);
-	for(int i = 0; i < size; ++i){
-		outValues[i] = std::exp(in[i]);
-	}
-
-	_outNumber->outValue()->setFloatValuesSlice(slice, outValues);
+	updateElementWise<float, float>(_inNumber->value(), _outNumber->outValue(), slice, arrayGrainSize(), expOf());
 }
 
 Log::Log(const std::string &name, Node *parent): Node(name, parent){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_inNumber = new NumericAttribute("in", this);
 	_outNumber = new NumericAttribute("out", this);
@@ -789,19 +933,12 @@ Log::Log(const std::string &name, Node *parent): Node(name, parent){
 }
 
 void Log::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<float> &in = _inNumber->value()->floatValuesSlice(slice);
-	int size = in.size();
-
-	std::vector<float> outValues(size);
-	for(int i = 0; i < size; ++i){
-		outValues[i] = std::log(in[i]);
-	}
-
-	_outNumber->outValue()->setFloatValuesSlice(slice, outValues);
+	updateElementWise<float, float>(_inNumber->value(), _outNumber->outValue(), slice, arrayGrainSize(), logOf());
 }
 
 Pow::Pow(const std::string &name, Node *parent): Node(name, parent){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_base = new NumericAttribute("base", this);
 	_exponent = new NumericAttribute("exponent", this);
@@ -826,20 +963,12 @@ Pow::Pow(const std::string &name, Node *parent): Node(name, parent){
 }
 
 void Pow::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<float> &base = _base->value()->floatValuesSlice(slice);
-	const std::vector<float> &exponent = _exponent->value()->floatValuesSlice(slice);
-	int size = base.size();
-
-	std::vector<float> outValues(size);
-	for(int i = 0; i < size; ++i){
-		outValues[i] = std::pow(base[i],exponent[i]);
-	}
-
-	_outNumber->outValue()->setFloatValuesSlice(slice, outValues);
+	updateElementWise<float, float, float>(_base->value(), _exponent->value(), _outNumber->outValue(), slice, arrayGrainSize(), powOf());
 }
 
 Sqrt::Sqrt(const std::string &name, Node *parent): Node(name, parent){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_inNumber = new NumericAttribute("in", this);
 	_outNumber = new NumericAttribute("out", this);
@@ -858,16 +987,20 @@ Sqrt::Sqrt(const std::string &name, Node *parent): Node(name, parent){
 	addAttributeSpecializationLink(_inNumber, _outNumber);
 }
 
-void Sqrt::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<float> &in = _inNumber->value()->floatValuesSlice(slice);
-	int size = in.size();
-
-	std::vector<float> outValues(size);
-	for(int i = 0; i < size; ++i){
-		outValues[i] = std::sqrt(in[i]);
+bool Sqrt::arrayFusionStage(Attribute *attribute, ArrayFusionStage &stage){
+	if(attribute == _outNumber && _inNumber->outValue()->type() == Numeric::numericTypeFloatArray){
+		return mathNodes_unaryFusionStage(_inNumber, &arrayFusion_unaryKernel<float, float, sqrtOf>, stage);
 	}
+	
+	return false;
+}
 
-	_outNumber->outValue()->setFloatValuesSlice(slice, outValues);
+void Sqrt::updateSlice(Attribute *attribute, unsigned int slice){
+	if(ArrayFusion::update(this, attribute)){
+		return;
+	}
+	
+	updateElementWise<float, float>(_inNumber->value(), _outNumber->outValue(), slice, arrayGrainSize(), sqrtOf());
 }
 
 Atan2::Atan2(const std::string &name, Node *parent): Node(name, parent){
@@ -896,22 +1029,14 @@ Atan2::Atan2(const std::string &name, Node *parent): Node(name, parent){
 }
 
 void Atan2::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<float> &y = _inNumberY->value()->floatValuesSlice(slice);
-	const std::vector<float> &x = _inNumberX->value()->floatValuesSlice(slice);
-	int size = y.size();
-
-	std::vector<float> outValues(size);
-	for(int i = 0; i < size; ++i){
-		outValues[i] = std::atan2(y[i],x[i]);
-	}
-
-	_outNumber->outValue()->setFloatValuesSlice(slice, outValues);
+	updateElementWise<float, float, float>(_inNumberY->value(), _inNumberX->value(), _outNumber->outValue(), slice, arrayGrainSize(), atan2Of());
 }
 
 Min::Min(const std::string &name, Node *parent):
 	Node(name, parent),
 	_selectedOperation(0){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_inNumber = new NumericAttribute("in", this);
 	_outNumber = new NumericAttribute("out", this);
@@ -949,7 +1074,7 @@ void Min::attributeSpecializationChanged(Attribute *attribute){
 }
 
 void Min::min_int(Numeric *inNumber, Numeric *outNumber, unsigned int slice){
-	std::vector<int> inValues = inNumber->intValuesSlice(slice);
+	NumericSpan<const int> inValues = inNumber->valuesSpanSlice<int>(slice);
 	std::vector<int> outValues(1);
 
 	int min = std::numeric_limits<int>::max();
@@ -962,7 +1087,7 @@ void Min::min_int(Numeric *inNumber, Numeric *outNumber, unsigned int slice){
 }
 
 void Min::min_float(Numeric *inNumber, Numeric *outNumber, unsigned int slice){
-	std::vector<float> inValues = inNumber->floatValuesSlice(slice);
+	NumericSpan<const float> inValues = inNumber->valuesSpanSlice<float>(slice);
 	std::vector<float> outValue(1);
 
 	float min = std::numeric_limits<float>::max();
@@ -1012,6 +1137,7 @@ Max::Max(const std::string &name, Node *parent):
 	Node(name, parent),
 	_selectedOperation(0){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_inNumber = new NumericAttribute("in", this);
 	_outNumber = new NumericAttribute("out", this);
@@ -1049,7 +1175,7 @@ void Max::attributeSpecializationChanged(Attribute *attribute){
 }
 
 void Max::max_int(Numeric *inNumber, Numeric *outNumber, unsigned int slice){
-	std::vector<int> inValues = inNumber->intValuesSlice(slice);
+	NumericSpan<const int> inValues = inNumber->valuesSpanSlice<int>(slice);
 	std::vector<int> outValues(1);
 
 	int max = std::numeric_limits<int>::min();
@@ -1062,7 +1188,7 @@ void Max::max_int(Numeric *inNumber, Numeric *outNumber, unsigned int slice){
 }
 
 void Max::max_float(Numeric *inNumber, Numeric *outNumber, unsigned int slice){
-	std::vector<float> inValues = inNumber->floatValuesSlice(slice);
+	NumericSpan<const float> inValues = inNumber->valuesSpanSlice<float>(slice);
 	std::vector<float> outValue(1);
 
 	float max = std::numeric_limits<float>::min();
@@ -1112,6 +1238,7 @@ Average::Average(const std::string &name, Node *parent):
 	Node(name, parent),
 	_selectedOperation(0){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_inNumber = new NumericAttribute("in", this);
 	_outNumber = new NumericAttribute("out", this);
@@ -1154,20 +1281,20 @@ void Average::attributeSpecializationChanged(Attribute *attribute){
 }
 
 void Average::average_int(Numeric *inNumber, Numeric *outNumber, unsigned int slice){
-	std::vector<int> inValues = inNumber->intValuesSlice(slice);
+	NumericSpan<const int> inValues = inNumber->valuesSpanSlice<int>(slice);
 	std::vector<int> outValues(1);
 
 	int av = 0;
 	for(int i = 0; i < inValues.size(); ++i){
 		av += inValues[i];
 	}
-	outValues[0] = int(av/inValues.size());
+	outValues[0] = av/int(inValues.size());
 
 	outNumber->setIntValuesSlice(slice, outValues);
 }
 
 void Average::average_float(Numeric *inNumber, Numeric *outNumber, unsigned int slice){
-	std::vector<float> inValues = inNumber->floatValuesSlice(slice);
+	NumericSpan<const float> inValues = inNumber->valuesSpanSlice<float>(slice);
 	std::vector<float> outValue(1);
 
 	float av = 0;
@@ -1180,7 +1307,7 @@ void Average::average_float(Numeric *inNumber, Numeric *outNumber, unsigned int
 }
 
 void Average::average_vec3(Numeric *inNumber, Numeric *outNumber, unsigned int slice){
-	std::vector<Imath::V3f> inValues = inNumber->vec3ValuesSlice(slice);
+	NumericSpan<const Imath::V3f> inValues = inNumber->valuesSpanSlice<Imath::V3f>(slice);
 	std::vector<Imath::V3f> outValue(1);
 
 	Imath::V3f av(0.0,0.0,0.0);
@@ -1234,6 +1361,7 @@ void Average::updateSpecializationLink(Attribute *attributeA, Attribute *attribu
 
 Slerp::Slerp(const std::string &name, Node *parent): Node(name, parent){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_inQuat1 = new NumericAttribute("q1", this);
 	_inQuat2 = new NumericAttribute("q2", this);
@@ -1346,23 +1474,22 @@ void Slerp::updateSpecializationLink(Attribute *attributeA, Attribute *attribute
 }
 
 void Slerp::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<Imath::Quatf> &q1 = _inQuat1->value()->quatValuesSlice(slice);
-	const std::vector<Imath::Quatf> &q2 = _inQuat2->value()->quatValuesSlice(slice);
-	const std::vector<float> &t = _param->value()->floatValuesSlice(slice);
+	NumericSpan<const Imath::Quatf> q1 = _inQuat1->value()->valuesSpanSlice<Imath::Quatf>(slice);
+	NumericSpan<const Imath::Quatf> q2 = _inQuat2->value()->valuesSpanSlice<Imath::Quatf>(slice);
+	NumericSpan<const float> t = _param->value()->valuesSpanSlice<float>(slice);
 	int size = q1.size();
 	size = (q2.size()<size)?q2.size():size;
 	size = (t.size()<size)?t.size():size;
 
-	std::vector<Imath::Quatf> outValues(size);
-	for(int i = 0; i < size; ++i){
-		outValues[i] = slerp(q1[i],q2[i],t[i]);
-	}
-
-	_outNumber->outValue()->setQuatValues(outValues);
+	NumericSpan<Imath::Quatf> outValues = _outNumber->outValue()->resizeValuesSpanSlice<Imath::Quatf>(slice, size);
+	
+	mathNodes_slerpKernel kernel(q1.data(), q2.data(), t.data(), outValues.data());
+	ParallelArrays::forEachRange(outValues.size(), arrayGrainSize(), kernel);
 }
 
 QuatMultiply::QuatMultiply(const std::string &name, Node *parent): Node(name, parent){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_quat0 = new NumericAttribute("q0", this);
 	_quat1 = new NumericAttribute("q1", this);
@@ -1387,30 +1514,14 @@ QuatMultiply::QuatMultiply(const std::string &name, Node *parent): Node(name, pa
 }
 
 void QuatMultiply::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<Imath::Quatf> &q0 = _quat0->value()->quatValuesSlice(slice);
-	const std::vector<Imath::Quatf> &q1 = _quat1->value()->quatValuesSlice(slice);
-
-	int size0 = q0.size();
-	int size1 = q1.size();
-
-	int minSize = size0;
-	if(size0 < size1){
-		minSize = size1;
-	}
-
-	std::vector<Imath::Quatf> outValues(minSize);
-
-	for(int i = 0; i < minSize; ++i){
-		outValues[i] = q1[i]*q0[i]*(~q1[i]);
-	}
-
-	_outQuat->outValue()->setQuatValues(outValues);
+	updateElementWise<Imath::Quatf, Imath::Quatf, Imath::Quatf>(_quat0->value(), _quat1->value(), _outQuat->outValue(), slice, arrayGrainSize(), quatRotationOf());
 }
 
 Negate::Negate(const std::string &name, Node *parent): 
 Node(name, parent),
 _selectedOperation(0){	
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_element = new NumericAttribute("element", this);
 	_negated = new NumericAttribute("negated", this);
@@ -1446,27 +1557,11 @@ void Negate::attributeSpecializationChanged(Attribute *attribute){
 }
 
 void Negate::updateVec3(Numeric *element, Numeric *negated, unsigned int slice){
-	std::vector<Imath::V3f> elementValues = element->vec3ValuesSlice(slice);
-
-	unsigned int size = elementValues.size();
-	std::vector<Imath::V3f> negatedValues(size);
-	for(int i = 0; i < size ;++i){
-		negatedValues[i] = elementValues[i].negate();
-	}
-	
-	negated->setVec3ValuesSlice(slice, negatedValues);
+	updateElementWise<Imath::V3f, Imath::V3f>(element, negated, slice, arrayGrainSize(), negatedOf<Imath::V3f>());
 }
 
 void Negate::updateMatrix44(Numeric *element, Numeric *negated, unsigned int slice){
-	std::vector<Imath::M44f> elementValues = element->matrix44ValuesSlice(slice);
-
-	unsigned int size = elementValues.size();
-	std::vector<Imath::M44f> negatedValues(size);
-	for(int i = 0; i < size ;++i){
-		negatedValues[i] = elementValues[i].negate();
-	}
-	
-	negated->setMatrix44ValuesSlice(slice, negatedValues);
+	updateElementWise<Imath::M44f, Imath::M44f>(element, negated, slice, arrayGrainSize(), negatedOf<Imath::M44f>());
 }
 
 void Negate::updateSlice(Attribute *attribute, unsigned int slice){
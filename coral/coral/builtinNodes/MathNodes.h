@@ -44,6 +44,7 @@ public:
 	void updateSpecializationLink(Attribute *attributeA, Attribute *attributeB, std::vector<std::string> &specializationA, std::vector<std::string> &specializationB);
 	void attributeSpecializationChanged(Attribute *attribute);
 	void updateSlice(Attribute *attribute, unsigned int slice);
+	bool arrayFusionStage(Attribute *attribute, ArrayFusionStage &stage);
 	
 private:
 	NumericAttribute *_element;
@@ -75,6 +76,7 @@ public:
 	Abs(const std::string &name, Node *parent);
 	void attributeSpecializationChanged(Attribute *attribute);
 	void updateSlice(Attribute *attribute, unsigned int slice);
+	bool arrayFusionStage(Attribute *attribute, ArrayFusionStage &stage);
 
 private:
 	NumericAttribute *_inNumber;
@@ -118,6 +120,7 @@ public:
 	Normalize(const std::string &name, Node *parent);
 	void attributeSpecializationChanged(Attribute *attribute);
 	void updateSlice(Attribute *attribute, unsigned int slice);
+	bool arrayFusionStage(Attribute *attribute, ArrayFusionStage &stage);
 
 private:
 	NumericAttribute *_element;
@@ -224,6 +227,7 @@ class Sqrt: public Node{
 public:
 	Sqrt(const std::string &name, Node *parent);
 	void updateSlice(Attribute *attribute, unsigned int slice);
+	bool arrayFusionStage(Attribute *attribute, ArrayFusionStage &stage);
 
 private:
 	NumericAttribute *_inNumber;
@@ -257,7 +257,7 @@ void Vec3ToFloats::updateSpecializationLink(Attribute *attributeA, Attribute *at
 }
 
 void Vec3ToFloats::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<Imath::V3f> &vec3Values = _vector->value()->vec3ValuesSlice(slice);
+	NumericSpan<const Imath::V3f> vec3Values = _vector->value()->valuesSpanSlice<Imath::V3f>(slice);
 	int size = vec3Values.size();
 	
 	std::vector<float> xValues(size);
@@ -464,7 +464,7 @@ void Col4ToFloats::updateSpecializationLink(Attribute *attributeA, Attribute *at
 }
 
 void Col4ToFloats::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<Imath::Color4f> &col4Values = _color->value()->col4ValuesSlice(slice);
+	NumericSpan<const Imath::Color4f> col4Values = _color->value()->valuesSpanSlice<Imath::Color4f>(slice);
 	int size = col4Values.size();
 
 	std::vector<float> rValues(size);
@@ -544,7 +544,7 @@ void Col4Reverse::updateSpecializationLink(Attribute *attributeA, Attribute *att
 }
 
 void Col4Reverse::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<Imath::Color4f> &inCol4Values = _inColor->value()->col4ValuesSlice(slice);
+	NumericSpan<const Imath::Color4f> inCol4Values = _inColor->value()->valuesSpanSlice<Imath::Color4f>(slice);
 	int size = inCol4Values.size();
 
 	std::vector<Imath::Color4f> outCol4Values(size);
@@ -733,7 +733,7 @@ void QuatToFloats::updateSpecializationLink(Attribute *attributeA, Attribute *at
 }
 
 void QuatToFloats::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<Imath::Quatf> &quatValues = _quat->value()->quatValuesSlice(slice);
+	NumericSpan<const Imath::Quatf> quatValues = _quat->value()->valuesSpanSlice<Imath::Quatf>(slice);
 	int size = quatValues.size();
 
 	std::vector<float> rValues(size);
@@ -1036,6 +1036,7 @@ void ConstantArray::updateSlice(Attribute *attribute, unsigned int slice){
 
 ArraySize::ArraySize(const std::string &name, Node *parent): Node(name, parent){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_array = new NumericAttribute("array", this);
 	_size = new NumericAttribute("size", this);
@@ -1356,7 +1357,7 @@ void Matrix44Translation::updateSpecializationLink(Attribute *attributeA, Attrib
 }
 
 void Matrix44Translation::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<Imath::M44f> &matrix = _matrix->value()->matrix44ValuesSlice(slice);
+	NumericSpan<const Imath::M44f> matrix = _matrix->value()->valuesSpanSlice<Imath::M44f>(slice);
 	int size = matrix.size();
 	std::vector<Imath::V3f> translationValues(size);
 	
@@ -1420,7 +1421,7 @@ void Matrix44RotationAxis::updateSpecializationLink(Attribute *attributeA, Attri
 }
 
 void Matrix44RotationAxis::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<Imath::M44f> &matrix = _matrix->value()->matrix44ValuesSlice(slice);
+	NumericSpan<const Imath::M44f> matrix = _matrix->value()->valuesSpanSlice<Imath::M44f>(slice);
 	int size = matrix.size();
 	std::vector<Imath::V3f> axisXValues(size);
 	std::vector<Imath::V3f> axisYValues(size);
@@ -1576,7 +1577,7 @@ void Matrix44EulerRotation::updateSpecializationLink(Attribute *attributeA, Attr
 }
 
 void Matrix44EulerRotation::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<Imath::M44f> &matrix = _matrix->value()->matrix44ValuesSlice(slice);
+	NumericSpan<const Imath::M44f> matrix = _matrix->value()->valuesSpanSlice<Imath::M44f>(slice);
 	int size = matrix.size();
 	
 	std::vector<Imath::V3f> eulerAngles(size);
@@ -1898,6 +1899,7 @@ GetArrayElement::GetArrayElement(const std::string &name, Node *parent):
 	Node(name, parent),
 	_selectedOperation(0){
 	setSliceable(true);
+	setEarlyCutoffEnabled(true);
 
 	_array = new NumericAttribute("array", this);
 	_index = new NumericAttribute("index", this);
@@ -2043,41 +2045,41 @@ void GetArrayElement::attributeSpecializationChanged(Attribute *attribute){
 	}
 }
 
-void GetArrayElement::updateInt(Numeric *array, const std::vector<int> &index, Numeric *element, unsigned int slice){
+void GetArrayElement::updateInt(Numeric *array, NumericSpan<const int> index, Numeric *element, unsigned int slice){
 	int size = index.size();
-	element->resize(size);
+	element->resizeSlice(slice, size);
 	for(int i = 0; i < size; ++i){
 		element->setIntValueAtSlice(slice, i, array->intValueAtSlice(slice, index[i]));
 	}
 }
 
-void GetArrayElement::updateFloat(Numeric *array,  const std::vector<int> &index, Numeric *element, unsigned int slice){
+void GetArrayElement::updateFloat(Numeric *array,  NumericSpan<const int> index, Numeric *element, unsigned int slice){
 	int size = index.size();
-	element->resize(size);
+	element->resizeSlice(slice, size);
 	for(int i = 0; i < size; ++i){
 		element->setFloatValueAtSlice(slice, i, array->floatValueAtSlice(slice, index[i]));
 	}
 }
 
-void GetArrayElement::updateVec3(Numeric *array,  const std::vector<int> &index, Numeric *element, unsigned int slice){
+void GetArrayElement::updateVec3(Numeric *array,  NumericSpan<const int> index, Numeric *element, unsigned int slice){
 	int size = index.size();
-	element->resize(size);
+	element->resizeSlice(slice, size);
 	for(int i = 0; i < size; ++i){
 		element->setVec3ValueAtSlice(slice, i, array->vec3ValueAtSlice(slice, index[i]));
 	}
 }
 
-void GetArrayElement::updateCol4(Numeric *array, const std::vector<int> &index, Numeric *element, unsigned int slice){
+void GetArrayElement::updateCol4(Numeric *array, NumericSpan<const int> index, Numeric *element, unsigned int slice){
 	int size = index.size();
-	element->resize(size);
+	element->resizeSlice(slice, size);
 	for(int i = 0; i < size; ++i){
 		element->setCol4ValueAtSlice(slice, i, array->col4ValueAtSlice(slice, index[i]));
 	}
 }
 
-void GetArrayElement::updateMatrix44(Numeric *array,  const std::vector<int> &index, Numeric *element, unsigned int slice){
+void GetArrayElement::updateMatrix44(Numeric *array,  NumericSpan<const int> index, Numeric *element, unsigned int slice){
 	int size = index.size();
-	element->resize(size);
+	element->resizeSlice(slice, size);
 	for(int i = 0; i < size; ++i){
 		element->setMatrix44ValueAtSlice(slice, i, array->matrix44ValueAtSlice(slice, index[i]));
 	}
@@ -2086,7 +2088,7 @@ void GetArrayElement::updateMatrix44(Numeric *array,  const std::vector<int> &in
 void GetArrayElement::updateSlice(Attribute *attribute, unsigned int slice){
 	if(_selectedOperation){
 		Numeric *array = _array->value();
-		std::vector<int> index = _index->value()->intValuesSlice(slice);
+		NumericSpan<const int> index = _index->value()->valuesSpanSlice<int>(slice);
 		Numeric *element = _element->outValue();
 		
 		(this->*_selectedOperation)(array, index, element, slice);
@@ -2198,7 +2200,7 @@ void SetArrayElement::attributeSpecializationChanged(Attribute *attribute){
 	}
 }
 
-void SetArrayElement::updateInt(Numeric *array, const std::vector<int> &index, Numeric *element, Numeric *outArray, unsigned int slice){
+void SetArrayElement::updateInt(Numeric *array, NumericSpan<const int> index, Numeric *element, Numeric *outArray, unsigned int slice){
 	std::vector<int> values = array->intValuesSlice(slice);
 	int valuesSize = array->sizeSlice(slice);
 	for(int i = 0; i < index.size(); ++i){
@@ -2211,7 +2213,7 @@ void SetArrayElement::updateInt(Numeric *array, const std::vector<int> &index, N
 	outArray->setIntValuesSlice(slice, values);
 }
 
-void SetArrayElement::updateFloat(Numeric *array, const std::vector<int> &index, Numeric *element, Numeric *outArray, unsigned int slice){
+void SetArrayElement::updateFloat(Numeric *array, NumericSpan<const int> index, Numeric *element, Numeric *outArray, unsigned int slice){
 	std::vector<float> values = array->floatValuesSlice(slice);
 	int valuesSize = array->sizeSlice(slice);
 	for(int i = 0; i < index.size(); ++i){
@@ -2224,7 +2226,7 @@ void SetArrayElement::updateFloat(Numeric *array, const std::vector<int> &index,
 	outArray->setFloatValuesSlice(slice, values);
 }
 
-void SetArrayElement::updateVec3(Numeric *array, const std::vector<int> &index, Numeric *element, Numeric *outArray, unsigned int slice){
+void SetArrayElement::updateVec3(Numeric *array, NumericSpan<const int> index, Numeric *element, Numeric *outArray, unsigned int slice){
 	std::vector<Imath::V3f> values = array->vec3ValuesSlice(slice);
 	int valuesSize = array->sizeSlice(slice);
 	for(int i = 0; i < index.size(); ++i){
@@ -2237,7 +2239,7 @@ void SetArrayElement::updateVec3(Numeric *array, const std::vector<int> &index,
 	outArray->setVec3ValuesSlice(slice, values);
 }
 
-void SetArrayElement::updateCol4(Numeric *array, const std::vector<int> &index, Numeric *element, Numeric *outArray, unsigned int slice){
+void SetArrayElement::updateCol4(Numeric *array, NumericSpan<const int> index, Numeric *element, Numeric *outArray, unsigned int slice){
 	std::vector<Imath::Color4f> values = array->col4ValuesSlice(slice);
 	int valuesSize = array->sizeSlice(slice);
 	for(int i = 0; i < index.size(); ++i){
@@ -2250,7 +2252,7 @@ void SetArrayElement::updateCol4(Numeric *array, const std::vector<int> &index,
 	outArray->setCol4ValuesSlice(slice, values);
 }
 
-void SetArrayElement::updateMatrix44(Numeric *array, const std::vector<int> &index, Numeric *element, Numeric *outArray, unsigned int slice){
+void SetArrayElement::updateMatrix44(Numeric *array, NumericSpan<const int> index, Numeric *element, Numeric *outArray, unsigned int slice){
 	std::vector<Imath::M44f> values = array->matrix44ValuesSlice(slice);
 	int valuesSize = array->sizeSlice(slice);
 	for(int i = 0; i < index.size(); ++i){
@@ -2266,7 +2268,7 @@ void SetArrayElement::updateMatrix44(Numeric *array, const std::vector<int> &ind
 void SetArrayElement::updateSlice(Attribute *attribute, unsigned int slice){
 	if(_selectedOperation){
 		Numeric *array = _array->value();
-		const std::vector<int> &index = _index->value()->intValuesSlice(slice);
+		NumericSpan<const int> index = _index->value()->valuesSpanSlice<int>(slice);
 		Numeric *element = _element->value();
 		Numeric *outArray = _outArray->outValue();
 		
@@ -2299,60 +2301,26 @@ void SetSimulationStep::attributeSpecializationChanged(Attribute *attribute){
 		
 		Numeric::Type type = _data->outValue()->type();
 		if(type != Numeric::numericTypeAny){
-			if(type == Numeric::numericTypeInt || type == Numeric::numericTypeIntArray){
-				_selectedOperation = &SetSimulationStep::updateInt;
-			}
-			else if(type == Numeric::numericTypeFloat || type == Numeric::numericTypeFloatArray){
-				_selectedOperation = &SetSimulationStep::updateFloat;
-			}
-			else if(type == Numeric::numericTypeVec3 || type == Numeric::numericTypeVec3Array){
-				_selectedOperation = &SetSimulationStep::updateVec3;
-			}
-			else if(type == Numeric::numericTypeCol4 || type == Numeric::numericTypeCol4Array){
-				_selectedOperation = &SetSimulationStep::updateCol4;
-			}
-			else if(type == Numeric::numericTypeMatrix44 || type == Numeric::numericTypeMatrix44Array){
-				_selectedOperation = &SetSimulationStep::updateMatrix44;
-			}
-			else if(type == Numeric::numericTypeQuat || type == Numeric::numericTypeQuatArray){
-				_selectedOperation = &SetSimulationStep::updateQuat;
-			}
+			_selectedOperation = &SetSimulationStep::updateValues;
 		}
 	}
 }
 
-void SetSimulationStep::updateInt(const std::string &storageKey, Numeric *data, Numeric *result, unsigned int slice){
-	_globalNumericStorage[storageKey].setIntValuesSlice(slice, data->intValuesSlice(slice));
-	result->setIntValuesSlice(slice, data->intValuesSlice(slice));
-}
-
-void SetSimulationStep::updateFloat(const std::string &storageKey, Numeric *data, Numeric *result, unsigned int slice){
-	_globalNumericStorage[storageKey].setFloatValuesSlice(slice, data->floatValuesSlice(slice));
-	result->setFloatValuesSlice(slice, data->floatValuesSlice(slice));
-}
-
-void SetSimulationStep::updateVec3(const std::string &storageKey, Numeric *data, Numeric *result, unsigned int slice){
-	_globalNumericStorage[storageKey].setVec3ValuesSlice(slice, data->vec3ValuesSlice(slice));
-	result->setVec3ValuesSlice(slice, data->vec3ValuesSlice(slice));
-}
-
-void SetSimulationStep::updateCol4(const std::string &storageKey, Numeric *data, Numeric *result, unsigned int slice){
-	_globalNumericStorage[storageKey].setCol4ValuesSlice(slice, data->col4ValuesSlice(slice));
-	result->setCol4ValuesSlice(slice, data->col4ValuesSlice(slice));
-}
-
-void SetSimulationStep::updateMatrix44(const std::string &storageKey, Numeric *data, Numeric *result, unsigned int slice){
-	_globalNumericStorage[storageKey].setMatrix44ValuesSlice(slice, data->matrix44ValuesSlice(slice));
-	result->setMatrix44ValuesSlice(slice, data->matrix44ValuesSlice(slice));
-}
-
-void SetSimulationStep::updateQuat(const std::string &storageKey, Numeric *data, Numeric *result, unsigned int slice){
-	_globalNumericStorage[storageKey].setQuatValuesSlice(slice, data->quatValuesSlice(slice));
-	result->setQuatValuesSlice(slice, data->quatValuesSlice(slice));
+// storage and result share the values of data, nothing gets copied until one of them is modified.
+void SetSimulationStep::updateValues(const std::string &storageKey, Numeric *data, Numeric *result, unsigned int slice){
+	Numeric &storage = _globalNumericStorage[storageKey];
+	if(storage.type() != data->type()){
+		storage.setType(data->type());
+	}
+	
+	storage.copySlice(slice, data);
+	result->copySlice(slice, data);
 }
 
 void SetSimulationStep::resizedSlices(unsigned int slices){
-	_globalNumericStorage[_storageKey->value()->stringValue()].resizeSlices(slices);
+	Numeric &storage = _globalNumericStorage[_storageKey->value()->stringValue()];
+	storage.setType(_data->value()->type());
+	storage.resizeSlices(slices);
 }
 
 void SetSimulationStep::updateSlice(Attribute *attribute, unsigned int slice){
@@ -2398,79 +2366,17 @@ void GetSimulationStep::attributeSpecializationChanged(Attribute *attribute){
 		
 		Numeric::Type type = _source->outValue()->type();
 		if(type != Numeric::numericTypeAny){
-			if(type == Numeric::numericTypeInt || type == Numeric::numericTypeIntArray){
-				_selectedOperation = &GetSimulationStep::updateInt;
-			}
-			else if(type == Numeric::numericTypeFloat || type == Numeric::numericTypeFloatArray){
-				_selectedOperation = &GetSimulationStep::updateFloat;
-			}
-			else if(type == Numeric::numericTypeVec3 || type == Numeric::numericTypeVec3Array){
-				_selectedOperation = &GetSimulationStep::updateVec3;
-			}
-			else if(type == Numeric::numericTypeCol4 || type == Numeric::numericTypeCol4Array){
-				_selectedOperation = &GetSimulationStep::updateCol4;
-			}
-			else if(type == Numeric::numericTypeMatrix44 || type == Numeric::numericTypeMatrix44Array){
-				_selectedOperation = &GetSimulationStep::updateMatrix44;
-			}
-			else if(type == Numeric::numericTypeQuat || type == Numeric::numericTypeQuatArray){
-				_selectedOperation = &GetSimulationStep::updateQuat;
-			}
+			_selectedOperation = &GetSimulationStep::updateValues;
 		}
 	}
 }
 
-void GetSimulationStep::updateInt(const std::string &storageKey, int step, Numeric *source, Numeric *data, unsigned int slice){
-	if(step <= 0 || _globalNumericStorage.find(storageKey) == _globalNumericStorage.end()){
-		data->setIntValuesSlice(slice, source->intValuesSlice(slice));
-	}
-	else{
-		data->setIntValuesSlice(slice, _globalNumericStorage[storageKey].intValuesSlice(slice));
-	}
-}
-
-void GetSimulationStep::updateFloat(const std::string &storageKey, int step, Numeric *source, Numeric *data, unsigned int slice){
-	if(step <= 0 || _globalNumericStorage.find(storageKey) == _globalNumericStorage.end()){
-		data->setFloatValuesSlice(slice, source->floatValuesSlice(slice));
-	}
-	else{
-		data->setFloatValuesSlice(slice, _globalNumericStorage[storageKey].floatValuesSlice(slice));
-	}
-}
-
-void GetSimulationStep::updateVec3(const std::string &storageKey, int step, Numeric *source, Numeric *data, unsigned int slice){
-	if(step <= 0 || _globalNumericStorage.find(storageKey) == _globalNumericStorage.end()){
-		data->setVec3ValuesSlice(slice, source->vec3ValuesSlice(slice));
-	}
-	else{
-		data->setVec3ValuesSlice(slice, _globalNumericStorage[storageKey].vec3ValuesSlice(slice));
-	}
-}
-
-void GetSimulationStep::updateCol4(const std::string &storageKey, int step, Numeric *source, Numeric *data, unsigned int slice){
-	if(step <= 0 || _globalNumericStorage.find(storageKey) == _globalNumericStorage.end()){
-		data->setCol4ValuesSlice(slice, source->col4ValuesSlice(slice));
-	}
-	else{
-		data->setCol4ValuesSlice(slice, _globalNumericStorage[storageKey].col4ValuesSlice(slice));
-	}
-}
-
-void GetSimulationStep::updateMatrix44(const std::string &storageKey, int step, Numeric *source, Numeric *data, unsigned int slice){
-	if(step <= 0 || _globalNumericStorage.find(storageKey) == _globalNumericStorage.end()){
-		data->setMatrix44ValuesSlice(slice, source->matrix44ValuesSlice(slice));
-	}
-	else{
-		data->setMatrix44ValuesSlice(slice, _globalNumericStorage[storageKey].matrix44ValuesSlice(slice));
-	}
-}
-
-void GetSimulationStep::updateQuat(const std::string &storageKey, int step, Numeric *source, Numeric *data, unsigned int slice){
+void GetSimulationStep::updateValues(const std::string &storageKey, int step, Numeric *source, Numeric *data, unsigned int slice){
 	if(step <= 0 || _globalNumericStorage.find(storageKey) == _globalNumericStorage.end()){
-		data->setQuatValuesSlice(slice, source->quatValuesSlice(slice));
+		data->copySlice(slice, source);
 	}
 	else{
-		data->setQuatValuesSlice(slice, _globalNumericStorage[storageKey].quatValuesSlice(slice));
+		data->copySlice(slice, &_globalNumericStorage[storageKey]);
 	}
 }
 
@@ -2551,7 +2457,7 @@ void QuatToAxisAngle::updateSpecializationLink(Attribute *attributeA, Attribute
 
 void QuatToAxisAngle::updateSlice(Attribute *attribute, unsigned int slice)
 {
-	const std::vector<Imath::Quatf> &quatValues = _quat->value()->quatValuesSlice(slice);
+	NumericSpan<const Imath::Quatf> quatValues = _quat->value()->valuesSpanSlice<Imath::Quatf>(slice);
 	int size = quatValues.size();
 
 	std::vector<Imath::V3f> axisValues(size);
@@ -2622,7 +2528,7 @@ void QuatToEulerRotation::updateSpecializationLink(Attribute *attributeA, Attrib
 
 void QuatToEulerRotation::updateSlice(Attribute *attribute, unsigned int slice)
 {
-	const std::vector<Imath::Quatf> &quatValues = _quat->value()->quatValuesSlice(slice);
+	NumericSpan<const Imath::Quatf> quatValues = _quat->value()->valuesSpanSlice<Imath::Quatf>(slice);
 	int size = quatValues.size();
 
 	std::vector<Imath::V3f> eulerValues(size);
@@ -2697,7 +2603,7 @@ void QuatToMatrix44::updateSpecializationLink(Attribute *attributeA, Attribute *
 }
 
 void QuatToMatrix44::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<Imath::Quatf> &quatValues = _quat->value()->quatValuesSlice(slice);
+	NumericSpan<const Imath::Quatf> quatValues = _quat->value()->valuesSpanSlice<Imath::Quatf>(slice);
 	int size = quatValues.size();
 
 	std::vector<Imath::M44f> matrixValues(size);
@@ -2763,7 +2669,7 @@ void Matrix44ToQuat::updateSpecializationLink(Attribute *attributeA, Attribute *
 }
 
 void Matrix44ToQuat::updateSlice(Attribute *attribute, unsigned int slice){
-	const std::vector<Imath::M44f> &mtxValues = _matrix->value()->matrix44ValuesSlice(slice);
+	NumericSpan<const Imath::M44f> mtxValues = _matrix->value()->valuesSpanSlice<Imath::M44f>(slice);
 	int size = mtxValues.size();
 
 	std::vector<Imath::Quatf> quatValues(size);
@@ -334,13 +334,13 @@ private:
 	NumericAttribute *_array;
 	NumericAttribute *_index;
 	NumericAttribute *_element;
-	void(GetArrayElement::*_selectedOperation)(Numeric *, const std::vector<int> &, Numeric *, unsigned int);
+	void(GetArrayElement::*_selectedOperation)(Numeric *, NumericSpan<const int>, Numeric *, unsigned int);
 	
-	void updateInt(Numeric *array, const std::vector<int> &index, Numeric *element, unsigned int slice);
-	void updateFloat(Numeric *array, const std::vector<int> &index, Numeric *element, unsigned int slice);
-	void updateVec3(Numeric *array, const std::vector<int> &index, Numeric *element, unsigned int slice);
-	void updateCol4(Numeric *array, const std::vector<int> &index, Numeric *element, unsigned int slice);
-	void updateMatrix44(Numeric *array, const std::vector<int> &index, Numeric *element, unsigned int slice);
+	void updateInt(Numeric *array, NumericSpan<const int> index, Numeric *element, unsigned int slice);
+	void updateFloat(Numeric *array, NumericSpan<const int> index, Numeric *element, unsigned int slice);
+	void updateVec3(Numeric *array, NumericSpan<const int> index, Numeric *element, unsigned int slice);
+	void updateCol4(Numeric *array, NumericSpan<const int> index, Numeric *element, unsigned int slice);
+	void updateMatrix44(Numeric *array, NumericSpan<const int> index, Numeric *element, unsigned int slice);
 };
 
 class SetArrayElement: public Node{
@@ -355,13 +355,13 @@ private:
 	NumericAttribute *_index;
 	NumericAttribute *_element;
 	NumericAttribute *_outArray;
-	void(SetArrayElement::*_selectedOperation)(Numeric *, const std::vector<int> &, Numeric *, Numeric *, unsigned int);
+	void(SetArrayElement::*_selectedOperation)(Numeric *, NumericSpan<const int>, Numeric *, Numeric *, unsigned int);
 
-	void updateInt(Numeric *array, const std::vector<int> &index, Numeric *element, Numeric *outArray, unsigned int slice);
-	void updateFloat(Numeric *array, const std::vector<int> &index, Numeric *element, Numeric *outArray, unsigned int slice);
-	void updateVec3(Numeric *array, const std::vector<int> &index, Numeric *element, Numeric *outArray, unsigned int slice);
-	void updateCol4(Numeric *array, const std::vector<int> &index, Numeric *element, Numeric *outArray, unsigned int slice);
-	void updateMatrix44(Numeric *array, const std::vector<int> &index, Numeric *element, Numeric *outArray, unsigned int slice);
+	void updateInt(Numeric *array, NumericSpan<const int> index, Numeric *element, Numeric *outArray, unsigned int slice);
+	void updateFloat(Numeric *array, NumericSpan<const int> index, Numeric *element, Numeric *outArray, unsigned int slice);
+	void updateVec3(Numeric *array, NumericSpan<const int> index, Numeric *element, Numeric *outArray, unsigned int slice);
+	void updateCol4(Numeric *array, NumericSpan<const int> index, Numeric *element, Numeric *outArray, unsigned int slice);
+	void updateMatrix44(Numeric *array, NumericSpan<const int> index, Numeric *element, Numeric *outArray, unsigned int slice);
 };
 
 class SetSimulationStep: public Node{
@@ -378,12 +378,7 @@ private:
 	NumericAttribute *_result;
 	void(SetSimulationStep::*_selectedOperation)(const std::string &, Numeric *, Numeric *, unsigned int );
 
-	void updateInt(const std::string &storageKey, Numeric *data, Numeric *result, unsigned int slice);
-	void updateFloat(const std::string &storageKey, Numeric *data, Numeric *result, unsigned int slice);
-	void updateVec3(const std::string &storageKey, Numeric *data, Numeric *result, unsigned int slice);
-	void updateCol4(const std::string &storageKey, Numeric *data, Numeric *result, unsigned int slice);
-	void updateMatrix44(const std::string &storageKey, Numeric *data, Numeric *result, unsigned int slice);
-	void updateQuat(const std::string &storageKey, Numeric *data, Numeric *result, unsigned int slice);
+	void updateValues(const std::string &storageKey, Numeric *data, Numeric *result, unsigned int slice);
 };
 
 class GetSimulationStep: public Node{
@@ -399,12 +394,7 @@ private:
 	NumericAttribute *_data;
 	void(GetSimulationStep::*_selectedOperation)(const std::string &, int, Numeric *, Numeric *, unsigned int);
 
-	void updateInt(const std::string &storageKey, int step, Numeric *source, Numeric *data, unsigned int slice);
-	void updateFloat(const std::string &storageKey, int step, Numeric *source, Numeric *data, unsigned int slice);
-	void updateVec3(const std::string &storageKey, int step, Numeric *source, Numeric *data, unsigned int slice);
-	void updateCol4(const std::string &storageKey, int step, Numeric *source, Numeric *data, unsigned int slice);
-	void updateMatrix44(const std::string &storageKey, int step, Numeric *source, Numeric *data, unsigned int slice);
-	void updateQuat(const std::string &storageKey, int step, Numeric *source, Numeric *data, unsigned int slice);
+	void updateValues(const std::string &storageKey, int step, Numeric *source, Numeric *data, unsigned int slice);
 };
 
 class QuatToAxisAngle: public Node
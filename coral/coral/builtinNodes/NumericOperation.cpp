@@ -43,48 +43,33 @@ namespace{
 	Numeric::Type numeric_type_col4_array = Numeric::numericTypeCol4Array;
 	Numeric::Type numeric_type_matrix44 = Numeric::numericTypeMatrix44;
 	Numeric::Type numeric_type_matrix44_array = Numeric::numericTypeMatrix44Array;
-
-	template<class type>
-	unsigned int getSliceInBounds(std::vector<std::vector<type> > &vec, unsigned int slice){
-		unsigned int size = vec.size();
-		if(slice >= size){
-			return size - 1;
-		}
-
-		return slice;
-	}
 }
 
 #define DEFINE_NUMERIC_OPERATION(operation, typeA, typeB) \
-	void NumericOperation::operation_##operation##_##typeA##_##typeB##_array_to_array(Numeric *operandA, Numeric *operandB, Numeric *result, unsigned int slice){ \
-		unsigned int sliceA = getSliceInBounds<typeA>(operandA->_##typeA##ValuesSliced, slice); \
-		unsigned int sliceB = getSliceInBounds<typeB>(operandB->_##typeB##ValuesSliced, slice); \
-		numericOperation_##operation##ArrayToArray<typeA, typeB>(operandA->_##typeA##ValuesSliced[sliceA], operandB->_##typeB##ValuesSliced[sliceB], result->_##typeA##ValuesSliced[slice]); \
+	void NumericOperation::operation_##operation##_##typeA##_##typeB##_array_to_array(Numeric *operandA, Numeric *operandB, Numeric *result, unsigned int slice, unsigned int grainSize){ \
+		numericOperation_arrayToArray<typeA, typeB, numericOperation_##operation>(operandA->valuesSpanSlice<typeA>(slice), operandB->valuesSpanSlice<typeB>(slice), result, slice, grainSize); \
 	} \
-	void NumericOperation::operation_##operation##_##typeA##_##typeB##_single_to_array(Numeric *operandA, Numeric *operandB, Numeric *result, unsigned int slice){ \
-		unsigned int sliceA = getSliceInBounds<typeA>(operandA->_##typeA##ValuesSliced, slice); \
-		unsigned int sliceB = getSliceInBounds<typeB>(operandB->_##typeB##ValuesSliced, slice); \
-		numericOperation_##operation##SingleToArray<typeA, typeB>(operandA->_##typeA##ValuesSliced[sliceA], operandB->_##typeB##ValuesSliced[sliceB], result->_##typeA##ValuesSliced[slice]); \
+	void NumericOperation::operation_##operation##_##typeA##_##typeB##_single_to_array(Numeric *operandA, Numeric *operandB, Numeric *result, unsigned int slice, unsigned int grainSize){ \
+		numericOperation_singleToArray<typeA, typeB, numericOperation_##operation>(operandA->valuesSpanSlice<typeA>(slice), operandB->valuesSpanSlice<typeB>(slice), result, slice, grainSize); \
 	} \
-	void NumericOperation::operation_##operation##_##typeA##_##typeB##_array_to_single(Numeric *operandA, Numeric *operandB, Numeric *result, unsigned int slice){ \
-		unsigned int sliceA = getSliceInBounds<typeA>(operandA->_##typeA##ValuesSliced, slice); \
-		unsigned int sliceB = getSliceInBounds<typeB>(operandB->_##typeB##ValuesSliced, slice); \
-		numericOperation_##operation##ArrayToSingle<typeA, typeB>(operandA->_##typeA##ValuesSliced[sliceA], operandB->_##typeB##ValuesSliced[sliceB], result->_##typeA##ValuesSliced[slice]); \
+	void NumericOperation::operation_##operation##_##typeA##_##typeB##_array_to_single(Numeric *operandA, Numeric *operandB, Numeric *result, unsigned int slice, unsigned int grainSize){ \
+		numericOperation_arrayToSingle<typeA, typeB, numericOperation_##operation>(operandA->valuesSpanSlice<typeA>(slice), operandB->valuesSpanSlice<typeB>(slice), result, slice, grainSize); \
 	} \
 
 #define DEFINE_PASSTRHOUGH_OPERATION(type) \
-	void NumericOperation::operation_##type##_passThrough(Numeric *operandA, Numeric *operandB, Numeric *result, unsigned int slice){ \
-		unsigned int sliceA = getSliceInBounds<type>(operandA->_##type##ValuesSliced, slice); \
-		numericOperation_passThrough<type>(operandA->_##type##ValuesSliced[sliceA], result->_##type##ValuesSliced[slice]); \
+	void NumericOperation::operation_##type##_passThrough(Numeric *operandA, Numeric *operandB, Numeric *result, unsigned int slice, unsigned int grainSize){ \
+		numericOperation_passThrough<type>(operandA, result, slice); \
 	} \
 
 #define SELECT_NUMERIC_OPERATION(operation, typeNameA, typeNameB) \
 	if(typeA == numeric_type_##typeNameA && typeB == numeric_type_##typeNameB){ \
 		_selectedOperation = &NumericOperation::operation_##operation##_##typeNameA##_##typeNameB##_array_to_single; return;} \
 	if(typeA == numeric_type_##typeNameA##_array && typeB == numeric_type_##typeNameB){ \
-		_selectedOperation = &NumericOperation::operation_##operation##_##typeNameA##_##typeNameB##_array_to_single; return;} \
+		_selectedOperation = &NumericOperation::operation_##operation##_##typeNameA##_##typeNameB##_array_to_single; \
+		_selectedFusionKernel = &arrayFusion_binaryKernel<typeNameA, typeNameB, typeNameA, numericOperation_function<typeNameA, typeNameB, numericOperation_##operation> >; return;} \
 	if(typeA == numeric_type_##typeNameA##_array && typeB == numeric_type_##typeNameB##_array){ \
-		_selectedOperation = &NumericOperation::operation_##operation##_##typeNameA##_##typeNameB##_array_to_array; return;} \
+		_selectedOperation = &NumericOperation::operation_##operation##_##typeNameA##_##typeNameB##_array_to_array; \
+		_selectedFusionKernel = &arrayFusion_binaryKernel<typeNameA, typeNameB, typeNameA, numericOperation_function<typeNameA, typeNameB, numericOperation_##operation> >; return;} \
 	if(typeA == numeric_type_##typeNameA && typeB == numeric_type_##typeNameB##_array){ \
 		_selectedOperation = &NumericOperation::operation_##operation##_##typeNameA##_##typeNameB##_single_to_array; return;} \
 
@@ -103,7 +88,8 @@ namespace{
 		return true; \
 
 NumericOperation::NumericOperation():
-	_selectedOperation(0){
+	_selectedOperation(0),
+	_selectedFusionKernel(0){
 }
 
 bool NumericOperation::allowOperation(Operation operation, Numeric::Type typeA, Numeric::Type typeB){	
@@ -207,9 +193,9 @@ void NumericOperation::selectOperands(Numeric::Type typeA, Numeric::Type typeB){
 	}
 }
 
-void NumericOperation::executeSelectedOperation(Numeric *operandA, Numeric *operandB, Numeric *out, unsigned int slice){
+void NumericOperation::executeSelectedOperation(Numeric *operandA, Numeric *operandB, Numeric *out, unsigned int slice, unsigned int grainSize){
 	if(_selectedOperation){
-		(this->*_selectedOperation)(operandA, operandB, out, slice);
+		(this->*_selectedOperation)(operandA, operandB, out, slice, grainSize);
 	}
 }
 
@@ -31,14 +31,15 @@
 
 #include <vector>
 #include "../src/Numeric.h"
+#include "../src/ArrayFusion.h"
 
 #define DECLARE_NUMERIC_OPERATION(operation, typeA, typeB) \
-	void operation_##operation##_##typeA##_##typeB##_array_to_array(Numeric *operandA, Numeric *operandB, Numeric *result, unsigned int slice); \
-	void operation_##operation##_##typeA##_##typeB##_single_to_array(Numeric *operandA, Numeric *operandB, Numeric *result, unsigned int slice); \
-	void operation_##operation##_##typeA##_##typeB##_array_to_single(Numeric *operandA, Numeric *operandB, Numeric *result, unsigned int slice) \
+	void operation_##operation##_##typeA##_##typeB##_array_to_array(Numeric *operandA, Numeric *operandB, Numeric *result, unsigned int slice, unsigned int grainSize); \
+	void operation_##operation##_##typeA##_##typeB##_single_to_array(Numeric *operandA, Numeric *operandB, Numeric *result, unsigned int slice, unsigned int grainSize); \
+	void operation_##operation##_##typeA##_##typeB##_array_to_single(Numeric *operandA, Numeric *operandB, Numeric *result, unsigned int slice, unsigned int grainSize) \
 
 #define DECLARE_PASSTRHOUGH_OPERATION(type) \
-	void operation_##type##_passThrough(Numeric *operandA, Numeric *operandB, Numeric *result, unsigned int slice); \
+	void operation_##type##_passThrough(Numeric *operandA, Numeric *operandB, Numeric *result, unsigned int slice, unsigned int grainSize); \
 
 namespace coral{
 
@@ -53,10 +54,16 @@ public:
 	
 	NumericOperation();
 	void selectOperands(Numeric::Type typeA, Numeric::Type typeB);
-	void executeSelectedOperation(Numeric *operandA, Numeric *operandB, Numeric *out, unsigned int slice);
+	void executeSelectedOperation(Numeric *operandA, Numeric *operandB, Numeric *out, unsigned int slice, unsigned int grainSize);
 	
 	void clearSelectedOperation(){
 		_selectedOperation = 0;
+		_selectedFusionKernel = 0;
+	}
+	
+	//! The element wise kernel of the selected operation when it maps an array on an array or on a single value, 0 otherwise.
+	ArrayFusionKernel selectedFusionKernel(){
+		return _selectedFusionKernel;
 	}
 	
 	bool operationSelected(){
@@ -79,7 +86,8 @@ public:
 	static bool allowOperation(Operation operation, Numeric::Type typeA, Numeric::Type typeB);
 	
 private:
-	void(NumericOperation::*_selectedOperation)(Numeric*, Numeric*, Numeric*, unsigned int);
+	void(NumericOperation::*_selectedOperation)(Numeric*, Numeric*, Numeric*, unsigned int, unsigned int);
+	ArrayFusionKernel _selectedFusionKernel;
 	Operation _operation;
 	
 	DECLARE_NUMERIC_OPERATION(add, int, int);
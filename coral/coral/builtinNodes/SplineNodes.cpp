@@ -149,7 +149,7 @@ float SplinePoint::basis(int i, int degree, float param, const std::vector<float
 	return ret;
 }
 
-void SplinePoint::pointOnBezier(float param, int degree, const std::vector<Imath::V3f> &cvs, const std::vector<float> &knots, Imath::V3f &outPoint){
+void SplinePoint::pointOnBezier(float param, int degree, NumericSpan<const Imath::V3f> cvs, const std::vector<float> &knots, Imath::V3f &outPoint){
 	if(param <= 0.0){
 		outPoint = cvs[0];
 		return;
@@ -189,7 +189,7 @@ void SplinePoint::evalCatmull(const Imath::V3f &point0, const Imath::V3f &point1
 	result.z = point0.z * f1 + point1.z * f2 + point2.z * f3 + point3.z * f4;
 }
 
-void SplinePoint::pointOnCatmull(float param, const std::vector<Imath::V3f> &cvs, const Imath::V3f &firstPoint, const Imath::V3f &lastPoint, Imath::V3f &result){
+void SplinePoint::pointOnCatmull(float param, NumericSpan<const Imath::V3f> cvs, const Imath::V3f &firstPoint, const Imath::V3f &lastPoint, Imath::V3f &result){
 	if(param <= 0.0){
 		result = cvs[0];
 		return;
@@ -217,8 +217,8 @@ void SplinePoint::pointOnCatmull(float param, const std::vector<Imath::V3f> &cvs
 }
 
 void SplinePoint::updateArray(){
-	const std::vector<float> &params = _param->value()->floatValues();
-	const std::vector<Imath::V3f> &cvs = _controlPoints->value()->vec3Values();
+	NumericSpan<const float> params = _param->value()->valuesSpanSlice<float>(0);
+	NumericSpan<const Imath::V3f> cvs = _controlPoints->value()->valuesSpanSlice<Imath::V3f>(0);
 	
 	int paramsSize = params.size();
 	int cvsSize = cvs.size();
@@ -252,7 +252,7 @@ void SplinePoint::updateArray(){
 
 void SplinePoint::updateSingle(){
 	int curveType = _curveType->value()->currentIndex();
-	const std::vector<Imath::V3f> &cvs = _controlPoints->value()->vec3Values();
+	NumericSpan<const Imath::V3f> cvs = _controlPoints->value()->valuesSpanSlice<Imath::V3f>(0);
 	float param = _param->value()->floatValueAt(0);
 
 	int cvsSize = cvs.size();
@@ -57,8 +57,8 @@ private:
 	void updateArray();
 	void updateSingle();
 	void updateKnots();
-	void pointOnBezier(float param, int degree, const std::vector<Imath::V3f> &cvs, const std::vector<float> &knots, Imath::V3f &outPoint);
-	void pointOnCatmull(float param, const std::vector<Imath::V3f> &cvs, const Imath::V3f &firstPoint, const Imath::V3f &lastPoint, Imath::V3f &result);
+	void pointOnBezier(float param, int degree, NumericSpan<const Imath::V3f> cvs, const std::vector<float> &knots, Imath::V3f &outPoint);
+	void pointOnCatmull(float param, NumericSpan<const Imath::V3f> cvs, const Imath::V3f &firstPoint, const Imath::V3f &lastPoint, Imath::V3f &result);
 	void evalCatmull(const Imath::V3f &point0, const Imath::V3f &point1, const Imath::V3f &point2, const Imath::V3f &point3, float u, Imath::V3f &result);
 	float basis(int i, int degree, float param, const std::vector<float> &knots);
 };
@@ -30,6 +30,7 @@
 #define CORAL_NUMERICOPERATIONS_H
 
 #include "../src/Numeric.h"
+#include "../src/ParallelArrays.h"
 
 typedef Imath::V3f vec3;
 typedef Imath::Color4f col4;
@@ -37,182 +38,137 @@ typedef Imath::M44f matrix44;
 
 using namespace coral;
 
-template <class type>
-void numericOperation_passThrough(const std::vector<type> &containerA, std::vector<type> &resultContainer){
-	resultContainer = containerA;
-}
-
-template <class TypeA, class TypeB>
-void numericOperation_addArrayToSingle(const std::vector<TypeA> &containerA, const std::vector<TypeB> &containerB, std::vector<TypeA> &resultContainer){
-	if(containerB.size()){
-		resultContainer.resize(containerA.size());
-
-		const TypeB &valueB = containerB[0];
-		for(int i = 0; i < containerA.size(); ++i){
-			resultContainer[i] = containerA[i] + valueB;
-		}
-	}
-}
+// The operations read the operands straight from their slices and write the result slice in place,
+// element wise operations run as kernels that ParallelArrays splits in ranges once the arrays exceed the grain size.
 
-template <class TypeA, class TypeB>
-void numericOperation_addArrayToArray(const std::vector<TypeA> &containerA, const std::vector<TypeB> &containerB, std::vector<TypeA> &resultContainer){
-	int sizeA = containerA.size();
-	int sizeB = containerB.size();
-	
-	int minorSize = sizeA;
-	if(sizeB < sizeA){
-		minorSize = sizeB;
+struct numericOperation_add{
+	template <class TypeA, class TypeB>
+	static TypeA apply(const TypeA &valueA, const TypeB &valueB){
+		return valueA + valueB;
 	}
-	
-	resultContainer.resize(minorSize);
+};
 
-	for(int i = 0; i < minorSize; ++i){
-		resultContainer[i] = containerA[i] + containerB[i];
+struct numericOperation_sub{
+	template <class TypeA, class TypeB>
+	static TypeA apply(const TypeA &valueA, const TypeB &valueB){
+		return valueA - valueB;
 	}
-}
+};
 
-template <class TypeA, class TypeB>
-void numericOperation_addSingleToArray(const std::vector<TypeA> &containerA, const std::vector<TypeB> &containerB, std::vector<TypeA> &resultContainer){
-	if(containerA.size()){
-		TypeA valueA = containerA[0];
-		resultContainer.resize(1);
-		
-		for(int i = 0; i < containerB.size(); ++i){
-			valueA += containerB[i];
-		}
-		
-		resultContainer[0] = valueA;
+struct numericOperation_mul{
+	template <class TypeA, class TypeB>
+	static TypeA apply(const TypeA &valueA, const TypeB &valueB){
+		return valueA * valueB;
 	}
-}
+};
 
-template <class TypeA, class TypeB>
-void numericOperation_subArrayToSingle(const std::vector<TypeA> &containerA, const std::vector<TypeB> &containerB, std::vector<TypeA> &resultContainer){
-	if(containerB.size()){
-		resultContainer.resize(containerA.size());
-
-		const TypeB &valueB = containerB[0];
-		for(int i = 0; i < containerA.size(); ++i){
-			resultContainer[i] = containerA[i] - valueB;
-		}
+struct numericOperation_div{
+	template <class TypeA, class TypeB>
+	static TypeA apply(const TypeA &valueA, const TypeB &valueB){
+		return valueA / valueB;
 	}
-}
+};
 
-template <class TypeA, class TypeB>
-void numericOperation_subSingleToArray(const std::vector<TypeA> &containerA, const std::vector<TypeB> &containerB, std::vector<TypeA> &resultContainer){
-	if(containerA.size()){
-		TypeA valueA = containerA[0];
-		resultContainer.resize(1);
-		
-		for(int i = 0; i < containerB.size(); ++i){
-			valueA -= containerB[i];
-		}
-		
-		resultContainer[0] = valueA;
+// Wraps an operator as the function object applied by the ArrayFusion kernels.
+template <class TypeA, class TypeB, class Operator>
+struct numericOperation_function{
+	TypeA operator() (const TypeA &valueA, const TypeB &valueB) const{
+		return Operator::apply(valueA, valueB);
 	}
-}
+};
 
-template <class TypeA, class TypeB>
-void numericOperation_subArrayToArray(const std::vector<TypeA> &containerA, const std::vector<TypeB> &containerB, std::vector<TypeA> &resultContainer){
-	int sizeA = containerA.size();
-	int sizeB = containerB.size();
-	
-	int minorSize = sizeA;
-	if(sizeB < sizeA){
-		minorSize = sizeB;
+template <class TypeA, class TypeB, class Operator>
+class numericOperation_arrayToArrayKernel{
+public:
+	numericOperation_arrayToArrayKernel(const TypeA *valuesA, const TypeB *valuesB, TypeA *result): 
+		_valuesA(valuesA), 
+		_valuesB(valuesB), 
+		_result(result){
 	}
 	
-	resultContainer.resize(minorSize);
-	
-	for(int i = 0; i < minorSize; ++i){
-		resultContainer[i] = containerA[i] - containerB[i];
-	}
-}
-
-template <class TypeA, class TypeB>
-void numericOperation_mulArrayToSingle(const std::vector<TypeA> &containerA, const std::vector<TypeB> &containerB, std::vector<TypeA> &resultContainer){
-	if(containerB.size()){
-		resultContainer.resize(containerA.size());
-		
-		const TypeB &valueB = containerB[0];
-		for(int i = 0; i < containerA.size(); ++i){
-			resultContainer[i] = containerA[i] * valueB;
+	void operator() (unsigned int begin, unsigned int end) const{
+		const TypeA *CORAL_RESTRICT valuesA = _valuesA;
+		const TypeB *CORAL_RESTRICT valuesB = _valuesB;
+		TypeA *CORAL_RESTRICT result = _result;
+		for(unsigned int i = begin; i < end; ++i){
+			result[i] = Operator::apply(valuesA[i], valuesB[i]);
 		}
 	}
-}
 
-template <class TypeA, class TypeB>
-void numericOperation_mulSingleToArray(const std::vector<TypeA> &containerA, const std::vector<TypeB> &containerB, std::vector<TypeA> &resultContainer){
-	if(containerA.size()){
-		TypeA valueA = containerA[0];
-		resultContainer.resize(1);
-		
-		for(int i = 0; i < containerB.size(); ++i){
-			valueA *= containerB[i];
-		}
-		
-		resultContainer[0] = valueA;
-	}
-}
+private:
+	const TypeA *_valuesA;
+	const TypeB *_valuesB;
+	TypeA *_result;
+};
 
-template <class TypeA, class TypeB>
-void numericOperation_mulArrayToArray(const std::vector<TypeA> &containerA, const std::vector<TypeB> &containerB, std::vector<TypeA> &resultContainer){
-	int sizeA = containerA.size();
-	int sizeB = containerB.size();
-	
-	int minorSize = sizeA;
-	if(sizeB < sizeA){
-		minorSize = sizeB;
+template <class TypeA, class TypeB, class Operator>
+class numericOperation_arrayToSingleKernel{
+public:
+	numericOperation_arrayToSingleKernel(const TypeA *valuesA, const TypeB &valueB, TypeA *result): 
+		_valuesA(valuesA), 
+		_valueB(valueB), 
+		_result(result){
 	}
 	
-	resultContainer.resize(minorSize);
-	
-	for(int i = 0; i < minorSize; ++i){
-		resultContainer[i] = containerA[i] * containerB[i];
+	void operator() (unsigned int begin, unsigned int end) const{
+		const TypeA *CORAL_RESTRICT valuesA = _valuesA;
+		const TypeB valueB = _valueB;
+		TypeA *CORAL_RESTRICT result = _result;
+		for(unsigned int i = begin; i < end; ++i){
+			result[i] = Operator::apply(valuesA[i], valueB);
+		}
 	}
+
+private:
+	const TypeA *_valuesA;
+	const TypeB _valueB;
+	TypeA *_result;
+};
+
+// The result shares the values of operandA until one of the two is modified.
+template <class type>
+void numericOperation_passThrough(Numeric *operandA, Numeric *result, unsigned int slice){
+	result->copySlice(slice, operandA);
 }
 
-template <class TypeA, class TypeB>
-void numericOperation_divArrayToSingle(const std::vector<TypeA> &containerA, const std::vector<TypeB> &containerB, std::vector<TypeA> &resultContainer){
+template <class TypeA, class TypeB, class Operator>
+void numericOperation_arrayToSingle(const NumericSpan<const TypeA> &containerA, const NumericSpan<const TypeB> &containerB, Numeric *result, unsigned int slice, unsigned int grainSize){
 	if(containerB.size()){
-		resultContainer.resize(containerA.size());
+		NumericSpan<TypeA> resultContainer = result->resizeValuesSpanSlice<TypeA>(slice, containerA.size());
 		
-		const TypeB &valueB = containerB[0];
-		for(int i = 0; i < containerA.size(); ++i){
-			resultContainer[i] = containerA[i] / valueB;
-		}
+		numericOperation_arrayToSingleKernel<TypeA, TypeB, Operator> kernel(containerA.data(), containerB[0], resultContainer.data());
+		ParallelArrays::forEachRange(resultContainer.size(), grainSize, kernel);
 	}
 }
 
-template <class TypeA, class TypeB>
-void numericOperation_divSingleToArray(const std::vector<TypeA> &containerA, const std::vector<TypeB> &containerB, std::vector<TypeA> &resultContainer){
+// Accumulates the whole array on the single value, this runs serially to keep the order of the operations.
+template <class TypeA, class TypeB, class Operator>
+void numericOperation_singleToArray(const NumericSpan<const TypeA> &containerA, const NumericSpan<const TypeB> &containerB, Numeric *result, unsigned int slice, unsigned int grainSize){
 	if(containerA.size()){
 		TypeA valueA = containerA[0];
-		resultContainer.resize(1);
 		
 		for(int i = 0; i < containerB.size(); ++i){
-			valueA /= containerB[i];
+			valueA = Operator::apply(valueA, containerB[i]);
 		}
 		
-		resultContainer[0] = valueA;
+		NumericSpan<TypeA> resultContainer = result->resizeValuesSpanSlice<TypeA>(slice, 1);
+		if(resultContainer.size()){
+			resultContainer[0] = valueA;
+		}
 	}
 }
 
-template <class TypeA, class TypeB>
-void numericOperation_divArrayToArray(const std::vector<TypeA> &containerA, const std::vector<TypeB> &containerB, std::vector<TypeA> &resultContainer){
-	int sizeA = containerA.size();
-	int sizeB = containerB.size();
-	
-	int minorSize = sizeA;
-	if(sizeB < sizeA){
-		minorSize = sizeB;
+template <class TypeA, class TypeB, class Operator>
+void numericOperation_arrayToArray(const NumericSpan<const TypeA> &containerA, const NumericSpan<const TypeB> &containerB, Numeric *result, unsigned int slice, unsigned int grainSize){
+	unsigned int minorSize = containerA.size();
+	if(containerB.size() < minorSize){
+		minorSize = containerB.size();
 	}
 	
-	resultContainer.resize(minorSize);
+	NumericSpan<TypeA> resultContainer = result->resizeValuesSpanSlice<TypeA>(slice, minorSize);
 	
-	for(int i = 0; i < minorSize; ++i){
-		resultContainer[i] = containerA[i] / containerB[i];
-	}
+	numericOperation_arrayToArrayKernel<TypeA, TypeB, Operator> kernel(containerA.data(), containerB.data(), resultContainer.data());
+	ParallelArrays::forEachRange(resultContainer.size(), grainSize, kernel);
 }
 
 #endif
-
@@ -0,0 +1,46 @@
+# <license>
+# Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+# This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+# 
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+# 
+#    * Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# </license>
+
+
+import _coral
+
+## Base class for python nodes computing whole arrays of values.
+# Reimplement compute(attribute, inputs) instead of update(attribute):
+# inputs has an entry per input attribute, a list of read-only numpy arrays (one per slice) for Numeric inputs,
+# the value itself for any other input and None for inputs not affecting attribute.
+# compute returns a single array for all the slices, a list of arrays (one per slice) or None when it sets the output itself.
+# The GIL is taken once per evaluation rather than once per slice.
+#@implements Node
+class ArrayNode(_coral.Node):
+    def __init__(self, name, parent):
+        _coral.Node.__init__(self, name, parent)
+        
+        self._setArrayCompute(True)
+    
+    def compute(self, attribute, inputs):
+        return None
@@ -60,6 +60,7 @@ class CoralAppData:
     autoLoadPaths = []
     instantiatedNodes = []
     loadingNetwork = False
+    loadingNetworkDepth = 0
     registeredNodeDescriptions = {}
     appendToLastCreatedNodes = False
     lastCreatedNodes = []
@@ -70,6 +71,7 @@ class CoralAppData:
     registeredNodeClassesObservers = ObserverCollector()
     createdNodeObservers = ObserverCollector()
     deletingNodeObservers = ObserverCollector()
+    deletingNodesObservers = ObserverCollector()
     connectedAttributesObservers = ObserverCollector()
     disconnectedInputObservers = ObserverCollector()
     attributeSpecializedObservers = ObserverCollector()
@@ -317,6 +319,18 @@ def addDeletingNodeObserver(observer, callback):
     CoralAppData.deletingNodeObservers.add(observer)
     observer.setNotificationCallback(callback)
 
+def _notifyDeletingNodesObservers(nodes):
+    nodeIds = [node.id() for node in nodes]
+    for observer in CoralAppData.deletingNodesObservers.observers():
+        observer.setData("nodeIds", nodeIds)
+        observer.notify()
+
+def addDeletingNodesObserver(observer, callback):
+    # notified once for every bulk deletion (see deleteNodes), nodeIds lists every node going away including the nested ones.
+    # Observers added with addDeletingNodeObserver are notified for each of those nodes too.
+    CoralAppData.deletingNodesObservers.add(observer)
+    observer.setNotificationCallback(callback)
+
 def _notifyCreatedNodeObservers(node):
     for observer in CoralAppData.createdNodeObservers.observers():
         observer.setData("nodeId", node.id())
@@ -436,40 +450,21 @@ def createAttribute(className, name, parent, input = False, output = False):
 def rootNode():
     return CoralAppData.rootNode
 
-def findNode(fullName):
-    names = fullName.split(".")
-    firstName = names.pop(0)
-    
-    node = None
-    if firstName == rootNode().name():
-        node = rootNode()
-        for name in names:
-            node = node.findNode(name)
-        
-            if node is None:
-                break
-    
-    return node
-
-def findAttribute(fullName):
-    names = fullName.split(".")
-    attrName = names.pop(-1)
-    
-    fullNodeName = ".".join(names)
-    node = findNode(fullNodeName)
+def _findObjectUnderRoot(fullName):
+    # the full name index is shared by every hierarchy, when it resolves to an object living outside of the current root 
+    # the name is walked one level at a time, each level being a lookup in the index restricted to the children of the level above.
+    root = rootNode()
+    if fullName == root.name():
+        return root
     
-    attribute = None
-    if node:
-        attribute = node.findAttribute(attrName)
+    object = _coral.NetworkManager.findObjectByFullName(fullName)
+    if object is not None and object.isChildOf(root):
+        return object
     
-    return attribute
-
-def findObject(fullName):
     names = fullName.split(".")
     rootName = names.pop(0)
-
+    
     object = None
-    root = rootNode()
     if rootName == root.name():
         object = root
         for name in names:
@@ -480,6 +475,23 @@ def findObject(fullName):
     
     return object
 
+def findNode(fullName):
+    node = _findObjectUnderRoot(fullName)
+    if not isinstance(node, _coral.Node):
+        node = None
+    
+    return node
+
+def findAttribute(fullName):
+    attribute = _findObjectUnderRoot(fullName)
+    if not isinstance(attribute, _coral.Attribute):
+        attribute = None
+    
+    return attribute
+
+def findObject(fullName):
+    return _findObjectUnderRoot(fullName)
+
 def findObjectById(id):
     return _coral.NetworkManager.findObjectById(id)
 
@@ -513,10 +525,13 @@ def init():
     _coral.setCallback("node_addOutputAttribute", _node_addOutputAttribute)
     _coral.setCallback("node_removeAttribute", _node_removeAttribute)
     _coral.setCallback("node_deleteIt", _node_deleteIt)
+    _coral.setCallback("networkManager_deleteNodes", _networkManager_deleteNodes)
     _coral.setCallback("node_connectionChanged", _node_connectionChanged)
     _coral.setCallback("attribute_deleteIt", _attribute_deleteIt)
     _coral.setCallback("nestedObject_setName", _nestedobject_setName)
     _coral.setCallback("attribute_specialization", _attribute_specialization)
+    _coral.setCallback("networkFile_createNode", createNode)
+    _coral.setCallback("networkFile_createAttribute", createAttribute)
 
 
     if os.environ.has_key("CORAL_PLUGINS_PATH"):
@@ -541,6 +556,17 @@ def _node_deleteIt(node):
         
     _notifyDeletingNodeObservers(node)
 
+def _networkManager_deleteNodes(nodes):
+    deletedIds = set([node.id() for node in nodes])
+    CoralAppData.instantiatedNodes = [nodeRef for nodeRef in CoralAppData.instantiatedNodes if nodeRef() is None or nodeRef().id() not in deletedIds]
+    
+    _notifyDeletingNodesObservers(nodes)
+    
+    # observers of single deletions still hear about every node
+    if CoralAppData.deletingNodeObservers.observers():
+        for node in nodes:
+            _notifyDeletingNodeObservers(node)
+
 def _node_addOutputAttribute(parentNode, attributeAdded):
     _notifyAddedAttributeObservers(parentNode, attributeAdded, output = True)
 
@@ -634,6 +660,7 @@ def finalize():
     _coral.setCallback("node_addInputAttribute", None)
     _coral.setCallback("node_addOutputAttribute", None)
     _coral.setCallback("node_deleteIt", None)
+    _coral.setCallback("networkManager_deleteNodes", None)
     _coral.setCallback("attribute_deleteIt", None)
     _coral.setCallback("nestedObject_setName", None)
     _coral.setCallback("attribute_specialization", None)
@@ -642,6 +669,9 @@ def finalize():
     CoralAppData.rootNode.deleteIt()
     CoralAppData.rootNode = None
     
+    clearOutputCache()
+    clearFusedArrayChains()
+    
 def _setClassNameTag(className, tag):
     if CoralAppData.classNameTags.has_key(tag) == False:
         CoralAppData.classNameTags[tag] = []
@@ -786,8 +816,9 @@ def executeCommand(cmdName, **args):
     return _executeCommand(cmdName, False, **args)
 
 def deleteNodes(nodes):
-    for node in nodes:
-        node.deleteIt()
+    # connections inside the deleted nodes are dropped without any update, observers get a single deletingNodes notification
+    # followed by a deletingNode one per node.
+    _coral.NetworkManager.deleteNodes(list(nodes))
 
 def deleteAttributes(attributes):
     for attribute in attributes:
@@ -795,6 +826,81 @@ def deleteAttributes(attributes):
         if attribute in parentNode.dynamicAttributes():
             attribute.deleteIt()
 
+def beginEditTransaction():
+    # connections made from now on won't rebuild the evaluation chains until commitEditTransaction() is called,
+    # transactions can be nested and the rebuild happens once for the whole edited region when the outermost is committed.
+    _coral.NetworkManager.beginEditTransaction()
+
+def commitEditTransaction():
+    _coral.NetworkManager.commitEditTransaction()
+
+def setEarlyCutoffAllowed(value = True):
+    # nodes enabled with node.setEarlyCutoffEnabled(True) skip their update when the values affecting an output didn't change,
+    # turning it off here updates every node again regardless of the per node setting.
+    _coral.Node.setEarlyCutoffAllowed(value)
+
+def earlyCutoffAllowed():
+    return _coral.Node.earlyCutoffAllowed()
+
+def setOutputCacheEnabled(value = True):
+    # nodes enabled with node.setOutputCacheEnabled(True) get their outputs restored from the cache 
+    # rather than updating whenever their inputs match an already computed state.
+    _coral.OutputCache.setEnabled(value)
+
+def outputCacheEnabled():
+    return _coral.OutputCache.enabled()
+
+def setOutputCacheMemoryBudget(megabytes):
+    _coral.OutputCache.setMemoryBudget(int(megabytes * 1024 * 1024))
+
+def outputCacheStats():
+    return {
+        "hits": _coral.OutputCache.hits(), 
+        "misses": _coral.OutputCache.misses(), 
+        "entries": _coral.OutputCache.entriesCount(), 
+        "memoryUsed": _coral.OutputCache.memoryUsed(), 
+        "memoryBudget": _coral.OutputCache.memoryBudget()}
+
+def resetOutputCacheStats():
+    _coral.OutputCache.resetStats()
+
+def clearOutputCache():
+    _coral.OutputCache.clear()
+
+def setArrayGrainSize(size):
+    # arrays larger than size are split in chunks computed in parallel by the array nodes, 0 computes every array serially.
+    # node.setArrayGrainSize(size) overrides this for a single node, -1 goes back to this global setting.
+    _coral.ParallelArrays.setGrainSize(size)
+
+def arrayGrainSize():
+    return _coral.ParallelArrays.grainSize()
+
+def setArrayFusionEnabled(value = True):
+    # chains of element wise array nodes, such as Add, Mul or Length, are computed by their last node in a single loop.
+    _coral.ArrayFusion.setEnabled(value)
+
+def arrayFusionEnabled():
+    return _coral.ArrayFusion.enabled()
+
+def fusedArrayChains():
+    # the chains fused since the last clear, each as a string like "root.Add -> root.Mul".
+    return _coral.ArrayFusion.fusedChains()
+
+def clearFusedArrayChains():
+    _coral.ArrayFusion.clearFusedChains()
+
+def _setLoadingNetwork(value):
+    # a network being loaded is always edited within a transaction, 
+    # loads can be nested (a network loading another one) and each True has to be matched by a False, like begin/commitEditTransaction.
+    if value:
+        CoralAppData.loadingNetworkDepth += 1
+        beginEditTransaction()
+    elif CoralAppData.loadingNetworkDepth > 0:
+        CoralAppData.loadingNetworkDepth -= 1
+        commitEditTransaction()
+    
+    CoralAppData.loadingNetwork = CoralAppData.loadingNetworkDepth > 0
+
 def _parseNetworkScript(saveScript):
     #returns the variables collected in the saveScript.
     
@@ -813,9 +919,37 @@ def _loadNetworkScript(networkScript, topNode = ""):
         logError("version mismatch")
         return;
     
-    CoralAppData.loadingNetwork = True
-    networkScriptData["runScript"](topNode)
-    CoralAppData.loadingNetwork = False
+    _setLoadingNetwork(True)
+    try:
+        networkScriptData["runScript"](topNode)
+    finally:
+        _setLoadingNetwork(False)
+    
+    _notifyNetworkLoadedObservers(topNode)
+
+def _loadNetworkBinary(networkData, topNode = ""):
+    networkFile = _coral.NetworkFile()
+    if not networkFile.setFromData(networkData):
+        logError("invalid network file or version mismatch")
+        return
+    
+    _notifyNetworkLoadingObservers()
+    
+    # the network is recreated from c++, only the commands added by the generatingSaveScript observers are run from here
+    topNodeObject = findNode(topNode)
+    
+    _setLoadingNetwork(True)
+    try:
+        record = networkFile.applyRecords(0, topNodeObject)
+        while record < networkFile.recordsCount():
+            executeCommand(networkFile.commandName(record, topNodeObject), **networkFile.commandArgs(record, topNodeObject))
+            
+            record = networkFile.applyRecords(record + 1, topNodeObject)
+    finally:
+        _setLoadingNetwork(False)
+    
+    for error in networkFile.errors():
+        logDebug(error)
     
     _notifyNetworkLoadedObservers(topNode)
 
@@ -823,7 +957,14 @@ def openNetworkFile(filename):
     if filename:
         newNetwork()
         
-        file = open(filename, "rU")
+        file = open(filename, "rb")
+        binary = _coral.NetworkFile.isNetworkFileData(file.read(4))
+        file.close()
+        
+        if binary:
+            file = open(filename, "rb")
+        else:
+            file = open(filename, "rU")
     
         saveScript = file.read()
         file.close()
@@ -833,7 +974,10 @@ def openNetworkFile(filename):
 
         _coral.NetworkManager.addSearchPath(filePath)
         
-        _loadNetworkScript(saveScript, topNode = CoralAppData.rootNode.fullName())
+        if binary:
+            _loadNetworkBinary(saveScript, topNode = CoralAppData.rootNode.fullName())
+        else:
+            _loadNetworkScript(saveScript, topNode = CoralAppData.rootNode.fullName())
         
         if CoralAppData.shouldLogInfos:
             logInfo("loaded netowrk file: " + filename)
@@ -873,24 +1017,54 @@ def _generateNetworkScript(topNode, saveTopNode = False):
     
     return saveScript
 
-def saveNetworkFile(filename):
+def _generateNetworkBinary(topNode):
+    networkFile = _coral.NetworkFile()
+    networkFile.setFromNode(topNode)
+    
+    saveScriptRef = [""]
+    _notifyGeneratingSaveScriptObservers(topNode, saveScriptRef)
+    networkFile.addCommandsFromScript(saveScriptRef[0])
+    
+    for error in networkFile.errors():
+        logError(error)
+    
+    return networkFile.data()
+
+def saveNetworkFile(filename, binary = None):
+    # binary files hold the values of the attributes as raw data and load without running any python script,
+    # unless told otherwise they are written for the .crlb extension
     if filename:
-        saveScript = _generateNetworkScript(topNode = CoralAppData.rootNode)
+        if binary is None:
+            binary = filename.endswith(".crlb")
         
-        file = open(filename, "w")
-        file.write(saveScript)
-        file.close()
+        if binary:
+            saveData = _generateNetworkBinary(topNode = CoralAppData.rootNode)
+            
+            file = open(filename, "wb")
+            file.write(saveData)
+            file.close()
+        else:
+            saveScript = _generateNetworkScript(topNode = CoralAppData.rootNode)
+            
+            file = open(filename, "w")
+            file.write(saveScript)
+            file.close()
         
         if CoralAppData.shouldLogInfos:
             logInfo("saved network file: " + filename)
 
 def newNetwork():
     _notifyInitializingNewNetworkObservers()
+    
+    deleteNodes(CoralAppData.rootNode.nodes())
 
     CoralAppData.rootNode = RootNode("root")
     
     _coral.NetworkManager.removeSearchPath(CoralAppData.currentNetworkDir)
     CoralAppData.currentNetworkDir = ""
+    
+    clearOutputCache()
+    clearFusedArrayChains()
 
     _notifyInitializedNewNetworkObservers()
 
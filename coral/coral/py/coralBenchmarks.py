@@ -0,0 +1,305 @@
+# <license>
+# Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+# This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+# 
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+# 
+#    * Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# </license>
+
+
+# Times the hot paths of the graph engine over synthetic networks and optionally compares them against a previous run.
+# usage: python coralBenchmarks.py [-s scale] [-r repeat] [-o results.json] [-b baseline.json] [-t tolerance]
+
+import sys
+import time
+import json
+import optparse
+from coral import _coral
+from coral import coralApp
+
+class BenchmarkNetwork(object):
+    # each synthetic network exposes the attributes driving it (to dirty) and the ones to pull (to clean)
+    def __init__(self, name):
+        self.name = name
+        self.sources = []
+        self.sinks = []
+        self.connections = []
+    
+    def connect(self, source, destination):
+        self.connections.append((source, destination))
+
+def _timeIt(function):
+    start = time.time()
+    function()
+    return time.time() - start
+
+def _createNode(className, name, parent):
+    node = coralApp.createNode(className, name, parent)
+    assert node is not None, "failed to create node " + className
+    return node
+
+def _chainNetwork(size):
+    network = BenchmarkNetwork("chain[%d]" % size)
+    root = coralApp.rootNode()
+    
+    source = _createNode("Float", "source", root)
+    previous = source.outputAttributeAt(0)
+    for i in range(size):
+        add = _createNode("Add", "add%d" % i, root)
+        network.connect(previous, add.inputAttributeAt(0))
+        previous = add.outputAttributeAt(0)
+    
+    network.sources.append(source.outputAttributeAt(0))
+    network.sinks.append(previous)
+    
+    return network
+
+def _fanOutNetwork(size):
+    network = BenchmarkNetwork("fanOut[%d]" % size)
+    root = coralApp.rootNode()
+    
+    source = _createNode("Float", "source", root)
+    for i in range(size):
+        add = _createNode("Add", "add%d" % i, root)
+        network.connect(source.outputAttributeAt(0), add.inputAttributeAt(0))
+        network.sinks.append(add.outputAttributeAt(0))
+    
+    network.sources.append(source.outputAttributeAt(0))
+    
+    return network
+
+def _fanInNetwork(size):
+    network = BenchmarkNetwork("fanIn[%d]" % size)
+    root = coralApp.rootNode()
+    
+    buildArray = _createNode("BuildArray", "buildArray", root)
+    for i in range(size):
+        source = _createNode("Float", "source%d" % i, root)
+        buildArray.addNumericAttribute()
+        network.connect(source.outputAttributeAt(0), buildArray.inputAttributeAt(i))
+        network.sources.append(source.outputAttributeAt(0))
+    
+    network.sinks.append(buildArray.outputAttributeAt(0))
+    
+    return network
+
+def _nestedCollapsedNetwork(depth):
+    network = BenchmarkNetwork("nestedCollapsed[%d]" % depth)
+    root = coralApp.rootNode()
+    
+    source = _createNode("Float", "source", root)
+    sink = _createNode("Add", "sink", root)
+    
+    previousIn = source.outputAttributeAt(0)
+    previousOut = sink.inputAttributeAt(0)
+    parent = root
+    for i in range(depth):
+        collapsed = _createNode("CollapsedNode", "collapsed%d" % i, parent)
+        inAttr = coralApp.createAttribute("PassThroughAttribute", "in", collapsed, input = True)
+        outAttr = coralApp.createAttribute("PassThroughAttribute", "out", collapsed, output = True)
+        
+        network.connect(previousIn, inAttr)
+        network.connect(outAttr, previousOut)
+        
+        previousIn = inAttr
+        previousOut = outAttr
+        parent = collapsed
+    
+    add = _createNode("Add", "add", parent)
+    network.connect(previousIn, add.inputAttributeAt(0))
+    network.connect(add.outputAttributeAt(0), previousOut)
+    
+    network.sources.append(source.outputAttributeAt(0))
+    network.sinks.append(sink.outputAttributeAt(0))
+    
+    return network
+
+def _forLoopNetwork(slices):
+    network = BenchmarkNetwork("forLoop[%d]" % slices)
+    root = coralApp.rootNode()
+    
+    start = _createNode("Float", "start", root)
+    end = _createNode("Float", "end", root)
+    steps = _createNode("Int", "steps", root)
+    rangeArray = _createNode("RangeArray", "range", root)
+    
+    end.outputAttributeAt(0).outValue().setFloatValueAt(0, 1.0)
+    steps.outputAttributeAt(0).outValue().setIntValueAt(0, slices)
+    
+    forLoop = _createNode("ForLoop", "forLoop", root)
+    loopInput = _createNode("LoopInput", "loopInput", forLoop)
+    add = _createNode("Add", "add", forLoop)
+    loopOutput = _createNode("LoopOutput", "loopOutput", forLoop)
+    
+    network.connect(start.outputAttributeAt(0), rangeArray.findAttribute("start"))
+    network.connect(end.outputAttributeAt(0), rangeArray.findAttribute("end"))
+    network.connect(steps.outputAttributeAt(0), rangeArray.findAttribute("steps"))
+    network.connect(rangeArray.findAttribute("array"), forLoop.findAttribute("globalArray"))
+    network.connect(rangeArray.findAttribute("array"), loopInput.findAttribute("globalArray"))
+    network.connect(loopInput.findAttribute("localElement"), add.inputAttributeAt(0))
+    network.connect(loopInput.findAttribute("localElement"), add.inputAttributeAt(1))
+    network.connect(add.outputAttributeAt(0), loopOutput.findAttribute("localElement"))
+    
+    network.sources.append(start.outputAttributeAt(0))
+    network.sinks.append(loopOutput.findAttribute("globalArray"))
+    
+    return network
+
+def _connectAll(network):
+    for source, destination in network.connections:
+        _coral.NetworkManager.connect(source, destination)
+
+def _dirtyAll(network):
+    for source in network.sources:
+        source.valueChanged()
+
+def _cleanAll(network):
+    for sink in network.sinks:
+        sink.value()
+
+def _benchmarkNetwork(generator, size, repeat, results):
+    name = ""
+    timings = {"connect": [], "dirty": [], "clean": [], "save": [], "load": [], "teardown": []}
+    
+    for i in range(repeat):
+        coralApp.newNetwork()
+        network = generator(size)
+        name = network.name
+        
+        timings["connect"].append(_timeIt(lambda: _connectAll(network)))
+        
+        # first clean outside of the timings, it only initializes the values
+        _cleanAll(network)
+        
+        timings["dirty"].append(_timeIt(lambda: _dirtyAll(network)))
+        timings["clean"].append(_timeIt(lambda: _cleanAll(network)))
+        
+        saveScript = []
+        timings["save"].append(_timeIt(lambda: saveScript.append(coralApp._generateNetworkScript(coralApp.rootNode()))))
+        
+        coralApp.newNetwork()
+        timings["load"].append(_timeIt(lambda: coralApp._loadNetworkScript(saveScript[0], topNode = "root")))
+        timings["teardown"].append(_timeIt(coralApp.newNetwork))
+    
+    coralApp.newNetwork()
+    
+    # the best run is the least affected by the noise of the machine
+    for operation, values in timings.iteritems():
+        results[name + "." + operation] = min(values)
+        print "%s.%s: %.6f secs" % (name, operation, results[name + "." + operation])
+    
+    sys.stdout.flush()
+
+def _benchmarkFanOutEdits(size, repeat, results):
+    # a single attribute feeding thousands of nodes, like a time attribute, stresses the editing of its adjacency
+    name = "fanOutEdits[%d]" % size
+    timings = {"connect": [], "disconnect": [], "delete": []}
+    
+    for i in range(repeat):
+        coralApp.newNetwork()
+        network = _fanOutNetwork(size)
+        destinations = [destination for source, destination in network.connections]
+        
+        timings["connect"].append(_timeIt(lambda: _connectAll(network)))
+        
+        halfDestinations = destinations[::2]
+        timings["disconnect"].append(_timeIt(lambda: [destination.disconnectInput() for destination in halfDestinations]))
+        
+        nodes = [destination.parent() for destination in destinations[1::2]]
+        timings["delete"].append(_timeIt(lambda: coralApp.deleteNodes(nodes)))
+    
+    coralApp.newNetwork()
+    
+    for operation, values in timings.iteritems():
+        results[name + "." + operation] = min(values)
+        print "%s.%s: %.6f secs" % (name, operation, results[name + "." + operation])
+    
+    sys.stdout.flush()
+
+def runBenchmarks(scale = 1, repeat = 3):
+    results = {}
+    
+    coralApp.init()
+    coralApp.setShouldLogInfos(False)
+    
+    try:
+        _benchmarkNetwork(_chainNetwork, 500 * scale, repeat, results)
+        _benchmarkNetwork(_fanOutNetwork, 1000 * scale, repeat, results)
+        _benchmarkNetwork(_fanInNetwork, 1000 * scale, repeat, results)
+        _benchmarkNetwork(_nestedCollapsedNetwork, 50 * scale, repeat, results)
+        _benchmarkNetwork(_forLoopNetwork, 100000 * scale, repeat, results)
+        _benchmarkFanOutEdits(2000 * scale, repeat, results)
+        _benchmarkFanOutEdits(5000 * scale, repeat, results)
+    finally:
+        coralApp.finalize()
+    
+    return results
+
+def compareResults(results, baseline, tolerance):
+    # returns the names of the benchmarks that got slower than the baseline by more than the given tolerance (0.1 == 10%)
+    regressions = []
+    for name in sorted(results.keys()):
+        if name in baseline and baseline[name] > 0.0:
+            ratio = results[name] / baseline[name]
+            status = ""
+            if ratio > 1.0 + tolerance:
+                status = " REGRESSION"
+                regressions.append(name)
+            
+            print "%s: %.6f secs, baseline %.6f secs, x%.2f%s" % (name, results[name], baseline[name], ratio, status)
+    
+    return regressions
+
+def main(args):
+    parser = optparse.OptionParser(usage = "%prog [options]")
+    parser.add_option("-s", "--scale", dest = "scale", type = "int", default = 1, help = "multiplies the size of every synthetic network")
+    parser.add_option("-r", "--repeat", dest = "repeat", type = "int", default = 3, help = "runs per benchmark, the fastest one is kept")
+    parser.add_option("-o", "--output", dest = "output", default = "", help = "json file where results are written")
+    parser.add_option("-b", "--baseline", dest = "baseline", default = "", help = "json file of a previous run to compare with")
+    parser.add_option("-t", "--tolerance", dest = "tolerance", type = "float", default = 0.1, help = "slowdown ratio tolerated before reporting a regression")
+    options, positional = parser.parse_args(args)
+    
+    results = runBenchmarks(options.scale, options.repeat)
+    
+    if options.output:
+        file = open(options.output, "w")
+        json.dump({"scale": options.scale, "repeat": options.repeat, "results": results}, file, indent = 1, sort_keys = True)
+        file.close()
+    
+    if options.baseline:
+        file = open(options.baseline, "r")
+        baseline = json.load(file)
+        file.close()
+        
+        if baseline["scale"] != options.scale:
+            print "warning: baseline was recorded with scale", baseline["scale"]
+        
+        regressions = compareResults(results, baseline["results"], options.tolerance)
+        if regressions:
+            print "%d regressions found" % len(regressions)
+            return 1
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -30,6 +30,7 @@
 import sys
 from coral import _coral
 from coral import coralApp
+from coral.arrayNode import ArrayNode
 import Imath
 
 class TestValue(_coral.Value):
@@ -286,6 +287,66 @@ def testSaveScript():
     
     coralApp.finalize()
 
+def testBinaryNetworkFile():
+    import os, tempfile
+    
+    coralApp.init()
+    
+    root = coralApp.rootNode()
+    n1 = coralApp.createNode("Float", "n1", root)
+    n1.outputAttributeAt(0).outValue().setFloatValueAt(0, 5.0)
+    
+    collapsed = coralApp.createNode("CollapsedNode", "collapsed", root)
+    in1 = coralApp.createAttribute("PassThroughAttribute", "in", collapsed, input = True)
+    out1 = coralApp.createAttribute("PassThroughAttribute", "out", collapsed, output = True)
+    add = coralApp.createNode("Add", "add", collapsed)
+    
+    _coral.NetworkManager.connect(n1.outputAttributeAt(0), in1)
+    _coral.NetworkManager.connect(in1, add.inputAttributeAt(0))
+    _coral.NetworkManager.connect(in1, add.inputAttributeAt(1))
+    _coral.NetworkManager.connect(add.outputAttributeAt(0), out1)
+    assert out1.value().floatValueAt(0) == 10.0
+    
+    # the .crlb extension saves the binary format
+    handle, filename = tempfile.mkstemp(suffix = ".crlb")
+    os.close(handle)
+    coralApp.saveNetworkFile(filename)
+    
+    networkFile = _coral.NetworkFile()
+    assert networkFile.setFromData(open(filename, "rb").read())
+    
+    recordTypes = [networkFile.recordType(i) for i in range(networkFile.recordsCount())]
+    assert _coral.NetworkFile.commandRecord not in recordTypes
+    assert recordTypes.count(_coral.NetworkFile.nodeRecord) == 3
+    assert recordTypes.count(_coral.NetworkFile.attributeRecord) == 2
+    assert recordTypes.count(_coral.NetworkFile.connectionRecord) == 4
+    
+    coralApp.finalize()
+    
+    coralApp.init()
+    coralApp.setShouldLogInfos(False)
+    
+    coralApp.openNetworkFile(filename)
+    os.remove(filename)
+    
+    n1 = coralApp.findNode("root.n1")
+    collapsed = coralApp.findNode("root.collapsed")
+    add = coralApp.findNode("root.collapsed.add")
+    
+    assert n1 is not None and collapsed is not None and add is not None
+    assert len(collapsed.dynamicAttributes()) == 2
+    
+    in1 = collapsed.findAttribute("in")
+    out1 = collapsed.findAttribute("out")
+    assert in1.isInput() and out1.isOutput()
+    assert in1.input() is n1.outputAttributeAt(0)
+    assert add.inputAttributeAt(1).input() is in1
+    assert out1.input() is add.outputAttributeAt(0)
+    assert n1.outputAttributeAt(0).outValue().floatValueAt(0) == 5.0
+    assert out1.value().floatValueAt(0) == 10.0
+    
+    coralApp.finalize()
+
 def testSpecializationBug1():
     n = _coral.Node("n", None)
     a = _coral.Attribute("a", n)
@@ -357,6 +418,467 @@ def testSpecializingPass():
     
     coralApp.finalize()
 
+def testEditTransaction():
+    coralApp.init()
+    
+    root = coralApp.rootNode()
+    n1 = coralApp.createNode("Float", "n1", root)
+    n2 = coralApp.createNode("Add", "n2", root)
+    
+    coralApp._setLoadingNetwork(True)
+    assert _coral.NetworkManager.editTransactionOpen()
+    
+    _coral.NetworkManager.connect(n1.outputAttributeAt(0), n2.inputAttributeAt(0))
+    
+    # a nested load keeps the outer transaction open when it ends
+    coralApp._setLoadingNetwork(True)
+    coralApp._setLoadingNetwork(False)
+    assert _coral.NetworkManager.editTransactionOpen()
+    assert coralApp.CoralAppData.loadingNetwork
+    
+    coralApp._setLoadingNetwork(False)
+    assert _coral.NetworkManager.editTransactionOpen() == False
+    assert coralApp.CoralAppData.loadingNetwork == False
+    assert n2.inputAttributeAt(0).input() is n1.outputAttributeAt(0)
+    
+    # an unmatched end doesn't commit a transaction opened by someone else
+    coralApp.beginEditTransaction()
+    coralApp._setLoadingNetwork(False)
+    assert _coral.NetworkManager.editTransactionOpen()
+    coralApp.commitEditTransaction()
+    assert _coral.NetworkManager.editTransactionOpen() == False
+    
+    coralApp.finalize()
+
+def testOutputCache():
+    coralApp.init()
+    
+    root = coralApp.rootNode()
+    n1 = coralApp.createNode("Float", "n1", root)
+    n2 = coralApp.createNode("Add", "n2", root)
+    n2.setOutputCacheEnabled(True)
+    
+    _coral.NetworkManager.connect(n1.outputAttributeAt(0), n2.inputAttributeAt(0))
+    
+    coralApp.setOutputCacheEnabled(True)
+    coralApp.resetOutputCacheStats()
+    
+    for value in [1.0, 2.0, 1.0]:
+        n1.outputAttributeAt(0).outValue().setFloatValueAt(0, value)
+        n1.outputAttributeAt(0).valueChanged()
+        assert n2.outputAttributeAt(0).value().floatValueAt(0) == value
+    
+    stats = coralApp.outputCacheStats()
+    assert stats["misses"] == 2
+    assert stats["hits"] == 1
+    
+    coralApp.setOutputCacheEnabled(False)
+    coralApp.finalize()
+    
+    assert coralApp.outputCacheStats()["entries"] == 0
+
+def testTracer():
+    coralApp.init()
+    
+    root = coralApp.rootNode()
+    n1 = coralApp.createNode("Float", "n1", root)
+    n2 = coralApp.createNode("Add", "n2", root)
+    _coral.NetworkManager.connect(n1.outputAttributeAt(0), n2.inputAttributeAt(0))
+    
+    _coral.Tracer.startCapture()
+    n2.outputAttributeAt(0).value()
+    _coral.Tracer.stopCapture()
+    
+    stats = _coral.Tracer.nodeStats()
+    assert stats[n2.fullName()]["updates"] == 1
+    assert "traceEvents" in _coral.Tracer.chromeTrace()
+    
+    coralApp.finalize()
+
+def testEarlyCutoff():
+    coralApp.init()
+    
+    root = coralApp.rootNode()
+    a = coralApp.createNode("Float", "a", root)
+    b = coralApp.createNode("Float", "b", root)
+    ifTrue = coralApp.createNode("Float", "ifTrue", root)
+    ifFalse = coralApp.createNode("Float", "ifFalse", root)
+    greater = coralApp.createNode("IfGreaterThan", "greater", root)
+    conditional = coralApp.createNode("ConditionalValue", "conditional", root)
+    
+    _coral.NetworkManager.connect(a.outputAttributeAt(0), greater.inputAttributeAt(0))
+    _coral.NetworkManager.connect(b.outputAttributeAt(0), greater.inputAttributeAt(1))
+    _coral.NetworkManager.connect(greater.outputAttributeAt(0), conditional.inputAttributeAt(0))
+    _coral.NetworkManager.connect(ifTrue.outputAttributeAt(0), conditional.inputAttributeAt(1))
+    _coral.NetworkManager.connect(ifFalse.outputAttributeAt(0), conditional.inputAttributeAt(2))
+    
+    for node, value in [(a, 2.0), (b, 1.0), (ifTrue, 10.0), (ifFalse, 20.0)]:
+        node.outputAttributeAt(0).outValue().setFloatValueAt(0, value)
+        node.outputAttributeAt(0).valueChanged()
+    
+    assert greater.earlyCutoffEnabled() and conditional.earlyCutoffEnabled()
+    assert conditional.outputAttributeAt(0).value().floatValueAt(0) == 10.0
+    
+    # the condition is still true, the conditional value isn't updated again
+    _coral.Tracer.startCapture()
+    a.outputAttributeAt(0).outValue().setFloatValueAt(0, 3.0)
+    a.outputAttributeAt(0).valueChanged()
+    assert conditional.outputAttributeAt(0).value().floatValueAt(0) == 10.0
+    _coral.Tracer.stopCapture()
+    
+    stats = _coral.Tracer.nodeStats()
+    assert stats[greater.fullName()]["updates"] == 1
+    assert conditional.fullName() not in stats
+    
+    _coral.Tracer.startCapture()
+    a.outputAttributeAt(0).outValue().setFloatValueAt(0, 0.0)
+    a.outputAttributeAt(0).valueChanged()
+    assert conditional.outputAttributeAt(0).value().floatValueAt(0) == 20.0
+    _coral.Tracer.stopCapture()
+    
+    assert _coral.Tracer.nodeStats()[conditional.fullName()]["updates"] == 1
+    
+    coralApp.finalize()
+
+def testEvaluationState():
+    coralApp.init()
+    
+    root = coralApp.rootNode()
+    n1 = coralApp.createNode("Float", "n1", root)
+    n2 = coralApp.createNode("Add", "n2", root)
+    _coral.NetworkManager.connect(n1.outputAttributeAt(0), n2.inputAttributeAt(0))
+    
+    states = []
+    for frame in range(3):
+        state = _coral.EvaluationState()
+        _coral.EvaluationState.setCurrent(state)
+        n1.outputAttributeAt(0).outValue().setFloatValueAt(0, float(frame))
+        n1.outputAttributeAt(0).valueChanged()
+        states.append(state)
+    
+    _coral.EvaluationState.setCurrent(None)
+    _coral.EvaluationState.evaluate(n2.outputAttributeAt(0), states)
+    
+    for frame in range(3):
+        _coral.EvaluationState.setCurrent(states[frame])
+        assert n2.outputAttributeAt(0).value().floatValueAt(0) == float(frame)
+    
+    _coral.EvaluationState.setCurrent(None)
+    assert n2.outputAttributeAt(0).value().floatValueAt(0) == 0.0
+    
+    for state in states:
+        state.clear()
+    
+    coralApp.finalize()
+
+def testBulkDeletion():
+    from coral.observer import Observer
+    
+    coralApp.init()
+    
+    root = coralApp.rootNode()
+    source = coralApp.createNode("Float", "source", root)
+    adds = []
+    for i in range(10):
+        add = coralApp.createNode("Add", "add" + str(i), root)
+        _coral.NetworkManager.connect(source.outputAttributeAt(0), add.inputAttributeAt(0))
+        adds.append(add)
+    
+    notifiedIds = []
+    observer = Observer()
+    def deletingNodes():
+        notifiedIds.append(observer.data("nodeIds"))
+    coralApp.addDeletingNodesObserver(observer, deletingNodes)
+    
+    singleIds = []
+    singleObserver = Observer()
+    def deletingNode():
+        singleIds.append(singleObserver.data("nodeId"))
+    coralApp.addDeletingNodeObserver(singleObserver, deletingNode)
+    
+    addIds = [add.id() for add in adds]
+    coralApp.deleteNodes(adds)
+    
+    assert len(notifiedIds) == 1
+    assert sorted(notifiedIds[0]) == sorted(addIds)
+    assert sorted(singleIds) == sorted(addIds)
+    assert len(source.outputAttributeAt(0).outputs()) == 0
+    assert coralApp.findNode("root.add0") is None
+    assert source in coralApp.instantiatedNodes()
+    assert adds[0] not in coralApp.instantiatedNodes()
+    
+    coralApp.finalize()
+
+def testArrayGrainSize():
+    coralApp.init()
+    
+    root = coralApp.rootNode()
+    n1 = coralApp.createNode("Float", "n1", root)
+    n2 = coralApp.createNode("Add", "n2", root)
+    _coral.NetworkManager.connect(n1.outputAttributeAt(0), n2.inputAttributeAt(0))
+    
+    oldGrainSize = coralApp.arrayGrainSize()
+    coralApp.setArrayGrainSize(1)
+    assert n2.arrayGrainSize() == 1
+    
+    n2.setArrayGrainSize(0)
+    assert n2.arrayGrainSize() == 0
+    
+    n1.outputAttributeAt(0).outValue().setFloatValueAt(0, 2.0)
+    n1.outputAttributeAt(0).valueChanged()
+    assert n2.outputAttributeAt(0).value().floatValueAt(0) == 2.0
+    
+    n2.setArrayGrainSize(-1)
+    assert n2.arrayGrainSize() == 1
+    
+    coralApp.setArrayGrainSize(oldGrainSize)
+    coralApp.finalize()
+
+def testNumpyArrays():
+    try:
+        import numpy
+    except ImportError:
+        print "* numpy not available, skipping"
+        return
+    
+    coralApp.init()
+    
+    root = coralApp.rootNode()
+    n1 = coralApp.createNode("Float", "n1", root)
+    value = n1.outputAttributeAt(0).outValue()
+    value.setFloatValueAt(0, 2.0)
+    
+    array = value.valuesArray()
+    assert array.shape == (1,) and array.dtype == numpy.float32
+    assert array[0] == 2.0
+    assert not array.flags.writeable
+    
+    # the array keeps viewing the old values once the Numeric changes
+    value.setFloatValueAt(0, 3.0)
+    assert array[0] == 2.0
+    assert value.valuesArray()[0] == 3.0
+    
+    coralApp.finalize()
+    
+    # and outlives it
+    assert array[0] == 2.0
+
+def testBulkSetters():
+    import array
+    
+    coralApp.init()
+    
+    root = coralApp.rootNode()
+    n1 = coralApp.createNode("Float", "n1", root)
+    value = n1.outputAttributeAt(0).outValue()
+    
+    value.setFloatValues(array.array("f", [4.0]))
+    assert value.floatValueAt(0) == 4.0
+    
+    value.setFloatValues([5.0])
+    assert value.floatValueAt(0) == 5.0
+    
+    for values in [array.array("d", [1.0]), array.array("i", [1])]:
+        try:
+            value.setFloatValues(values)
+            assert False
+        except TypeError:
+            pass
+    
+    # the type is checked even when there's nothing to set
+    for values in [array.array("i", [1]), []]:
+        try:
+            value.setIntValues(values)
+            assert False
+        except TypeError:
+            pass
+    
+    # any integer code of 4 bytes is read as int32
+    if array.array("l").itemsize == 4:
+        intValue = coralApp.createNode("Int", "n2", root).outputAttributeAt(0).outValue()
+        intValue.setIntValues(array.array("l", [3]))
+        assert intValue.intValueAt(0) == 3
+    
+    geo = _coral.Geo()
+    geo.build(array.array("f", [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0]), [[0, 1, 2]])
+    
+    try:
+        geo.build(array.array("f", [0.0, 0.0, 0.0]), [[0, 1, 2]])
+        assert False
+    except ValueError:
+        pass
+    
+    try:
+        import numpy
+    except ImportError:
+        coralApp.finalize()
+        return
+    
+    points = numpy.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 1.0, 0.0]], numpy.float32)
+    geo.build(points, numpy.array([0, 1, 3, 2], numpy.int32), numpy.array([4], numpy.int32))
+    assert (geo.pointsArray() == points).all()
+    assert list(geo.rawIndicesArray()) == [0, 1, 3, 2]
+    
+    geo.setPoints(points * 2.0)
+    assert (geo.pointsArray() == points * 2.0).all()
+    
+    try:
+        geo.setPoints(points[:2])
+        assert False
+    except ValueError:
+        pass
+    
+    try:
+        geo.setPoints(numpy.zeros((4, 4), numpy.float32))
+        assert False
+    except ValueError:
+        pass
+    
+    coralApp.finalize()
+
+class AddArraysNode(ArrayNode):
+    def __init__(self, name, parent):
+        ArrayNode.__init__(self, name, parent)
+        
+        self.in0 = _coral.NumericAttribute("in0", self)
+        self.in1 = _coral.NumericAttribute("in1", self)
+        self.out = _coral.NumericAttribute("out", self)
+        
+        self.addInputAttribute(self.in0)
+        self.addInputAttribute(self.in1)
+        self.addOutputAttribute(self.out)
+        
+        self._setAttributeAffect(self.in0, self.out)
+        self._setAttributeAffect(self.in1, self.out)
+        
+        for attr in [self.in0, self.in1, self.out]:
+            self._setAttributeAllowedSpecializations(attr, ["Float"])
+        
+        self.computeCalls = 0
+    
+    def compute(self, attribute, inputs):
+        self.computeCalls += 1
+        return [a + b for a, b in zip(inputs[0], inputs[1])]
+
+def testArrayNode():
+    try:
+        import numpy
+    except ImportError:
+        print "* numpy not available, skipping"
+        return
+    
+    coralApp.init()
+    
+    root = coralApp.rootNode()
+    n1 = coralApp.createNode("Float", "n1", root)
+    n2 = coralApp.createNode("Float", "n2", root)
+    n3 = AddArraysNode("n3", root)
+    root.addNode(n3)
+    
+    _coral.NetworkManager.connect(n1.outputAttributeAt(0), n3.in0)
+    _coral.NetworkManager.connect(n2.outputAttributeAt(0), n3.in1)
+    
+    n1.outputAttributeAt(0).outValue().setFloatValueAt(0, 2.0)
+    n2.outputAttributeAt(0).outValue().setFloatValueAt(0, 3.0)
+    n1.outputAttributeAt(0).valueChanged()
+    
+    assert n3.out.value().floatValueAt(0) == 5.0
+    assert n3.computeCalls == 1
+    
+    coralApp.finalize()
+
+def testArrayFusion():
+    coralApp.init()
+    
+    root = coralApp.rootNode()
+    count = coralApp.createNode("Int", "count", root)
+    constant = coralApp.createNode("Float", "constant", root)
+    array = coralApp.createNode("ConstantArray", "array", root)
+    factor = coralApp.createNode("Float", "factor", root)
+    offset = coralApp.createNode("Float", "offset", root)
+    mul = coralApp.createNode("Mul", "mul", root)
+    add = coralApp.createNode("Add", "add", root)
+    absolute = coralApp.createNode("Abs", "abs", root)
+    
+    _coral.NetworkManager.connect(count.outputAttributeAt(0), array.inputAttributeAt(0))
+    _coral.NetworkManager.connect(constant.outputAttributeAt(0), array.inputAttributeAt(1))
+    _coral.NetworkManager.connect(array.outputAttributeAt(0), mul.inputAttributeAt(0))
+    _coral.NetworkManager.connect(factor.outputAttributeAt(0), mul.inputAttributeAt(1))
+    _coral.NetworkManager.connect(mul.outputAttributeAt(0), add.inputAttributeAt(0))
+    _coral.NetworkManager.connect(offset.outputAttributeAt(0), add.inputAttributeAt(1))
+    _coral.NetworkManager.connect(add.outputAttributeAt(0), absolute.inputAttributeAt(0))
+    
+    count.outputAttributeAt(0).outValue().setIntValueAt(0, 4)
+    count.outputAttributeAt(0).valueChanged()
+    constant.outputAttributeAt(0).outValue().setFloatValueAt(0, 2.0)
+    constant.outputAttributeAt(0).valueChanged()
+    factor.outputAttributeAt(0).outValue().setFloatValueAt(0, -3.0)
+    factor.outputAttributeAt(0).valueChanged()
+    offset.outputAttributeAt(0).outValue().setFloatValueAt(0, 1.0)
+    offset.outputAttributeAt(0).valueChanged()
+    
+    # abs computes the mul and add nodes in the same loop
+    assert coralApp.arrayFusionEnabled()
+    coralApp.clearFusedArrayChains()
+    assert absolute.outputAttributeAt(0).value().floatValues() == [5.0] * 4
+    assert coralApp.fusedArrayChains() == ["root.mul -> root.add -> root.abs"]
+    assert add.outputAttributeAt(0).value().floatValues() == [-5.0] * 4
+    
+    coralApp.setArrayFusionEnabled(False)
+    coralApp.clearFusedArrayChains()
+    offset.outputAttributeAt(0).outValue().setFloatValueAt(0, 0.0)
+    offset.outputAttributeAt(0).valueChanged()
+    assert absolute.outputAttributeAt(0).value().floatValues() == [6.0] * 4
+    assert coralApp.fusedArrayChains() == []
+    
+    coralApp.setArrayFusionEnabled(True)
+    coralApp.finalize()
+
+def testReleasedGIL():
+    import threading
+    
+    parentNode = _coral.Node("parentNode", None)
+    attr = TestAttribute("attr", parentNode)
+    parentNode.addOutputAttribute(attr)
+    
+    nodes = [TestNode("node%s" % i, None) for i in range(3)]
+    _coral.NetworkManager.connect(attr, nodes[0].inAttr)
+    for i in range(1, len(nodes)):
+        _coral.NetworkManager.connect(nodes[i - 1].outAttr, nodes[i].inAttr)
+    
+    attr.value().value = 7
+    attr.valueChanged()
+    
+    # the evaluation runs without the GIL, python nodes take it back from whichever thread evaluates them
+    results = []
+    thread = threading.Thread(target = lambda: results.append(nodes[-1].outAttr.value().value))
+    thread.start()
+    thread.join()
+    
+    assert results == [7]
+    
+    # connections keep the GIL, edits coming from several python threads never interleave on the same attribute
+    targets = [TestNode("target%s" % i, None) for i in range(8)]
+    def reconnect(target):
+        for i in range(20):
+            _coral.NetworkManager.connect(nodes[i % len(nodes)].outAttr, target.inAttr)
+    
+    threads = [threading.Thread(target = reconnect, args = (target,)) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    for target in targets:
+        source = target.inAttr.input()
+        assert source is nodes[19 % len(nodes)].outAttr
+        assert target.inAttr in source.outputs()
+    
+    for node in nodes:
+        assert len(node.outAttr.outputs()) == len(set(node.outAttr.outputs()))
+        for output in node.outAttr.outputs():
+            assert output.input() is node.outAttr
+
 def runTest(function):
     print "* running", function.__name__
 
@@ -380,5 +902,18 @@ if __name__ == "__main__":
     runTest(testCollapsingBug1)
     runTest(testSpecializingPass)
     runTest(testSpecializationBug1)
+    runTest(testEditTransaction)
+    runTest(testOutputCache)
+    runTest(testTracer)
+    runTest(testEarlyCutoff)
+    runTest(testBinaryNetworkFile)
+    runTest(testEvaluationState)
+    runTest(testBulkDeletion)
+    runTest(testArrayGrainSize)
+    runTest(testNumpyArrays)
+    runTest(testBulkSetters)
+    runTest(testArrayNode)
+    runTest(testArrayFusion)
+    runTest(testReleasedGIL)
     
     # _coral.runTests()
@@ -93,7 +93,7 @@ def _saveNetworkClicked():
     from coral import coralApp
     from coral.coralUi.mainWindow import MainWindow
     
-    filename = MainWindow.saveFileDialog("save network file", "Coral Network (*.crl)")
+    filename = MainWindow.saveFileDialog("save network file", "Coral Network (*.crl);;Coral Binary Network (*.crlb)")
     if filename:
         coralApp.saveNetworkFile(filename)
 
@@ -101,7 +101,7 @@ def _openNetworkClicked():
     from coral import coralApp
     from coral.coralUi.mainWindow import MainWindow
     
-    filename = MainWindow.openFileDialog("open network file", "Coral Network (*.crl)")
+    filename = MainWindow.openFileDialog("open network file", "Coral Network (*.crl *.crlb)")
     if filename:
         coralApp.openNetworkFile(filename)
 
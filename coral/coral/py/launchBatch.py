@@ -0,0 +1,200 @@
+# <license>
+# Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+# This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+# 
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+# 
+#    * Redistributions in binary form must reproduce the above copyright
+#      notice, this list of conditions and the following disclaimer in the
+#      documentation and/or other materials provided with the distribution.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+# IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+# PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# </license>
+
+
+# Evaluates a network without any UI, frames are split among worker processes each holding its own instance of the network.
+# usage: python launchBatch.py network.crl -o root.node.out [-o root.other.out] -s 1 -e 100 [-t root.Time.time] [-w 4] [-d resultsDir]
+
+import os
+import sys
+import time
+import json
+import Queue
+import optparse
+import multiprocessing
+
+def _parseOptions(args):
+    parser = optparse.OptionParser(usage = "%prog networkFile -o outputAttribute [options]")
+    parser.add_option("-o", "--output", dest = "outputs", action = "append", default = [], help = "full name of an attribute to evaluate, can be repeated")
+    parser.add_option("-s", "--start", dest = "start", type = "int", default = 1, help = "first frame")
+    parser.add_option("-e", "--end", dest = "end", type = "int", default = 1, help = "last frame (included)")
+    parser.add_option("-t", "--time", dest = "time", default = "", help = "full name of the Numeric attribute set to the current frame")
+    parser.add_option("-w", "--workers", dest = "workers", type = "int", default = 1, help = "number of worker processes")
+    parser.add_option("-d", "--dir", dest = "dir", default = "", help = "directory where results are written")
+    
+    options, positional = parser.parse_args(args)
+    if len(positional) != 1 or not options.outputs:
+        parser.error("a network file and at least one output attribute are required")
+    
+    options.networkFile = os.path.abspath(positional[0])
+    if not options.dir:
+        options.dir = os.path.splitext(options.networkFile)[0] + "_batch"
+    
+    return options
+
+def _splitFrames(start, end, workers):
+    # contiguous chunks, so that nodes relying on previous frames (simulations and alike) keep working within each worker.
+    frames = range(start, end + 1)
+    workers = max(1, min(workers, len(frames)))
+    chunkSize = len(frames) / workers
+    remainder = len(frames) % workers
+    
+    chunks = []
+    first = 0
+    for i in range(workers):
+        last = first + chunkSize
+        if i < remainder:
+            last += 1
+        
+        chunks.append(frames[first:last])
+        first = last
+    
+    return chunks
+
+def _findAttribute(coralApp, fullName):
+    attribute = coralApp.findAttribute(fullName)
+    if attribute is None:
+        raise RuntimeError("attribute not found: " + fullName)
+    
+    return attribute
+
+def _evaluateFrames(options, frames, queue):
+    from coral import coralApp
+    
+    coralApp.init()
+    coralApp.setShouldLogInfos(False)
+    coralApp.scanAutoLoadPaths()
+    
+    try:
+        coralApp.openNetworkFile(options.networkFile)
+        
+        outputs = [_findAttribute(coralApp, name) for name in options.outputs]
+        timeAttribute = None
+        if options.time:
+            timeAttribute = _findAttribute(coralApp, options.time)
+        
+        for frame in frames:
+            frameStart = time.time()
+            
+            if timeAttribute:
+                timeAttribute.outValue().setFloatValueAt(0, float(frame))
+                timeAttribute.valueChanged()
+            
+            results = {}
+            for attribute in outputs:
+                results[attribute.fullName()] = attribute.value().asString()
+            
+            frameTime = time.time() - frameStart
+            
+            resultFile = open(os.path.join(options.dir, "frame.%04d.json" % frame), "w")
+            json.dump({"frame": frame, "seconds": frameTime, "outputs": results}, resultFile, indent = 1)
+            resultFile.close()
+            
+            queue.put(("frame", frame, frameTime))
+    
+    except Exception, e:
+        queue.put(("error", os.getpid(), str(e)))
+    
+    finally:
+        # the parent waits for this message, it must be sent even if finalizing fails
+        try:
+            coralApp.finalize()
+        
+        finally:
+            queue.put(("done", os.getpid(), None))
+
+def run(args):
+    options = _parseOptions(args)
+    
+    if not os.path.isdir(options.dir):
+        os.makedirs(options.dir)
+    
+    chunks = _splitFrames(options.start, options.end, options.workers)
+    totalFrames = sum([len(chunk) for chunk in chunks])
+    
+    queue = multiprocessing.Queue()
+    workers = []
+    for chunk in chunks:
+        worker = multiprocessing.Process(target = _evaluateFrames, args = (options, chunk, queue))
+        worker.start()
+        workers.append(worker)
+    
+    batchStart = time.time()
+    frameTimes = {}
+    errors = []
+    runningWorkers = dict([(worker.pid, worker) for worker in workers])
+    while runningWorkers:
+        try:
+            message, key, value = queue.get(timeout = 1.0)
+        
+        except Queue.Empty:
+            # a worker killed by a crash in the core never reports back, one exiting cleanly already queued its messages
+            for pid, worker in runningWorkers.items():
+                if not worker.is_alive() and worker.exitcode != 0:
+                    errors.append("exited with code %s" % worker.exitcode)
+                    print "worker %d died with exit code %s" % (pid, worker.exitcode)
+                    del runningWorkers[pid]
+            
+            continue
+        
+        if message == "frame":
+            frameTimes[key] = value
+            print "frame %d done in %.3f secs (%d/%d)" % (key, value, len(frameTimes), totalFrames)
+            sys.stdout.flush()
+        
+        elif message == "error":
+            errors.append(value)
+            print "worker %d failed: %s" % (key, value)
+        
+        elif message == "done":
+            runningWorkers.pop(key, None)
+    
+    for worker in workers:
+        worker.join()
+    
+    batchTime = time.time() - batchStart
+    
+    summaryFile = open(os.path.join(options.dir, "batch.json"), "w")
+    json.dump({
+        "networkFile": options.networkFile, 
+        "outputs": options.outputs, 
+        "workers": len(workers), 
+        "seconds": batchTime, 
+        "frameSeconds": dict([(str(frame), seconds) for frame, seconds in frameTimes.items()]), 
+        "errors": errors}, summaryFile, indent = 1)
+    summaryFile.close()
+    
+    print "evaluated %d/%d frames with %d workers in %.3f secs" % (len(frameTimes), totalFrames, len(workers), batchTime)
+    
+    if errors or len(frameTimes) != totalFrames:
+        return 1
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(run(sys.argv[1:]))
@@ -84,22 +84,17 @@ std::vector<Attribute*> attribute_affectedBy(Attribute &self){
 }
 
 boost::python::object attribute_value(Attribute &self){
-	PyThreadState *state = 0;
-	if(!pythonWrapperUtils::pyGILEnsured){
-		state = PyEval_SaveThread();
+	Value *value = 0;
+	{
+		pythonWrapperUtils::GILRelease releaseGIL;
+		value = self.value();
 	}
-
-	boost::python::object valueObj;
 	
-	Value *value = self.value();
+	boost::python::object valueObj;
 	if(value){
 		valueObj = PythonDataCollector::findPyObject(value->id());
 	}
 
-	if(state){
-		PyEval_RestoreThread(state);
-	}
-
 	return valueObj;
 }
 
@@ -115,6 +110,8 @@ boost::python::object attributeoutValue(Attribute &self){
 }
 
 void attribute_connectToCallback(Attribute *self, Attribute *other){
+	pythonWrapperUtils::GILEnsure ensureGIL;
+	
 	if(PythonDataCollector::hasCallback("attribute_connectTo")){
 		if(PythonDataCollector::hasPyObject(self->id()) && PythonDataCollector::hasPyObject(other->id()))
 			PythonDataCollector::findCallback("attribute_connectTo")(PythonDataCollector::findPyObject(self->id()), PythonDataCollector::findPyObject(other->id()));
@@ -122,6 +119,8 @@ void attribute_connectToCallback(Attribute *self, Attribute *other){
 }
 
 void attribute_disconnectInputCallback(Attribute *self){
+	pythonWrapperUtils::GILEnsure ensureGIL;
+	
 	if(PythonDataCollector::hasCallback("attribute_disconnectInput")){
 		if(PythonDataCollector::hasPyObject(self->id()))
 			PythonDataCollector::findCallback("attribute_disconnectInput")(PythonDataCollector::findPyObject(self->id()));
@@ -129,6 +128,8 @@ void attribute_disconnectInputCallback(Attribute *self){
 }
 
 void attribute_disconnectOutputCallback(Attribute *self, Attribute *other){
+	pythonWrapperUtils::GILEnsure ensureGIL;
+	
 	if(PythonDataCollector::hasCallback("attribute_disconnectOutput")){
 		if(PythonDataCollector::hasPyObject(self->id()) && PythonDataCollector::hasPyObject(other->id()))
 			PythonDataCollector::findCallback("attribute_disconnectOutput")(PythonDataCollector::findPyObject(self->id()), PythonDataCollector::findPyObject(other->id()));
@@ -136,6 +137,8 @@ void attribute_disconnectOutputCallback(Attribute *self, Attribute *other){
 }
 
 void attribute_specializationCallBack(Attribute *self){
+	pythonWrapperUtils::GILEnsure ensureGIL;
+	
 	if(PythonDataCollector::hasCallback("attribute_specialization")){
 		if(PythonDataCollector::hasPyObject(self->id()))
 			PythonDataCollector::findCallback("attribute_specialization")(PythonDataCollector::findPyObject(self->id()));
@@ -150,6 +153,8 @@ void attribute__del__(Attribute &self){
 }
 
 void attribute_deleteItCallback(Attribute *self){
+	pythonWrapperUtils::GILEnsure ensureGIL;
+	
 	if(PythonDataCollector::hasCallback("attribute_deleteIt")){
 		if(PythonDataCollector::hasPyObject(self->id()))
 			PythonDataCollector::findCallback("attribute_deleteIt")(PythonDataCollector::findPyObject(self->id()));
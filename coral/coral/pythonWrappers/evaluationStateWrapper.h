@@ -0,0 +1,78 @@
+// <license>
+// Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+// This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+// 
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are
+// met:
+// 
+//    * Redistributions of source code must retain the above copyright
+//      notice, this list of conditions and the following disclaimer.
+// 
+//    * Redistributions in binary form must reproduce the above copyright
+//      notice, this list of conditions and the following disclaimer in the
+//      documentation and/or other materials provided with the distribution.
+// 
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+// IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+// PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+// LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+// NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+// SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// </license>
+
+
+#ifndef CORAL_EVALUATIONSTATEWRAPPER_H
+#define CORAL_EVALUATIONSTATEWRAPPER_H
+
+#include <boost/python.hpp>
+
+#include "../src/EvaluationState.h"
+#include "../src/EvaluationContext.h"
+#include "../src/Attribute.h"
+#include "../src/pythonWrapperUtils.h"
+
+void evaluationContext_wait(){
+	// the thread holding the claim runs a python node and needs the GIL to get done
+	if(!pythonWrapperUtils::pyGILEnsured){
+		PyThreadState *state = PyEval_SaveThread();
+		PyEval_RestoreThread(state);
+	}
+}
+
+void evaluationState_evaluate(Attribute *attribute, boost::python::list states){
+	std::vector<EvaluationState*> statesVector;
+	for(int i = 0; i < boost::python::len(states); ++i){
+		EvaluationState *state = boost::python::extract<EvaluationState*>(states[i]);
+		statesVector.push_back(state);
+	}
+	
+	// the states are evaluated by the tbb workers, which need the GIL to run python nodes
+	pythonWrapperUtils::GILRelease releaseGIL;
+	EvaluationState::evaluate(attribute, statesVector);
+}
+
+void evaluationStateWrapper(){
+	boost::python::class_<EvaluationState, boost::noncopyable>("EvaluationState")
+		.def("id", &EvaluationState::id)
+		.def("clear", &EvaluationState::clear)
+		.def("valuesCount", &EvaluationState::valuesCount)
+		.def("evaluate", evaluationState_evaluate)
+		.staticmethod("evaluate")
+		.def("current", &EvaluationState::current, boost::python::return_value_policy<boost::python::reference_existing_object>())
+		.staticmethod("current")
+		.def("setCurrent", &EvaluationState::setCurrent)
+		.staticmethod("setCurrent")
+	;
+	
+	#ifndef CORAL_PARALLEL_TBB
+		EvaluationContext::_waitCallback = evaluationContext_wait;
+	#endif
+}
+
+#endif
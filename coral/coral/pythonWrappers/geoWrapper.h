@@ -37,9 +37,146 @@
 #include "../src/GeoInstanceArrayAttribute.h"
 #include "../builtinNodes/GeoArrayInstanceNodes.h"
 
+// The arrays below view the Geo storage without copying it, they are read-only, keep the viewed values alive,
+// and never see later changes to the Geo, which replaces a storage rather than modifying it while it's viewed.
+boost::python::object geo_vec3Array(const boost::shared_ptr<const std::vector<Imath::V3f> > &values){
+	std::vector<Py_ssize_t> shape(1, values->size());
+	shape.push_back(3);
+	
+	return pythonWrapperUtils::numpyArray(values, values->size() ? &(*values)[0] : 0, 'f', shape);
+}
+
+boost::python::object geo_intArray(const boost::shared_ptr<const std::vector<int> > &values){
+	std::vector<Py_ssize_t> shape(1, values->size());
+	
+	return pythonWrapperUtils::numpyArray(values, values->size() ? &(*values)[0] : 0, 'i', shape);
+}
+
+boost::python::object geo_pointsArray(Geo &self){
+	return geo_vec3Array(self.sharedPoints());
+}
+
+boost::python::object geo_faceNormalsArray(Geo &self){
+	return geo_vec3Array(self.sharedFaceNormals());
+}
+
+boost::python::object geo_rawIndicesArray(Geo &self){
+	return geo_intArray(self.sharedRawIndices());
+}
+
+boost::python::object geo_rawIndexCountsArray(Geo &self){
+	return geo_intArray(self.sharedRawIndexCounts());
+}
+
+// Points are read with a single copy from any contiguous buffer of float32 items shaped (N,3) or flat,
+// any other sequence is converted point by point.
+class GeoPoints{
+public:
+	GeoPoints(boost::python::object points): _buffer(points, 'f', std::vector<Py_ssize_t>(1, 3)){
+		if(!_buffer.isBuffer()){
+			_convertedPoints = pythonWrapperUtils::pythonSequenceToStdVector<Imath::V3f>(points);
+		}
+	}
+	
+	const Imath::V3f *data() const{
+		if(_buffer.isBuffer()){
+			return (const Imath::V3f*)_buffer.data();
+		}
+		
+		return _convertedPoints.size() ? &_convertedPoints[0] : 0;
+	}
+	
+	unsigned int size() const{
+		return _buffer.isBuffer() ? _buffer.size() : _convertedPoints.size();
+	}
+
+private:
+	pythonWrapperUtils::BufferValues _buffer;
+	std::vector<Imath::V3f> _convertedPoints;
+};
+
+std::vector<int> geo_intValues(boost::python::object values){
+	pythonWrapperUtils::BufferValues buffer(values, 'i', std::vector<Py_ssize_t>());
+	if(buffer.isBuffer()){
+		const int *data = (const int*)buffer.data();
+		return std::vector<int>(data, data + buffer.size());
+	}
+	
+	return pythonWrapperUtils::pythonSequenceToStdVector<int>(values);
+}
+
+void geo_checkFaces(const std::vector<std::vector<int> > &faces, unsigned int pointsCount){
+	for(int i = 0; i < faces.size(); ++i){
+		const std::vector<int> &face = faces[i];
+		for(int j = 0; j < face.size(); ++j){
+			if(face[j] < 0 || face[j] >= pointsCount){
+				PyErr_SetString(PyExc_ValueError, "face index out of range");
+				boost::python::throw_error_already_set();
+			}
+		}
+	}
+}
+
+void geo_setPoints(Geo &self, boost::python::object points){
+	GeoPoints geoPoints(points);
+	if(geoPoints.size() != self.pointsCount()){
+		PyErr_SetString(PyExc_ValueError, "the number of points doesn't match the points of this Geo");
+		boost::python::throw_error_already_set();
+	}
+	
+	self.setPoints(geoPoints.data(), geoPoints.size());
+}
+
+// faces is a sequence of sequences of point indices
+void geo_build(Geo &self, boost::python::object points, boost::python::object faces){
+	GeoPoints geoPoints(points);
+	
+	std::vector<std::vector<int> > rawFaces(boost::python::len(faces));
+	for(int i = 0; i < rawFaces.size(); ++i){
+		rawFaces[i] = geo_intValues(faces[i]);
+	}
+	
+	geo_checkFaces(rawFaces, geoPoints.size());
+	self.build(geoPoints.data(), geoPoints.size(), rawFaces);
+}
+
+// the faces are packed like rawIndicesArray() and rawIndexCountsArray()
+void geo_buildFromRawIndices(Geo &self, boost::python::object points, boost::python::object rawIndices, boost::python::object rawIndexCounts){
+	GeoPoints geoPoints(points);
+	std::vector<int> indices = geo_intValues(rawIndices);
+	std::vector<int> counts = geo_intValues(rawIndexCounts);
+	
+	std::vector<std::vector<int> > rawFaces(counts.size());
+	unsigned int offset = 0;
+	for(int i = 0; i < counts.size(); ++i){
+		if(counts[i] < 0 || offset + counts[i] > indices.size()){
+			PyErr_SetString(PyExc_ValueError, "the index counts don't match the number of indices");
+			boost::python::throw_error_already_set();
+		}
+		
+		rawFaces[i].assign(indices.begin() + offset, indices.begin() + offset + counts[i]);
+		offset += counts[i];
+	}
+	
+	if(offset != indices.size()){
+		PyErr_SetString(PyExc_ValueError, "the index counts don't match the number of indices");
+		boost::python::throw_error_already_set();
+	}
+	
+	geo_checkFaces(rawFaces, geoPoints.size());
+	self.build(geoPoints.data(), geoPoints.size(), rawFaces);
+}
+
 void geoWrapper(){
 	boost::python::class_<Geo, boost::shared_ptr<Geo>, boost::python::bases<Value>, boost::noncopyable>("Geo", boost::python::no_init)
 		.def("__init__", pythonWrapperUtils::__init__<Geo>)
+		.def("pointsArray", geo_pointsArray)
+		.def("faceNormalsArray", geo_faceNormalsArray)
+		.def("rawIndicesArray", geo_rawIndicesArray)
+		.def("rawIndexCountsArray", geo_rawIndexCountsArray)
+		.def("setPoints", geo_setPoints)
+		.def("build", geo_build)
+		.def("build", geo_buildFromRawIndices)
 		.def("createUnwrapped", pythonWrapperUtils::createUnwrapped<Geo>)
 		.staticmethod("createUnwrapped")
 	;
@@ -36,7 +36,35 @@
 
 using namespace coral;
 
+// Returns a read-only numpy array of shape (height, width, channels) viewing the pixels without copying them,
+// the array keeps the viewed pixels alive and isn't affected by loading another image.
+boost::python::object image_pixelsArray(Image &self){
+	boost::shared_ptr<const std::vector<float> > pixels = self.sharedPixels();
+	
+	std::vector<Py_ssize_t> shape;
+	if(pixels->size()){
+		shape.push_back(self.height());
+		shape.push_back(self.width());
+		shape.push_back(self.channelCount());
+	}
+	else{
+		shape.resize(3, 0);
+	}
+	
+	return pythonWrapperUtils::numpyArray(pixels, self.pixels(), 'f', shape);
+}
+
 void imageNodeWrapper(){
+	boost::python::class_<Image, boost::shared_ptr<Image>, boost::python::bases<Value>, boost::noncopyable>("Image", boost::python::no_init)
+		.def("__init__", pythonWrapperUtils::__init__<Image>)
+		.def("width", &Image::width)
+		.def("height", &Image::height)
+		.def("channelCount", &Image::channelCount)
+		.def("pixelsArray", image_pixelsArray)
+		.def("createUnwrapped", pythonWrapperUtils::createUnwrapped<Image>)
+		.staticmethod("createUnwrapped")
+	;
+	
 	pythonWrapperUtils::pythonWrapper<ImageAttribute, Attribute>("ImageAttribute");
 	pythonWrapperUtils::pythonWrapper<ImageNode, Node>("ImageNode");
 }
@@ -39,6 +39,8 @@
 // TODO: change name of this file and other outdated wrappers
 
 void nestedObject_setNameCallback(NestedObject *self, const std::string &name){
+	pythonWrapperUtils::GILEnsure ensureGIL;
+	
 	if(PythonDataCollector::hasCallback("nestedObject_setName")){
 		if(PythonDataCollector::hasPyObject(self->id()))
 			PythonDataCollector::findCallback("nestedObject_setName")(PythonDataCollector::findPyObject(self->id()), name);
@@ -68,6 +70,7 @@ void nestedObjectWrapper(){
 		.def("findObject", nestedObject_findObject)
 		.def("fullName", &NestedObject::fullName)
 		.def("objects", &NestedObject::objects)
+		.def("isChildOf", &NestedObject::isChildOf)
 		.def("createUnwrapped", pythonWrapperUtils::createUnwrapped2<NestedObject, const std::string, Node*>)
 		.staticmethod("createUnwrapped")
 		;
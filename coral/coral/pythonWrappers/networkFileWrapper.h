@@ -0,0 +1,175 @@
+// <license>
+// Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+// This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+// 
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are
+// met:
+// 
+//    * Redistributions of source code must retain the above copyright
+//      notice, this list of conditions and the following disclaimer.
+// 
+//    * Redistributions in binary form must reproduce the above copyright
+//      notice, this list of conditions and the following disclaimer in the
+//      documentation and/or other materials provided with the distribution.
+// 
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+// IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+// PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+// LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+// NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+// SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// </license>
+
+
+#ifndef CORAL_NETWORKFILEWRAPPER_H
+#define CORAL_NETWORKFILEWRAPPER_H
+
+#include <boost/python.hpp>
+
+#include "../src/NetworkFile.h"
+#include "../src/Node.h"
+#include "../src/Attribute.h"
+#include "../src/PythonDataCollector.h"
+#include "../src/pythonWrapperUtils.h"
+
+int networkFile_nodeRecord(){
+	return int(NetworkFile::nodeRecord);
+}
+
+int networkFile_attributeRecord(){
+	return int(NetworkFile::attributeRecord);
+}
+
+int networkFile_specializationOverrideRecord(){
+	return int(NetworkFile::specializationOverrideRecord);
+}
+
+int networkFile_attributeAffectRecord(){
+	return int(NetworkFile::attributeAffectRecord);
+}
+
+int networkFile_specializationLinkRecord(){
+	return int(NetworkFile::specializationLinkRecord);
+}
+
+int networkFile_allowedSpecializationRecord(){
+	return int(NetworkFile::allowedSpecializationRecord);
+}
+
+int networkFile_valueRecord(){
+	return int(NetworkFile::valueRecord);
+}
+
+int networkFile_stringValueRecord(){
+	return int(NetworkFile::stringValueRecord);
+}
+
+int networkFile_connectionRecord(){
+	return int(NetworkFile::connectionRecord);
+}
+
+int networkFile_commandRecord(){
+	return int(NetworkFile::commandRecord);
+}
+
+int networkFile_recordType(NetworkFile &self, int record){
+	return int(self.recordType(record));
+}
+
+std::string networkFile_commandName(NetworkFile &self, int record, Node *topNode){
+	return self.command(record, topNode).name();
+}
+
+boost::python::dict networkFile_commandArgs(NetworkFile &self, int record, Node *topNode){
+	boost::python::dict argsDict;
+	
+	Command command = self.command(record, topNode);
+	std::vector<std::string> argNames = command.argNames();
+	for(int i = 0; i < argNames.size(); ++i){
+		const std::string &argName = argNames[i];
+		Command::CommandValueType type = command.argType(argName);
+		
+		if(type == Command::boolType){
+			argsDict[argName] = command.argAsBool(argName);
+		}
+		else if(type == Command::intType){
+			argsDict[argName] = command.argAsInt(argName);
+		}
+		else if(type == Command::floatType){
+			argsDict[argName] = command.argAsFloat(argName);
+		}
+		else{
+			argsDict[argName] = command.argAsString(argName);
+		}
+	}
+	
+	return argsDict;
+}
+
+Node *networkFile_createNodeCallback(const std::string &className, const std::string &name, Node *parent){
+	pythonWrapperUtils::GILEnsure ensureGIL;
+	
+	Node *node = 0;
+	if(PythonDataCollector::hasCallback("networkFile_createNode")){
+		boost::python::object pyNode = PythonDataCollector::findCallback("networkFile_createNode")(className, name, PythonDataCollector::findPyObject(parent->id()));
+		if(!pyNode.is_none()){
+			node = boost::python::extract<Node*>(pyNode);
+		}
+	}
+	
+	return node;
+}
+
+Attribute *networkFile_createAttributeCallback(const std::string &className, const std::string &name, Node *parent, bool input, bool output){
+	pythonWrapperUtils::GILEnsure ensureGIL;
+	
+	Attribute *attribute = 0;
+	if(PythonDataCollector::hasCallback("networkFile_createAttribute")){
+		boost::python::object pyAttribute = PythonDataCollector::findCallback("networkFile_createAttribute")(className, name, PythonDataCollector::findPyObject(parent->id()), input, output);
+		if(!pyAttribute.is_none()){
+			attribute = boost::python::extract<Attribute*>(pyAttribute);
+		}
+	}
+	
+	return attribute;
+}
+
+void networkFileWrapper(){
+	boost::python::class_<NetworkFile>("NetworkFile")
+		.def("setFromNode", &NetworkFile::setFromNode)
+		.def("addCommandsFromScript", &NetworkFile::addCommandsFromScript)
+		.def("data", &NetworkFile::data)
+		.def("setFromData", &NetworkFile::setFromData)
+		.def("isNetworkFileData", &NetworkFile::isNetworkFileData)
+		.staticmethod("isNetworkFileData")
+		.def("version", &NetworkFile::version)
+		.staticmethod("version")
+		.def("recordsCount", &NetworkFile::recordsCount)
+		.def("recordType", networkFile_recordType)
+		.def("commandName", networkFile_commandName)
+		.def("commandArgs", networkFile_commandArgs)
+		.def("applyRecords", &NetworkFile::applyRecords)
+		.def("errors", &NetworkFile::errors)
+		.add_static_property("nodeRecord", networkFile_nodeRecord)
+		.add_static_property("attributeRecord", networkFile_attributeRecord)
+		.add_static_property("specializationOverrideRecord", networkFile_specializationOverrideRecord)
+		.add_static_property("attributeAffectRecord", networkFile_attributeAffectRecord)
+		.add_static_property("specializationLinkRecord", networkFile_specializationLinkRecord)
+		.add_static_property("allowedSpecializationRecord", networkFile_allowedSpecializationRecord)
+		.add_static_property("valueRecord", networkFile_valueRecord)
+		.add_static_property("stringValueRecord", networkFile_stringValueRecord)
+		.add_static_property("connectionRecord", networkFile_connectionRecord)
+		.add_static_property("commandRecord", networkFile_commandRecord)
+	;
+	
+	NetworkFile::_createNodeCallback = networkFile_createNodeCallback;
+	NetworkFile::_createAttributeCallback = networkFile_createAttributeCallback;
+}
+
+#endif
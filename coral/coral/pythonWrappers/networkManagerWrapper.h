@@ -34,18 +34,58 @@
 #include <boost/python.hpp>
 
 #include "../src/NetworkManager.h"
+#include "../src/NestedObject.h"
+#include "../src/Node.h"
 #include "../src/PythonDataCollector.h"
+#include "../src/pythonWrapperUtils.h"
 
 boost::python::object nodeManager_findObjectById(int id){
 	return PythonDataCollector::findPyObject(id);
 }
 
+boost::python::object nodeManager_findObjectByFullName(const std::string &fullName){
+	boost::python::object pyObject;
+	
+	NestedObject *object = NetworkManager::findObjectByFullName(fullName);
+	if(object){
+		pyObject = PythonDataCollector::findPyObject(object->id());
+	}
+	
+	return pyObject;
+}
+
+void networkManager_deleteNodes(boost::python::list nodes){
+	std::vector<Node*> nodesToDelete;
+	for(int i = 0; i < boost::python::len(nodes); ++i){
+		nodesToDelete.push_back(boost::python::extract<Node*>(nodes[i]));
+	}
+	
+	NetworkManager::deleteNodes(nodesToDelete);
+}
+
+void networkManager_deleteNodesCallback(const std::vector<Node*> &nodes){
+	pythonWrapperUtils::GILEnsure ensureGIL;
+	
+	if(PythonDataCollector::hasCallback("networkManager_deleteNodes")){
+		boost::python::list pyNodes;
+		for(int i = 0; i < nodes.size(); ++i){
+			if(PythonDataCollector::hasPyObject(nodes[i]->id())){
+				pyNodes.append(PythonDataCollector::findPyObject(nodes[i]->id()));
+			}
+		}
+		
+		PythonDataCollector::findCallback("networkManager_deleteNodes")(pyNodes);
+	}
+}
+
 void networkManagerWrapper(){
 	boost::python::class_<NetworkManager>("NetworkManager")
 		.def("objectCount", &NetworkManager::objectCount)
 		.staticmethod("objectCount")
 		.def("findObjectById", nodeManager_findObjectById)
 		.staticmethod("findObjectById")
+		.def("findObjectByFullName", nodeManager_findObjectByFullName)
+		.staticmethod("findObjectByFullName")
 		.def("allowConnection", &NetworkManager::allowConnection)
 		.staticmethod("allowConnection")
 		.def("connect", &NetworkManager::connect, ("sourceAttribute", "destinationAttribute", boost::python::args("errorObject") = boost::python::object()))
@@ -58,7 +98,17 @@ void networkManagerWrapper(){
 		.staticmethod("addSearchPath")
 		.def("removeSearchPath", &NetworkManager::removeSearchPath)
 		.staticmethod("removeSearchPath")
+		.def("beginEditTransaction", &NetworkManager::beginEditTransaction)
+		.staticmethod("beginEditTransaction")
+		.def("commitEditTransaction", &NetworkManager::commitEditTransaction)
+		.staticmethod("commitEditTransaction")
+		.def("editTransactionOpen", &NetworkManager::editTransactionOpen)
+		.staticmethod("editTransactionOpen")
+		.def("deleteNodes", networkManager_deleteNodes)
+		.staticmethod("deleteNodes")
 	;
+	
+	NetworkManager::_deleteNodesCallback = networkManager_deleteNodesCallback;
 }
 
 #endif
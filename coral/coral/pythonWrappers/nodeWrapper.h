@@ -43,15 +43,23 @@
 #include "../src/ErrorObject.h"
 #include "../src/PythonDataCollector.h"
 #include "../src/pythonWrapperUtils.h"
+#include "numericNodesWrapper.h"
 
 using namespace coral;
 
 class NodeWrapper: public Node, public boost::python::wrapper<Node>{
 public:
-	NodeWrapper(const std::string &name, Node *parent): Node(name, parent){
+	NodeWrapper(const std::string &name, Node *parent): Node(name, parent), _arrayCompute(false){
+	}
+	
+	// Python nodes in array compute mode, see coral.ArrayNode, reimplement compute(attribute, inputs) rather than update(attribute).
+	void setArrayCompute(bool value){
+		_arrayCompute = value;
 	}
 	
 	void setName(const std::string &name){
+		pythonWrapperUtils::GILEnsure ensureGIL;
+		
 		// TODO: findPyObject shouldn't be needed to get a pointer to self, investigate...
 		boost::python::object self = PythonDataCollector::findPyObject(id());
 		
@@ -63,12 +71,12 @@ public:
 	}
 	
 	void update(Attribute *attribute){
-		bool releaseGIL = false;
-		PyGILState_STATE state;
-		if(!pythonWrapperUtils::pyGILEnsured){
-			releaseGIL = true;
-			state = PyGILState_Ensure();
+		if(_arrayCompute){
+			Node::update(attribute);
+			return;
 		}
+		
+		pythonWrapperUtils::GILEnsure ensureGIL;
 
 		boost::python::object attr = PythonDataCollector::findPyObject(attribute->id());
 		boost::python::object self = PythonDataCollector::findPyObject(id());
@@ -79,18 +87,71 @@ public:
 		catch(...){
 			PyErr_Print();
 		}
-
-		if(releaseGIL){
-			PyGILState_Release(state);
-			pythonWrapperUtils::pyGILEnsured = false;
-		}
 	}
 	
 	void update_default(Attribute *attribute){
+		pythonWrapperUtils::GILRelease releaseGIL;
+		
 		Node::update(attribute);
 	}
 	
+	// Invokes compute once for all the slices, the GIL is taken once the inputs affecting attribute are computed.
+	void updateSlices(Attribute *attribute){
+		if(!_arrayCompute){
+			Node::updateSlices(attribute);
+			return;
+		}
+		
+		const std::vector<Attribute*> &inputAttributes = this->inputAttributes();
+		const std::vector<Attribute*> &affectedBy = attribute->affectedBy();
+		std::vector<Value*> inputValues(inputAttributes.size(), (Value*)0);
+		for(int i = 0; i < inputAttributes.size(); ++i){
+			if(std::find(affectedBy.begin(), affectedBy.end(), inputAttributes[i]) != affectedBy.end()){
+				inputValues[i] = inputAttributes[i]->value();
+			}
+		}
+		
+		pythonWrapperUtils::GILEnsure ensureGIL;
+		
+		try{
+			unsigned int slices = this->slices();
+			
+			boost::python::list inputs;
+			for(int i = 0; i < inputValues.size(); ++i){
+				Value *value = inputValues[i];
+				Numeric *numeric = dynamic_cast<Numeric*>(value);
+				if(numeric){
+					boost::python::list sliceArrays;
+					for(unsigned int slice = 0; slice < slices; ++slice){
+						sliceArrays.append(numeric_valuesArraySlice(*numeric, slice));
+					}
+					
+					inputs.append(sliceArrays);
+				}
+				else if(value){
+					inputs.append(PythonDataCollector::findPyObject(value->id()));
+				}
+				else{
+					inputs.append(boost::python::object());
+				}
+			}
+			
+			boost::python::object self = PythonDataCollector::findPyObject(id());
+			boost::python::object attr = PythonDataCollector::findPyObject(attribute->id());
+			boost::python::object outputs = boost::python::call_method<boost::python::object>(self.ptr(), "compute", attr, inputs);
+			
+			if(!outputs.is_none()){
+				setComputedValues(attribute, outputs, slices);
+			}
+		}
+		catch(...){
+			PyErr_Print();
+		}
+	}
+	
 	void updateSpecializationLink(Attribute *attributeA, Attribute *attributeB, std::vector<std::string> &specializationA, std::vector<std::string> &specializationB){
+		pythonWrapperUtils::GILEnsure ensureGIL;
+		
 		boost::python::object attrA = PythonDataCollector::findPyObject(attributeA->id());
 		boost::python::object attrB = PythonDataCollector::findPyObject(attributeB->id());
 		boost::python::object self = PythonDataCollector::findPyObject(id());
@@ -130,6 +191,8 @@ public:
 	}
 	
 	std::string asScript(){
+		pythonWrapperUtils::GILEnsure ensureGIL;
+		
 		boost::python::object self = PythonDataCollector::findPyObject(id());
 		
 		return boost::python::call_method<std::string>(self.ptr(), "asScript");
@@ -140,6 +203,8 @@ public:
 	}
 	
 	void deleteIt(){
+		pythonWrapperUtils::GILEnsure ensureGIL;
+		
 		boost::python::object self = PythonDataCollector::findPyObject(id());
 
 		try{
@@ -155,6 +220,8 @@ public:
 	}
 
 	void attributeDirtied(Attribute *attribute){
+		pythonWrapperUtils::GILEnsure ensureGIL;
+		
 		boost::python::object self = PythonDataCollector::findPyObject(id());
 		boost::python::object attr = PythonDataCollector::findPyObject(attribute->id());
 
@@ -172,6 +239,8 @@ public:
 	}
 
 	void addDynamicAttribute(Attribute *attribute){
+		pythonWrapperUtils::GILEnsure ensureGIL;
+		
 		boost::python::object self = PythonDataCollector::findPyObject(id());
 		boost::python::object attr = PythonDataCollector::findPyObject(attribute->id());
 
@@ -188,6 +257,8 @@ public:
 	}
 
 	std::string shortDebugInfo(){
+		pythonWrapperUtils::GILEnsure ensureGIL;
+		
 		boost::python::object self = PythonDataCollector::findPyObject(id());
 		
 		return boost::python::call_method<std::string>(self.ptr(), "shortDebugInfo");
@@ -196,6 +267,27 @@ public:
 	std::string shortDebugInfo_default(){
 		return Node::shortDebugInfo();
 	}
+
+private:
+	void setComputedValues(Attribute *attribute, boost::python::object values, unsigned int slices){
+		Numeric *numeric = dynamic_cast<Numeric*>(attribute->outValue());
+		if(!numeric){
+			PyErr_SetString(PyExc_TypeError, "compute can only return the values of numeric attributes");
+			boost::python::throw_error_already_set();
+		}
+		
+		bool sliceValues = PyList_Check(values.ptr()) || PyTuple_Check(values.ptr());
+		if(sliceValues && boost::python::len(values) != slices){
+			PyErr_SetString(PyExc_ValueError, "compute must return an array for each slice");
+			boost::python::throw_error_already_set();
+		}
+		
+		for(unsigned int slice = 0; slice < slices; ++slice){
+			numeric_setValuesSlice(*numeric, slice, sliceValues ? values[slice] : values);
+		}
+	}
+	
+	bool _arrayCompute;
 };
 
 boost::python::object node_parent(Node &self){
@@ -254,6 +346,8 @@ boost::python::object node_outputAttributeAt(Node &self, int position){
 }
 
 void node_addNodeCallback(Node *self, Node *node){
+	pythonWrapperUtils::GILEnsure ensureGIL;
+	
 	if(PythonDataCollector::hasCallback("node_addNode")){
 		if(PythonDataCollector::hasPyObject(self->id() && node->id()))
 			PythonDataCollector::findCallback("node_addNode")(PythonDataCollector::findPyObject(self->id()), PythonDataCollector::findPyObject(node->id()));
@@ -261,6 +355,8 @@ void node_addNodeCallback(Node *self, Node *node){
 }
 
 void node_removeNodeCallback(Node *self, Node *node){
+	pythonWrapperUtils::GILEnsure ensureGIL;
+	
 	if(PythonDataCollector::hasCallback("node_removeNode")){
 		if(PythonDataCollector::hasPyObject(self->id()) && PythonDataCollector::hasPyObject(node->id()))
 			PythonDataCollector::findCallback("node_removeNode")(PythonDataCollector::findPyObject(self->id()), PythonDataCollector::findPyObject(node->id()));
@@ -268,6 +364,8 @@ void node_removeNodeCallback(Node *self, Node *node){
 }
 
 void node_addInputAttributeCallback(Node *self, Attribute *attribute){
+	pythonWrapperUtils::GILEnsure ensureGIL;
+	
 	if(PythonDataCollector::hasCallback("node_addInputAttribute")){
 		if(PythonDataCollector::hasPyObject(self->id()) && PythonDataCollector::hasPyObject(attribute->id()))
 			PythonDataCollector::findCallback("node_addInputAttribute")(PythonDataCollector::findPyObject(self->id()), PythonDataCollector::findPyObject(attribute->id()));
@@ -275,6 +373,8 @@ void node_addInputAttributeCallback(Node *self, Attribute *attribute){
 }
 
 void node_addOutputAttributeCallback(Node *self, Attribute *attribute){
+	pythonWrapperUtils::GILEnsure ensureGIL;
+	
 	if(PythonDataCollector::hasCallback("node_addOutputAttribute")){
 		if(PythonDataCollector::hasPyObject(self->id()) && PythonDataCollector::hasPyObject(attribute->id()))
 			PythonDataCollector::findCallback("node_addOutputAttribute")(PythonDataCollector::findPyObject(self->id()), PythonDataCollector::findPyObject(attribute->id()));
@@ -282,6 +382,8 @@ void node_addOutputAttributeCallback(Node *self, Attribute *attribute){
 }
 
 void node_connectionChangedCallback(Node *self, Attribute *attribute){
+	pythonWrapperUtils::GILEnsure ensureGIL;
+	
 	if(PythonDataCollector::hasCallback("node_connectionChanged")){
 		if(PythonDataCollector::hasPyObject(self->id()) && PythonDataCollector::hasPyObject(attribute->id()))
 			PythonDataCollector::findCallback("node_connectionChanged")(PythonDataCollector::findPyObject(self->id()), PythonDataCollector::findPyObject(attribute->id()));
@@ -318,6 +420,8 @@ void node__del__(Node &self){
 }
 
 void node_deleteItCallback(Node *self){
+	pythonWrapperUtils::GILEnsure ensureGIL;
+	
 	if(PythonDataCollector::hasCallback("node_deleteIt")){
 		if(PythonDataCollector::hasPyObject(self->id()))
 			PythonDataCollector::findCallback("node_deleteIt")(PythonDataCollector::findPyObject(self->id()));
@@ -325,6 +429,8 @@ void node_deleteItCallback(Node *self){
 }
 
 void node_removeAttributeCallback(Node *self, Attribute *attribute){
+	pythonWrapperUtils::GILEnsure ensureGIL;
+	
 	if(PythonDataCollector::hasCallback("node_removeAttribute")){
 		if(PythonDataCollector::hasPyObject(self->id()) && PythonDataCollector::hasPyObject(attribute->id()))
 			PythonDataCollector::findCallback("node_removeAttribute")(PythonDataCollector::findPyObject(self->id()), PythonDataCollector::findPyObject(attribute->id()));
@@ -389,6 +495,10 @@ void node_addAttributeSpecializationLink(Node &self, Attribute *attributeA, Attr
 	NodeAccessor::_addAttributeSpecializationLink(self, attributeA, attributeB);
 }
 
+void node_setArrayCompute(NodeWrapper &self, bool value){
+	self.setArrayCompute(value);
+}
+
 void node_setUpdateEnabled(Node &self, bool value){
 	NodeAccessor::_setUpdateEnabled(self, value);
 }
@@ -419,6 +529,7 @@ void nodeWrapper(){
 		.def("outputAttributeAt", node_outputAttributeAt)
 		.def("removeNode", &Node::removeNode)
 		.def("containsNode", &Node::containsNode)
+		.def("containsAttribute", &Node::containsAttribute)
 		.def("update", &Node::update, &NodeWrapper::update_default)
 		.def("nodes", &Node::nodes)
 		.def("inputAttributes", node_inputAttributes)
@@ -440,6 +551,7 @@ void nodeWrapper(){
 		.def("isValid", &Node::isValid)
 		.def("updateEnabled", &Node::updateEnabled)
 		.def("_setUpdateEnabled", node_setUpdateEnabled)
+		.def("_setArrayCompute", node_setArrayCompute)
 		.def("debugInfo", &Node::debugInfo)
 		.def("computeTimeTicks", &Node::computeTimeTicks)
 		.def("computeTimeMilliseconds", &Node::computeTimeMilliseconds)
@@ -461,6 +573,16 @@ void nodeWrapper(){
 		.def("_setSliceable", node_setSliceable)
 		.def("slicer", &node_slicer)
 		.def("shortDebugInfo", &Node::shortDebugInfo, &NodeWrapper::shortDebugInfo_default)
+		.def("setOutputCacheEnabled", &Node::setOutputCacheEnabled)
+		.def("outputCacheEnabled", &Node::outputCacheEnabled)
+		.def("setEarlyCutoffEnabled", &Node::setEarlyCutoffEnabled)
+		.def("earlyCutoffEnabled", &Node::earlyCutoffEnabled)
+		.def("setEarlyCutoffAllowed", &Node::setEarlyCutoffAllowed)
+		.staticmethod("setEarlyCutoffAllowed")
+		.def("earlyCutoffAllowed", &Node::earlyCutoffAllowed)
+		.staticmethod("earlyCutoffAllowed")
+		.def("setArrayGrainSize", &Node::setArrayGrainSize)
+		.def("arrayGrainSize", &Node::arrayGrainSize)
 	;
 	
 	Node::_addNodeCallback = node_addNodeCallback;
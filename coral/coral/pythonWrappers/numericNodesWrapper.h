@@ -117,18 +117,168 @@ std::vector<float> numeric_floatValues(Numeric &self){
 	return self.floatValues();
 }
 
-void numeric_setFloatValues(Numeric &self, boost::python::list pyList){
-	std::vector<float> convertedList;
-	for(int i = 0; i < boost::python::len(pyList); ++i){
-		float val = boost::python::extract<float>(pyList[i]);
-		convertedList.push_back(val);
+std::vector<int> numeric_intValues(Numeric &self){
+	return self.intValues();
+}
+
+template<class T>
+boost::python::object numeric_valuesArrayOf(Numeric &self, unsigned int slice, char format, Py_ssize_t rows, Py_ssize_t columns){
+	NumericSpan<const T> values;
+	boost::shared_ptr<const std::vector<char> > buffer = self.sharedValuesSlice<T>(slice, values);
+	
+	std::vector<Py_ssize_t> shape(1, values.size());
+	if(rows){
+		shape.push_back(rows);
+	}
+	if(columns){
+		shape.push_back(columns);
 	}
+	
+	return pythonWrapperUtils::numpyArray(buffer, values.data(), format, shape);
+}
 
-	self.setFloatValues(convertedList);
+// Returns a read-only numpy array viewing the values without copying them, of shape (N,), (N,3), (N,4) or (N,4,4).
+// Quaternions are laid out as (r, x, y, z). The array keeps the viewed values alive and never sees later changes to this Numeric,
+// which copies its values before modifying them while they are viewed.
+boost::python::object numeric_valuesArraySlice(Numeric &self, unsigned int slice){
+	Numeric::Type type = self.type();
+	if(type == Numeric::numericTypeInt || type == Numeric::numericTypeIntArray){
+		return numeric_valuesArrayOf<int>(self, slice, 'i', 0, 0);
+	}
+	else if(type == Numeric::numericTypeVec3 || type == Numeric::numericTypeVec3Array){
+		return numeric_valuesArrayOf<Imath::V3f>(self, slice, 'f', 3, 0);
+	}
+	else if(type == Numeric::numericTypeCol4 || type == Numeric::numericTypeCol4Array){
+		return numeric_valuesArrayOf<Imath::Color4f>(self, slice, 'f', 4, 0);
+	}
+	else if(type == Numeric::numericTypeQuat || type == Numeric::numericTypeQuatArray){
+		return numeric_valuesArrayOf<Imath::Quatf>(self, slice, 'f', 4, 0);
+	}
+	else if(type == Numeric::numericTypeMatrix44 || type == Numeric::numericTypeMatrix44Array){
+		return numeric_valuesArrayOf<Imath::M44f>(self, slice, 'f', 4, 4);
+	}
+	
+	return numeric_valuesArrayOf<float>(self, slice, 'f', 0, 0);
 }
 
-std::vector<int> numeric_intValues(Numeric &self){
-	return self.intValues();
+boost::python::object numeric_valuesArray(Numeric &self){
+	return numeric_valuesArraySlice(self, 0);
+}
+
+// Values are read from any contiguous buffer of int32 or float32 items, shaped like valuesArray() or flat, with a single memcpy,
+// any other sequence is converted value by value.
+template<class T>
+void numeric_setValuesSliceOf(Numeric &self, unsigned int slice, boost::python::object values, char format, Py_ssize_t rows, Py_ssize_t columns){
+	// every array type follows its single type
+	Numeric::Type valuesType = NumericValuesType<T>::type;
+	if(self.type() != valuesType && self.type() != Numeric::Type(valuesType + 1)){
+		PyErr_SetString(PyExc_TypeError, "the values don't match the type of this Numeric");
+		boost::python::throw_error_already_set();
+	}
+	
+	std::vector<Py_ssize_t> valueShape;
+	if(rows){
+		valueShape.push_back(rows);
+	}
+	if(columns){
+		valueShape.push_back(columns);
+	}
+	
+	pythonWrapperUtils::BufferValues buffer(values, format, valueShape);
+	const void *data = buffer.data();
+	unsigned int size = buffer.size();
+	
+	std::vector<T> convertedValues;
+	if(!buffer.isBuffer()){
+		convertedValues = pythonWrapperUtils::pythonSequenceToStdVector<T>(values);
+		data = convertedValues.size() ? &convertedValues[0] : 0;
+		size = convertedValues.size();
+	}
+	
+	NumericSpan<T> sliceValues = self.resizeValuesSpanSlice<T>(slice, size);
+	if(sliceValues.size() != size){
+		PyErr_SetString(PyExc_IndexError, "the slice is out of range");
+		boost::python::throw_error_already_set();
+	}
+	
+	if(size){
+		memcpy(sliceValues.data(), data, size * sizeof(T));
+	}
+}
+
+void numeric_setIntValuesSlice(Numeric &self, unsigned int slice, boost::python::object values){
+	numeric_setValuesSliceOf<int>(self, slice, values, 'i', 0, 0);
+}
+
+void numeric_setFloatValuesSlice(Numeric &self, unsigned int slice, boost::python::object values){
+	numeric_setValuesSliceOf<float>(self, slice, values, 'f', 0, 0);
+}
+
+void numeric_setVec3ValuesSlice(Numeric &self, unsigned int slice, boost::python::object values){
+	numeric_setValuesSliceOf<Imath::V3f>(self, slice, values, 'f', 3, 0);
+}
+
+void numeric_setCol4ValuesSlice(Numeric &self, unsigned int slice, boost::python::object values){
+	numeric_setValuesSliceOf<Imath::Color4f>(self, slice, values, 'f', 4, 0);
+}
+
+void numeric_setQuatValuesSlice(Numeric &self, unsigned int slice, boost::python::object values){
+	numeric_setValuesSliceOf<Imath::Quatf>(self, slice, values, 'f', 4, 0);
+}
+
+void numeric_setMatrix44ValuesSlice(Numeric &self, unsigned int slice, boost::python::object values){
+	numeric_setValuesSliceOf<Imath::M44f>(self, slice, values, 'f', 4, 4);
+}
+
+// Sets the values of a slice according to the type of this Numeric, see numeric_setValuesSliceOf().
+void numeric_setValuesSlice(Numeric &self, unsigned int slice, boost::python::object values){
+	Numeric::Type type = self.type();
+	if(type == Numeric::numericTypeInt || type == Numeric::numericTypeIntArray){
+		numeric_setIntValuesSlice(self, slice, values);
+	}
+	else if(type == Numeric::numericTypeFloat || type == Numeric::numericTypeFloatArray){
+		numeric_setFloatValuesSlice(self, slice, values);
+	}
+	else if(type == Numeric::numericTypeVec3 || type == Numeric::numericTypeVec3Array){
+		numeric_setVec3ValuesSlice(self, slice, values);
+	}
+	else if(type == Numeric::numericTypeCol4 || type == Numeric::numericTypeCol4Array){
+		numeric_setCol4ValuesSlice(self, slice, values);
+	}
+	else if(type == Numeric::numericTypeQuat || type == Numeric::numericTypeQuatArray){
+		numeric_setQuatValuesSlice(self, slice, values);
+	}
+	else if(type == Numeric::numericTypeMatrix44 || type == Numeric::numericTypeMatrix44Array){
+		numeric_setMatrix44ValuesSlice(self, slice, values);
+	}
+	else{
+		PyErr_SetString(PyExc_TypeError, "the Numeric has no type yet");
+		boost::python::throw_error_already_set();
+	}
+}
+
+void numeric_setIntValues(Numeric &self, boost::python::object values){
+	numeric_setIntValuesSlice(self, 0, values);
+}
+
+void numeric_setFloatValues(Numeric &self, boost::python::object values){
+	numeric_setFloatValuesSlice(self, 0, values);
+}
+
+void numeric_setVec3Values(Numeric &self, boost::python::object values){
+	numeric_setVec3ValuesSlice(self, 0, values);
+}
+
+void numeric_setCol4Values(Numeric &self, boost::python::object values){
+	numeric_setCol4ValuesSlice(self, 0, values);
+}
+
+void numeric_setQuatValues(Numeric &self, boost::python::object values){
+	numeric_setQuatValuesSlice(self, 0, values);
+}
+
+void numeric_setMatrix44Values(Numeric &self, boost::python::object values){
+	numeric_setMatrix44ValuesSlice(self, 0, values);
 }
 
 void numericNodesWrapper(){
@@ -155,17 +305,26 @@ void numericNodesWrapper(){
 		.def("col4Values", numeric_col4Values)
 		.def("quatValues", numeric_quatValues)
 		.def("matrix44Values", numeric_matrix44Values)
+		.def("valuesArray", numeric_valuesArray)
+		.def("valuesArraySlice", numeric_valuesArraySlice)
 		.def("intValueAt", &Numeric::intValueAt)
 		.def("floatValueAt", &Numeric::floatValueAt)
 		.def("vec3ValueAt", &Numeric::vec3ValueAt)
 		.def("col4ValueAt", &Numeric::col4ValueAt)
 		.def("quatValueAt", &Numeric::quatValueAt)
 		.def("matrix44ValueAt", &Numeric::matrix44ValueAt)
-		.def("setIntValues", &Numeric::setIntValues)
+		.def("setIntValues", numeric_setIntValues)
 		.def("setFloatValues", numeric_setFloatValues)
-		.def("setVec3Values", &Numeric::setVec3Values)
-		.def("setCol4Values", &Numeric::setCol4Values)
-		.def("setMatrix44Values", &Numeric::setMatrix44Values)
+		.def("setVec3Values", numeric_setVec3Values)
+		.def("setCol4Values", numeric_setCol4Values)
+		.def("setQuatValues", numeric_setQuatValues)
+		.def("setMatrix44Values", numeric_setMatrix44Values)
+		.def("setIntValuesSlice", numeric_setIntValuesSlice)
+		.def("setFloatValuesSlice", numeric_setFloatValuesSlice)
+		.def("setVec3ValuesSlice", numeric_setVec3ValuesSlice)
+		.def("setCol4ValuesSlice", numeric_setCol4ValuesSlice)
+		.def("setQuatValuesSlice", numeric_setQuatValuesSlice)
+		.def("setMatrix44ValuesSlice", numeric_setMatrix44ValuesSlice)
 		.add_static_property("numericTypeAny", numeric_numericTypeAny)
 		.add_static_property("numericTypeInt", numeric_numericTypeInt)
 		.add_static_property("numericTypeIntArray", numeric_numericTypeIntArray)
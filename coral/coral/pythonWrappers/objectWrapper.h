@@ -38,6 +38,9 @@
 #include "../src/pythonWrapperUtils.h"
 
 void object_addReferenceCallback(Object *object){
+	// references are also taken and dropped by C++ code running with the GIL released, such as connect() or an evaluation
+	pythonWrapperUtils::GILEnsure ensureGIL;
+	
 	boost::python::object pyObject = PythonDataCollector::findPyObject(object->id());
 	
 	if(!pyObject){
@@ -53,6 +56,8 @@ void object_addReferenceCallback(Object *object){
 }
 
 void object_removeReferenceCallback(Object *object){
+	pythonWrapperUtils::GILEnsure ensureGIL;
+	
 	PyObject *pyObj = PythonDataCollector::findPyObjectPtr(object->id());
 	
 	if(pyObj){
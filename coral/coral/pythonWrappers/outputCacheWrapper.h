@@ -0,0 +1,62 @@
+// <license>
+// Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+// This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+// 
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are
+// met:
+// 
+//    * Redistributions of source code must retain the above copyright
+//      notice, this list of conditions and the following disclaimer.
+// 
+//    * Redistributions in binary form must reproduce the above copyright
+//      notice, this list of conditions and the following disclaimer in the
+//      documentation and/or other materials provided with the distribution.
+// 
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+// IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+// PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+// LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+// NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+// SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// </license>
+
+
+#ifndef CORAL_OUTPUTCACHEWRAPPER_H
+#define CORAL_OUTPUTCACHEWRAPPER_H
+
+#include <boost/python.hpp>
+
+#include "../src/OutputCache.h"
+
+void outputCacheWrapper(){
+	boost::python::class_<OutputCache>("OutputCache")
+		.def("setEnabled", &OutputCache::setEnabled)
+		.staticmethod("setEnabled")
+		.def("enabled", &OutputCache::enabled)
+		.staticmethod("enabled")
+		.def("setMemoryBudget", &OutputCache::setMemoryBudget)
+		.staticmethod("setMemoryBudget")
+		.def("memoryBudget", &OutputCache::memoryBudget)
+		.staticmethod("memoryBudget")
+		.def("memoryUsed", &OutputCache::memoryUsed)
+		.staticmethod("memoryUsed")
+		.def("entriesCount", &OutputCache::entriesCount)
+		.staticmethod("entriesCount")
+		.def("hits", &OutputCache::hits)
+		.staticmethod("hits")
+		.def("misses", &OutputCache::misses)
+		.staticmethod("misses")
+		.def("resetStats", &OutputCache::resetStats)
+		.staticmethod("resetStats")
+		.def("clear", &OutputCache::clear)
+		.staticmethod("clear")
+	;
+}
+
+#endif
@@ -38,6 +38,12 @@
 #include "../tests/coralTests.h"
 
 #include "networkManagerWrapper.h"
+#include "outputCacheWrapper.h"
+#include "parallelArraysWrapper.h"
+#include "arrayFusionWrapper.h"
+#include "tracerWrapper.h"
+#include "networkFileWrapper.h"
+#include "evaluationStateWrapper.h"
 #include "nodeWrapper.h"
 #include "objectWrapper.h"
 #include "nestedObjectWrapper.h"
@@ -92,6 +98,9 @@ void coral_setCallback(const std::string &message, boost::python::object callbac
 
 BOOST_PYTHON_MODULE(_coral)
 {
+	// the bindings release the GIL while evaluating and python nodes take it back from any thread
+	PyEval_InitThreads();
+	
 	boost::python::def("setCallback", coral_setCallback);
 	boost::python::def("runTests", coralTests::run);
 	
@@ -101,6 +110,12 @@ BOOST_PYTHON_MODULE(_coral)
 	attributeWrapper();
 	nodeWrapper();
 	networkManagerWrapper();
+	outputCacheWrapper();
+	parallelArraysWrapper();
+	arrayFusionWrapper();
+	tracerWrapper();
+	networkFileWrapper();
+	evaluationStateWrapper();
 	loopNodesWrapper();
 	numericNodesWrapper();
 	mathNodesWrapper();
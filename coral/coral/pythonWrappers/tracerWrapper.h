@@ -0,0 +1,80 @@
+// <license>
+// Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+// This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+// 
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are
+// met:
+// 
+//    * Redistributions of source code must retain the above copyright
+//      notice, this list of conditions and the following disclaimer.
+// 
+//    * Redistributions in binary form must reproduce the above copyright
+//      notice, this list of conditions and the following disclaimer in the
+//      documentation and/or other materials provided with the distribution.
+// 
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+// IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+// PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+// LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+// NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+// SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// </license>
+
+
+#ifndef CORAL_TRACERWRAPPER_H
+#define CORAL_TRACERWRAPPER_H
+
+#include <boost/python.hpp>
+
+#include "../src/Tracer.h"
+#include "../src/NetworkManager.h"
+#include "../src/NestedObject.h"
+
+boost::python::dict tracer_nodeStats(){
+	boost::python::dict statsDict;
+	
+	std::vector<TraceNodeStats> nodeStats = Tracer::nodeStats();
+	for(int i = 0; i < nodeStats.size(); ++i){
+		TraceNodeStats &stats = nodeStats[i];
+		
+		NestedObject *node = dynamic_cast<NestedObject*>(NetworkManager::findObjectById(stats.nodeId));
+		if(node){
+			boost::python::dict nodeDict;
+			nodeDict["updates"] = stats.updates;
+			nodeDict["slices"] = stats.slices;
+			nodeDict["totalMicroseconds"] = stats.totalTime;
+			nodeDict["maxMicroseconds"] = stats.maxTime;
+			
+			statsDict[node->fullName()] = nodeDict;
+		}
+	}
+	
+	return statsDict;
+}
+
+void tracerWrapper(){
+	boost::python::class_<Tracer>("Tracer")
+		.def("startCapture", &Tracer::startCapture, (boost::python::args("maxEvents") = 65536))
+		.staticmethod("startCapture")
+		.def("stopCapture", &Tracer::stopCapture)
+		.staticmethod("stopCapture")
+		.def("capturing", &Tracer::capturing)
+		.staticmethod("capturing")
+		.def("eventsCount", &Tracer::eventsCount)
+		.staticmethod("eventsCount")
+		.def("nodeStats", tracer_nodeStats)
+		.staticmethod("nodeStats")
+		.def("chromeTrace", &Tracer::chromeTrace)
+		.staticmethod("chromeTrace")
+		.def("saveChromeTrace", &Tracer::saveChromeTrace)
+		.staticmethod("saveChromeTrace")
+	;
+}
+
+#endif
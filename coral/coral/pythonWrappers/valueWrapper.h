@@ -51,6 +51,7 @@ void valueWrapper(){
 		.def("createUnwrapped", pythonWrapperUtils::createUnwrapped<Value>)
 		.staticmethod("createUnwrapped")
 		.def("setFromString", &Value::setFromString)
+		.def("version", &Value::version)
 		.def("asString()", &Value::asString)
 	;
 }
@@ -0,0 +1,486 @@
+// <license>
+// Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+// This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+// 
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are
+// met:
+// 
+//    * Redistributions of source code must retain the above copyright
+//      notice, this list of conditions and the following disclaimer.
+// 
+//    * Redistributions in binary form must reproduce the above copyright
+//      notice, this list of conditions and the following disclaimer in the
+//      documentation and/or other materials provided with the distribution.
+// 
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+// IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+// PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+// LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+// NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+// SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// </license>
+
+#ifdef CORAL_PARALLEL_TBB
+	#include <tbb/mutex.h>
+#endif
+
+#include <map>
+#include <algorithm>
+
+#include "ArrayFusion.h"
+#include "Node.h"
+#include "Attribute.h"
+#include "Numeric.h"
+#include "OutputCache.h"
+#include "ParallelArrays.h"
+#include "EvaluationContext.h"
+#include "EvaluationState.h"
+#include "NetworkManager.h"
+
+using namespace coral;
+
+bool ArrayFusion::_enabled = true;
+const unsigned int ArrayFusion::blockSize;
+
+namespace {
+	// ids of the nodes of each fused chain, by id of the last node
+	std::map<int, std::vector<int> > _fusedChains;
+	
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex _fusedChainsMutex;
+	#endif
+	
+	// outputs and values fed from a stage to the next one are kept in blocks of registers, 16 bytes per element
+	const unsigned int arrayFusion_registerSize = 16;
+	
+	struct arrayFusion_link{
+		Node *node;
+		Attribute *output;
+		ArrayFusionStage stage;
+		Attribute *chainedInput; // the operand fed by the previous link
+	};
+	
+	unsigned int arrayFusion_elementSize(Numeric::Type type){
+		switch(type){
+		case Numeric::numericTypeInt:
+		case Numeric::numericTypeIntArray:
+			return sizeof(int);
+		case Numeric::numericTypeFloat:
+		case Numeric::numericTypeFloatArray:
+			return sizeof(float);
+		case Numeric::numericTypeVec3:
+		case Numeric::numericTypeVec3Array:
+			return sizeof(Imath::V3f);
+		case Numeric::numericTypeCol4:
+		case Numeric::numericTypeCol4Array:
+			return sizeof(Imath::Color4f);
+		case Numeric::numericTypeQuat:
+		case Numeric::numericTypeQuatArray:
+			return sizeof(Imath::Quatf);
+		case Numeric::numericTypeMatrix44:
+		case Numeric::numericTypeMatrix44Array:
+			return sizeof(Imath::M44f);
+		default:
+			return 0;
+		}
+	}
+	
+	template<class T>
+	const void *arrayFusion_valuesOf(Numeric *numeric, unsigned int &size){
+		NumericSpan<const T> values = numeric->valuesSpanSlice<T>(0);
+		size = values.size();
+		
+		return values.data();
+	}
+	
+	const void *arrayFusion_values(Numeric *numeric, unsigned int &size){
+		size = 0;
+		
+		switch(numeric->type()){
+		case Numeric::numericTypeInt:
+		case Numeric::numericTypeIntArray:
+			return arrayFusion_valuesOf<int>(numeric, size);
+		case Numeric::numericTypeFloat:
+		case Numeric::numericTypeFloatArray:
+			return arrayFusion_valuesOf<float>(numeric, size);
+		case Numeric::numericTypeVec3:
+		case Numeric::numericTypeVec3Array:
+			return arrayFusion_valuesOf<Imath::V3f>(numeric, size);
+		case Numeric::numericTypeCol4:
+		case Numeric::numericTypeCol4Array:
+			return arrayFusion_valuesOf<Imath::Color4f>(numeric, size);
+		case Numeric::numericTypeQuat:
+		case Numeric::numericTypeQuatArray:
+			return arrayFusion_valuesOf<Imath::Quatf>(numeric, size);
+		case Numeric::numericTypeMatrix44:
+		case Numeric::numericTypeMatrix44Array:
+			return arrayFusion_valuesOf<Imath::M44f>(numeric, size);
+		default:
+			return 0;
+		}
+	}
+	
+	void *arrayFusion_resizeValues(Numeric *numeric, unsigned int size){
+		switch(numeric->type()){
+		case Numeric::numericTypeIntArray:
+			return numeric->resizeValuesSpanSlice<int>(0, size).data();
+		case Numeric::numericTypeFloatArray:
+			return numeric->resizeValuesSpanSlice<float>(0, size).data();
+		case Numeric::numericTypeVec3Array:
+			return numeric->resizeValuesSpanSlice<Imath::V3f>(0, size).data();
+		case Numeric::numericTypeCol4Array:
+			return numeric->resizeValuesSpanSlice<Imath::Color4f>(0, size).data();
+		case Numeric::numericTypeQuatArray:
+			return numeric->resizeValuesSpanSlice<Imath::Quatf>(0, size).data();
+		default:
+			return 0;
+		}
+	}
+	
+	bool arrayFusion_isArrayOfType(Attribute *attribute, bool fitsRegister){
+		Numeric *numeric = dynamic_cast<Numeric*>(attribute->outValue());
+		if(numeric == 0 || numeric->isArray() == false){
+			return false;
+		}
+		
+		unsigned int elementSize = arrayFusion_elementSize(numeric->type());
+		return elementSize && (!fitsRegister || elementSize <= arrayFusion_registerSize);
+	}
+	
+	// the stage computing output, if the node can take part in fusion at all
+	bool arrayFusion_stage(Node *node, Attribute *output, ArrayFusionStage &stage){
+		if(node == 0 || node->updateEnabled() == false || node->slicer()){
+			return false;
+		}
+		
+		if(node->outputCacheEnabled() && OutputCache::enabled()){
+			return false;
+		}
+		
+		if(node->arrayFusionStage(output, stage) == false || stage.inputA == 0 || stage.kernel == 0){
+			return false;
+		}
+		
+		if(arrayFusion_isArrayOfType(output, true) == false || arrayFusion_isArrayOfType(stage.inputA, false) == false){
+			return false;
+		}
+		
+		if(stage.inputB){
+			Numeric *numeric = dynamic_cast<Numeric*>(stage.inputB->outValue());
+			if(numeric == 0 || arrayFusion_elementSize(numeric->type()) == 0){
+				return false;
+			}
+		}
+		
+		return true;
+	}
+	
+	bool arrayFusion_canChain(Node *node, Attribute *input){
+		Attribute *source = input->input();
+		if(source == 0 || source->outputs().size() != 1){
+			return false;
+		}
+		
+		Node *sourceNode = source->parent();
+		if(sourceNode == node){
+			return false;
+		}
+		
+		ArrayFusionStage stage;
+		return arrayFusion_stage(sourceNode, source, stage);
+	}
+	
+	// the operand fed by a node the stage can be chained with, the first operand is preferred
+	Attribute *arrayFusion_chainedInput(Node *node, const ArrayFusionStage &stage){
+		if(arrayFusion_canChain(node, stage.inputA)){
+			return stage.inputA;
+		}
+		else if(stage.inputB && arrayFusion_canChain(node, stage.inputB)){
+			return stage.inputB;
+		}
+		
+		return 0;
+	}
+	
+	// the input of the node downstream computing output as part of its own stage, if any
+	Attribute *arrayFusion_chainedConsumer(Attribute *output){
+		const std::vector<Attribute*> &outputs = output->outputs();
+		if(outputs.size() != 1){
+			return 0;
+		}
+		
+		Attribute *input = outputs[0];
+		Node *node = input->parent();
+		if(node == 0 || node->outputAttributes().size() != 1){
+			return 0;
+		}
+		
+		ArrayFusionStage stage;
+		if(arrayFusion_stage(node, node->outputAttributes()[0], stage) == false){
+			return 0;
+		}
+		
+		if(arrayFusion_chainedInput(node, stage) != input){
+			return 0;
+		}
+		
+		return input;
+	}
+	
+	struct arrayFusion_operand{
+		arrayFusion_operand(): values(0), stride(0), elementSize(0), chained(false){
+		}
+		
+		const void *at(unsigned int index) const{
+			return values + index * stride * elementSize;
+		}
+		
+		const char *values;
+		unsigned int stride;
+		unsigned int elementSize;
+		bool chained; // read from the registers written by the previous stage
+	};
+	
+	struct arrayFusion_stageValues{
+		ArrayFusionKernel kernel;
+		arrayFusion_operand operandA;
+		arrayFusion_operand operandB;
+	};
+	
+	// Runs the stages one block of elements at a time, every stage but the last writes its block in registers that the next stage reads back.
+	class arrayFusion_chainKernel{
+	public:
+		arrayFusion_chainKernel(const std::vector<arrayFusion_stageValues> &stages, void *result, unsigned int resultElementSize): 
+			_stages(stages), 
+			_result((char*)result), 
+			_resultElementSize(resultElementSize){
+		}
+		
+		void operator() (unsigned int begin, unsigned int end) const{
+			union{
+				char bytes[2][ArrayFusion::blockSize * arrayFusion_registerSize];
+				double alignment;
+			} registers;
+			
+			unsigned int lastStage = _stages.size() - 1;
+			for(unsigned int blockBegin = begin; blockBegin < end; blockBegin += ArrayFusion::blockSize){
+				unsigned int count = std::min(ArrayFusion::blockSize, end - blockBegin);
+				
+				const void *chainedValues = 0;
+				for(unsigned int i = 0; i < _stages.size(); ++i){
+					const arrayFusion_stageValues &stage = _stages[i];
+					
+					const void *valuesA = stage.operandA.chained ? chainedValues : stage.operandA.at(blockBegin);
+					const void *valuesB = stage.operandB.chained ? chainedValues : stage.operandB.at(blockBegin);
+					
+					void *result = registers.bytes[i % 2];
+					if(i == lastStage){
+						result = _result + blockBegin * _resultElementSize;
+					}
+					
+					stage.kernel(valuesA, stage.operandA.stride, valuesB, stage.operandB.stride, result, count);
+					chainedValues = result;
+				}
+			}
+		}
+	
+	private:
+		const std::vector<arrayFusion_stageValues> &_stages;
+		char *_result;
+		unsigned int _resultElementSize;
+	};
+	
+	// Returns false without computing anything if an operand is an empty single value.
+	bool arrayFusion_readOperand(Attribute *input, bool chained, arrayFusion_operand &operand, unsigned int &size){
+		if(input == 0){
+			return true;
+		}
+		
+		if(chained){
+			operand.chained = true;
+			operand.stride = 1;
+			return true;
+		}
+		
+		Numeric *numeric = dynamic_cast<Numeric*>(input->value());
+		if(numeric == 0){
+			return false;
+		}
+		
+		unsigned int valuesSize = 0;
+		operand.values = (const char*)arrayFusion_values(numeric, valuesSize);
+		operand.elementSize = arrayFusion_elementSize(numeric->type());
+		
+		if(numeric->isArray()){
+			operand.stride = 1;
+			size = std::min(size, valuesSize);
+		}
+		else if(valuesSize == 0){
+			return false;
+		}
+		
+		return true;
+	}
+	
+	// Computes the links from first to last in a single loop writing only the output of the last one,
+	// the first link reads its chained operand from the output of the link before it.
+	bool arrayFusion_evaluate(const std::vector<arrayFusion_link> &chain, unsigned int first, unsigned int last, unsigned int grainSize){
+		std::vector<arrayFusion_stageValues> stages(last - first + 1);
+		unsigned int size = (unsigned int)-1;
+		
+		for(unsigned int i = first; i <= last; ++i){
+			const arrayFusion_link &link = chain[i];
+			arrayFusion_stageValues &stage = stages[i - first];
+			stage.kernel = link.stage.kernel;
+			
+			bool chainedA = i > first && link.stage.inputA == link.chainedInput;
+			bool chainedB = i > first && link.stage.inputB == link.chainedInput;
+			if(arrayFusion_readOperand(link.stage.inputA, chainedA, stage.operandA, size) == false || 
+				arrayFusion_readOperand(link.stage.inputB, chainedB, stage.operandB, size) == false){
+				return false;
+			}
+		}
+		
+		Numeric *out = dynamic_cast<Numeric*>(chain[last].output->outValue());
+		void *result = arrayFusion_resizeValues(out, size);
+		
+		arrayFusion_chainKernel kernel(stages, result, arrayFusion_elementSize(out->type()));
+		ParallelArrays::forEachRange(size, grainSize, kernel);
+		
+		return true;
+	}
+}
+
+void ArrayFusion::setEnabled(bool value){
+	_enabled = value;
+}
+
+bool ArrayFusion::enabled(){
+	return _enabled;
+}
+
+std::vector<std::string> ArrayFusion::fusedChains(){
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex::scoped_lock lock(_fusedChainsMutex);
+	#endif
+	
+	std::vector<std::string> chains;
+	for(std::map<int, std::vector<int> >::iterator it = _fusedChains.begin(); it != _fusedChains.end(); ++it){
+		std::string chain;
+		for(int i = 0; i < it->second.size(); ++i){
+			NestedObject *node = dynamic_cast<NestedObject*>(NetworkManager::findObjectById(it->second[i]));
+			if(node == 0){ // deleted since
+				chain = "";
+				break;
+			}
+			
+			if(i){
+				chain += " -> ";
+			}
+			chain += node->fullName();
+		}
+		
+		if(chain.empty() == false){
+			chains.push_back(chain);
+		}
+	}
+	
+	return chains;
+}
+
+void ArrayFusion::clearFusedChains(){
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex::scoped_lock lock(_fusedChainsMutex);
+	#endif
+	
+	_fusedChains.clear();
+}
+
+bool ArrayFusion::isDeferred(Attribute *attribute){
+	// values evaluated within an EvaluationState aren't the ones the fused loop reads and writes
+	if(_enabled == false || attribute->isInput() || EvaluationState::current()){
+		return false;
+	}
+	
+	// an output pulled directly, or through the input it feeds, is computed by its own node
+	EvaluationContext *context = EvaluationContext::current();
+	if(context == 0 || context->attribute() == attribute){
+		return false;
+	}
+	
+	ArrayFusionStage stage;
+	if(arrayFusion_stage(attribute->parent(), attribute, stage) == false){
+		return false;
+	}
+	
+	Attribute *consumer = arrayFusion_chainedConsumer(attribute);
+	
+	return consumer && consumer != context->attribute();
+}
+
+bool ArrayFusion::update(Node *node, Attribute *attribute){
+	if(_enabled == false){
+		return false;
+	}
+	
+	std::vector<arrayFusion_link> chain(1);
+	chain[0].node = node;
+	chain[0].output = attribute;
+	chain[0].chainedInput = 0;
+	if(arrayFusion_stage(node, attribute, chain[0].stage) == false){
+		return false;
+	}
+	
+	// walks upstream collecting the nodes that left their output to this evaluation
+	while(true){
+		Attribute *input = arrayFusion_chainedInput(chain.back().node, chain.back().stage);
+		if(input == 0 || isDeferred(input->input()) == false){
+			break;
+		}
+		
+		chain.back().chainedInput = input;
+		
+		arrayFusion_link link;
+		link.output = input->input();
+		link.node = link.output->parent();
+		link.chainedInput = 0;
+		arrayFusion_stage(link.node, link.output, link.stage);
+		
+		chain.push_back(link);
+	}
+	
+	if(chain.size() == 1){
+		return false;
+	}
+	
+	// each chained operand is fed by the link before it
+	std::reverse(chain.begin(), chain.end());
+	
+	unsigned int grainSize = node->arrayGrainSize();
+	if(arrayFusion_evaluate(chain, 0, chain.size() - 1, grainSize)){
+		std::vector<int> ids(chain.size());
+		for(int i = 0; i < chain.size(); ++i){
+			ids[i] = chain[i].node->id();
+		}
+		
+		#ifdef CORAL_PARALLEL_TBB
+			tbb::mutex::scoped_lock lock(_fusedChainsMutex);
+		#endif
+		
+		_fusedChains[node->id()] = ids;
+	}
+	else{
+		// a stage with an empty single operand leaves its output untouched, the links are computed one by one to keep that
+		for(int i = 0; i < chain.size(); ++i){
+			arrayFusion_evaluate(chain, i, i, grainSize);
+		}
+	}
+	
+	return true;
+}
@@ -0,0 +1,119 @@
+// <license>
+// Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+// This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+// 
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are
+// met:
+// 
+//    * Redistributions of source code must retain the above copyright
+//      notice, this list of conditions and the following disclaimer.
+// 
+//    * Redistributions in binary form must reproduce the above copyright
+//      notice, this list of conditions and the following disclaimer in the
+//      documentation and/or other materials provided with the distribution.
+// 
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+// IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+// PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+// LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+// NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+// SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// </license>
+
+#ifndef CORAL_ARRAYFUSION_H
+#define CORAL_ARRAYFUSION_H
+
+#include <vector>
+#include <string>
+#include "coralDefinitions.h"
+
+namespace coral{
+
+class Node;
+class Attribute;
+
+//! Computes count elements of an element wise operation: result[i] = function(valuesA[i * strideA], valuesB[i * strideB]).
+//! A stride of 0 reads a single value for all the elements, valuesB is 0 for unary operations.
+typedef void(*ArrayFusionKernel)(const void *valuesA, unsigned int strideA, const void *valuesB, unsigned int strideB, void *result, unsigned int count);
+
+//! The element wise operation computing the output of a node, see Node::arrayFusionStage().
+//
+//! Operands and output are Numeric values of ints, floats, vec3s, col4s or quats, the output and inputA are arrays while inputB is either an array
+//! or a single value, the output gets as many elements as the shortest array and it's left untouched when inputB is an empty single value.
+struct ArrayFusionStage{
+	ArrayFusionStage(): inputA(0), inputB(0), kernel(0){
+	}
+	
+	Attribute *inputA;
+	
+	//! 0 for unary operations.
+	Attribute *inputB;
+	ArrayFusionKernel kernel;
+};
+
+//! An ArrayFusionKernel applying Function()(valueA) to each element.
+template<class TypeA, class TypeResult, class Function>
+void arrayFusion_unaryKernel(const void *valuesA, unsigned int strideA, const void *valuesB, unsigned int strideB, void *result, unsigned int count){
+	const TypeA *a = (const TypeA*)valuesA;
+	TypeResult *r = (TypeResult*)result;
+	Function function;
+	for(unsigned int i = 0; i < count; ++i){
+		r[i] = function(a[i * strideA]);
+	}
+}
+
+//! An ArrayFusionKernel applying Function()(valueA, valueB) to each element.
+template<class TypeA, class TypeB, class TypeResult, class Function>
+void arrayFusion_binaryKernel(const void *valuesA, unsigned int strideA, const void *valuesB, unsigned int strideB, void *result, unsigned int count){
+	const TypeA *a = (const TypeA*)valuesA;
+	const TypeB *b = (const TypeB*)valuesB;
+	TypeResult *r = (TypeResult*)result;
+	Function function;
+	for(unsigned int i = 0; i < count; ++i){
+		r[i] = function(a[i * strideA], b[i * strideB]);
+	}
+}
+
+//! Fuses linear chains of element wise array nodes in a single loop.
+//
+//! Nodes such as AddNode, MulNode or Normalize describe the element wise operation they apply by reimplementing Node::arrayFusionStage().
+//! When the output of such a node only feeds an operand of another one the two nodes form a chain, chains extend as long as the pattern repeats,
+//! the node at the end of the chain then computes the whole chain reading the inputs once and writing its output once,
+//! elements are processed in small blocks so that the intermediate values never leave the cpu caches.
+//! The outputs along the chain aren't computed while the node at the end is being evaluated, they're left dirty 
+//! and they get computed as usual whenever they're pulled directly.
+//! Sliced nodes and nodes restored from the OutputCache don't take part in fusion.
+class CORAL_EXPORT ArrayFusion{
+public:
+	//! Fusion is enabled by default, when disabled every node computes its own output.
+	static void setEnabled(bool value);
+	static bool enabled();
+	
+	//! The chains fused since the report was last cleared, each listed as the full names of its nodes from the first to the last.
+	static std::vector<std::string> fusedChains();
+	static void clearFusedChains();
+	
+	//! Invoked by fusible nodes from their update, computes the chain ending with attribute if there's one and returns true,
+	//! returns false if the node must compute attribute on its own.
+	static bool update(Node *node, Attribute *attribute);
+
+	//! The number of elements processed at once, per stage, by a fused chain.
+	static const unsigned int blockSize = 256;
+
+private:
+	friend class Attribute;
+	
+	static bool isDeferred(Attribute *attribute);
+	
+	static bool _enabled;
+};
+
+}
+
+#endif
@@ -27,7 +27,8 @@
 // </license>
 
 #ifdef CORAL_PARALLEL_TBB
-	#include <tbb/parallel_for.h>
+	#include <tbb/parallel_do.h>
+	#include <tbb/atomic.h>
 	#include <tbb/mutex.h>
 	#include "coreParallelAlgos.h"
 #endif
@@ -36,6 +37,7 @@
 #include <string>
 #include <map>
 #include <vector>
+#include <algorithm>
 #include <assert.h>
 
 #include "Attribute.h"
@@ -46,6 +48,11 @@
 #include "Command.h"
 #include "ErrorObject.h"
 #include "stringUtils.h"
+#include "EvaluationContext.h"
+#include "EvaluationState.h"
+#include "SpecializationSolver.h"
+#include "Tracer.h"
+#include "ArrayFusion.h"
 
 using namespace coral;
 
@@ -56,23 +63,15 @@ void(*Attribute::_deleteItCallback)(Attribute *self) = 0;
 void(*Attribute::_specializationCallBack)(Attribute *self) = 0;
 
 std::vector<void(*)(Attribute *)> _dirtyingDoneCallbackQueue;
-bool _cleaningLocked = false;
 
 namespace {
-	std::vector<std::string> intersectedSpecialization(const std::vector<std::string> &specialization1, const std::vector<std::string> &specialization2){
-		std::vector<std::string> newSpecialization;
-	
-		for(int i = 0; i < specialization1.size(); ++i){
-			if(containerUtils::elementInContainer(specialization1[i], specialization2)){
-				newSpecialization.push_back(specialization1[i]);
-			}
-		}
-	
-		return newSpecialization;
-	}
-
 	#ifdef CORAL_PARALLEL_TBB
 		tbb::mutex _globalMutex;
+		tbb::atomic<unsigned int> _lastDirtyGeneration;
+		tbb::atomic<int> _dirtyObserversCount;
+	#else
+		unsigned int _lastDirtyGeneration = 0;
+		int _dirtyObserversCount = 0;
 	#endif
 }
 
@@ -88,9 +87,12 @@ Attribute::Attribute(const std::string &name, Node *parent):
 	// _valueObserved(0),
 	_computeTimeSeconds(0),
 	_computeTimeMilliseconds(0),
-	_notifyParentNodeOnDirty(false){
-		
-	_dirtyChain.push_back(this);
+	_notifyParentNodeOnDirty(false),
+	_notifyOnDirty(false),
+	_dirtyGeneration(0),
+	_forcedGeneration(0),
+	_validatedGeneration(0),
+	_evaluationClaim(0){
 }
 
 Attribute::~Attribute(){
@@ -117,13 +119,13 @@ void Attribute::setParent(Node *parent){
 }
 
 void Attribute::removeAffectFrom(Attribute *attribute){
-	if(containerUtils::elementInContainer(attribute, _affectedBy)){
+	if(_affectedBySet.erase(attribute)){
 		containerUtils::eraseElementInContainer(attribute, _affectedBy);
 	}
 }
 
 void Attribute::removeAffect(Attribute *attribute){
-	if(containerUtils::elementInContainer(attribute, _affect)){
+	if(_affectSet.erase(attribute)){
 		containerUtils::eraseElementInContainer(attribute, _affect);
 		
 		if(attribute->isAffectedBy(this)){
@@ -135,7 +137,7 @@ void Attribute::removeAffect(Attribute *attribute){
 }
 
 bool Attribute::isConnectedTo(Attribute *attribute){
-	return attribute && containerUtils::elementInContainer(attribute, _outputs);
+	return attribute && _outputsSet.find(attribute) != _outputsSet.end();
 }
 
 void Attribute::resetInputValuesInChain(){
@@ -191,6 +193,7 @@ void Attribute::disconnectInput(){
 
 void Attribute::disconnectOutput(Attribute *attribute){
 	if(this->isConnectedTo(attribute)){		
+		_outputsSet.erase(attribute);
 		containerUtils::eraseElementInContainer(attribute, _outputs);
 		
 		if(attribute->input() == this){
@@ -200,8 +203,6 @@ void Attribute::disconnectOutput(Attribute *attribute){
 		if(!isDeleted()){
 			ErrorObject *error = new ErrorObject();
 			
-			cacheEvaluationChain();
-			
 			bool resetBranchSpecialization = true;
 			updateBranchSpecializations(resetBranchSpecialization);
 			
@@ -215,11 +216,27 @@ void Attribute::disconnectOutput(Attribute *attribute){
 }
 
 bool Attribute::isClean(){
+	// the flags are brought up to date with what got dirtied upstream when they're read, an evaluation already did it before starting.
+	if(EvaluationContext::current() == 0){
+		validateCleanFlags();
+	}
+	
+	EvaluationState *state = EvaluationState::current();
+	if(state){
+		return state->isClean(this);
+	}
+	
 	return _isClean;
 }
 
 void Attribute::setIsClean(bool value){
-	_isClean = value;
+	EvaluationState *state = EvaluationState::current();
+	if(state){
+		state->setIsClean(this, value);
+	}
+	else{
+		_isClean = value;
+	}
 }
 
 void Attribute::setIsOutput(bool value){
@@ -239,7 +256,7 @@ Attribute *Attribute::input(){
 }
 
 bool Attribute::isAffectedBy(Attribute *attribute){
-	return containerUtils::elementInContainer(attribute, _affectedBy);
+	return _affectedBySet.find(attribute) != _affectedBySet.end();
 }
 
 const std::vector<Attribute*> &Attribute::affectedBy(){
@@ -252,7 +269,7 @@ const std::vector<Attribute*> &Attribute::affecting(){
 
 void Attribute::addAffectedFrom(Attribute *attribute){
 	if(attribute){
-		if(containerUtils::elementInContainer(attribute, _affectedBy) == false){
+		if(_affectedBySet.insert(attribute).second){
 			_affectedBy.push_back(attribute);
 		}
 	}
@@ -260,7 +277,7 @@ void Attribute::addAffectedFrom(Attribute *attribute){
 
 void Attribute::addAffect(Attribute *attribute){
 	if(attribute){
-		if(containerUtils::elementInContainer(attribute, _affect) == false){
+		if(_affectSet.insert(attribute).second){
 			_affect.push_back(attribute);
 			
 			if(attribute->isAffectedBy(this) == false){
@@ -285,85 +302,262 @@ void Attribute::setValuePtr(Value *value){
 }
 
 void Attribute::valueChanged(){
+	Value *value = outValue();
+	if(value){
+		value->_version++;
+		value->_changed = false;
+	}
+	
 	dirty();
 }
 
 Value *Attribute::value(){
 	clean();
 	
+	EvaluationState *state = EvaluationState::current();
+	if(state){
+		return state->inputValue(this);
+	}
+	
 	return _inputValue;
 }
 
 Value *Attribute::outValue(){
+	if(_value){
+		EvaluationState *state = EvaluationState::current();
+		if(state){
+			return state->outValue(this);
+		}
+	}
+	
 	return _value;
 }
 
 void Attribute::clean(){
-	if(!_cleaningLocked){
-		if(_isClean == false){
+	// a pull nested in an update doesn't start a new evaluation, the running one already cleaned its upstream chain.
+	if(EvaluationContext::current() == 0){
+		NetworkManager::flushEditTransaction();
+		
+		if(isClean()){
+			// the attribute is flagged clean as soon as its update starts, if that update is still running it's waited for
+			EvaluationContext::wait(this);
+		}
+		else{
 			if(_isInput && _input == 0){
-				_isClean = true;
+				setIsClean(true);
 			}
 
-			_cleaningLocked = true;
+			EvaluationContext context(this);
+			EvaluationScope scope(&context);
+			TraceScope traceScope(Tracer::eventTypeEvaluation, id());
+			
+			// the evaluation runs on its own copy, an edit made meanwhile can rebuild the schedule
+			CleanSchedule cleanSchedule;
+			{
+				NetworkEditLock lock;
+				cleanSchedule = _cleanSchedule;
+			}
 			
 			boost::posix_time::ptime startTime = boost::posix_time::microsec_clock::universal_time();
 			
-			for(std::map<int, std::vector<Attribute*> >::iterator i = _cleanChain.begin(); i != _cleanChain.end(); ++i){
-				std::vector<Attribute*> &outputAttributes = i->second;
-
-				#ifdef CORAL_PARALLEL_TBB
-					tbb::parallel_for(tbb::blocked_range<size_t>(0, outputAttributes.size()), attribute_parallelClean(&outputAttributes));
-				#else
-					for(int j = 0; j < outputAttributes.size(); ++j){
-						outputAttributes[j]->cleanSelf();
+			#ifdef CORAL_PARALLEL_TBB
+				// every task starts as soon as its own predecessors are done, ready tasks are fed back to the workers
+				std::vector<tbb::atomic<int> > pendingPredecessors(cleanSchedule.predecessorsCount.size());
+				std::vector<int> readyTasks;
+				for(int i = 0; i < cleanSchedule.predecessorsCount.size(); ++i){
+					pendingPredecessors[i] = cleanSchedule.predecessorsCount[i];
+					if(cleanSchedule.predecessorsCount[i] == 0){
+						readyTasks.push_back(i);
 					}
-				#endif
-			}
+				}
+				
+				tbb::parallel_do(readyTasks.begin(), readyTasks.end(), attribute_scheduledClean(&cleanSchedule, &pendingPredecessors, &context));
+			#else
+				// the schedule is already sorted topologically
+				for(int i = 0; i < cleanSchedule.attributes.size(); ++i){
+					context.clean(cleanSchedule.attributes[i]);
+				}
+			#endif
 			
 			boost::posix_time::ptime endTime = boost::posix_time::microsec_clock::universal_time();
 			_computeTimeSeconds = boost::posix_time::time_period(startTime, endTime).length().total_seconds();
 			_computeTimeMilliseconds = boost::posix_time::time_period(startTime, endTime).length().total_milliseconds() % 1000;
-			
-			_cleaningLocked = false;
 		}
 	}
 }
 
 void Attribute::cleanSelf(){
-	if(_isClean == false){
-		_isClean = true;
+	if(isClean() == false){
+		// a fused output is computed by the node at the end of its chain, it's left dirty so that pulling it directly still computes it.
+		bool deferred = ArrayFusion::isDeferred(this);
+		if(deferred == false){
+			setIsClean(true);
+		}
 
 		Node *parentNode = parent();
 		if(parentNode){
-			std::vector<Attribute*> inputsToClean = _inputsCleanChain[id()];
+			std::vector<Attribute*> inputsToClean;
+			{
+				NetworkEditLock lock;
+				std::map<int, std::vector<Attribute*> >::iterator it = _inputsCleanChain.find(id());
+				if(it != _inputsCleanChain.end()){
+					inputsToClean = it->second;
+				}
+			}
+			
 			for(int i = 0; i < inputsToClean.size(); ++i){
-				inputsToClean[i]->_isClean = true;
+				inputsToClean[i]->setIsClean(true);
 			}	
 			
-			if(parentNode->updateEnabled()){
+			if(deferred){
+				// the value is about to change under the node downstream, its early cutoff must not skip the update
+				if(_value){
+					_value->_version++;
+					_value->_changed = false;
+				}
+			}
+			else if(parentNode->updateEnabled() && EvaluationState::current()){
+				// the recorded versions belong to the network's values, within a state the node is always updated
 				parentNode->doUpdate(this);
 			}
+			else if(parentNode->updateEnabled()){
+				// early cutoff: if the values affecting this attribute didn't change since the last update there's nothing to recompute,
+				// sliced nodes are always updated as their slices might have changed.
+				std::vector<std::pair<int, unsigned int> > affectedByVersions;
+				collectAffectedByVersions(affectedByVersions);
+				
+				bool cutoff = 
+					parentNode->earlyCutoffEnabled() && Node::earlyCutoffAllowed() && parentNode->slicer() == 0 && 
+					affectedByVersions.size() && affectedByVersions == _affectedByVersions;
+				
+				if(!cutoff){
+					parentNode->doUpdate(this);
+					
+					// an update that couldn't compute this attribute left it dirty, the next pull has to try again
+					if(_isClean){
+						_affectedByVersions = affectedByVersions;
+					}
+					else{
+						_affectedByVersions.clear();
+					}
+					
+					stampValueVersion();
+				}
+			}
+		}
+	}
+}
+
+void Attribute::collectAffectedByVersions(std::vector<std::pair<int, unsigned int> > &versions){
+	for(int i = 0; i < _affectedBy.size(); ++i){
+		Value *value = _affectedBy[i]->_inputValue;
+		if(value){
+			versions.push_back(std::make_pair(value->id(), value->_version));
+		}
+	}
+}
+
+void Attribute::stampValueVersion(){
+	if(_value){
+		// values tracking their changes reported any write of different data through Value::changed(), the others always get a new version.
+		if(_value->_tracksChanges == false || _value->_changed){
+			_value->_version++;
 		}
+		
+		_value->_changed = false;
 	}
 }
 
 void Attribute::setNotifyParentNodeOnDirty(bool value){
-	_notifyParentNodeOnDirty = value;
+	if(value != _notifyParentNodeOnDirty){
+		_dirtyObserversCount += value ? 1 : -1;
+		_notifyParentNodeOnDirty = value;
+	}
+}
+
+void Attribute::setNotifyOnDirty(bool value){
+	if(value != _notifyOnDirty){
+		_dirtyObserversCount += value ? 1 : -1;
+		_notifyOnDirty = value;
+	}
+}
+
+void Attribute::validateCleanFlags(){
+	NetworkEditLock lock;
+	
+	// an attribute is dirty if anything upstream of it got dirtied after its flag was last validated,
+	// the chain is in topological order so the latest generation upstream is known by the time each attribute is reached.
+	const std::vector<Attribute*> &chain = _cleanSchedule.chain;
+	unsigned int generation = _lastDirtyGeneration;
+	std::vector<unsigned int> dirtied(chain.size());
+	std::vector<unsigned int> forced(chain.size());
+	for(int i = 0; i < chain.size(); ++i){
+		Attribute *attr = chain[i];
+		dirtied[i] = attr->_dirtyGeneration;
+		forced[i] = attr->_forcedGeneration;
+		
+		const std::vector<int> &inputs = _cleanSchedule.chainInputs[i];
+		for(int j = 0; j < inputs.size(); ++j){
+			dirtied[i] = std::max(dirtied[i], dirtied[inputs[j]]);
+			forced[i] = std::max(forced[i], forced[inputs[j]]);
+		}
+		
+		if(dirtied[i] > attr->_validatedGeneration){
+			attr->_isClean = false;
+		}
+		
+		if(forced[i] > attr->_validatedGeneration){ // no early cutoff, everything downstream gets updated
+			attr->_affectedByVersions.clear();
+		}
+		
+		attr->_validatedGeneration = generation;
+	}
 }
 
 void Attribute::dirty(bool force){
-	if(!_cleaningLocked){
-		if(_isClean || force){
-			for(int i = 0; i < _dirtyChain.size(); ++i){
-				Attribute* attr = _dirtyChain[i];
-				attr->_isClean = false;
-				attr->onDirtied();
+	EvaluationState *state = EvaluationState::current();
+	if(state){
+		// only the state's clean flags are affected, dirty notifications keep following the network's own values
+		if(EvaluationContext::current() == 0){
+			state->dirty(this);
+		}
+		
+		return;
+	}
+	
+	if(NetworkManager::deferEvaluationChainUpdates()){
+		// the dirty chain might be out of date, dirtying happens once the edit transaction is flushed
+		NetworkManager::queueDirty(this, force);
+		return;
+	}
+	
+	// values set by a node while it's being updated don't dirty the chain being evaluated.
+	if(EvaluationContext::current() == 0){
+		// only this attribute is stamped with a new generation, the attributes downstream compare it with their own when they're pulled.
+		bool wasClean = _isClean;
+		_isClean = false;
+		_dirtyGeneration = ++_lastDirtyGeneration;
+		if(force){
+			_forcedGeneration = _dirtyGeneration;
+		}
+		
+		if(wasClean || force){
+			// the downstream chain is only walked to notify the attributes observing it.
+			if(_dirtyObserversCount > 0){
+				std::vector<Attribute*> dirtyChain;
+				NetworkManager::getDownstreamChain(this, dirtyChain);
 				
-				if(attr->_notifyParentNodeOnDirty){
-					Node *parentNode = attr->parent();
-					if(parentNode){
-						parentNode->attributeDirtied(attr);
+				for(int i = 0; i < dirtyChain.size(); ++i){
+					Attribute* attr = dirtyChain[i];
+					if(attr->_notifyOnDirty){
+						attr->onDirtied();
+					}
+					
+					if(attr->_notifyParentNodeOnDirty){
+						Node *parentNode = attr->parent();
+						if(parentNode){
+							parentNode->attributeDirtied(attr);
+						}
 					}
 				}
 			}
@@ -371,10 +565,6 @@ void Attribute::dirty(bool force){
 			processDirtyingDoneCallbackQueue();
 		}
 	}
-	
-	for(int i = 0; i < _dirtyChain.size(); ++i){
-		Attribute* attr = _dirtyChain[i];
-	}
 }
 
 void Attribute::forceDirty(){
@@ -452,12 +642,18 @@ void Attribute::setInput(Attribute *attribute){
 
 bool Attribute::connectTo(Attribute *attribute, ErrorObject *errorObject){
 	_outputs.push_back(attribute);
+	_outputsSet.insert(attribute);
 	attribute->setInput(this);
 	
-	cacheEvaluationChain();
+	// only the chains downstream of the new input get a different upstream, the other outputs of this attribute are left alone
+	attribute->cacheEvaluationChain();
 	
-	bool resetBranchSpecialization = false;
-	bool success = updateBranchSpecializations(resetBranchSpecialization);
+	// both branches are already solved, joining two that share the same specialization can't narrow either of them
+	bool success = true;
+	if(_specialization != attribute->_specialization){
+		bool resetBranchSpecialization = false;
+		success = updateBranchSpecializations(resetBranchSpecialization);
+	}
 	
 	if(parent()){
 		parent()->_attributeConnectionChanged(this);
@@ -526,6 +722,9 @@ void Attribute::deleteIt(){
 		_value = 0;
 	}
 	
+	setNotifyParentNodeOnDirty(false);
+	setNotifyOnDirty(false);
+	
 	setIsDeleted(true);
 }
 
@@ -571,166 +770,13 @@ std::vector<std::string> Attribute::allowedSpecialization(){
 	return _allowedSpecialization;
 }
 
-void Attribute::collectSpecializationBranch(std::vector<std::pair<Attribute*, Attribute*> > &specializationPairs, std::vector<std::pair<Attribute*, Attribute*> > &specializationLinks, std::map<int, std::vector<std::string> > &specializationMap, bool reset){
-	int thisId = id();
-	if(specializationMap.find(thisId) == specializationMap.end()){
-		if(reset){
-			if(_specializationOverride.size() == 1){
-				specializationMap[thisId] = _specializationOverride;
-			}
-			else{
-				specializationMap[thisId] = _allowedSpecialization;
-			}
-		}
-		else{
-			specializationMap[thisId] = _specialization;
-		}
-		
-		for(int i = 0; i < _specializationLinks.size(); ++i){
-			Attribute *attributeA = _specializationLinks[i]->attributeA;
-			Attribute *attributeB = _specializationLinks[i]->attributeB;
-
-			std::pair<Attribute*, Attribute*> specLink(attributeA, attributeB);
-			if(containerUtils::elementInContainer(specLink, specializationLinks) == false){
-				specializationLinks.push_back(specLink);
-			}
-
-			if(this != attributeA){
-				attributeA->collectSpecializationBranch(specializationPairs, specializationLinks, specializationMap, reset);
-			}
-			else{
-				attributeB->collectSpecializationBranch(specializationPairs, specializationLinks, specializationMap, reset);
-			}
-		}
-		
-		if(_input){
-			std::pair<Attribute*, Attribute*> specPair(_input, this);
-			if(containerUtils::elementInContainer(specPair, specializationPairs) == false){
-				specializationPairs.push_back(specPair);
-			}
-
-			_input->collectSpecializationBranch(specializationPairs, specializationLinks, specializationMap, reset);
-		}
-
-		for(int i = 0; i < _outputs.size(); ++i){
-			std::pair<Attribute*, Attribute*> specPair(this, _outputs[i]);
-			if(containerUtils::elementInContainer(specPair, specializationPairs) == false){
-				specializationPairs.push_back(specPair);
-			}
-
-			_outputs[i]->collectSpecializationBranch(specializationPairs, specializationLinks, specializationMap, reset);
-		}
-	}
-}
-
-bool Attribute::updateSpecialization(std::vector<std::pair<Attribute*, Attribute*> > &specializationPairs, std::vector<std::pair<Attribute*, Attribute*> > &specializationLinks, std::map<int, std::vector<std::string> > &specializationMap){
-	int oldUnresolved = specializationLinks.size() + specializationPairs.size();
-
-	// solve links
-	std::vector<std::pair<Attribute*, Attribute*> >::iterator specLinksIt = specializationLinks.begin();
-	while(specLinksIt != specializationLinks.end()){
-		std::pair<Attribute*, Attribute*> &specLink = *specLinksIt;
-		Attribute *attrA = specLink.first;
-		Attribute *attrB = specLink.second;
-
-		std::vector<std::string> &specA = specializationMap[attrA->id()];
-		std::vector<std::string> &specB = specializationMap[attrB->id()];
-
-		if(specA.size() > 1 || specB.size() > 1){
-			Node *parentNode = attrA->parent();
-			if(parentNode){
-				parentNode->updateSpecializationLink(attrA, attrB, specA, specB);
-			}
-		}
-
-		if(specA.size() == 1 && specB.size() == 1){
-			specLinksIt = specializationLinks.erase(specLinksIt);
-		}
-		else{
-			++specLinksIt;
-		}
-	}
-
-	// solve pairs
-	std::vector<std::pair<Attribute*, Attribute*> >::iterator specPairsIt = specializationPairs.begin();
-	while(specPairsIt != specializationPairs.end()){
-		std::pair<Attribute*, Attribute*> &specPair = *specPairsIt;
-
-		Attribute *attrA = specPair.first;
-		Attribute *attrB = specPair.second;
-
-		std::vector<std::string> &specA = specializationMap[attrA->id()];
-		std::vector<std::string> &specB = specializationMap[attrB->id()];
-
-		if(attrA->_passThrough && specA.size() == 0){
-			specA = specB;
-		}
-		else if(attrB->_passThrough && specB.size() == 0){
-			specB = specA;
-		}
-		else if(specA != specB){
-			std::vector<std::string> newSpec = intersectedSpecialization(specA, specB);
-			
-			specA = newSpec;
-			specB = newSpec;
-		}
-
-		if(specA.size() == 1 && specB.size() == 1){
-			specPairsIt = specializationPairs.erase(specPairsIt);
-		}
-		else{
-			++specPairsIt;
-		}
-	}
-
-	int currentUnresolved = specializationLinks.size() + specializationPairs.size();
-
-	bool complete = false;
-	if(oldUnresolved == currentUnresolved){
-		complete = true;
-	}
-
-	return complete;
-}
-
 bool Attribute::updateBranchSpecializations(bool reset){
-	bool success = true;
-
-	// collect
-	std::map<int, std::vector<std::string> > specializationMap;
-	std::vector<std::pair<Attribute*, Attribute*> > specializationPairs;
-	std::vector<std::pair<Attribute*, Attribute*> > specializationLinks;
-	collectSpecializationBranch(specializationPairs, specializationLinks, specializationMap, reset);
-
-	// specialize
-	int maxIter = 100;
-	int i = 0;
-	for(; i < maxIter; ++i){
-		bool complete = updateSpecialization(specializationPairs, specializationLinks, specializationMap);
-		if(complete){
-			break;
-		}
-	}
-
-	if(i == maxIter){
-		std::cout << "Maximum recursion reached during specialization." << std::endl;
-		success = false;
+	SpecializationSolver solver;
+	if(reset){
+		return solver.solveBranch(this);
 	}
-
-	// set resulting specialization
-	std::map<int, std::vector<std::string> >::iterator specializationMapIt = specializationMap.begin();
-	for(; specializationMapIt != specializationMap.end(); ++specializationMapIt){
-		int id = specializationMapIt->first;
-		std::vector<std::string> newSpec = specializationMapIt->second;
 	
-		Object *object = NetworkManager::findObjectById(id);
-		if(object){
-			Attribute *attribute = (Attribute*)object;
-			attribute->setSpecialization(newSpec);
-		}
-	}
-
-	return success;
+	return solver.solveNarrowing(this);
 }
 
 void Attribute::onSettingSpecialization(const std::vector<std::string> &specialization){
@@ -745,6 +791,12 @@ void Attribute::setSpecialization(const std::vector<std::string> &specialization
 		Node *parentNode = parent();
 		if(parentNode){
 			parentNode->attributeSpecializationChanged(this);
+			
+			// the node picks its operation from the specializations, its outputs can't be skipped by the early cutoff even if the values didn't change
+			const std::vector<Attribute*> &outputs = parentNode->outputAttributes();
+			for(int i = 0; i < outputs.size(); ++i){
+				outputs[i]->_affectedByVersions.clear();
+			}
 		}
 		
 		if(_specializationCallBack){
@@ -820,45 +872,51 @@ std::string Attribute::debugInfo(){
 	
 	info += "last cleaning took: secs:" + stringUtils::intToString(_computeTimeSeconds) + ", millisecs: " + stringUtils::intToString(_computeTimeMilliseconds) + "\n";
 	
+	std::vector<Attribute*> dirtyChain;
+	NetworkManager::getDownstreamChain(this, dirtyChain);
+	
 	info += "dirty chain: [";
-	for(int i = 0; i < _dirtyChain.size(); ++i){
-		info += _dirtyChain[i]->fullName() + ", ";
+	for(int i = 0; i < dirtyChain.size(); ++i){
+		info += dirtyChain[i]->fullName() + ", ";
 	}
 	info += "]\n";
 	
-	info += "clean chain: [";
-	for(std::map<int, std::vector<Attribute*> >::iterator i = _cleanChain.begin(); i != _cleanChain.end(); ++i){
-		std::vector<Attribute*> &outputAttributes = i->second;
-		info += "[";
-		for(int j = 0; j < outputAttributes.size(); ++j){
-			Node *parentNode = outputAttributes[j]->parent();
-			info += parentNode->fullName() + ", ";
+	CleanSchedule cleanSchedule;
+	{
+		NetworkEditLock lock;
+		cleanSchedule = _cleanSchedule;
+	}
+	
+	info += "clean schedule: [";
+	for(int i = 0; i < cleanSchedule.attributes.size(); ++i){
+		info += cleanSchedule.attributes[i]->parent()->fullName() + " -> [";
+		const std::vector<int> &successors = cleanSchedule.successors[i];
+		for(int j = 0; j < successors.size(); ++j){
+			info += cleanSchedule.attributes[successors[j]]->parent()->fullName() + ", ";
 		}
-		info += "] -> ";
+		info += "], ";
 	}
 	info += "]\n";
 	
 	return info;
 }
 
-void Attribute::cacheDirtyChainUpstream(){
-	std::vector<Attribute*> attributes;
-	NetworkManager::getUpstreamChain(this, attributes);
-	for(int i = 0; i < attributes.size(); ++i){
-		NetworkManager::getDownstreamChain(attributes[i], attributes[i]->_dirtyChain);
-	}
-}
-
 void Attribute::cacheCleanChainDownstream(){
+	NetworkEditLock lock;
+	
 	std::vector<Attribute*> attributes;
 	NetworkManager::getDownstreamChain(this, attributes);
 	for(int i = 0; i < attributes.size(); ++i){
-		NetworkManager::getCleanChain(attributes[i], attributes[i]->_cleanChain, attributes[i]->_inputsCleanChain);
+		NetworkManager::getCleanSchedule(attributes[i], attributes[i]->_cleanSchedule, attributes[i]->_inputsCleanChain);
 	}
 }
 
 void Attribute::cacheEvaluationChain(){
-	cacheDirtyChainUpstream();
+	if(NetworkManager::deferEvaluationChainUpdates()){
+		NetworkManager::queueEvaluationChainUpdate(this);
+		return;
+	}
+	
 	cacheCleanChainDownstream();
 }
 
@@ -885,6 +943,8 @@ std::vector<Attribute*> Attribute::specializationLinkedBy(){
 }
 
 Attribute *Attribute::connectedNonPassThrough(){
+	NetworkManager::flushEditTransaction();
+	
     Attribute *input = _input;
     while(input){
     	if(!input->_passThrough){
@@ -895,8 +955,10 @@ Attribute *Attribute::connectedNonPassThrough(){
     	}
     }
 
-	for(int i = 0; i < _dirtyChain.size(); ++i){
-		Attribute *outAttr = _dirtyChain[i];
+	std::vector<Attribute*> downstreamChain;
+	NetworkManager::getDownstreamChain(this, downstreamChain);
+	for(int i = 0; i < downstreamChain.size(); ++i){
+		Attribute *outAttr = downstreamChain[i];
 		if(!outAttr->_passThrough){
 			return  outAttr;
 		}
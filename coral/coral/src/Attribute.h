@@ -34,6 +34,7 @@
 #include <map>
 #include <time.h>
 #include <iostream>
+#include <boost/unordered_set.hpp>
 
 #include "NestedObject.h"
 
@@ -44,7 +45,11 @@ class AttributeAccessor;
 class NetworkManager;
 class SpecializationLink;
 class ErrorObject;
-class attribute_parallelClean;
+class attribute_scheduledClean;
+class EvaluationContext;
+class EvaluationClaim;
+class EvaluationState;
+class SpecializationSolver;
 class Attribute;
 
 struct SpecializationLink{
@@ -53,6 +58,18 @@ struct SpecializationLink{
 	Attribute *attributeB;
 };
 
+struct CleanSchedule{
+	// Dependency graph of the output attributes to clean, not exposed to public API.
+	// attributes are stored in topological order, each task is run as soon as all of its predecessors are done.
+	std::vector<Attribute*> attributes;
+	std::vector<std::vector<int> > successors;
+	std::vector<int> predecessorsCount;
+	// the whole upstream chain in topological order, with the positions of the attributes feeding each of them,
+	// it's what the clean flags are validated against when the attribute is pulled.
+	std::vector<Attribute*> chain;
+	std::vector<std::vector<int> > chainInputs;
+};
+
 //! The base class for customized attributes.
 //
 //! Internally it stores a pointer to a Value, 
@@ -118,7 +135,8 @@ public:
 		then you must use outValue() instead.*/
 	Value *value();
 	
-	/*! Return this attribute's value without cleaning it, use this method to access the Value for modifying its internal data.*/
+	/*! Return this attribute's value without cleaning it, use this method to access the Value for modifying its internal data.
+		While an EvaluationState is current the value returned is the state's own copy.*/
 	Value *outValue();
 	
 	// UI\external observers stuff
@@ -136,13 +154,21 @@ protected:
 	void setIsOutput(bool value);
 	void setIsInput(bool value);
 	void setIsClean(bool value);
+	
+	/*! onDirtied() is only invoked on the attributes that enabled it, 
+		the downstream chain of a dirtied attribute is walked only while some attribute is observing it.*/
+	void setNotifyOnDirty(bool value);
 	void setAllowedSpecialization(const std::vector<std::string> &specialization);
 
 private:
 	friend class AttributeAccessor;
-	friend class attribute_parallelClean;
+	friend class attribute_scheduledClean;
+	friend class EvaluationContext;
+	friend class EvaluationState;
+	friend class SpecializationSolver;
 	friend class Node;
 	friend class NetworkManager;
+	friend class NetworkFile;
 
 	bool connectTo(Attribute *attribute, ErrorObject *errorObject);
 	void addAffectedFrom(Attribute *attribute);
@@ -161,26 +187,33 @@ private:
 	bool specializationContainedOne(const std::vector<std::string> &specialization1, const std::vector<std::string> &specialization2);
 	void linkSpecializationTo(Attribute *attribute);
 	void cacheEvaluationChain();
-	void cacheDirtyChainUpstream();
 	void cacheCleanChainDownstream();
 	void cleanSelf();
+	void collectAffectedByVersions(std::vector<std::pair<int, unsigned int> > &versions);
+	void stampValueVersion();
 	void processDirtyingDoneCallbackQueue();
 	Attribute *findFirstOutputNotPassThrough();
 	void initValueFromPassThroughFirstOutput(Attribute *attribute);
 	void setNotifyParentNodeOnDirty(bool value);
-	void collectSpecializationBranch(std::vector<std::pair<Attribute*, Attribute*> > &specializationPairs, std::vector<std::pair<Attribute*, Attribute*> > &specializationLinks, std::map<int, std::vector<std::string> > &specializationMap, bool reset);
-	bool updateSpecialization(std::vector<std::pair<Attribute*, Attribute*> > &specializationPairs, std::vector<std::pair<Attribute*, Attribute*> > &specializationLinks, std::map<int, std::vector<std::string> > &specializationMap);
+	void validateCleanFlags();
 
 	Attribute *_input;
 	std::vector<Attribute*> _outputs;
 	std::vector<Attribute*> _affect;
 	std::vector<Attribute*> _affectedBy;
+	boost::unordered_set<Attribute*> _outputsSet; // membership of _outputs, the vectors keep the connection order
+	boost::unordered_set<Attribute*> _affectSet;
+	boost::unordered_set<Attribute*> _affectedBySet;
 	bool _isClean;
 	bool _isOutput;
 	bool _isInput;
 	bool _passThrough;
 	bool _valueObserved;
 	bool _notifyParentNodeOnDirty;
+	bool _notifyOnDirty;
+	unsigned int _dirtyGeneration;
+	unsigned int _forcedGeneration;
+	unsigned int _validatedGeneration;
 	Value *_value;
 	Value *_inputValue;
 	std::vector<std::string> _allowedSpecialization;
@@ -189,9 +222,10 @@ private:
 	std::vector<SpecializationLink*> _specializationLinks;
 	int _computeTimeSeconds;
 	int _computeTimeMilliseconds;
-	std::vector<Attribute*> _dirtyChain;
-	std::map<int, std::vector<Attribute*> > _cleanChain;
+	CleanSchedule _cleanSchedule;
 	std::map<int, std::vector<Attribute*> > _inputsCleanChain;
+	EvaluationClaim *_evaluationClaim;
+	std::vector<std::pair<int, unsigned int> > _affectedByVersions;
 	
 	Attribute();
 	Attribute(const Attribute &other);
@@ -25,6 +25,8 @@
 // NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 // SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 // </license>
+#include <boost/functional/hash.hpp>
+
 #include "BoolAttribute.h"
 #include "stringUtils.h"
 
@@ -36,6 +38,8 @@ _slices(1){
 	_boolValuesSliced.resize(1);
 	_boolValuesSliced[0].resize(1);
 	_boolValuesSliced[0][0] = false;
+	
+	setTracksChanges(true);
 }
 
 unsigned int Bool::slices(){
@@ -69,21 +73,22 @@ void Bool::resizeSlices(unsigned int slices){
 		}
 		
 		_slices = slices;
+		changed();
 	}
 }
 
 void Bool::setBoolValueAtSlice(unsigned int slice, unsigned int id, bool value){
 	if(slice < _boolValuesSliced.size()){
 		std::vector<bool> &slicevec = _boolValuesSliced[slice];
-		if(id < slicevec.size()){
+		if(id < slicevec.size() && slicevec[id] != value){
 			slicevec[id] = value;
+			changed();
 		}
 	}
 }
 
 void Bool::setBoolValueAt(unsigned int id, bool value){
-	if(id < _boolValuesSliced[0].size())
-		_boolValuesSliced[0][id] = value;
+	setBoolValueAtSlice(0, id, value);
 }
 
 bool Bool::boolValueAtSlice(unsigned int slice, unsigned int id){
@@ -127,17 +132,21 @@ const std::vector<bool> &Bool::boolValues(){
 }
 
 void Bool::setBoolValuesSlice(unsigned int slice, const std::vector<bool> &values){
-	if(slice < _boolValuesSliced.size()){
+	if(slice < _boolValuesSliced.size() && _boolValuesSliced[slice] != values){
 		_boolValuesSliced[slice] = values;
+		changed();
 	}
 }
 
 void Bool::setBoolValues(const std::vector<bool> &values){
-	_boolValuesSliced[0] = values;
+	setBoolValuesSlice(0, values);
 }
 
 void Bool::setIsArray(bool value){
-	_isArray = value;
+	if(value != _isArray){
+		_isArray = value;
+		changed();
+	}
 }
 
 bool Bool::isArray(){
@@ -145,7 +154,10 @@ bool Bool::isArray(){
 }
 
 void Bool::resize(unsigned int size){
-	_boolValuesSliced[0].resize(size);
+	if(size != _boolValuesSliced[0].size()){
+		_boolValuesSliced[0].resize(size);
+		changed();
+	}
 }
 
 std::string Bool::sliceAsString(unsigned int slice){
@@ -216,6 +228,63 @@ void Bool::setFromString(const std::string &value){
 			_boolValuesSliced[0][0] = false;
 		}
 	}
+	
+	changed();
+}
+
+void Bool::copy(const Value *other){
+	const Bool *otherBool = dynamic_cast<const Bool*>(other);
+	
+	if(otherBool){
+		_boolValuesSliced = otherBool->_boolValuesSliced;
+		_isArray = otherBool->_isArray;
+		_slices = otherBool->_slices;
+		changed();
+	}
+}
+
+Value *Bool::duplicate(){
+	Bool *value = new Bool();
+	value->copy(this);
+	
+	return value;
+}
+
+bool Bool::isHashable(){
+	return true;
+}
+
+std::size_t Bool::hash(){
+	std::size_t seed = 0;
+	boost::hash_combine(seed, _isArray);
+	
+	for(int i = 0; i < _boolValuesSliced.size(); ++i){
+		const std::vector<bool> &slice = _boolValuesSliced[i];
+		boost::hash_combine(seed, slice.size());
+		for(int j = 0; j < slice.size(); ++j){
+			boost::hash_combine(seed, (bool)slice[j]);
+		}
+	}
+	
+	return seed;
+}
+
+bool Bool::isEqual(Value *other){
+	Bool *otherBool = dynamic_cast<Bool*>(other);
+	if(otherBool == 0){
+		return false;
+	}
+	
+	return _isArray == otherBool->_isArray && _boolValuesSliced == otherBool->_boolValuesSliced;
+}
+
+unsigned int Bool::sizeInBytes(){
+	unsigned int size = sizeof(Bool);
+	for(int i = 0; i < _boolValuesSliced.size(); ++i){
+		size += _boolValuesSliced[i].size() / 8 + 1;
+	}
+	
+	return size;
 }
 
 BoolAttribute::BoolAttribute(const std::string &name, Node *parent) : Attribute(name, parent){
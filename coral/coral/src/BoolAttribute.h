@@ -50,6 +50,12 @@ public:
 	void resize(unsigned int size);
 	std::string asString();
 	void setFromString(const std::string &value);
+	void copy(const Value *other);
+	Value *duplicate();
+	bool isHashable();
+	std::size_t hash();
+	bool isEqual(Value *other);
+	unsigned int sizeInBytes();
 	unsigned int slices();
 
 	unsigned int sizeSlice(unsigned int slice);
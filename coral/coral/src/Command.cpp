@@ -26,10 +26,320 @@
 // SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 // </license>
 
+#include <cstdlib>
+#include <cstring>
+#include <cerrno>
+#include <climits>
+
 #include "Command.h"
+#include "stringUtils.h"
 
 using namespace coral;
 
+namespace {
+	bool command_isSpace(char c){
+		return c == ' ' || c == '\t' || c == '\n' || c == '\r';
+	}
+	
+	void command_skipSpaces(const std::string &script, std::size_t &position){
+		while(position < script.size() && command_isSpace(script[position])){
+			position++;
+		}
+	}
+	
+	int command_hexDigit(char c){
+		if(c >= '0' && c <= '9'){
+			return c - '0';
+		}
+		else if(c >= 'a' && c <= 'f'){
+			return c - 'a' + 10;
+		}
+		else if(c >= 'A' && c <= 'F'){
+			return c - 'A' + 10;
+		}
+		
+		return -1;
+	}
+	
+	// reads count hex digits at position, returns false if any of them is missing
+	bool command_readHex(const std::string &script, std::size_t &position, int count, unsigned int &value){
+		value = 0;
+		for(int i = 0; i < count; ++i){
+			int digit = position < script.size() ? command_hexDigit(script[position]) : -1;
+			if(digit == -1){
+				return false;
+			}
+			
+			value = (value << 4) | digit;
+			position++;
+		}
+		
+		return true;
+	}
+	
+	void command_appendUtf8(std::string &value, unsigned int codePoint){
+		if(codePoint < 0x80){
+			value += char(codePoint);
+		}
+		else if(codePoint < 0x800){
+			value += char(0xc0 | (codePoint >> 6));
+			value += char(0x80 | (codePoint & 0x3f));
+		}
+		else if(codePoint < 0x10000){
+			value += char(0xe0 | (codePoint >> 12));
+			value += char(0x80 | ((codePoint >> 6) & 0x3f));
+			value += char(0x80 | (codePoint & 0x3f));
+		}
+		else{
+			value += char(0xf0 | (codePoint >> 18));
+			value += char(0x80 | ((codePoint >> 12) & 0x3f));
+			value += char(0x80 | ((codePoint >> 6) & 0x3f));
+			value += char(0x80 | (codePoint & 0x3f));
+		}
+	}
+	
+	// returns the position of the opening quote if a python string literal, prefix included, starts at position
+	std::size_t command_stringLiteralQuote(const std::string &script, std::size_t position){
+		std::size_t quote = position;
+		while(quote < script.size() && quote - position < 2 && strchr("uUbBrR", script[quote])){
+			quote++;
+		}
+		
+		if(quote < script.size() && (script[quote] == '\'' || script[quote] == '"')){
+			return quote;
+		}
+		
+		return std::string::npos;
+	}
+	
+	// reads the python string literal starting at position into value, the way python 2 reads it, and moves position after its closing quote.
+	bool command_readStringLiteral(const std::string &script, std::size_t &position, std::string &value){
+		std::size_t i = command_stringLiteralQuote(script, position);
+		if(i == std::string::npos){
+			return false;
+		}
+		
+		std::string prefix = stringUtils::lower(script.substr(position, i - position));
+		bool raw = prefix.find('r') != std::string::npos;
+		bool unicode = prefix.find('u') != std::string::npos;
+		
+		std::string closing(3, script[i]);
+		if(script.compare(i, 3, closing) != 0){
+			closing = script[i];
+		}
+		i += closing.size();
+		
+		value.clear();
+		while(i < script.size()){
+			char c = script[i];
+			if(script.compare(i, closing.size(), closing) == 0){
+				position = i + closing.size();
+				return true;
+			}
+			else if(c == '\n' && closing.size() == 1){
+				return false;
+			}
+			else if(c != '\\' || i + 1 >= script.size()){
+				value += c;
+				i++;
+				continue;
+			}
+			
+			char escaped = script[i + 1];
+			i += 2;
+			
+			if(raw){
+				// raw strings keep the backslash, it only stops the next quote from closing the string
+				value += '\\';
+				value += escaped;
+				continue;
+			}
+			
+			unsigned int code = 0;
+			switch(escaped){
+				case '\n':
+					break;
+				case '\r':
+					if(i < script.size() && script[i] == '\n'){
+						i++;
+					}
+					break;
+				case 'a': value += '\a'; break;
+				case 'b': value += '\b'; break;
+				case 'f': value += '\f'; break;
+				case 'n': value += '\n'; break;
+				case 'r': value += '\r'; break;
+				case 't': value += '\t'; break;
+				case 'v': value += '\v'; break;
+				case '\\': case '\'': case '"':
+					value += escaped;
+					break;
+				case 'x':
+					if(!command_readHex(script, i, 2, code)){
+						return false;
+					}
+					value += char(code);
+					break;
+				case 'u': case 'U':
+					if(!unicode){
+						value += '\\';
+						value += escaped;
+						break;
+					}
+					if(!command_readHex(script, i, escaped == 'u' ? 4 : 8, code) || code > 0x10ffff){
+						return false;
+					}
+					command_appendUtf8(value, code);
+					break;
+				default:
+					if(escaped >= '0' && escaped <= '7'){
+						code = escaped - '0';
+						for(int digits = 1; digits < 3 && i < script.size() && script[i] >= '0' && script[i] <= '7'; ++digits){
+							code = code * 8 + (script[i] - '0');
+							i++;
+						}
+						value += char(code & 0xff);
+					}
+					else{
+						// python keeps unknown escapes as they are
+						value += '\\';
+						value += escaped;
+					}
+			}
+		}
+		
+		return false;
+	}
+	
+	// moves position to the first comma or closing bracket that isn't nested or part of a string literal
+	bool command_skipValue(const std::string &script, std::size_t &position){
+		int depth = 0;
+		std::string literal;
+		while(position < script.size()){
+			char c = script[position];
+			if(c == '\'' || c == '"'){
+				if(!command_readStringLiteral(script, position, literal)){
+					return false;
+				}
+				continue;
+			}
+			else if(c == '(' || c == '[' || c == '{'){
+				depth++;
+			}
+			else if(c == ')' || c == ']' || c == '}'){
+				if(depth == 0){
+					return true;
+				}
+				depth--;
+			}
+			else if(c == ',' && depth == 0){
+				return true;
+			}
+			
+			position++;
+		}
+		
+		return false;
+	}
+	
+	bool command_isIdentifier(const std::string &name){
+		if(name.empty() || (name[0] >= '0' && name[0] <= '9')){
+			return false;
+		}
+		
+		for(int i = 0; i < name.size(); ++i){
+			char c = name[i];
+			if(!((c >= 'a' && c <= 'z') || (c >= 'A' && c <= 'Z') || (c >= '0' && c <= '9') || c == '_')){
+				return false;
+			}
+		}
+		
+		return true;
+	}
+	
+	// python 2 reads 010 as an octal number, such ints are left undefined and evaluated by python itself
+	bool command_parseInt(const std::string &value, int &result){
+		std::string digits = value.compare(0, 1, "-") == 0 ? value.substr(1) : value;
+		if(digits.empty() || !stringUtils::isdigit(digits) || (digits.size() > 1 && digits[0] == '0')){
+			return false;
+		}
+		
+		errno = 0;
+		long parsed = strtol(value.c_str(), 0, 10);
+		if(errno == ERANGE || parsed < INT_MIN || parsed > INT_MAX){
+			return false;
+		}
+		
+		result = int(parsed);
+		return true;
+	}
+	
+	bool command_parseFloat(const std::string &value, double &result){
+		if(value.empty() || value.find_first_not_of("0123456789.eE+-") != std::string::npos || value.find_first_of(".eE") == std::string::npos){
+			return false;
+		}
+		
+		char *end = 0;
+		result = strtod(value.c_str(), &end);
+		
+		return end == value.c_str() + value.size();
+	}
+	
+	std::string command_stringLiteral(const std::string &value){
+		std::string literal = "'";
+		for(int i = 0; i < value.size(); ++i){
+			unsigned char c = value[i];
+			if(c == '\\' || c == '\''){
+				literal += '\\';
+				literal += c;
+			}
+			else if(c == '\n'){
+				literal += "\\n";
+			}
+			else if(c == '\r'){
+				literal += "\\r";
+			}
+			else if(c == '\t'){
+				literal += "\\t";
+			}
+			else if(c < 0x20 || c == 0x7f){
+				char buffer[8];
+				sprintf(buffer, "\\x%02x", c);
+				literal += buffer;
+			}
+			else{
+				literal += c;
+			}
+		}
+		
+		return literal + "'";
+	}
+	
+	std::string command_floatLiteral(double value){
+		if(value - value != 0.0){
+			if(value != value){
+				return "float('nan')";
+			}
+			
+			return value > 0.0 ? "float('inf')" : "float('-inf')";
+		}
+		
+		// the usual six decimals when they read back the same value, otherwise the shortest exact form
+		char buffer[512];
+		sprintf(buffer, "%f", value);
+		for(int precision = 15; strtod(buffer, 0) != value && precision <= 17; ++precision){
+			sprintf(buffer, "%.*g", precision, value);
+		}
+		
+		std::string literal = buffer;
+		if(literal.find_first_of(".e") == std::string::npos){
+			literal += ".0";
+		}
+		
+		return literal;
+	}
+}
+
 Command::Command():
 	_name(""){
 }
@@ -60,7 +370,7 @@ void Command::setArgInt(const std::string &name, int value){
 	setCommandValueArg(name, cmdValue);
 }
 
-void Command::setArgFloat(const std::string &name, float value){
+void Command::setArgFloat(const std::string &name, double value){
 	CommandValue cmdValue;
 	cmdValue.setFloat(value);
 	setCommandValueArg(name, cmdValue);
@@ -88,7 +398,7 @@ int Command::argAsInt(const std::string &name){
 	return _args[name].asInt();
 }
 
-float Command::argAsFloat(const std::string &name){
+double Command::argAsFloat(const std::string &name){
 	return _args[name].asFloat();
 }
 
@@ -108,7 +418,7 @@ void Command::setResultInt(int value){
 	setCommandValueResult(cmdValue);
 }
 
-void Command::setResultFloat(float value){
+void Command::setResultFloat(double value){
 	CommandValue cmdValue;
 	cmdValue.setFloat(value);
 	setCommandValueResult(cmdValue);
@@ -128,7 +438,7 @@ int Command::resultAsInt(){
 	return _result.asInt();
 }
 
-float Command::resultAsFloat(){
+double Command::resultAsFloat(){
 	return _result.asFloat();
 }
 
@@ -161,19 +471,13 @@ std::string Command::argToString(CommandValue &arg){
 		}
 	}
 	else if(argType == CommandValue::intType){
-		char buffer[sizeof(int)];
-		sprintf(buffer, "%i", arg.asInt());
-		
-		argString = buffer;
+		argString = stringUtils::intToString(arg.asInt());
 	}
 	else if(argType == CommandValue::floatType){
-		char buffer[sizeof(float)];
-		sprintf(buffer, "%f", arg.asFloat());
-		
-		argString = buffer;
+		argString = command_floatLiteral(arg.asFloat());
 	}
 	else if(argType == CommandValue::stringType){
-		argString = "'" + arg.asString() + "'";
+		argString = command_stringLiteral(arg.asString());
 	}
 	else if(argType == CommandValue::undefinedType){
 		argString = arg.asString();
@@ -199,6 +503,97 @@ std::string Command::asScript(){
 	return cmdString;
 }
 
+bool Command::setFromScript(const std::string &script){
+	std::size_t position = 0;
+	if(!setFromScript(script, position)){
+		return false;
+	}
+	
+	command_skipSpaces(script, position);
+	
+	return position == script.size();
+}
+
+bool Command::setFromScript(const std::string &script, std::size_t &position){
+	std::string header = "executeCommand(";
+	if(script.compare(position, header.size(), header) != 0){
+		return false;
+	}
+	
+	std::size_t current = position + header.size();
+	command_skipSpaces(script, current);
+	
+	std::string name;
+	if(!command_readStringLiteral(script, current, name)){
+		return false;
+	}
+	
+	_name = name;
+	_args.clear();
+	_argNames.clear();
+	
+	while(true){
+		command_skipSpaces(script, current);
+		if(current >= script.size()){
+			return false;
+		}
+		else if(script[current] == ')'){
+			position = current + 1;
+			return true;
+		}
+		else if(script[current] == ','){
+			current++;
+			continue;
+		}
+		
+		std::size_t equal = script.find("=", current);
+		if(equal == std::string::npos){
+			return false;
+		}
+		
+		std::string argName = stringUtils::strip(script.substr(current, equal - current));
+		if(!command_isIdentifier(argName)){
+			return false;
+		}
+		
+		current = equal + 1;
+		command_skipSpaces(script, current);
+		
+		std::size_t valueStart = current;
+		if(!command_skipValue(script, current)){
+			return false;
+		}
+		
+		std::string value = stringUtils::strip(script.substr(valueStart, current - valueStart));
+		
+		// a literal alone is a string, anything else made of literals, such as 'a' + 'b', is left to python
+		std::string literal;
+		std::size_t literalEnd = 0;
+		bool isString = command_stringLiteralQuote(value, 0) != std::string::npos && command_readStringLiteral(value, literalEnd, literal) && literalEnd == value.size();
+		
+		int intValue = 0;
+		double floatValue = 0.0;
+		if(isString){
+			setArgString(argName, literal);
+		}
+		else if(value == "True" || value == "False"){
+			setArgBool(argName, value == "True");
+		}
+		else if(command_parseInt(value, intValue)){
+			setArgInt(argName, intValue);
+		}
+		else if(command_parseFloat(value, floatValue)){
+			setArgFloat(argName, floatValue);
+		}
+		else if(!value.empty()){
+			setArgUndefined(argName, value);
+		}
+		else{
+			return false;
+		}
+	}
+}
+
 void Command::doIt(){
 }
 
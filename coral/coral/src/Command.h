@@ -74,7 +74,7 @@ public:
 		_type = CommandValue::intType;
 	}
 	
-	void setFloat(float value){
+	void setFloat(double value){
 		_floatValue = value;
 		_type = CommandValue::floatType;
 	}
@@ -92,7 +92,7 @@ public:
 		return _intValue;
 	}
 	
-	float asFloat(){
+	double asFloat(){
 		return _floatValue;
 	}
 	
@@ -107,7 +107,7 @@ public:
 private:
 	bool _boolValue;
 	int _intValue;
-	float _floatValue;
+	double _floatValue;
 	std::string _stringValue;
 	CommandValueType _type;
 };
@@ -135,19 +135,19 @@ public:
 	virtual void undoIt();
 	void setArgBool(const std::string &name, bool value);
 	void setArgInt(const std::string &name, int value);
-	void setArgFloat(const std::string &name, float value);
+	void setArgFloat(const std::string &name, double value);
 	void setArgString(const std::string &name, const std::string &value);
 	bool argAsBool(const std::string &name);
 	int argAsInt(const std::string &name);
-	float argAsFloat(const std::string &name);
+	double argAsFloat(const std::string &name);
 	std::string argAsString(const std::string &name);
 	void setResultBool(bool value);
 	void setResultInt(int value);
-	void setResultFloat(float value);
+	void setResultFloat(double value);
 	void setResultString(const std::string &value);
 	bool resultAsBool();
 	int resultAsInt();
-	float resultAsFloat();
+	double resultAsFloat();
 	std::string resultAsString();
 	CommandValueType argType(const std::string &argName);
 	CommandValueType resultType();
@@ -164,8 +164,18 @@ public:
 	
 	//! Returns a string of python code in the form of:
 	//! executeCommand('MyCommand', myBoolArg = True, myIntArg = 1, myFloatArg = 0.0, myStringArg = 'something', myUndefinedArg = SomeClass())
+	//! String args are escaped as python string literals, float args are written with enough digits to read back the same double.
 	std::string asScript();
 	
+	//! Does the opposite of asScript(), the name and args of this command are set from a string of python code in the form of:
+	//! executeCommand('MyCommand', myBoolArg = True, myIntArg = 1, myFloatArg = 0.0, myStringArg = 'something', myUndefinedArg = SomeClass())
+	//! String literals are read as python reads them, with either quotes, prefixes and escapes.
+	//! Args that are neither bools, numbers nor plain string literals are set as undefined, returns false if the script isn't a command.
+	bool setFromScript(const std::string &script);
+	
+	//! Same as above for the command starting at position in script, on success position is moved right after the closing bracket of the command.
+	bool setFromScript(const std::string &script, std::size_t &position);
+	
 private:
 	void setCommandValueArg(const std::string &name, const CommandValue &value);
 	void setCommandValueResult(const CommandValue &value);
@@ -1,3 +1,4 @@
+#include <boost/functional/hash.hpp>
 #include "EnumAttribute.h"
 
 using namespace coral;
@@ -69,6 +70,38 @@ void Enum::setFromString(const std::string &value){
 	}
 }
 
+Value *Enum::duplicate(){
+	Enum *value = new Enum();
+	value->_enum = _enum;
+	value->_currentIndex = _currentIndex;
+	
+	return value;
+}
+
+bool Enum::isHashable(){
+	return true;
+}
+
+std::size_t Enum::hash(){
+	std::size_t seed = 0;
+	boost::hash_combine(seed, _currentIndex);
+	for(std::map<int, std::string>::iterator i = _enum.begin(); i != _enum.end(); ++i){
+		boost::hash_combine(seed, i->first);
+		boost::hash_combine(seed, i->second);
+	}
+	
+	return seed;
+}
+
+bool Enum::isEqual(Value *other){
+	Enum *otherEnum = dynamic_cast<Enum*>(other);
+	if(otherEnum == 0){
+		return false;
+	}
+	
+	return _currentIndex == otherEnum->_currentIndex && _enum == otherEnum->_enum;
+}
+
 void Enum::setCurrentIndex(int index){
 	if(_enum.find(index) != _enum.end()){
 		_currentIndex = index;
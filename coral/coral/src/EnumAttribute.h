@@ -50,6 +50,10 @@ public:
 	int currentIndex();
 	std::string asString();
 	void setFromString(const std::string &value);
+	Value *duplicate();
+	bool isHashable();
+	std::size_t hash();
+	bool isEqual(Value *other);
 	void setCurrentIndexChangedCallback(Node * parentNode, void(*callback)(Node *, Enum *));
 	
 private:
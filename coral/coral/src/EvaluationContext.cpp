@@ -0,0 +1,275 @@
+// <license>
+// Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+// This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+// 
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are
+// met:
+// 
+//    * Redistributions of source code must retain the above copyright
+//      notice, this list of conditions and the following disclaimer.
+// 
+//    * Redistributions in binary form must reproduce the above copyright
+//      notice, this list of conditions and the following disclaimer in the
+//      documentation and/or other materials provided with the distribution.
+// 
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+// IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+// PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+// LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+// NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+// SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// </license>
+
+
+#ifdef CORAL_PARALLEL_TBB
+	#include <tbb/mutex.h>
+	#include <tbb/task_arena.h>
+	#include <tbb/enumerable_thread_specific.h>
+#endif
+
+#include "EvaluationContext.h"
+#include "EvaluationState.h"
+#include "Attribute.h"
+
+using namespace coral;
+
+namespace {
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex _claimMutex;
+		tbb::enumerable_thread_specific<EvaluationContext*> _currentContext((EvaluationContext*)0);
+	#else
+		CORAL_THREAD_LOCAL EvaluationContext *_currentContext = 0;
+	#endif
+}
+
+void(*EvaluationContext::_waitCallback)() = 0;
+
+namespace coral{
+
+//! An attribute claimed by the context cleaning it, the contexts waiting on it keep the claim alive until they are done waiting.
+class EvaluationClaim{
+public:
+	EvaluationClaim(EvaluationContext *context): context(context), waiters(0), released(false){
+		#ifdef CORAL_PARALLEL_TBB
+			computing.lock(); // held until the claim is released, waiters block on it
+		#endif
+	}
+	
+	EvaluationContext *context;
+	int waiters;
+	bool released;
+	
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex computing;
+	#endif
+};
+
+}
+
+//! Releases a claimed attribute once it's cleaned, also when its update throws.
+class EvaluationContext::ClaimScope{
+public:
+	ClaimScope(EvaluationContext *context, Attribute *attribute, EvaluationClaim *claim): _context(context), _attribute(attribute), _claim(claim){
+	}
+	
+	~ClaimScope(){
+		_context->release(_attribute, _claim);
+	}
+
+private:
+	EvaluationContext *_context;
+	Attribute *_attribute;
+	EvaluationClaim *_claim;
+};
+
+//! Cleans an attribute as an isolated tbb region.
+//
+//! A thread waiting on the nested parallel loops of the update only takes tasks spawned by that same update,
+//! it can't pick up an unrelated pull that would then wait on the claims held further down its own stack.
+class EvaluationContext::IsolatedClean{
+public:
+	IsolatedClean(Attribute *attribute): _attribute(attribute){
+	}
+	
+	void operator() () const{
+		EvaluationContext::cleanSelf(_attribute);
+	}
+
+private:
+	Attribute *_attribute;
+};
+
+EvaluationContext::EvaluationContext(Attribute *attribute):
+	_attribute(attribute),
+	_state(EvaluationState::current()){
+}
+
+Attribute *EvaluationContext::attribute(){
+	return _attribute;
+}
+
+EvaluationState *EvaluationContext::state(){
+	return _state;
+}
+
+EvaluationContext *EvaluationContext::current(){
+	#ifdef CORAL_PARALLEL_TBB
+		return _currentContext.local();
+	#else
+		return _currentContext;
+	#endif
+}
+
+void EvaluationContext::setCurrent(EvaluationContext *context){
+	#ifdef CORAL_PARALLEL_TBB
+		_currentContext.local() = context;
+	#else
+		_currentContext = context;
+	#endif
+}
+
+EvaluationClaim *&EvaluationContext::claimSlot(EvaluationState *state, Attribute *attribute){
+	if(state){
+		return state->entry(attribute).claim;
+	}
+	
+	return attribute->_evaluationClaim;
+}
+
+void EvaluationContext::waitFor(EvaluationState *state, EvaluationClaim *claim){
+	// the claim was given a waiter by the caller, it stays alive until this waiter is done
+	#ifdef CORAL_PARALLEL_TBB
+		claim->computing.lock();
+		claim->computing.unlock();
+	#else
+		if(_waitCallback){
+			_waitCallback();
+		}
+	#endif
+	
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex::scoped_lock lock(state ? state->_mutex : _claimMutex);
+	#endif
+	
+	claim->waiters -= 1;
+	if(claim->released && claim->waiters == 0){
+		delete claim;
+	}
+}
+
+void EvaluationContext::wait(Attribute *attribute){
+	EvaluationState *state = EvaluationState::current();
+	while(true){
+		EvaluationClaim *otherClaim = 0;
+		{
+			#ifdef CORAL_PARALLEL_TBB
+				tbb::mutex::scoped_lock lock(state ? state->_mutex : _claimMutex);
+			#endif
+			
+			// looked up without adding an entry to the state, an attribute it never touched can't be claimed in it
+			if(state){
+				std::map<int, EvaluationState::Entry>::iterator it = state->_entries.find(attribute->id());
+				if(it != state->_entries.end()){
+					otherClaim = it->second.claim;
+				}
+			}
+			else{
+				otherClaim = attribute->_evaluationClaim;
+			}
+			
+			if(otherClaim == 0){
+				return;
+			}
+			
+			otherClaim->waiters += 1;
+		}
+		
+		waitFor(state, otherClaim);
+	}
+}
+
+EvaluationClaim *EvaluationContext::claim(Attribute *attribute){
+	while(true){
+		EvaluationClaim *otherClaim = 0;
+		{
+			// a state guards its own claims, the network's claims share a single lock
+			#ifdef CORAL_PARALLEL_TBB
+				tbb::mutex::scoped_lock lock(_state ? _state->_mutex : _claimMutex);
+			#endif
+			
+			EvaluationClaim *&slot = claimSlot(_state, attribute);
+			if(slot == 0){
+				bool isClean = _state ? _state->entry(attribute).isClean : attribute->_isClean;
+				if(isClean){
+					return 0;
+				}
+				
+				slot = new EvaluationClaim(this);
+				return slot;
+			}
+			else if(slot->context == this){
+				return 0;
+			}
+			
+			otherClaim = slot;
+			otherClaim->waiters += 1;
+		}
+		
+		// another pull is computing this attribute, its upstream is already clean so it won't be waiting on us.
+		waitFor(_state, otherClaim);
+	}
+}
+
+void EvaluationContext::release(Attribute *attribute, EvaluationClaim *claim){
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex::scoped_lock lock(_state ? _state->_mutex : _claimMutex);
+	#endif
+	
+	EvaluationClaim *&slot = claimSlot(_state, attribute);
+	if(slot == claim){
+		slot = 0;
+	}
+	
+	claim->released = true;
+	#ifdef CORAL_PARALLEL_TBB
+		claim->computing.unlock();
+	#endif
+	
+	if(claim->waiters == 0){
+		delete claim;
+	}
+}
+
+void EvaluationContext::cleanSelf(Attribute *attribute){
+	attribute->cleanSelf();
+}
+
+void EvaluationContext::clean(Attribute *attribute){
+	EvaluationClaim *attributeClaim = claim(attribute);
+	if(attributeClaim){
+		ClaimScope claimScope(this, attribute, attributeClaim);
+		EvaluationScope scope(this);
+		
+		#ifdef CORAL_PARALLEL_TBB
+			tbb::this_task_arena::isolate(IsolatedClean(attribute));
+		#else
+			cleanSelf(attribute);
+		#endif
+	}
+}
+
+EvaluationScope::EvaluationScope(EvaluationContext *context):
+	_previousContext(EvaluationContext::current()){
+	
+	EvaluationContext::setCurrent(context);
+}
+
+EvaluationScope::~EvaluationScope(){
+	EvaluationContext::setCurrent(_previousContext);
+}
@@ -0,0 +1,102 @@
+// <license>
+// Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+// This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+// 
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are
+// met:
+// 
+//    * Redistributions of source code must retain the above copyright
+//      notice, this list of conditions and the following disclaimer.
+// 
+//    * Redistributions in binary form must reproduce the above copyright
+//      notice, this list of conditions and the following disclaimer in the
+//      documentation and/or other materials provided with the distribution.
+// 
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+// IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+// PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+// LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+// NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+// SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// </license>
+
+
+#ifndef CORAL_EVALUATIONCONTEXT_H
+#define CORAL_EVALUATIONCONTEXT_H
+
+#include "coralDefinitions.h"
+
+namespace coral{
+class Attribute;
+class EvaluationScope;
+class EvaluationState;
+class EvaluationClaim;
+
+//! Tracks a single in-flight evaluation, that is a pull on an attribute, not exposed to public API.
+//
+//! Each output attribute being cleaned is claimed by the context cleaning it, 
+//! pulls on disjoint subgraphs can then run concurrently while a pull overlapping an in-flight one 
+//! waits for the shared attributes to be computed instead of reading stale data.
+//! Claims are held per EvaluationState, pulls made within different states never wait on each other.
+class EvaluationContext{
+public:
+	EvaluationContext(Attribute *attribute);
+	
+	//! The attribute that was pulled to start this evaluation.
+	Attribute *attribute();
+	
+	//! The EvaluationState this evaluation runs in, NULL if it works on the network's own values.
+	EvaluationState *state();
+	
+	//! Cleans attribute within this context, if another context is computing it then this call waits for it to be done.
+	void clean(Attribute *attribute);
+	
+	//! The context being evaluated by the calling thread, or NULL when the calling thread is not running any evaluation.
+	static EvaluationContext *current();
+	
+	//! Waits for the evaluation computing attribute within the current EvaluationState, if any, to be done.
+	//! An attribute is flagged clean as soon as its update starts, a pull reading it directly waits here instead of reading stale data.
+	static void wait(Attribute *attribute);
+	
+	//! Invoked by builds without TBB while waiting on an attribute claimed by another thread.
+	//! Such builds rely on the GIL to run a single thread at a time, the python bindings set this callback to hand the GIL to the thread holding the claim.
+	static void(*_waitCallback)();
+
+private:
+	friend class EvaluationScope;
+	
+	class ClaimScope;
+	class IsolatedClean;
+	
+	EvaluationClaim *claim(Attribute *attribute);
+	void release(Attribute *attribute, EvaluationClaim *claim);
+	static EvaluationClaim *&claimSlot(EvaluationState *state, Attribute *attribute);
+	static void waitFor(EvaluationState *state, EvaluationClaim *claim);
+	static void cleanSelf(Attribute *attribute);
+	static void setCurrent(EvaluationContext *context);
+	
+	Attribute *_attribute;
+	EvaluationState *_state;
+	
+	EvaluationContext(const EvaluationContext &other);
+	EvaluationContext &operator =(const EvaluationContext &other);
+};
+
+//! Makes a context current for the calling thread for the lifetime of this object, the previous context is restored on destruction.
+class EvaluationScope{
+public:
+	EvaluationScope(EvaluationContext *context);
+	~EvaluationScope();
+
+private:
+	EvaluationContext *_previousContext;
+};
+
+}
+#endif
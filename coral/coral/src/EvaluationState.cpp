@@ -0,0 +1,279 @@
+// <license>
+// Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+// This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+// 
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are
+// met:
+// 
+//    * Redistributions of source code must retain the above copyright
+//      notice, this list of conditions and the following disclaimer.
+// 
+//    * Redistributions in binary form must reproduce the above copyright
+//      notice, this list of conditions and the following disclaimer in the
+//      documentation and/or other materials provided with the distribution.
+// 
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+// IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+// PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+// LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+// NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+// SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// </license>
+
+#include <set>
+
+#ifdef CORAL_PARALLEL_TBB
+	#include <tbb/enumerable_thread_specific.h>
+	#include <tbb/parallel_for.h>
+	#include "coreParallelAlgos.h"
+#endif
+
+#include "EvaluationState.h"
+#include "EvaluationContext.h"
+#include "Attribute.h"
+#include "Value.h"
+#include "NetworkManager.h"
+
+using namespace coral;
+
+int EvaluationState::_nextId = 0;
+
+namespace {
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::enumerable_thread_specific<EvaluationState*> _threadState((EvaluationState*)0);
+	#else
+		EvaluationState *_threadState = 0;
+	#endif
+	
+	EvaluationState *threadState(){
+		#ifdef CORAL_PARALLEL_TBB
+			return _threadState.local();
+		#else
+			return _threadState;
+		#endif
+	}
+	
+	void setThreadState(EvaluationState *state){
+		#ifdef CORAL_PARALLEL_TBB
+			_threadState.local() = state;
+		#else
+			_threadState = state;
+		#endif
+	}
+}
+
+EvaluationState::EvaluationState(){
+	_nextId += 1;
+	_id = _nextId;
+}
+
+EvaluationState::~EvaluationState(){
+	clear();
+}
+
+int EvaluationState::id(){
+	return _id;
+}
+
+void EvaluationState::clear(){
+	// the values are released without holding the lock, releasing them can wait on the GIL
+	std::map<int, Entry> entries;
+	{
+		#ifdef CORAL_PARALLEL_TBB
+			tbb::mutex::scoped_lock lock(_mutex);
+		#endif
+		
+		entries.swap(_entries);
+	}
+	
+	for(std::map<int, Entry>::iterator it = entries.begin(); it != entries.end(); ++it){
+		if(it->second.value){
+			it->second.value->removeReference();
+		}
+	}
+}
+
+int EvaluationState::valuesCount(){
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex::scoped_lock lock(_mutex);
+	#endif
+	
+	int count = 0;
+	for(std::map<int, Entry>::iterator it = _entries.begin(); it != _entries.end(); ++it){
+		if(it->second.value){
+			count++;
+		}
+	}
+	
+	return count;
+}
+
+EvaluationState *EvaluationState::current(){
+	// an evaluation carries the state it was started in, also on the threads running its tasks
+	EvaluationContext *context = EvaluationContext::current();
+	if(context){
+		return context->state();
+	}
+	
+	return threadState();
+}
+
+void EvaluationState::setCurrent(EvaluationState *state){
+	setThreadState(state);
+}
+
+void EvaluationState::evaluate(Attribute *attribute, const std::vector<EvaluationState*> &states){
+	// queued edits are flushed once here, not concurrently by each state
+	NetworkManager::flushEditTransaction();
+	
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::parallel_for(tbb::blocked_range<size_t>(0, states.size()), evaluationState_parallelEvaluate(attribute, &states));
+	#else
+		for(int i = 0; i < states.size(); ++i){
+			EvaluationStateScope scope(states[i]);
+			attribute->value();
+		}
+	#endif
+}
+
+EvaluationState::Entry &EvaluationState::entry(Attribute *attribute){
+	std::map<int, Entry>::iterator it = _entries.find(attribute->id());
+	if(it == _entries.end()){
+		// an attribute first touched by this state starts from the network's clean flag
+		Entry newEntry;
+		newEntry.value = 0;
+		newEntry.isClean = attribute->_isClean;
+		newEntry.claim = 0;
+		
+		it = _entries.insert(std::make_pair(attribute->id(), newEntry)).first;
+	}
+	
+	return it->second;
+}
+
+bool EvaluationState::isClean(Attribute *attribute){
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex::scoped_lock lock(_mutex);
+	#endif
+	
+	std::map<int, Entry>::iterator it = _entries.find(attribute->id());
+	if(it != _entries.end()){
+		return it->second.isClean;
+	}
+	
+	return attribute->_isClean;
+}
+
+void EvaluationState::setIsClean(Attribute *attribute, bool value){
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex::scoped_lock lock(_mutex);
+	#endif
+	
+	entry(attribute).isClean = value;
+}
+
+Value *EvaluationState::outValue(Attribute *attribute){
+	{
+		#ifdef CORAL_PARALLEL_TBB
+			tbb::mutex::scoped_lock lock(_mutex);
+		#endif
+		
+		Entry &attributeEntry = entry(attribute);
+		if(attributeEntry.value){
+			return attributeEntry.value;
+		}
+	}
+	
+	// the value is duplicated and referenced without holding the lock, taking a reference can wait on the GIL
+	// values that can't be duplicated stay shared with the network
+	Value *value = attribute->_value->duplicate();
+	if(value == 0){
+		return attribute->_value;
+	}
+	
+	value->addReference();
+	
+	Value *existingValue = 0;
+	{
+		#ifdef CORAL_PARALLEL_TBB
+			tbb::mutex::scoped_lock lock(_mutex);
+		#endif
+		
+		// another thread of the same state might have got there first
+		Entry &attributeEntry = entry(attribute);
+		if(attributeEntry.value == 0){
+			attributeEntry.value = value;
+		}
+		else{
+			existingValue = attributeEntry.value;
+		}
+	}
+	
+	if(existingValue){
+		value->removeReference();
+		return existingValue;
+	}
+	
+	return value;
+}
+
+Value *EvaluationState::inputValue(Attribute *attribute){
+	// the value read through a connection belongs to the first attribute of the chain
+	Attribute *source = attribute;
+	while(source->_input){
+		source = source->_input;
+	}
+	
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex::scoped_lock lock(_mutex);
+	#endif
+	
+	std::map<int, Entry>::iterator it = _entries.find(source->id());
+	if(it != _entries.end() && it->second.value){
+		return it->second.value;
+	}
+	
+	return attribute->_inputValue;
+}
+
+void EvaluationState::dirty(Attribute *attribute){
+	// the walk keeps its own visited set so that states can be dirtied from separate threads
+	std::set<Attribute*> visited;
+	std::vector<Attribute*> stack(1, attribute);
+	visited.insert(attribute);
+	
+	while(!stack.empty()){
+		Attribute *attr = stack.back();
+		stack.pop_back();
+		
+		setIsClean(attr, false);
+		
+		for(int i = 0; i < attr->_outputs.size(); ++i){
+			if(visited.insert(attr->_outputs[i]).second){
+				stack.push_back(attr->_outputs[i]);
+			}
+		}
+		
+		for(int i = 0; i < attr->_affect.size(); ++i){
+			if(visited.insert(attr->_affect[i]).second){
+				stack.push_back(attr->_affect[i]);
+			}
+		}
+	}
+}
+
+EvaluationStateScope::EvaluationStateScope(EvaluationState *state):
+	_previousState(threadState()){
+	
+	setThreadState(state);
+}
+
+EvaluationStateScope::~EvaluationStateScope(){
+	setThreadState(_previousState);
+}
@@ -0,0 +1,118 @@
+// <license>
+// Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+// This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+// 
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are
+// met:
+// 
+//    * Redistributions of source code must retain the above copyright
+//      notice, this list of conditions and the following disclaimer.
+// 
+//    * Redistributions in binary form must reproduce the above copyright
+//      notice, this list of conditions and the following disclaimer in the
+//      documentation and/or other materials provided with the distribution.
+// 
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+// IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+// PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+// LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+// NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+// SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// </license>
+
+
+#ifndef CORAL_EVALUATIONSTATE_H
+#define CORAL_EVALUATIONSTATE_H
+
+#include <map>
+#include <vector>
+#include "coralDefinitions.h"
+
+#ifdef CORAL_PARALLEL_TBB
+	#include <tbb/mutex.h>
+#endif
+
+namespace coral{
+class Attribute;
+class Value;
+class EvaluationClaim;
+
+//! An independent state of a network, holding its own copy of the values and clean flags of the attributes it touches.
+//
+//! While a state is current Attribute::outValue(), value(), valueChanged() and isClean() work on the state instead of the network,
+//! attributes never written within the state read the network's own values.
+//! Several states can then be set up with different inputs, for example different times, and evaluated concurrently on the same network.
+//! The state is carried by every evaluation started while it's current, node updates and their slices run within it.
+//! Nodes whose update() keeps data in the node itself are shared among the states and are not made safe by this class.
+class CORAL_EXPORT EvaluationState{
+public:
+	EvaluationState();
+	~EvaluationState();
+	
+	//! Identifies this state among the others.
+	int id();
+	
+	//! Discards the values held by this state, every attribute goes back to reading the network's values.
+	//! A state should be cleared after the network itself is edited, its clean flags don't follow edits made outside the state.
+	void clear();
+	
+	//! The number of attributes holding their own value within this state.
+	int valuesCount();
+	
+	//! Pulls attribute within each of the states, the states are evaluated concurrently when built with TBB.
+	static void evaluate(Attribute *attribute, const std::vector<EvaluationState*> &states);
+	
+	//! The state in use by the calling thread, NULL if the network's own values are in use.
+	static EvaluationState *current();
+	
+	//! Makes state current for the calling thread, pass NULL to go back to the network's own values.
+	static void setCurrent(EvaluationState *state);
+
+private:
+	friend class Attribute;
+	friend class EvaluationContext;
+	
+	struct Entry{
+		Value *value;
+		bool isClean;
+		EvaluationClaim *claim;
+	};
+	
+	Entry &entry(Attribute *attribute);
+	bool isClean(Attribute *attribute);
+	void setIsClean(Attribute *attribute, bool value);
+	Value *outValue(Attribute *attribute);
+	Value *inputValue(Attribute *attribute);
+	void dirty(Attribute *attribute);
+	
+	int _id;
+	std::map<int, Entry> _entries;
+	
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex _mutex;
+	#endif
+	
+	static int _nextId;
+	
+	EvaluationState(const EvaluationState &other);
+	EvaluationState &operator =(const EvaluationState &other);
+};
+
+//! Makes a state current for the calling thread for the lifetime of this object, the previous state is restored on destruction.
+class CORAL_EXPORT EvaluationStateScope{
+public:
+	EvaluationStateScope(EvaluationState *state);
+	~EvaluationStateScope();
+
+private:
+	EvaluationState *_previousState;
+};
+
+}
+#endif
@@ -30,6 +30,8 @@
 
 #include "Geo.h"
 #include <assert.h>
+#include <cstring>
+#include <boost/functional/hash.hpp>
 #include "containerUtils.h"
 
 using namespace coral;
@@ -40,7 +42,12 @@ _faceNormalsDirty(true),
 _verticesNormalsDirty(true),
 _topologyStructuresDirty(true),
 _alignmentDataDirty(true),
-_overrideVerticesNormals(false){
+_overrideVerticesNormals(false),
+_points(new std::vector<Imath::V3f>()),
+_faceNormals(new std::vector<Imath::V3f>()),
+_rawIndices(new std::vector<int>()),
+_rawIndexCounts(new std::vector<int>()){
+	setTracksChanges(true);
 }
 
 void Geo::copy(const Geo *other){
@@ -48,23 +55,100 @@ void Geo::copy(const Geo *other){
 	
 	_points = other->_points;
 	_rawFaces = other->_rawFaces;
+	_rawUvs = other->_rawUvs;
 	if(other->_overrideVerticesNormals){
 		_verticesNormals = other->_verticesNormals;
 		_overrideVerticesNormals = true;
 	}
 }
 
+void Geo::copy(const Value *other){
+	const Geo *otherGeo = dynamic_cast<const Geo*>(other);
+	if(otherGeo){
+		copy(otherGeo);
+	}
+}
+
+Value *Geo::duplicate(){
+	Geo *value = new Geo();
+	value->copy(this);
+	
+	return value;
+}
+
+bool Geo::isHashable(){
+	return true;
+}
+
+std::size_t Geo::hash(){
+	std::size_t seed = 0;
+	
+	boost::hash_combine(seed, _points->size());
+	if(_points->size()){
+		const float *data = (const float*)&(*_points)[0];
+		boost::hash_range(seed, data, data + _points->size() * 3);
+	}
+	
+	boost::hash_combine(seed, _rawUvs.size());
+	if(_rawUvs.size()){
+		const float *data = (const float*)&_rawUvs[0];
+		boost::hash_range(seed, data, data + _rawUvs.size() * 2);
+	}
+	
+	for(int i = 0; i < _rawFaces.size(); ++i){
+		boost::hash_combine(seed, _rawFaces[i].size());
+		boost::hash_range(seed, _rawFaces[i].begin(), _rawFaces[i].end());
+	}
+	
+	if(_overrideVerticesNormals && _verticesNormals.size()){
+		const float *data = (const float*)&_verticesNormals[0];
+		boost::hash_range(seed, data, data + _verticesNormals.size() * 3);
+	}
+	
+	return seed;
+}
+
+bool Geo::isEqual(Value *other){
+	Geo *otherGeo = dynamic_cast<Geo*>(other);
+	if(otherGeo == 0){
+		return false;
+	}
+	
+	if(_points != otherGeo->_points && *_points != *otherGeo->_points){
+		return false;
+	}
+	
+	if(_rawUvs != otherGeo->_rawUvs || _rawFaces != otherGeo->_rawFaces || _overrideVerticesNormals != otherGeo->_overrideVerticesNormals){
+		return false;
+	}
+	
+	return !_overrideVerticesNormals || _verticesNormals == otherGeo->_verticesNormals;
+}
+
+unsigned int Geo::sizeInBytes(){
+	unsigned int size = sizeof(Geo) + 
+		(_points->size() + _faceNormals->size() + _verticesNormals.size()) * sizeof(Imath::V3f) + 
+		_rawUvs.size() * sizeof(Imath::V2f);
+	
+	for(int i = 0; i < _rawFaces.size(); ++i){
+		size += _rawFaces[i].size() * sizeof(int);
+	}
+	
+	return size;
+}
+
 void Geo::setVerticesNormals(const std::vector<Imath::V3f> &normals){
 	_verticesNormals = normals;
 	_overrideVerticesNormals = true;
+	changed();
 }
 
 const std::vector<Imath::V3f> &Geo::points(){
-	return _points;
+	return *_points;
 }
 
 int Geo::pointsCount() const{
-	return (int)_points.size();
+	return (int)_points->size();
 }
 
 const std::vector<Imath::V2f> &Geo::rawUvs(){
@@ -84,7 +168,7 @@ const std::vector<int> &Geo::rawIndices(){
 		cacheAlignmentData();
 	}
 
-	return _rawIndices;
+	return *_rawIndices;
 }
 
 const std::vector<int> &Geo::rawIndexCounts(){
@@ -96,7 +180,7 @@ const std::vector<int> &Geo::rawIndexCounts(){
 		cacheAlignmentData();
 	}
 	
-	return _rawIndexCounts;
+	return *_rawIndexCounts;
 }
 
 int Geo::facesCount() const{
@@ -109,20 +193,36 @@ bool Geo::hasSameTopology(const std::vector<std::vector<int> > &faces) const{
 
 // assign new vertices coordinates IF arrays match
 void Geo::setPoints(const std::vector<Imath::V3f> &points){
-	if(_points.size() == points.size()){
+	setPoints(points.size() ? &points[0] : 0, points.size());
+}
 
-		_points = points;
+void Geo::setPoints(const Imath::V3f *points, unsigned int pointsCount){
+	if(_points->size() == pointsCount){
+		if(_points.unique()){
+			if(pointsCount && points != &(*_points)[0]){
+				memcpy(&(*_points)[0], points, pointsCount * sizeof(Imath::V3f));
+			}
+		}
+		else{
+			_points.reset(new std::vector<Imath::V3f>(points, points + pointsCount));
+			clearTopologyStructures();
+		}
 
 		_faceNormalsDirty = true;
 		_verticesNormalsDirty = true;
 		_overrideVerticesNormals = false;
+		changed();
 	}
 }
 
 // Will displace the points of this geo without modifying the size of the array.
 void Geo::displacePoints(const std::vector<Imath::V3f> &displacedPoints){
-	int displacedPointsSize = displacedPoints.size();
-	int pointsSize = _points.size();
+	displacePoints(displacedPoints.empty() ? 0 : &displacedPoints[0], displacedPoints.size());
+}
+
+void Geo::displacePoints(const Imath::V3f *displacedPoints, unsigned int displacedPointsCount){
+	int displacedPointsSize = displacedPointsCount;
+	int pointsSize = _points->size();
 	int minSize;
 	
 	if(displacedPointsSize >= pointsSize){
@@ -132,45 +232,61 @@ void Geo::displacePoints(const std::vector<Imath::V3f> &displacedPoints){
 		minSize = displacedPointsSize;
 	}
 	
-	for(int i = 0; i < minSize; ++i){
-		_points[i] = displacedPoints[i];
+	if(_points.unique()){
+		for(int i = 0; i < minSize; ++i){
+			(*_points)[i] = displacedPoints[i];
+		}
+	}
+	else{
+		// the points are shared with another Geo, build them anew rather than copying the shared ones first
+		boost::shared_ptr<std::vector<Imath::V3f> > points(new std::vector<Imath::V3f>(displacedPoints, displacedPoints + minSize));
+		points->insert(points->end(), _points->begin() + minSize, _points->end());
+		
+		_points = points;
+		clearTopologyStructures();
 	}
 
 	_faceNormalsDirty = true;
 	_verticesNormalsDirty = true;
 	_overrideVerticesNormals = false;
+	changed();
 }
 
 void Geo::clear(){
-	_points.clear();
+	_points.reset(new std::vector<Imath::V3f>());
 	_rawFaces.clear();
 	_rawUvs.clear();
-	_rawIndices.clear();
-	_rawIndexCounts.clear();
+	_rawIndices.reset(new std::vector<int>());
+	_rawIndexCounts.reset(new std::vector<int>());
 	_faces.clear();
 	_vertices.clear();
 	
 	_vertexIdOffset.clear();
-	_faceNormals.clear();
+	_faceNormals.reset(new std::vector<Imath::V3f>());
 	_vertexFaces.clear();
 
 	_faceNormalsDirty = true;
 	_verticesNormalsDirty = true;
 	_topologyStructuresDirty = true;
 	_alignmentDataDirty = true;
+	changed();
 }
 
 void Geo::build(const std::vector<Imath::V3f> &points, const std::vector<std::vector<int> > &faces){
+	build(points.size() ? &points[0] : 0, points.size(), faces);
+}
+
+void Geo::build(const Imath::V3f *points, unsigned int pointsCount, const std::vector<std::vector<int> > &faces){
 	clear();
 	
-	_points = points;
+	_points.reset(new std::vector<Imath::V3f>(points, points + pointsCount));
 	_rawFaces = faces;
 }
 
 void Geo::build(const std::vector<Imath::V3f> &points, const std::vector<std::vector<int> > &faces, const std::vector<Imath::V2f> &uvs){
 	clear();
 
-	_points = points;
+	_points.reset(new std::vector<Imath::V3f>(points));
 	_rawFaces = faces;
 	_rawUvs = uvs;
 }
@@ -194,9 +310,9 @@ void Geo::computeVertexPerFaceNormals(std::vector<Imath::V3f> &vertexPerFaceNorm
 				// for each triplet of points in this polygon, cross the 2 adjacent points of each point
 				// es: {last,0,1}, {0,1,2}, {1,2,3}, {2,3,last}, {3,last,0}
     
-				const Imath::V3f& v0 = _points[face[i == 0 ? faceVerticesCount-1 : i-1]];
-				const Imath::V3f& v1 = _points[face[i]];
-				const Imath::V3f& v2 = _points[face[i == faceVerticesCount-1 ? 0 : i+1]];
+				const Imath::V3f& v0 = (*_points)[face[i == 0 ? faceVerticesCount-1 : i-1]];
+				const Imath::V3f& v1 = (*_points)[face[i]];
+				const Imath::V3f& v2 = (*_points)[face[i == faceVerticesCount-1 ? 0 : i+1]];
     
 				vertexPerFaceNormals[counter].setValue((v1-v0).cross(v2-v0).normalized());
 				++counter;
@@ -213,8 +329,13 @@ void Geo::cacheFaceNormals(){
 	std::vector<Imath::V3f> vertexPerFaceNormals;
 	computeVertexPerFaceNormals(vertexPerFaceNormals);
 	
+	if(!_faceNormals.unique()){
+		_faceNormals.reset(new std::vector<Imath::V3f>());
+	}
+	
 	int facesCount = (int)_rawFaces.size();
-	_faceNormals.resize(facesCount);
+	std::vector<Imath::V3f> &faceNormals = *_faceNormals;
+	faceNormals.resize(facesCount);
 
 	int counter = 0;
 	for(int f = 0; f < facesCount; ++f){
@@ -230,7 +351,7 @@ void Geo::cacheFaceNormals(){
 		faceNormal /= face.size();
 		faceNormal.normalize();
 
-		_faceNormals[f].setValue(faceNormal);
+		faceNormals[f].setValue(faceNormal);
 	}
 
 	_faceNormalsDirty = false;
@@ -245,7 +366,7 @@ const std::vector<Imath::V3f> &Geo::faceNormals(){
 		cacheFaceNormals();
 	}
 	
-	return _faceNormals;
+	return *_faceNormals;
 }
 
 const std::vector<Imath::V3f> &Geo::verticesNormals(){
@@ -262,7 +383,7 @@ const std::vector<Imath::V3f> &Geo::verticesNormals(){
 				cacheFaceNormals();
 			}
 			
-			int verticesCount = (int)_points.size();
+			int verticesCount = (int)_points->size();
 			_verticesNormals.resize(verticesCount);
 
 			for(int vertexID = 0; vertexID < verticesCount; ++vertexID){
@@ -272,7 +393,7 @@ const std::vector<Imath::V3f> &Geo::verticesNormals(){
 				for(unsigned int index = 0; index < faces.size(); ++index){
 					int faceID = faces[index];
 
-					vertexNormal += _faceNormals[faceID];
+					vertexNormal += (*_faceNormals)[faceID];
 				}
 
 				vertexNormal.normalize();
@@ -287,11 +408,19 @@ const std::vector<Imath::V3f> &Geo::verticesNormals(){
 }
 
 void Geo::cacheAlignmentData(){
+	if(!_rawIndices.unique()){
+		_rawIndices.reset(new std::vector<int>());
+	}
+	
+	if(!_rawIndexCounts.unique()){
+		_rawIndexCounts.reset(new std::vector<int>());
+	}
+	
 	int faceCount = _rawFaces.size();
 	_vertexIdOffset.resize(faceCount);
-	_rawIndexCounts.reserve(faceCount);
+	_rawIndexCounts->reserve(faceCount);
 
-	int vertexCount = _points.size();
+	int vertexCount = _points->size();
 	_vertexFaces.resize(vertexCount);
 	
 	int vertexIdOffset = 0;
@@ -304,7 +433,7 @@ void Geo::cacheAlignmentData(){
 	}
 
 	// reserve a size for the array and feed it of index
-	_rawIndices.reserve(idxCount);
+	_rawIndices->reserve(idxCount);
 	
 	for(int i = 0; i < faceCount; ++i){
 		std::vector<int> &rawVerticesPerFace = _rawFaces[i];
@@ -313,13 +442,13 @@ void Geo::cacheAlignmentData(){
 		
 		_vertexIdOffset[i] = vertexIdOffset;
 
-		_rawIndexCounts.push_back(verticesPerFaceCount);	// {4,4,4,4,3,4,4,4,4,5, etc...}
+		_rawIndexCounts->push_back(verticesPerFaceCount);	// {4,4,4,4,3,4,4,4,4,5, etc...}
 		_vertexIdOffset[i] = vertexIdOffset;
 		
 		for(int j = 0; j < verticesPerFaceCount; ++j){
 			int vertexId = rawVerticesPerFace[j];
 			
-			_rawIndices.push_back(vertexId);	// {0,1,2,3, 1,4,5,2 4,6,7,5, etc...}.
+			_rawIndices->push_back(vertexId);	// {0,1,2,3, 1,4,5,2 4,6,7,5, etc...}.
 			_vertexFaces[vertexId].push_back(i);
 			
 			vertexIdOffset += verticesPerFaceCount;
@@ -329,12 +458,64 @@ void Geo::cacheAlignmentData(){
 	_alignmentDataDirty = false;
 }
 
+boost::shared_ptr<const std::vector<Imath::V3f> > Geo::sharedPoints(){
+	return _points;
+}
+
+boost::shared_ptr<const std::vector<Imath::V3f> > Geo::sharedFaceNormals(){
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex::scoped_lock lock(_localMutex);
+	#endif
+	
+	if(_faceNormalsDirty){
+		cacheFaceNormals();
+	}
+	
+	return _faceNormals;
+}
+
+boost::shared_ptr<const std::vector<int> > Geo::sharedRawIndices(){
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex::scoped_lock lock(_localMutex);
+	#endif
+	
+	if(_alignmentDataDirty){
+		cacheAlignmentData();
+	}
+	
+	return _rawIndices;
+}
+
+boost::shared_ptr<const std::vector<int> > Geo::sharedRawIndexCounts(){
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex::scoped_lock lock(_localMutex);
+	#endif
+	
+	if(_alignmentDataDirty){
+		cacheAlignmentData();
+	}
+	
+	return _rawIndexCounts;
+}
+
+// Face, Edge and Vertex point inside _points, they must be rebuilt once the points are moved to a new buffer.
+void Geo::clearTopologyStructures(){
+	_faces.clear();
+	_facesPtr.clear();
+	_vertices.clear();
+	_verticesPtr.clear();
+	_edges.clear();
+	_edgesMap.clear();
+	
+	_topologyStructuresDirty = true;
+}
+
 void Geo::cacheTopologyStructures(){
 	int faceCount = _rawFaces.size();
 	_faces.resize(faceCount);
 	_facesPtr.resize(faceCount);
 
-	int vertexCount = _points.size();
+	int vertexCount = _points->size();
 	_vertices.resize(vertexCount);
 	_verticesPtr.resize(vertexCount);
 	
@@ -359,7 +540,7 @@ void Geo::cacheTopologyStructures(){
 		for(int j = 0; j < verticesPerFaceCount; ++j){
 			int vertexId = rawVerticesPerFace[j];
 			
-			Imath::V3f &point = _points[vertexId];
+			Imath::V3f &point = (*_points)[vertexId];
 			
 			face._points[j] = &point;
 			
@@ -394,8 +575,8 @@ void Geo::cacheTopologyStructures(){
 			Vertex &vertex1 = _vertices[edgeVertexId1];
 			Vertex &vertex2 = _vertices[edgeVertexId2];
 		
-			Imath::V3f &point1 = _points[edgeVertexId1];
-			Imath::V3f &point2 = _points[edgeVertexId2];
+			Imath::V3f &point1 = (*_points)[edgeVertexId1];
+			Imath::V3f &point2 = (*_points)[edgeVertexId2];
 			
 			if(!edge._geo){
 				_edges.push_back(&edge);
@@ -35,6 +35,7 @@
 
 #include <map>
 #include <vector>
+#include <boost/shared_ptr.hpp>
 #include <ImathVec.h>
 
 #include "Value.h"
@@ -171,13 +172,24 @@ private:
 };
 
 //! A class to handle Geometry, used by GeoAttribute. 
+//! The points are shared by copy() and only copied when one of the Geos sharing them displaces them.
+//! The points, face normals and raw indices can also be shared with Python, see sharedPoints().
 class CORAL_EXPORT Geo: public Value{ 
 public:
 	Geo();
 	
 	void copy(const Geo *other);
+	void copy(const Value *other);
+	Value *duplicate();
+	bool isHashable();
+	std::size_t hash();
+	bool isEqual(Value *other);
+	unsigned int sizeInBytes();
 	void build(const std::vector<Imath::V3f> &points, const std::vector<std::vector<int> > &faces);
 	void build(const std::vector<Imath::V3f> &points, const std::vector<std::vector<int> > &faces, const std::vector<Imath::V2f> &uvs);
+	
+	//! Same as build(), but reads the points from an array of pointsCount points.
+	void build(const Imath::V3f *points, unsigned int pointsCount, const std::vector<std::vector<int> > &faces);
 	const std::vector<Imath::V3f> &points();
 	int pointsCount() const;
 	const std::vector<Imath::V2f> &rawUvs();
@@ -199,18 +211,32 @@ public:
 	const std::vector<Imath::V3f> &verticesNormals();
 	void setVerticesNormals(const std::vector<Imath::V3f> &normals);
 	void setPoints(const std::vector<Imath::V3f> &points);
+	
+	//! Same as setPoints(), but reads the points from an array of pointsCount points.
+	void setPoints(const Imath::V3f *points, unsigned int pointsCount);
 	void displacePoints(const std::vector<Imath::V3f> &displacedPoints);
+	
+	//! Same as displacePoints(), but reads the points from an array of displacedPointsCount points.
+	void displacePoints(const Imath::V3f *displacedPoints, unsigned int displacedPointsCount);
 	bool hasSameTopology(const std::vector<std::vector<int> > &faces) const;
 	void clear();
 	const std::vector<Vertex*> &vertices();
 	const std::vector<Edge*> &edges();
 	const std::vector<Face*> &faces();
+	
+	//! Shares the storage of points() rather than copying it.
+	//! A Geo never writes a storage while it's shared, so the values stay valid and unchanged for as long as it's held.
+	boost::shared_ptr<const std::vector<Imath::V3f> > sharedPoints();
+	boost::shared_ptr<const std::vector<Imath::V3f> > sharedFaceNormals();
+	boost::shared_ptr<const std::vector<int> > sharedRawIndices();
+	boost::shared_ptr<const std::vector<int> > sharedRawIndexCounts();
 
 private:
 	void computeVertexPerFaceNormals(std::vector<Imath::V3f> &vertexPerFaceNormals);
 	void cacheTopologyStructures();
 	void cacheFaceNormals();
 	void cacheAlignmentData();
+	void clearTopologyStructures();
 
 	bool _topologyStructuresDirty;
 	bool _faceNormalsDirty;
@@ -226,14 +252,14 @@ private:
 	std::vector<Edge*> _edges;
 	std::map<std::pair<int, int>, Edge> _edgesMap;
 	
-	std::vector<Imath::V3f> _points;
-	std::vector<Imath::V3f> _faceNormals;
+	boost::shared_ptr<std::vector<Imath::V3f> > _points; // copy on write, Face, Edge and Vertex point inside it
+	boost::shared_ptr<std::vector<Imath::V3f> > _faceNormals; // replaced rather than written while shared
 	std::vector<Imath::V3f> _verticesNormals;
 	std::vector<Imath::V2f> _rawUvs;
 	
 	// alignement data
-	std::vector<int> _rawIndices;
-	std::vector<int> _rawIndexCounts;
+	boost::shared_ptr<std::vector<int> > _rawIndices; // replaced rather than written while shared
+	boost::shared_ptr<std::vector<int> > _rawIndexCounts;
 	std::vector<int> _vertexIdOffset;
 	std::vector<std::vector<int> > _vertexFaces;
 	
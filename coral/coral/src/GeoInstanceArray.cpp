@@ -6,8 +6,8 @@ GeoInstanceArray::GeoInstanceArray(): Value(){
 
 }
 
-void GeoInstanceArray::setData(const std::vector<Geo*> &sourceGeos, const std::vector<Imath::M44f> &locations, const std::vector<int> &selector){
-	_locations = locations;
+void GeoInstanceArray::setData(const std::vector<Geo*> &sourceGeos, NumericSpan<const Imath::M44f> locations, NumericSpan<const int> selector){
+	_locations.assign(locations.data(), locations.data() + locations.size());
 	_sourceGeos = sourceGeos;
 
 	// resize and validate selector according to sourceGeos and locations
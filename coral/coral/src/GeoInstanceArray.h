@@ -5,6 +5,7 @@
 #include <ImathMatrix.h>
 #include "Value.h"
 #include "Geo.h"
+#include "Numeric.h"
 
 namespace coral{
 
@@ -12,7 +13,7 @@ class CORAL_EXPORT GeoInstanceArray: public Value{
 public:
 	GeoInstanceArray();
 
-	void setData(const std::vector<Geo*> &sourceGeos, const std::vector<Imath::M44f> &locations, const std::vector<int> &selector);
+	void setData(const std::vector<Geo*> &sourceGeos, NumericSpan<const Imath::M44f> locations, NumericSpan<const int> selector);
 	const std::vector<Geo*> &sourceGeos();
 	const std::vector<Imath::M44f> &locations();
 	const std::vector<int> &selector();
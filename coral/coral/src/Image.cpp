@@ -37,16 +37,12 @@ Image::Image():
 	_xres(0),
 	_yres(0),
 	_channelCount(0),
-	_pixels(0){
+	_pixels(new std::vector<float>()){
 
 	/*_col4Values.resize(1);
 	_col4Values[0] = Imath::Color4f(0.0, 0.0, 0.0, 1.0);*/
 }
 
-Image::~Image(){
-	delete _pixels;
-}
-
 void Image::load(const char *filePath){
 	ImageInput *imgIn = ImageInput::create(filePath);
 
@@ -61,14 +57,20 @@ void Image::load(const char *filePath){
 	_yres = imgSpec.height;
 	_channelCount = imgSpec.nchannels;
 
-	_pixels = new float [_xres*_yres*_channelCount];
-	imgIn->read_image(TypeDesc::FLOAT, _pixels);
+	_pixels.reset(new std::vector<float>(_xres*_yres*_channelCount));
+	if(_pixels->size()){
+		imgIn->read_image(TypeDesc::FLOAT, &(*_pixels)[0]);
+	}
 	imgIn->close();
 
 	delete imgIn;
 }
 
 const float* Image::pixels(){
+	return _pixels->size() ? &(*_pixels)[0] : 0;
+}
+
+boost::shared_ptr<const std::vector<float> > Image::sharedPixels(){
 	return _pixels;
 }
 
@@ -33,6 +33,7 @@
 
 #include <cstdio>
 #include <vector>
+#include <boost/shared_ptr.hpp>
 
 #include <ImathColor.h>
 
@@ -44,16 +45,18 @@ namespace coral{
 class CORAL_EXPORT Image : public Value{
 public:
 	Image();
-	~Image();
 	void load(const char *filePath);
 	const float* pixels();
 	int width();
 	int height();
 	int channelCount();
+	
+	//! Shares the storage of pixels() rather than copying it, loading another image doesn't modify a shared storage.
+	boost::shared_ptr<const std::vector<float> > sharedPixels();
 
 private:
 	int _xres, _yres, _channelCount;
-	float *_pixels;
+	boost::shared_ptr<std::vector<float> > _pixels;
 };
 
 }
@@ -60,12 +60,47 @@ void(*NestedObject::_setNameCallback)(NestedObject *self, const std::string &nam
 
 NestedObject::NestedObject(const std::string &name, NestedObject *parent): 
 	Object(),
-	_parentObject(parent){
+	_parentObject(parent),
+	_fullNameIndexed(false){
 	
 	_name = generateUniqueName(name);
 }
 
 NestedObject::~NestedObject(){
+	if(_fullNameIndexed){
+		NetworkManager::unindexFullName(_indexedFullName, this);
+	}
+}
+
+void NestedObject::setFullNameIndexed(bool value){
+	if(_fullNameIndexed){
+		NetworkManager::unindexFullName(_indexedFullName, this);
+		_indexedFullName = "";
+	}
+	
+	_fullNameIndexed = value;
+	
+	if(_fullNameIndexed){
+		_indexedFullName = fullName();
+		NetworkManager::indexFullName(_indexedFullName, this);
+	}
+	
+	for(int i = 0; i < _objects.size(); ++i){
+		_objects[i]->setFullNameIndexed(value);
+	}
+}
+
+void NestedObject::updateFullNameIndex(){
+	if(_fullNameIndexed){
+		NetworkManager::unindexFullName(_indexedFullName, this);
+		
+		_indexedFullName = fullName();
+		NetworkManager::indexFullName(_indexedFullName, this);
+	}
+	
+	for(int i = 0; i < _objects.size(); ++i){
+		_objects[i]->updateFullNameIndex();
+	}
 }
 
 void NestedObject::setClassName(const std::string &className){
@@ -87,6 +122,8 @@ void NestedObject::setName(const std::string &name){
 	std::string uniqueName = generateUniqueName(name);
 	_name = uniqueName;
 	
+	updateFullNameIndex();
+	
 	if(_setNameCallback && !isDeleted()){
 		_setNameCallback(this, _name);
 	}
@@ -129,6 +166,8 @@ std::string NestedObject::fullName(){
 
 void NestedObject::setParentObject(NestedObject *object){
 	_parentObject = object;
+	
+	updateFullNameIndex();
 }
 
 Object *NestedObject::parentObject(){
@@ -138,6 +177,7 @@ Object *NestedObject::parentObject(){
 void NestedObject::addObject(NestedObject *object){
 	if(containerUtils::elementInContainer(object, _objects) == false){
 		_objects.push_back(object);
+		object->setFullNameIndexed(true);
 		
 		object->addReference();
 	}
@@ -146,23 +186,14 @@ void NestedObject::addObject(NestedObject *object){
 void NestedObject::removeObject(NestedObject *object){
 	if(containerUtils::elementInContainer(object, _objects)){
 		containerUtils::eraseElementInContainer(object, _objects);
+		object->setFullNameIndexed(false);
 
 		object->removeReference();
 	}
 }
 
 NestedObject *NestedObject::findObject(const std::string &name){
-	NestedObject *foundObject = 0;
-	
-	for(std::vector<NestedObject*>::iterator it = _objects.begin(); it != _objects.end(); ++it){
-		NestedObject *object = *it;
-		if(object->_name == name){
-			foundObject = object;
-			break;
-		}
-	}
-	
-	return foundObject;
+	return NetworkManager::findObjectByFullName(fullName() + "." + name, this);
 }
 
 std::vector<NestedObject*> NestedObject::objects(){
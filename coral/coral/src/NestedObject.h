@@ -73,6 +73,11 @@ private:
 	NestedObject *_parentObject;
 	std::vector<NestedObject*> _objects;
 	bool _isConstructing;
+	bool _fullNameIndexed;
+	std::string _indexedFullName;
+	
+	void setFullNameIndexed(bool value);
+	void updateFullNameIndex();
 
 	NestedObject();
 	NestedObject(const NestedObject &other);
@@ -0,0 +1,631 @@
+// <license>
+// Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+// This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+// 
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are
+// met:
+// 
+//    * Redistributions of source code must retain the above copyright
+//      notice, this list of conditions and the following disclaimer.
+// 
+//    * Redistributions in binary form must reproduce the above copyright
+//      notice, this list of conditions and the following disclaimer in the
+//      documentation and/or other materials provided with the distribution.
+// 
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+// IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+// PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+// LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+// NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+// SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// </license>
+
+
+#include "NetworkFile.h"
+#include "Node.h"
+#include "Attribute.h"
+#include "Value.h"
+#include "NetworkManager.h"
+#include "stringUtils.h"
+
+#include <algorithm>
+
+using namespace coral;
+
+Node *(*NetworkFile::_createNodeCallback)(const std::string &className, const std::string &name, Node *parent) = 0;
+Attribute *(*NetworkFile::_createAttributeCallback)(const std::string &className, const std::string &name, Node *parent, bool input, bool output) = 0;
+
+namespace {
+	const std::string magic = "CRLB";
+	// version 3 reads the records straight from the nodes rather than from their save script
+	const unsigned int fileVersion = 3;
+	
+	// stands for the node the file was saved from in the args of the stored commands
+	const std::string topNodeToken = "\x01";
+	
+	// the fields each record can't do without
+	int networkFile_requiredFields(unsigned int type){
+		if(type == NetworkFile::nodeRecord || type == NetworkFile::attributeRecord){
+			return 4;
+		}
+		else if(type == NetworkFile::allowedSpecializationRecord){
+			return 1;
+		}
+		else if(type < NetworkFile::commandRecord){
+			return 2;
+		}
+		
+		return -1;
+	}
+	
+	void networkFile_writeCommand(std::string &data, Command &command){
+		stringUtils::appendSizedString(data, command.name());
+		
+		std::vector<std::string> argNames = command.argNames();
+		stringUtils::appendUInt32(data, argNames.size());
+		for(int i = 0; i < argNames.size(); ++i){
+			const std::string &argName = argNames[i];
+			Command::CommandValueType type = command.argType(argName);
+			
+			stringUtils::appendSizedString(data, argName);
+			stringUtils::appendUInt32(data, (unsigned int)type);
+			
+			if(type == Command::boolType){
+				stringUtils::appendUInt32(data, (unsigned int)command.argAsBool(argName));
+			}
+			else if(type == Command::intType){
+				stringUtils::appendUInt32(data, (unsigned int)command.argAsInt(argName));
+			}
+			else if(type == Command::floatType){
+				stringUtils::appendFloat64(data, command.argAsFloat(argName));
+			}
+			else{
+				stringUtils::appendSizedString(data, command.argAsString(argName));
+			}
+		}
+	}
+	
+	bool networkFile_readCommand(const std::string &data, unsigned int &position, Command &command){
+		std::string name;
+		unsigned int argsCount = 0;
+		if(!stringUtils::readSizedString(data, position, name) || !stringUtils::readUInt32(data, position, argsCount)){
+			return false;
+		}
+		
+		command.setName(name);
+		
+		for(int i = 0; i < argsCount; ++i){
+			std::string argName;
+			unsigned int type = 0;
+			if(!stringUtils::readSizedString(data, position, argName) || !stringUtils::readUInt32(data, position, type)){
+				return false;
+			}
+			
+			if(type == Command::boolType || type == Command::intType){
+				unsigned int value = 0;
+				if(!stringUtils::readUInt32(data, position, value)){
+					return false;
+				}
+				
+				if(type == Command::boolType){
+					command.setArgBool(argName, value != 0);
+				}
+				else{
+					command.setArgInt(argName, (int)value);
+				}
+			}
+			else if(type == Command::floatType){
+				double value = 0.0;
+				if(!stringUtils::readFloat64(data, position, value)){
+					return false;
+				}
+				
+				command.setArgFloat(argName, value);
+			}
+			else{
+				std::string value;
+				if(!stringUtils::readSizedString(data, position, value)){
+					return false;
+				}
+				
+				if(type == Command::stringType){
+					command.setArgString(argName, value);
+				}
+				else{
+					command.setArgUndefined(argName, value);
+				}
+			}
+		}
+		
+		return true;
+	}
+}
+
+NetworkFile::NetworkFile(){
+}
+
+unsigned int NetworkFile::version(){
+	return fileVersion;
+}
+
+bool NetworkFile::isNetworkFileData(const std::string &data){
+	return data.compare(0, magic.size(), magic) == 0;
+}
+
+std::string NetworkFile::relativeName(const std::string &fullName){
+	std::string prefix = _savedTopNodeName + ".";
+	if(fullName.compare(0, prefix.size(), prefix) == 0){
+		return fullName.substr(prefix.size());
+	}
+	
+	return "";
+}
+
+std::string NetworkFile::resolvedName(Node *topNode, const std::string &name){
+	if(name.compare(0, topNodeToken.size(), topNodeToken) == 0){
+		return topNode->fullName() + name.substr(topNodeToken.size());
+	}
+	
+	return name;
+}
+
+Node *NetworkFile::findNode(Node *topNode, const std::string &path){
+	std::vector<std::string> names;
+	if(!path.empty()){
+		stringUtils::split(path, names, ".");
+	}
+	
+	// nodes created from this file are found under the name they were saved with, even if they had to be renamed
+	Node *node = topNode;
+	std::string currentPath;
+	for(int i = 0; i < names.size() && node; ++i){
+		if(i){
+			currentPath += ".";
+		}
+		currentPath += names[i];
+		
+		std::map<std::string, Node*>::iterator createdNode = _createdNodes.find(currentPath);
+		if(createdNode != _createdNodes.end()){
+			node = createdNode->second;
+		}
+		else{
+			node = node->findNode(names[i]);
+		}
+	}
+	
+	return node;
+}
+
+Attribute *NetworkFile::findAttribute(Node *topNode, const std::string &path){
+	std::size_t separator = path.rfind(".");
+	if(separator == std::string::npos){
+		return topNode->findAttribute(path);
+	}
+	
+	Node *node = findNode(topNode, path.substr(0, separator));
+	if(node){
+		return node->findAttribute(path.substr(separator + 1));
+	}
+	
+	return 0;
+}
+
+NetworkFileRecord &NetworkFile::addRecord(RecordType type){
+	NetworkFileRecord record;
+	record.type = type;
+	_records.push_back(record);
+	
+	return _records.back();
+}
+
+void NetworkFile::addNode(Node *node){
+	std::string path = relativeName(node->fullName());
+	
+	std::string parentPath;
+	if(node->parent()->fullName() != _savedTopNodeName){
+		parentPath = relativeName(node->parent()->fullName());
+	}
+	
+	NetworkFileRecord &nodeRecord = addRecord(NetworkFile::nodeRecord);
+	nodeRecord.fields.push_back(parentPath);
+	nodeRecord.fields.push_back(node->className());
+	nodeRecord.fields.push_back(node->name());
+	nodeRecord.fields.push_back(node->enabledSpecializationPreset());
+	
+	if(node->allowDynamicAttributes()){
+		const std::vector<Attribute*> &dynamicAttributes = node->dynamicAttributes();
+		for(int i = 0; i < dynamicAttributes.size(); ++i){
+			Attribute *attribute = dynamicAttributes[i];
+			
+			NetworkFileRecord &attributeRecord = addRecord(NetworkFile::attributeRecord);
+			attributeRecord.fields.push_back(path);
+			attributeRecord.fields.push_back(attribute->className());
+			attributeRecord.fields.push_back(attribute->name());
+			attributeRecord.fields.push_back(attribute->isInput() ? "input" : attribute->isOutput() ? "output" : "");
+			
+			std::string specializationOverride = attribute->specializationOverride();
+			if(!specializationOverride.empty()){
+				NetworkFileRecord &overrideRecord = addRecord(NetworkFile::specializationOverrideRecord);
+				overrideRecord.fields.push_back(relativeName(attribute->fullName()));
+				overrideRecord.fields.push_back(specializationOverride);
+			}
+		}
+		
+		for(int i = 0; i < dynamicAttributes.size(); ++i){
+			Attribute *attribute = dynamicAttributes[i];
+			std::string attributePath = relativeName(attribute->fullName());
+			
+			std::vector<Attribute*> affect = attribute->affecting();
+			std::vector<Attribute*> affectedBy = attribute->affectedBy();
+			std::vector<std::string> allowedSpecialization = attribute->allowedSpecialization();
+			std::vector<Attribute*> specializationLinkedTo = attribute->specializationLinkedTo();
+			std::vector<Attribute*> specializationLinkedBy = attribute->specializationLinkedBy();
+			
+			if(affect.empty() && affectedBy.empty() && allowedSpecialization.empty() && specializationLinkedTo.empty() && specializationLinkedBy.empty()){
+				continue;
+			}
+			
+			for(int j = 0; j < affect.size(); ++j){
+				NetworkFileRecord &affectRecord = addRecord(attributeAffectRecord);
+				affectRecord.fields.push_back(attributePath);
+				affectRecord.fields.push_back(relativeName(affect[j]->fullName()));
+			}
+			
+			for(int j = 0; j < affectedBy.size(); ++j){
+				NetworkFileRecord &affectRecord = addRecord(attributeAffectRecord);
+				affectRecord.fields.push_back(relativeName(affectedBy[j]->fullName()));
+				affectRecord.fields.push_back(attributePath);
+			}
+			
+			for(int j = 0; j < specializationLinkedTo.size(); ++j){
+				NetworkFileRecord &linkRecord = addRecord(specializationLinkRecord);
+				linkRecord.fields.push_back(attributePath);
+				linkRecord.fields.push_back(relativeName(specializationLinkedTo[j]->fullName()));
+			}
+			
+			for(int j = 0; j < specializationLinkedBy.size(); ++j){
+				NetworkFileRecord &linkRecord = addRecord(specializationLinkRecord);
+				linkRecord.fields.push_back(relativeName(specializationLinkedBy[j]->fullName()));
+				linkRecord.fields.push_back(attributePath);
+			}
+			
+			NetworkFileRecord &allowedRecord = addRecord(allowedSpecializationRecord);
+			allowedRecord.fields.push_back(attributePath);
+			allowedRecord.fields.insert(allowedRecord.fields.end(), allowedSpecialization.begin(), allowedSpecialization.end());
+		}
+	}
+	
+	// the same values Attribute::asScript() saves
+	std::vector<Attribute*> attributes = node->attributes();
+	for(int i = 0; i < attributes.size(); ++i){
+		Attribute *attribute = attributes[i];
+		if(attribute->_value && attribute->connectedInputNonPassThrough(attribute) == 0 && attribute->_affectedBy.empty()){
+			std::string payload = attribute->_value->asBinary();
+			RecordType type = valueRecord;
+			if(payload.empty()){
+				payload = attribute->_value->asString();
+				type = stringValueRecord;
+			}
+			
+			if(!payload.empty()){
+				NetworkFileRecord &valueRecord = addRecord(type);
+				valueRecord.fields.push_back(relativeName(attribute->fullName()));
+				valueRecord.fields.push_back(payload);
+			}
+		}
+	}
+}
+
+void NetworkFile::addConnections(Node *node){
+	std::vector<Attribute*> attributes = node->attributes();
+	for(int i = 0; i < attributes.size(); ++i){
+		Attribute *attribute = attributes[i];
+		
+		Attribute *input = attribute->input();
+		if(input){
+			NetworkFileRecord &connectionRecord = addRecord(NetworkFile::connectionRecord);
+			connectionRecord.fields.push_back(relativeName(input->fullName()));
+			connectionRecord.fields.push_back(relativeName(attribute->fullName()));
+		}
+		
+		// passthrough outputs are saved from here only on the top node, the inputs of the nodes under it are saved with them
+		const std::vector<Attribute*> &outputs = attribute->outputs();
+		for(int j = 0; j < outputs.size(); ++j){
+			if(outputs[j]->isPassThrough() && outputs[j]->parent()->fullName() == _savedTopNodeName){
+				NetworkFileRecord &connectionRecord = addRecord(NetworkFile::connectionRecord);
+				connectionRecord.fields.push_back(relativeName(attribute->fullName()));
+				connectionRecord.fields.push_back(relativeName(outputs[j]->fullName()));
+			}
+		}
+	}
+}
+
+void NetworkFile::addContent(Node *node){
+	// same order as Node::contentAsScript()
+	std::vector<Node*> nodes = node->nodes();
+	for(int i = 0; i < nodes.size(); ++i){
+		addNode(nodes[i]);
+		addContent(nodes[i]);
+	}
+	
+	for(int i = 0; i < nodes.size(); ++i){
+		addConnections(nodes[i]);
+	}
+}
+
+void NetworkFile::setFromNode(Node *topNode){
+	_records.clear();
+	_errors.clear();
+	_savedTopNodeName = topNode->fullName();
+	
+	addContent(topNode);
+}
+
+void NetworkFile::addCommandsFromScript(const std::string &script){
+	std::size_t position = 0;
+	while(position < script.size()){
+		position = script.find_first_not_of(" \t\r\n", position);
+		if(position == std::string::npos){
+			break;
+		}
+		
+		std::size_t lineEnd = script.find("\n", position);
+		if(lineEnd == std::string::npos){
+			lineEnd = script.size();
+		}
+		
+		Command command;
+		if(script[position] == '#'){
+			position = lineEnd;
+		}
+		else if(command.setFromScript(script, position)){
+			std::vector<std::string> argNames = command.argNames();
+			for(int i = 0; i < argNames.size(); ++i){
+				const std::string &argName = argNames[i];
+				if(command.argType(argName) == Command::stringType){
+					std::string value = command.argAsString(argName);
+					if(value == _savedTopNodeName){
+						command.setArgString(argName, topNodeToken);
+					}
+					else if(!relativeName(value).empty()){
+						command.setArgString(argName, topNodeToken + "." + relativeName(value));
+					}
+				}
+			}
+			
+			NetworkFileRecord &commandRecord = addRecord(NetworkFile::commandRecord);
+			commandRecord.command = command;
+		}
+		else{
+			_errors.push_back("only commands can be stored in a network file, left out: " + stringUtils::strip(script.substr(position, lineEnd - position)));
+			position = lineEnd;
+		}
+	}
+}
+
+std::string NetworkFile::data(){
+	std::string data = magic;
+	stringUtils::appendUInt32(data, fileVersion);
+	stringUtils::appendUInt32(data, _records.size());
+	
+	for(int i = 0; i < _records.size(); ++i){
+		NetworkFileRecord &record = _records[i];
+		stringUtils::appendUInt32(data, record.type);
+		
+		if(record.type == commandRecord){
+			networkFile_writeCommand(data, record.command);
+		}
+		else{
+			stringUtils::appendUInt32(data, record.fields.size());
+			for(int j = 0; j < record.fields.size(); ++j){
+				stringUtils::appendSizedString(data, record.fields[j]);
+			}
+		}
+	}
+	
+	return data;
+}
+
+bool NetworkFile::setFromData(const std::string &data){
+	_records.clear();
+	
+	if(!isNetworkFileData(data)){
+		return false;
+	}
+	
+	unsigned int position = magic.size();
+	unsigned int version = 0;
+	unsigned int recordsCount = 0;
+	if(!stringUtils::readUInt32(data, position, version) || version != fileVersion || !stringUtils::readUInt32(data, position, recordsCount)){
+		return false;
+	}
+	
+	for(int i = 0; i < recordsCount; ++i){
+		NetworkFileRecord record;
+		unsigned int type = 0;
+		if(!stringUtils::readUInt32(data, position, type)){
+			_records.clear();
+			return false;
+		}
+		
+		record.type = type;
+		
+		bool success = false;
+		if(type == commandRecord){
+			success = networkFile_readCommand(data, position, record.command);
+		}
+		else if(networkFile_requiredFields(type) != -1){
+			unsigned int fieldsCount = 0;
+			success = stringUtils::readUInt32(data, position, fieldsCount) && fieldsCount >= networkFile_requiredFields(type);
+			for(int j = 0; j < fieldsCount && success; ++j){
+				std::string field;
+				success = stringUtils::readSizedString(data, position, field);
+				record.fields.push_back(field);
+			}
+		}
+		
+		if(!success){
+			_records.clear();
+			return false;
+		}
+		
+		_records.push_back(record);
+	}
+	
+	return true;
+}
+
+int NetworkFile::recordsCount(){
+	return _records.size();
+}
+
+NetworkFile::RecordType NetworkFile::recordType(int record){
+	return NetworkFile::RecordType(_records[record].type);
+}
+
+Command NetworkFile::command(int record, Node *topNode){
+	Command command = _records[record].command;
+	
+	std::vector<std::string> argNames = command.argNames();
+	for(int i = 0; i < argNames.size(); ++i){
+		const std::string &argName = argNames[i];
+		if(command.argType(argName) == Command::stringType){
+			command.setArgString(argName, resolvedName(topNode, command.argAsString(argName)));
+		}
+	}
+	
+	return command;
+}
+
+void NetworkFile::applyRecord(NetworkFileRecord &record, Node *topNode){
+	std::vector<std::string> &fields = record.fields;
+	
+	if(record.type == nodeRecord){
+		Node *parent = findNode(topNode, fields[0]);
+		
+		Node *node = 0;
+		if(parent && _createNodeCallback){
+			node = _createNodeCallback(fields[1], fields[2], parent);
+		}
+		
+		std::string path = fields[0].empty() ? fields[2] : fields[0] + "." + fields[2];
+		if(node){
+			if(!fields[3].empty()){
+				node->enableSpecializationPreset(fields[3]);
+			}
+			
+			_createdNodes[path] = node;
+		}
+		else{
+			_errors.push_back("failed to create node " + path);
+		}
+	}
+	else if(record.type == attributeRecord){
+		Node *node = findNode(topNode, fields[0]);
+		
+		Attribute *attribute = 0;
+		if(node && _createAttributeCallback){
+			attribute = _createAttributeCallback(fields[1], fields[2], node, fields[3] == "input", fields[3] == "output");
+		}
+		
+		if(!attribute){
+			_errors.push_back("failed to create attribute " + fields[2] + " under " + fields[0]);
+		}
+	}
+	else if(record.type == allowedSpecializationRecord){
+		Attribute *attribute = findAttribute(topNode, fields[0]);
+		if(attribute){
+			std::vector<std::string> allowedSpecialization(fields.begin() + 1, fields.end());
+			attribute->parent()->setAttributeAllowedSpecializations(attribute, allowedSpecialization);
+			attribute->parent()->updateAttributeSpecialization(attribute);
+		}
+		else{
+			_errors.push_back("could not find attribute " + fields[0]);
+		}
+	}
+	else if(record.type == specializationOverrideRecord){
+		Attribute *attribute = findAttribute(topNode, fields[0]);
+		if(attribute){
+			if(fields[1] != "none"){
+				attribute->setSpecializationOverride(fields[1]);
+			}
+		}
+		else{
+			_errors.push_back("could not find attribute " + fields[0]);
+		}
+	}
+	else if(record.type == valueRecord || record.type == stringValueRecord){
+		Attribute *attribute = findAttribute(topNode, fields[0]);
+		if(attribute && attribute->outValue()){
+			if(record.type == valueRecord){
+				attribute->outValue()->setFromBinary(fields[1]);
+			}
+			else{
+				attribute->outValue()->setFromString(fields[1]);
+			}
+			
+			attribute->valueChanged();
+		}
+		else{
+			_errors.push_back("could not find attribute " + fields[0]);
+		}
+	}
+	else{
+		Attribute *source = findAttribute(topNode, fields[0]);
+		Attribute *destination = findAttribute(topNode, fields[1]);
+		
+		bool success = false;
+		if(source && destination){
+			if(record.type == attributeAffectRecord){
+				Node *node = source->parent();
+				if(node == destination->parent()){
+					node->setAttributeAffect(source, destination);
+					success = true;
+				}
+			}
+			else if(record.type == specializationLinkRecord){
+				std::vector<Attribute*> linkedTo = source->specializationLinkedTo();
+				if(std::find(linkedTo.begin(), linkedTo.end(), destination) == linkedTo.end()){
+					source->parent()->addAttributeSpecializationLink(source, destination);
+				}
+				success = true;
+			}
+			else{
+				if(destination->input()){
+					destination->disconnectInput();
+				}
+				
+				success = NetworkManager::connect(source, destination);
+			}
+		}
+		
+		if(!success){
+			_errors.push_back("error while linking " + fields[0] + " to " + fields[1]);
+		}
+	}
+}
+
+int NetworkFile::applyRecords(int record, Node *topNode){
+	if(record == 0){
+		_createdNodes.clear();
+		_errors.clear();
+	}
+	
+	int recordsCount = _records.size();
+	while(record < recordsCount && _records[record].type != commandRecord){
+		applyRecord(_records[record], topNode);
+		record++;
+	}
+	
+	return record;
+}
+
+std::vector<std::string> NetworkFile::errors(){
+	return _errors;
+}
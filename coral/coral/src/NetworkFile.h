@@ -0,0 +1,129 @@
+// <license>
+// Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+// This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+// 
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are
+// met:
+// 
+//    * Redistributions of source code must retain the above copyright
+//      notice, this list of conditions and the following disclaimer.
+// 
+//    * Redistributions in binary form must reproduce the above copyright
+//      notice, this list of conditions and the following disclaimer in the
+//      documentation and/or other materials provided with the distribution.
+// 
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+// IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+// PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+// LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+// NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+// SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// </license>
+
+
+#ifndef CORAL_NETWORKFILE_H
+#define CORAL_NETWORKFILE_H
+
+#include <string>
+#include <vector>
+#include <map>
+#include "Command.h"
+#include "coralDefinitions.h"
+
+namespace coral{
+
+class Node;
+class Attribute;
+
+struct NetworkFileRecord{
+	// A single entry of a NetworkFile, not exposed to public API.
+	int type;
+	std::vector<std::string> fields; // paths relative to the node the file was saved from, names and payloads
+	Command command; // only used by command records
+};
+
+//! A versioned binary alternative to the python save script of a network.
+//
+//! The file is a sequence of records read straight from the nodes: the nodes and their dynamic attributes, 
+//! the specializations, the values of the attributes as raw little-endian payloads (see Value::asBinary()) and the connections.
+//! Loading applies the records from C++ without executing or parsing any python code, 
+//! nodes and dynamic attributes are instantiated through _createNodeCallback and _createAttributeCallback.
+//! Only the extra commands added by the generatingSaveScript observers are run by name through the python layer.
+//! Paths are stored relative to the node the network was saved from, so that the file can be loaded under any other node.
+class CORAL_EXPORT NetworkFile{
+public:
+	enum RecordType{
+		nodeRecord = 0,
+		attributeRecord,
+		specializationOverrideRecord,
+		attributeAffectRecord,
+		specializationLinkRecord,
+		allowedSpecializationRecord,
+		valueRecord,
+		stringValueRecord,
+		connectionRecord,
+		commandRecord
+	};
+	
+	NetworkFile();
+	
+	//! Fills this file with the content of topNode, the same content Node::contentAsScript() would save.
+	void setFromNode(Node *topNode);
+	
+	//! Appends the commands of a script made of executeCommand() statements, such as the one collected from the generatingSaveScript observers.
+	//! Comments are skipped, any other statement can't be stored and is reported in errors().
+	void addCommandsFromScript(const std::string &script);
+	
+	//! The content of this file as a string of bytes ready to be written to disk.
+	std::string data();
+	
+	//! Fills this file from a string of bytes as returned by data(), returns false if the data is not a valid network file or its version is not supported.
+	bool setFromData(const std::string &data);
+	
+	//! Returns true if the given bytes start like a binary network file.
+	static bool isNetworkFileData(const std::string &data);
+	static unsigned int version();
+	
+	int recordsCount();
+	RecordType recordType(int record);
+	
+	//! The command stored by a command record, with its paths resolved under topNode.
+	Command command(int record, Node *topNode);
+	
+	//! Applies the records starting from record up to the first command record, the index of the latter is returned.
+	//! Errors found along the way are collected in errors().
+	int applyRecords(int record, Node *topNode);
+	std::vector<std::string> errors();
+	
+	//! Set by the python layer to instantiate the classes registered there, the returned node must already be added to parent.
+	static Node *(*_createNodeCallback)(const std::string &className, const std::string &name, Node *parent);
+	
+	//! Set by the python layer, the returned attribute must already be added to parent as a dynamic attribute.
+	static Attribute *(*_createAttributeCallback)(const std::string &className, const std::string &name, Node *parent, bool input, bool output);
+	
+private:
+	std::string relativeName(const std::string &fullName);
+	std::string resolvedName(Node *topNode, const std::string &name);
+	Node *findNode(Node *topNode, const std::string &path);
+	Attribute *findAttribute(Node *topNode, const std::string &path);
+	NetworkFileRecord &addRecord(RecordType type);
+	void addContent(Node *node);
+	void addNode(Node *node);
+	void addConnections(Node *node);
+	void applyRecord(NetworkFileRecord &record, Node *topNode);
+	
+	std::vector<NetworkFileRecord> _records;
+	std::vector<std::string> _errors;
+	std::string _savedTopNodeName;
+	std::map<std::string, Node*> _createdNodes;
+};
+
+}
+
+#endif
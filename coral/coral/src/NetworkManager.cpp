@@ -27,6 +27,8 @@
 // </license>
 
 #include <sys/stat.h>
+#include <algorithm>
+#include <stdexcept>
 
 #include <boost/graph/adjacency_list.hpp>
 #include <boost/graph/graph_traits.hpp>
@@ -34,6 +36,13 @@
 #include <boost/graph/depth_first_search.hpp>
 #include <boost/graph/reverse_graph.hpp>
 #include <boost/graph/topological_sort.hpp>
+#include <boost/unordered_map.hpp>
+#include <boost/unordered_set.hpp>
+
+#ifdef CORAL_PARALLEL_TBB
+	#include <tbb/enumerable_thread_specific.h>
+	#include <tbb/recursive_mutex.h>
+#endif
 
 #include "NetworkManager.h"
 #include "Node.h"
@@ -53,23 +62,234 @@ using namespace coral;
 typedef boost::adjacency_list<boost::vecS, boost::vecS, boost::bidirectionalS> Graph;
 typedef boost::graph_traits<Graph>::vertex_descriptor GraphVertex;
 
+// object ids are made of a slot index in the low bits and the generation of that slot in the high bits,
+// slots are recycled once their object is deleted and the generation keeps stale ids from resolving to the new occupant.
+// A slot whose generations are exhausted is retired rather than wrapped, so a stale id never resolves again.
+// The slot is also the vertex of the object in _graph, so the graph only grows up to the peak number of live objects.
+// 20 bits allow about a million live objects and 2047 generations per slot.
+const int idSlotBits = 20;
+const int idSlotMask = (1 << idSlotBits) - 1;
+const int idMaxGeneration = (1 << (31 - idSlotBits)) - 1;
+
 Graph _graph;
+boost::unordered_multimap<std::string, NestedObject*> _fullNameIndex;
+std::vector<Object*> _objectSlots;
+std::vector<int> _slotGenerations;
+std::vector<int> _freeSlots;
+int _liveObjectsCount = 0;
+
+// topological order of _graph kept up to date as edges are added (Pearce-Kelly),
+// for every edge u -> v _vertexOrder[u] < _vertexOrder[v] as long as the graph has no cycle.
+std::vector<int> _vertexOrder;
+bool _vertexOrderValid = true;
+
+// marks left on the vertices reached by a walk, stamped with a new generation on every walk so they never need clearing.
+// Each thread keeps its own marks, walks started by concurrent pulls or dirtying don't step on each other.
+struct VisitMarks{
+	VisitMarks(): current(0){
+	}
+	
+	std::vector<unsigned int> vertices;
+	unsigned int current;
+};
+
+#ifdef CORAL_PARALLEL_TBB
+	tbb::enumerable_thread_specific<VisitMarks> _visitMarks;
+	tbb::recursive_mutex _editMutex;
+#else
+	VisitMarks _visitMarks;
+#endif
 
-int NetworkManager::_nextAvailableId = 0;
-std::map<int, Object *> NetworkManager::_objectsById;
 std::vector<std::string> NetworkManager::_searchPaths;
+int NetworkManager::_editTransactionDepth = 0;
+bool NetworkManager::_flushingEditTransaction = false;
+std::set<int> NetworkManager::_pendingChainUpdates;
+std::map<int, bool> NetworkManager::_pendingDirty;
+void(*NetworkManager::_deleteNodesCallback)(const std::vector<Node*> &nodes) = 0;
 
 namespace {
 	int fileExist(const std::string &filename){
 	  struct stat buffer;
 	  return (stat (filename.data(), &buffer) == 0);
 	}
+	
+	inline int slotFromId(int id){
+		return id & idSlotMask;
+	}
+	
+	inline int generationFromId(int id){
+		return id >> idSlotBits;
+	}
+	
+	inline GraphVertex attributeVertex(Attribute *attribute){
+		return slotFromId(attribute->id());
+	}
+	
+	// new vertices are appended at the end of the topological order
+	void growVertexOrder(GraphVertex vertex){
+		while(_vertexOrder.size() <= vertex){
+			_vertexOrder.push_back(_vertexOrder.size());
+		}
+	}
+	
+	// the marks of the calling thread, sized to cover every vertex and stamped with a new generation
+	VisitMarks &beginVisit(){
+		#ifdef CORAL_PARALLEL_TBB
+			VisitMarks &marks = _visitMarks.local();
+		#else
+			VisitMarks &marks = _visitMarks;
+		#endif
+		
+		marks.vertices.resize(_vertexOrder.size(), 0);
+		
+		marks.current += 1;
+		if(marks.current == 0){
+			std::fill(marks.vertices.begin(), marks.vertices.end(), 0);
+			marks.current = 1;
+		}
+		
+		return marks;
+	}
+	
+	// walks the graph from start collecting the vertices whose order lies within [lowerBound, upperBound],
+	// each vertex is visited once and the walk stops returning true as soon as target is reached.
+	bool collectVertices(GraphVertex start, GraphVertex target, int lowerBound, int upperBound, bool downstream, std::vector<GraphVertex> &collected){
+		VisitMarks &marks = beginVisit();
+		unsigned int visit = marks.current;
+		std::vector<unsigned int> &visits = marks.vertices;
+		visits[start] = visit;
+		
+		std::vector<GraphVertex> stack(1, start);
+		std::vector<GraphVertex> adjacents;
+		while(!stack.empty()){
+			GraphVertex vertex = stack.back();
+			stack.pop_back();
+			collected.push_back(vertex);
+			
+			adjacents.clear();
+			if(downstream){
+				Graph::out_edge_iterator e, e_end;
+				for(boost::tie(e, e_end) = boost::out_edges(vertex, _graph); e != e_end; ++e){
+					adjacents.push_back(boost::target(*e, _graph));
+				}
+			}
+			else{
+				Graph::in_edge_iterator e, e_end;
+				for(boost::tie(e, e_end) = boost::in_edges(vertex, _graph); e != e_end; ++e){
+					adjacents.push_back(boost::source(*e, _graph));
+				}
+			}
+			
+			for(int i = 0; i < adjacents.size(); ++i){
+				GraphVertex adjacent = adjacents[i];
+				if(adjacent == target){
+					return true;
+				}
+				
+				int order = _vertexOrder[adjacent];
+				if(visits[adjacent] != visit && order >= lowerBound && order <= upperBound){
+					visits[adjacent] = visit;
+					stack.push_back(adjacent);
+				}
+			}
+		}
+		
+		return false;
+	}
+	
+	bool vertexComesFirst(GraphVertex vertexA, GraphVertex vertexB){
+		return _vertexOrder[vertexA] < _vertexOrder[vertexB];
+	}
+	
+	// the new edge source -> destination goes against the current order, 
+	// only the vertices between the two in the order get shuffled so that everything upstream of source comes before everything downstream of destination.
+	void reorderVertices(GraphVertex source, GraphVertex destination){
+		int lowerBound = _vertexOrder[destination];
+		int upperBound = _vertexOrder[source];
+		
+		std::vector<GraphVertex> downstream;
+		if(collectVertices(destination, source, lowerBound, upperBound, true, downstream)){
+			// the edge closed a cycle, no order exists until it is removed
+			_vertexOrderValid = false;
+			return;
+		}
+		
+		std::vector<GraphVertex> upstream;
+		collectVertices(source, boost::graph_traits<Graph>::null_vertex(), lowerBound, upperBound, false, upstream);
+		
+		std::sort(downstream.begin(), downstream.end(), vertexComesFirst);
+		std::sort(upstream.begin(), upstream.end(), vertexComesFirst);
+		
+		std::vector<int> orders;
+		for(int i = 0; i < upstream.size(); ++i){
+			orders.push_back(_vertexOrder[upstream[i]]);
+		}
+		for(int i = 0; i < downstream.size(); ++i){
+			orders.push_back(_vertexOrder[downstream[i]]);
+		}
+		std::sort(orders.begin(), orders.end());
+		
+		int orderId = 0;
+		for(int i = 0; i < upstream.size(); ++i){
+			_vertexOrder[upstream[i]] = orders[orderId++];
+		}
+		for(int i = 0; i < downstream.size(); ++i){
+			_vertexOrder[downstream[i]] = orders[orderId++];
+		}
+	}
+	
+	// recomputes the whole order from scratch, used once a cycle was found in the graph to check if it's been removed since.
+	void rebuildVertexOrder(){
+		int nvertices = _vertexOrder.size();
+		std::vector<int> inDegree(nvertices, 0);
+		std::vector<GraphVertex> ready;
+		for(int i = 0; i < nvertices; ++i){
+			inDegree[i] = boost::in_degree(i, _graph);
+			if(inDegree[i] == 0){
+				ready.push_back(i);
+			}
+		}
+		
+		std::vector<int> order(nvertices, -1);
+		int orderId = 0;
+		while(!ready.empty()){
+			GraphVertex vertex = ready.back();
+			ready.pop_back();
+			order[vertex] = orderId++;
+			
+			Graph::out_edge_iterator e, e_end;
+			for(boost::tie(e, e_end) = boost::out_edges(vertex, _graph); e != e_end; ++e){
+				GraphVertex target = boost::target(*e, _graph);
+				inDegree[target] -= 1;
+				if(inDegree[target] == 0){
+					ready.push_back(target);
+				}
+			}
+		}
+		
+		if(orderId == nvertices){
+			_vertexOrder = order;
+			_vertexOrderValid = true;
+		}
+	}
+}
+
+NetworkEditLock::NetworkEditLock(){
+	#ifdef CORAL_PARALLEL_TBB
+		_editMutex.lock();
+	#endif
+}
+
+NetworkEditLock::~NetworkEditLock(){
+	#ifdef CORAL_PARALLEL_TBB
+		_editMutex.unlock();
+	#endif
 }
 
 class DownstreamVisitor : public boost::default_dfs_visitor{
 public:
 	void discover_vertex(GraphVertex v, const Graph& g){
-		Attribute *attr = (Attribute*)NetworkManager::findObjectById(v);
+		Attribute *attr = (Attribute*)_objectSlots[v];
 		
 		collectedAttributes->push_back(attr);
 	}
@@ -77,45 +297,88 @@ public:
 	std::vector<Attribute*> *collectedAttributes;
 };
 
-class UpstreamVisitor : public boost::default_dfs_visitor{
-public:
-	void finish_vertex(GraphVertex v, const boost::reverse_graph<Graph>& g){
-		Attribute *attr = (Attribute*)NetworkManager::findObjectById(v);
-		collectedAttributes->push_back(attr);
-	}
-	
-	std::vector<Attribute*> *collectedAttributes;
-};
-
 void NetworkManager::getDownstreamChain(Attribute *attribute, std::vector<Attribute*> &downstreamChain){
-	downstreamChain.clear();
+	NetworkEditLock lock;
 	
-	int nvertices = boost::num_vertices(_graph);
+	downstreamChain.clear();
 	
-	if(nvertices){
-		DownstreamVisitor visitor;
-		visitor.collectedAttributes = &downstreamChain;
+	GraphVertex vertex = attributeVertex(attribute);
+	if(vertex < _vertexOrder.size()){
+		// the visit marks are stamped with a new generation on every walk, so the cost only depends on the vertices reached
+		std::vector<GraphVertex> vertices;
+		collectVertices(vertex, boost::graph_traits<Graph>::null_vertex(), 0, _vertexOrder.size(), true, vertices);
 		
-
-		std::vector<boost::default_color_type> color_map(nvertices);
-		boost::depth_first_visit(_graph, boost::vertex(attribute->id(), _graph), visitor, 
-			boost::make_iterator_property_map(color_map.begin(), boost::get(boost::vertex_index, _graph), color_map[0]));
+		downstreamChain.reserve(vertices.size());
+		for(int i = 0; i < vertices.size(); ++i){
+			downstreamChain.push_back((Attribute*)_objectSlots[vertices[i]]);
+		}
+	}
+	else{
+		downstreamChain.push_back(attribute);
 	}
 }
 
 void NetworkManager::getUpstreamChain(Attribute *attribute, std::vector<Attribute*> &upstreamChain){
+	NetworkEditLock lock;
+	
 	upstreamChain.clear();
 	
+	GraphVertex vertex = attributeVertex(attribute);
+	if(vertex >= _vertexOrder.size()){
+		upstreamChain.push_back(attribute);
+	}
+	else{
+		// post-order walk so that upstream attributes come first, 
+		// a vertex is marked when expanded and the marks are stamped per walk so the cost only depends on the vertices reached.
+		VisitMarks &marks = beginVisit();
+		unsigned int visit = marks.current;
+		std::vector<unsigned int> &visits = marks.vertices;
+		std::vector<std::pair<GraphVertex, bool> > stack(1, std::make_pair(vertex, false));
+		while(!stack.empty()){
+			std::pair<GraphVertex, bool> &top = stack.back();
+			GraphVertex current = top.first;
+			if(top.second){
+				upstreamChain.push_back((Attribute*)_objectSlots[current]);
+				stack.pop_back();
+			}
+			else if(visits[current] == visit){
+				stack.pop_back();
+			}
+			else{
+				visits[current] = visit;
+				top.second = true;
+				
+				Graph::in_edge_iterator e, e_end;
+				for(boost::tie(e, e_end) = boost::in_edges(current, _graph); e != e_end; ++e){
+					GraphVertex source = boost::source(*e, _graph);
+					if(visits[source] != visit){
+						stack.push_back(std::make_pair(source, false));
+					}
+				}
+			}
+		}
+	}
+}
+
+void NetworkManager::getDownstreamRegion(const std::vector<Attribute*> &attributes, std::vector<Attribute*> &region){
+	NetworkEditLock lock;
+	
+	region.clear();
+	
 	int nvertices = boost::num_vertices(_graph);
 	
 	if(nvertices){
-		UpstreamVisitor visitor;
-		visitor.collectedAttributes = &upstreamChain;
+		DownstreamVisitor visitor;
+		visitor.collectedAttributes = &region;
 		
-		std::vector<boost::default_color_type> color_map(nvertices);
-		boost::reverse_graph<Graph> reverseGraph(_graph);
-		boost::depth_first_visit(reverseGraph, boost::vertex(attribute->id(), _graph), visitor, 
-			boost::make_iterator_property_map(color_map.begin(), boost::get(boost::vertex_index, _graph), color_map[0]));
+		std::vector<boost::default_color_type> color_map(nvertices, boost::white_color);
+		for(int i = 0; i < attributes.size(); ++i){
+			int vertex = attributeVertex(attributes[i]);
+			if(vertex < nvertices && color_map[vertex] == boost::white_color){
+				boost::depth_first_visit(_graph, vertex, visitor, 
+					boost::make_iterator_property_map(color_map.begin(), boost::get(boost::vertex_index, _graph), color_map[0]));
+			}
+		}
 	}
 }
 
@@ -131,132 +394,426 @@ void NetworkManager::collectParentNodeConnectedInputs(Attribute *attribute, Node
 	}
 }
 
-void NetworkManager::getCleanChain(Attribute *attribute, std::map<int, std::vector<Attribute*> > &cleanChain, std::map<int, std::vector<Attribute*> > &affectedInputs){
-	Node *startContainerNode = attribute->parent();
-	if(startContainerNode){
-		startContainerNode = startContainerNode->parent();
-	}
-
+void NetworkManager::getCleanSchedule(Attribute *attribute, CleanSchedule &cleanSchedule, std::map<int, std::vector<Attribute*> > &affectedInputs){
+	NetworkEditLock lock;
+	
 	std::vector<Attribute*> attributes;
-	getUpstreamChain(attribute, attributes);
+	getUpstreamChain(attribute, attributes); // upstream attributes come first
 	
-	cleanChain.clear();
+	cleanSchedule.attributes.clear();
+	cleanSchedule.successors.clear();
+	cleanSchedule.predecessorsCount.clear();
+	cleanSchedule.chain = attributes;
+	cleanSchedule.chainInputs.assign(attributes.size(), std::vector<int>());
 	affectedInputs.clear();
 	
-	int nvertices = boost::num_vertices(_graph);
-	std::vector<int> attrDependencyOrder(nvertices, 0);
+	// for every vertex in the chain keep the closest upstream tasks, 
+	// each output attribute with a parent node is a task and only depends on the tasks feeding it.
+	// Vertices are indexed by their position in the chain so that the cost doesn't depend on the size of the whole graph.
+	boost::unordered_map<GraphVertex, int> chainIndex;
+	std::vector<int> taskIndex(attributes.size(), -1);
+	std::vector<std::vector<int> > upstreamTasks(attributes.size());
+	std::map<Node*, int> lastNodeTask;
 	
-	// sort the chain in parallel slices
-	std::vector<Node*> processedNodes;
-	int offset = 0;
 	for(int i = 0; i < attributes.size(); ++i){
 		Attribute *attr = attributes[i];
-		int attrId = attr->id();
+		GraphVertex vertex = attributeVertex(attr);
+		chainIndex[vertex] = i;
 		
-		if(in_degree(attrId, _graph) > 0){
+		std::vector<int> &predecessors = upstreamTasks[i];
+		if(vertex < boost::num_vertices(_graph)){
 			Graph::in_edge_iterator j, j_end;
-			int maxdist = 0;
-			
-			for(boost::tie(j, j_end) = boost::in_edges(attrId, _graph); j != j_end; ++j){
-				maxdist = std::max(attrDependencyOrder[source(*j, _graph)], maxdist);
+			for(boost::tie(j, j_end) = boost::in_edges(vertex, _graph); j != j_end; ++j){
+				int sourceIndex = chainIndex[source(*j, _graph)];
+				cleanSchedule.chainInputs[i].push_back(sourceIndex);
+				
+				if(taskIndex[sourceIndex] != -1){
+					predecessors.push_back(taskIndex[sourceIndex]);
+				}
+				else{
+					const std::vector<int> &sourceTasks = upstreamTasks[sourceIndex];
+					predecessors.insert(predecessors.end(), sourceTasks.begin(), sourceTasks.end());
+				}
 			}
-			
-			attrDependencyOrder[attrId] = maxdist + 1;
 		}
 		
-		if(attr->isOutput()){
-			Node *parentNode = attr->parent();
-			if(parentNode){
-				Node *containerNode = parentNode->parent();
-
-				if(containerUtils::elementInContainer(parentNode, processedNodes)){ // make sure the same node doesn't fall in the same slice more than once.
-					offset++;
-				}
-
-				int dependencyOrder = attrDependencyOrder[attrId] + offset;
-				std::vector<Attribute*> &slice = cleanChain[dependencyOrder];
-				slice.push_back(attr);
-				
-				processedNodes.push_back(parentNode);
-				
-				std::vector<Attribute*> &inputs = affectedInputs[attr->id()];
-				collectParentNodeConnectedInputs(attr, parentNode, inputs);
+		Node *parentNode = attr->parent();
+		if(attr->isOutput() && parentNode){
+			int task = cleanSchedule.attributes.size();
+			
+			// make sure the same node is never updated concurrently by two of its outputs.
+			std::map<Node*, int>::iterator nodeTask = lastNodeTask.find(parentNode);
+			if(nodeTask != lastNodeTask.end()){
+				predecessors.push_back(nodeTask->second);
 			}
+			lastNodeTask[parentNode] = task;
+			
+			std::sort(predecessors.begin(), predecessors.end());
+			predecessors.erase(std::unique(predecessors.begin(), predecessors.end()), predecessors.end());
+			
+			cleanSchedule.attributes.push_back(attr);
+			cleanSchedule.successors.push_back(std::vector<int>());
+			cleanSchedule.predecessorsCount.push_back(predecessors.size());
+			for(int k = 0; k < predecessors.size(); ++k){
+				cleanSchedule.successors[predecessors[k]].push_back(task);
+			}
+			
+			taskIndex[i] = task;
+			predecessors.clear();
+			
+			std::vector<Attribute*> &inputs = affectedInputs[attr->id()];
+			collectParentNodeConnectedInputs(attr, parentNode, inputs);
+		}
+		else if(predecessors.size() > 1){
+			std::sort(predecessors.begin(), predecessors.end());
+			predecessors.erase(std::unique(predecessors.begin(), predecessors.end()), predecessors.end());
 		}
 	}
 }
 
 
 void NetworkManager::addEdge(Attribute *attributeA, Attribute *attributeB){
-	boost::add_edge(attributeA->id(), attributeB->id(), _graph);
+	NetworkEditLock lock;
+	
+	GraphVertex source = attributeVertex(attributeA);
+	GraphVertex destination = attributeVertex(attributeB);
+	
+	boost::add_edge(source, destination, _graph);
+	growVertexOrder(std::max(source, destination));
+	
+	if(_vertexOrderValid && _vertexOrder[source] >= _vertexOrder[destination]){
+		reorderVertices(source, destination);
+	}
 }
 
 void NetworkManager::removeEdge(Attribute *attributeA, Attribute *attributeB){
-	boost::remove_edge(attributeA->id(), attributeB->id(), _graph);
+	NetworkEditLock lock;
+	
+	boost::remove_edge(attributeVertex(attributeA), attributeVertex(attributeB), _graph);
 }
 
 int NetworkManager::useNextAvailableId(){
-	_nextAvailableId += 1;
+	NetworkEditLock lock;
+	
+	int slot;
+	if(_freeSlots.empty()){
+		if(_objectSlots.size() > idSlotMask){
+			// any further slot would overlap the generation bits
+			throw std::overflow_error("too many objects, no object id left");
+		}
+		
+		slot = _objectSlots.size();
+		_objectSlots.push_back(0);
+		_slotGenerations.push_back(1);
+	}
+	else{
+		// reuse the most recently freed slot, its vertex is likely still hot in memory
+		slot = _freeSlots.back();
+		_freeSlots.pop_back();
+	}
 	
-	return _nextAvailableId;
+	return (_slotGenerations[slot] << idSlotBits) | slot;
 }
 
 void NetworkManager::storeObject(int id, Object *object){
-	_objectsById[id] = object;
+	NetworkEditLock lock;
+	
+	int slot = slotFromId(id);
+	if(_objectSlots[slot] == 0){
+		_liveObjectsCount += 1;
+	}
+	
+	_objectSlots[slot] = object;
 }
 
 void NetworkManager::removeObject(int id){
-	std::map<int, Object *>::iterator it = _objectsById.find(id);
-	if(it != _objectsById.end()){
-		_objectsById.erase(it);
+	NetworkEditLock lock;
+	
+	int slot = slotFromId(id);
+	if(slot < _objectSlots.size() && _objectSlots[slot] && _slotGenerations[slot] == generationFromId(id)){
+		_objectSlots[slot] = 0;
+		_liveObjectsCount -= 1;
+		
+		// drop any edge left on the vertex so that the next occupant of the slot starts disconnected
+		if(slot < boost::num_vertices(_graph)){
+			boost::clear_vertex(slot, _graph);
+		}
+		
+		// a retired slot keeps generation 0, which no id carries
+		int generation = _slotGenerations[slot] + 1;
+		if(generation > idMaxGeneration){
+			generation = 0;
+		}
+		
+		_slotGenerations[slot] = generation;
+		if(generation){
+			_freeSlots.push_back(slot);
+		}
 	}
 }
 
 int NetworkManager::objectCount(){
-	return (int)_objectsById.size();
+	NetworkEditLock lock;
+	
+	return _liveObjectsCount;
 }
 
 Object *NetworkManager::findObjectById(int id){
+	NetworkEditLock lock;
+	
 	Object *foundObject = 0;
 	
-	std::map<int, Object *>::iterator it = _objectsById.find(id);
-	if(it != _objectsById.end()){
-		foundObject = _objectsById[id];
+	int slot = slotFromId(id);
+	if(id > 0 && slot < _objectSlots.size() && _slotGenerations[slot] == generationFromId(id)){
+		foundObject = _objectSlots[slot];
 	}
 	
 	return foundObject;
 }
 
-bool NetworkManager::isCycle(Attribute *attribute, Attribute *input){
+NestedObject *NetworkManager::findObjectByFullName(const std::string &fullName, NestedObject *parent){
+	typedef boost::unordered_multimap<std::string, NestedObject*>::iterator Iterator;
+	
+	NetworkEditLock lock;
+	
+	std::pair<Iterator, Iterator> range = _fullNameIndex.equal_range(fullName);
+	for(Iterator it = range.first; it != range.second; ++it){
+		NestedObject *object = it->second;
+		if(parent == 0 || object->parentObject() == parent){
+			return object;
+		}
+	}
+	
+	return 0;
+}
 
+void NetworkManager::indexFullName(const std::string &fullName, NestedObject *object){
+	NetworkEditLock lock;
+	
+	_fullNameIndex.insert(std::make_pair(fullName, object));
+}
+
+void NetworkManager::unindexFullName(const std::string &fullName, NestedObject *object){
+	typedef boost::unordered_multimap<std::string, NestedObject*>::iterator Iterator;
+	
+	NetworkEditLock lock;
+	
+	std::pair<Iterator, Iterator> range = _fullNameIndex.equal_range(fullName);
+	for(Iterator it = range.first; it != range.second; ++it){
+		if(it->second == object){
+			_fullNameIndex.erase(it);
+			break;
+		}
+	}
+}
+
+void NetworkManager::beginEditTransaction(){
+	NetworkEditLock lock;
+	
+	_editTransactionDepth += 1;
+}
+
+void NetworkManager::commitEditTransaction(){
+	bool flush = false;
+	{
+		NetworkEditLock lock;
+		
+		if(_editTransactionDepth > 0){
+			_editTransactionDepth -= 1;
+			flush = _editTransactionDepth == 0;
+		}
+	}
+	
+	if(flush){
+		flushEditTransaction();
+	}
+}
+
+bool NetworkManager::editTransactionOpen(){
+	NetworkEditLock lock;
+	
+	return _editTransactionDepth > 0;
+}
+
+void NetworkManager::queueEvaluationChainUpdate(Attribute *attribute){
+	NetworkEditLock lock;
+	
+	_pendingChainUpdates.insert(attribute->id());
+}
+
+void NetworkManager::queueDirty(Attribute *attribute, bool force){
+	NetworkEditLock lock;
+	
+	std::map<int, bool>::iterator it = _pendingDirty.find(attribute->id());
+	if(it == _pendingDirty.end()){
+		_pendingDirty[attribute->id()] = force;
+	}
+	else if(force){
+		it->second = true;
+	}
+}
+
+void NetworkManager::flushEditTransaction(){
+	std::map<int, bool> pendingDirty;
+	{
+		NetworkEditLock lock;
+		
+		if(_pendingChainUpdates.empty() && _pendingDirty.empty()){
+			return;
+		}
+		
+		// objects deleted while the transaction was open are simply skipped, their neighbours got queued when they were disconnected
+		std::vector<Attribute*> attributes;
+		for(std::set<int>::iterator it = _pendingChainUpdates.begin(); it != _pendingChainUpdates.end(); ++it){
+			Attribute *attr = (Attribute*)findObjectById(*it);
+			if(attr && !attr->isDeleted()){
+				attributes.push_back(attr);
+			}
+		}
+		_pendingChainUpdates.clear();
+		
+		std::vector<Attribute*> region;
+		getDownstreamRegion(attributes, region);
+		for(int i = 0; i < region.size(); ++i){
+			getCleanSchedule(region[i], region[i]->_cleanSchedule, region[i]->_inputsCleanChain);
+		}
+		
+		pendingDirty.swap(_pendingDirty);
+		_flushingEditTransaction = true;
+	}
+	
+	// dirtying is done last, with the evaluation chains up to date.
+	// It runs the dirty callbacks, so it's done without holding the lock.
+	for(std::map<int, bool>::iterator it = pendingDirty.begin(); it != pendingDirty.end(); ++it){
+		Attribute *attr = (Attribute*)findObjectById(it->first);
+		if(attr && !attr->isDeleted()){
+			attr->dirty(it->second);
+		}
+	}
+	
+	NetworkEditLock lock;
+	_flushingEditTransaction = false;
+}
+
+bool NetworkManager::deferEvaluationChainUpdates(){
+	NetworkEditLock lock;
+	
+	return _editTransactionDepth > 0 && !_flushingEditTransaction;
+}
+
+void NetworkManager::deleteNodes(const std::vector<Node*> &nodes){
+	// collect everything going away, nested nodes included
+	boost::unordered_set<Object*> deletedObjects;
+	std::vector<Node*> deletedNodes;
+	std::vector<Attribute*> deletedAttributes;
+	for(int i = 0; i < nodes.size(); ++i){
+		Node *node = nodes[i];
+		if(node && !node->isDeleted() && deletedObjects.insert(node).second){
+			deletedNodes.push_back(node);
+		}
+	}
+	
+	for(int i = 0; i < deletedNodes.size(); ++i){
+		Node *node = deletedNodes[i];
+		
+		const std::vector<Node*> &children = node->_nodes;
+		for(int j = 0; j < children.size(); ++j){
+			if(deletedObjects.insert(children[j]).second){
+				deletedNodes.push_back(children[j]);
+			}
+		}
+		
+		std::vector<Attribute*> attributes = node->attributes();
+		for(int j = 0; j < attributes.size(); ++j){
+			if(deletedObjects.insert(attributes[j]).second){
+				deletedAttributes.push_back(attributes[j]);
+			}
+		}
+	}
+	
+	if(deletedNodes.empty()){
+		return;
+	}
+	
+	// one notification for the whole set, sent while the objects are still intact
+	if(_deleteNodesCallback){
+		_deleteNodesCallback(deletedNodes);
+	}
+	
+	// everything is kept alive until the end, removing an object from its parent could otherwise release it halfway.
+	// Objects are flagged as deleted up front like in the destructors, so no callback, evaluation chain or specialization is computed inside the set.
+	for(int i = 0; i < deletedNodes.size(); ++i){
+		deletedNodes[i]->addReference();
+		deletedNodes[i]->setIsDeleted(true);
+	}
+	
+	for(int i = 0; i < deletedAttributes.size(); ++i){
+		deletedAttributes[i]->addReference();
+		deletedAttributes[i]->setIsDeleted(true);
+	}
+	
+	beginEditTransaction();
+	
+	// connections crossing the boundary are cut once, the attributes left in the network are updated as usual
+	for(int i = 0; i < deletedAttributes.size(); ++i){
+		Attribute *attribute = deletedAttributes[i];
+		if(attribute->_input && deletedObjects.find(attribute->_input) == deletedObjects.end()){
+			attribute->disconnectInput();
+		}
+		
+		std::vector<Attribute*> outputs = attribute->_outputs;
+		for(int j = 0; j < outputs.size(); ++j){
+			if(deletedObjects.find(outputs[j]) == deletedObjects.end()){
+				outputs[j]->disconnectInput();
+			}
+		}
+	}
+	
+	for(int i = 0; i < deletedAttributes.size(); ++i){
+		deletedAttributes[i]->deleteIt();
+	}
+	
+	// nested nodes come after their parent in the list, walking it backwards deletes children first
+	for(int i = deletedNodes.size() - 1; i >= 0; --i){
+		deletedNodes[i]->deleteIt();
+	}
+	
+	commitEditTransaction();
+	
+	for(int i = 0; i < deletedAttributes.size(); ++i){
+		deletedAttributes[i]->removeReference();
+	}
+	
+	for(int i = deletedNodes.size() - 1; i >= 0; --i){
+		deletedNodes[i]->removeReference();
+	}
+}
+
+bool NetworkManager::isCycle(Attribute *attribute, Attribute *input){
+	NetworkEditLock lock;
+	
 	if(attribute && input){
-		bool inputNeedsRecursion = false;
-		bool affectedByNeedsRecursion = false;
-
-		if(attribute->_isInput && attribute->_input){
-			if(attribute->_input == input)
-				return true;
-			else
-				inputNeedsRecursion = true;
-		}
-		// check attribute->affectedBy() too before starting an input recursion
-		else if(attribute->_isOutput && attribute->_affectedBy.empty() == false){
-			if(attribute->isAffectedBy(input))
-				return true;
-			else
-				affectedByNeedsRecursion = true;
-		}
-
-		if(inputNeedsRecursion)
-			if(isCycle(attribute->_input, input))
-				return true;
-
-		if(affectedByNeedsRecursion){
-			for(unsigned int u = 0; u < attribute->_affectedBy.size(); ++u){
-				if(isCycle(attribute->_affectedBy[u], input)){
-					return true;
+		GraphVertex vertex = attributeVertex(attribute);
+		GraphVertex inputVertex = attributeVertex(input);
+		
+		// vertices beyond the order never had an edge
+		if(vertex < _vertexOrder.size() && inputVertex < _vertexOrder.size()){
+			if(_vertexOrderValid == false){
+				rebuildVertexOrder();
+			}
+			
+			std::vector<GraphVertex> upstream;
+			if(_vertexOrderValid){
+				// input can only be upstream of attribute if it comes first in the order, 
+				// in which case only the vertices in between need to be searched.
+				if(_vertexOrder[inputVertex] > _vertexOrder[vertex]){
+					return false;
 				}
+				
+				return collectVertices(vertex, inputVertex, _vertexOrder[inputVertex], _vertexOrder[vertex], false, upstream);
 			}
+			
+			return collectVertices(vertex, inputVertex, 0, _vertexOrder.size(), false, upstream);
 		}
 	}
 
@@ -282,13 +839,13 @@ bool NetworkManager::allowConnection(Attribute *sourceAttribute, Attribute *dest
 		return false;
 	}
 
-	if(sourceAttribute->parent() == 0 || containerUtils::elementInContainer(sourceAttribute, sourceAttribute->parent()->attributes()) == false){
+	if(sourceAttribute->parent() == 0 || sourceAttribute->parent()->containsAttribute(sourceAttribute) == false){
 		errorObject->setMessage("no parent node found for " + sourceAttribute->fullName());
 
 		return false;
 	}
 	
-	if(destinationAttribute->parent() == 0 || containerUtils::elementInContainer(destinationAttribute, destinationAttribute->parent()->attributes()) == false){
+	if(destinationAttribute->parent() == 0 || destinationAttribute->parent()->containsAttribute(destinationAttribute) == false){
 		errorObject->setMessage("no parent node found for " + destinationAttribute->fullName());
 
 		return false;
@@ -33,20 +33,31 @@
 #include <string>
 #include <vector>
 #include <map>
+#include <set>
 #include "coralDefinitions.h"
 
 namespace coral{
 
 class Object;
+class NestedObject;
 class Attribute;
 class Node;
 class ErrorObject;
+struct CleanSchedule;
 
 //! In charge of managing lifetime and connections of each Object in the network.
 class CORAL_EXPORT NetworkManager{
 public:
 	static int objectCount();
+	
+	//! Returns the live object with the given id in constant time, NULL if the object was deleted.
+	//! Ids of deleted objects are recycled with a new generation, a stale id never resolves to the object that later reused its slot.
 	static Object *findObjectById(int id);
+	
+	//! Returns the object registered under the given full name (see NestedObject::fullName()) in constant time, NULL if none is found.
+	//! Only objects contained by a parent are indexed, an object with no parent is not found by this method.
+	//! Separate hierarchies can share full names, if parent is given only an object directly contained by it is returned.
+	static NestedObject *findObjectByFullName(const std::string &fullName, NestedObject *parent = 0);
 	static bool allowConnection(Attribute *sourceAttribute, Attribute *destinationAttribute, ErrorObject *errorObject);
 	static bool connect(Attribute *sourceAttribute, Attribute *destinationAttribute, ErrorObject *errorObject = 0);
 	static bool isCycle(Attribute *sourceAttribute, Attribute *destinationAttribute);
@@ -56,22 +67,67 @@ public:
 	static void addSearchPath(const std::string &path);
 	static void removeSearchPath(const std::string &path);
 
+	//! Opens a graph-edit transaction, transactions can be nested.
+	//! While a transaction is open connections and affects don't rebuild the evaluation chains of the attributes involved,
+	//! the rebuild is queued and performed once for the whole affected region when the outermost transaction is committed.
+	static void beginEditTransaction();
+
+	//! Closes the current graph-edit transaction, if this is the outermost one the queued evaluation chains are rebuilt and the queued attributes dirtied.
+	static void commitEditTransaction();
+	static bool editTransactionOpen();
+
+	//! Deletes the given nodes and everything nested under them in a single pass.
+	//! Connections to the rest of the network are cut once and the attributes left behind are updated within one edit transaction,
+	//! while connections inside the deleted set are dropped without rebuilding evaluation chains or specializations.
+	//! A single _deleteNodesCallback, listing every node going away, replaces the callbacks of the individual objects.
+	static void deleteNodes(const std::vector<Node*> &nodes);
+
+	static void(*_deleteNodesCallback)(const std::vector<Node*> &nodes);
+
 private:
 	friend class Object;
+	friend class NestedObject;
 	friend class Attribute;
 	friend class Node;
+	friend class EvaluationState;
 	
 	static int useNextAvailableId();
 	static void storeObject(int id, Object *object);
 	static void removeObject(int id);
+	static void indexFullName(const std::string &fullName, NestedObject *object);
+	static void unindexFullName(const std::string &fullName, NestedObject *object);
 	static void addEdge(Attribute *attributeA, Attribute *attributeB);
 	static void removeEdge(Attribute *attributeA, Attribute *attributeB);
-	static void getCleanChain(Attribute *attribute, std::map<int, std::vector<Attribute*> > &cleanChain, std::map<int, std::vector<Attribute*> > &affectedInputs);
+	static void getCleanSchedule(Attribute *attribute, CleanSchedule &cleanSchedule, std::map<int, std::vector<Attribute*> > &affectedInputs);
 	static void collectParentNodeConnectedInputs(Attribute *attribute, Node *parentNode, std::vector<Attribute*> &attributes);
+	static void getDownstreamRegion(const std::vector<Attribute*> &attributes, std::vector<Attribute*> &region);
+	static void queueEvaluationChainUpdate(Attribute *attribute);
+	static void queueDirty(Attribute *attribute, bool force);
+	static void flushEditTransaction();
+	static bool deferEvaluationChainUpdates();
 
-	static int _nextAvailableId;
-	static std::map<int, Object *> _objectsById;
 	static std::vector<std::string> _searchPaths;
+	static int _editTransactionDepth;
+	static bool _flushingEditTransaction;
+	static std::set<int> _pendingChainUpdates;
+	static std::map<int, bool> _pendingDirty;
+};
+
+//! Locks the state shared by the whole network for the lifetime of this object, not exposed to public API.
+//
+//! Guards the object slots, the full-name index, the graph, the pending edits and the clean schedules,
+//! so that the evaluation threads never read them while an edit is rebuilding them.
+//! The lock is reentrant and only held for short stretches that never wait on anything else,
+//! no reference, callback or evaluation must be triggered while holding it.
+//! Builds without TBB run a single thread at a time and don't lock anything.
+class NetworkEditLock{
+public:
+	NetworkEditLock();
+	~NetworkEditLock();
+
+private:
+	NetworkEditLock(const NetworkEditLock &);
+	NetworkEditLock &operator=(const NetworkEditLock &);
 };
 
 }
@@ -39,6 +39,9 @@
 #include "containerUtils.h"
 #include "Command.h"
 #include "stringUtils.h"
+#include "OutputCache.h"
+#include "ParallelArrays.h"
+#include "Tracer.h"
 
 using namespace coral;
 
@@ -49,6 +52,7 @@ void(*Node::_addOutputAttributeCallback)(Node *self, Attribute *attribute) = 0;
 void(*Node::_removeAttributeCallback)(Node *self, Attribute *attribute) = 0;
 void(*Node::_deleteItCallback)(Node *self) = 0;
 void(*Node::_connectionChangedCallback)(Node *self, Attribute *attribute) = 0;
+bool Node::_earlyCutoffAllowed = true;
 
 namespace {
 
@@ -79,7 +83,10 @@ Node::Node(const std::string &name, Node *parent):
 	_specializationPreset("none"),
 	_slices(1),
 	_isSlicer(false),
-	_sliceable(false){
+	_sliceable(false),
+	_outputCacheEnabled(false),
+	_earlyCutoffEnabled(false),
+	_arrayGrainSize(-1){
 	
 	_slicer = findParentSlicer();
 }
@@ -123,10 +130,50 @@ bool Node::updateEnabled(){
 	return _updateEnabled;
 }
 
+void Node::setOutputCacheEnabled(bool value){
+	_outputCacheEnabled = value;
+}
+
+bool Node::outputCacheEnabled(){
+	return _outputCacheEnabled;
+}
+
+void Node::setEarlyCutoffEnabled(bool value){
+	_earlyCutoffEnabled = value;
+}
+
+bool Node::earlyCutoffEnabled(){
+	return _earlyCutoffEnabled;
+}
+
+void Node::setEarlyCutoffAllowed(bool value){
+	_earlyCutoffAllowed = value;
+}
+
+bool Node::earlyCutoffAllowed(){
+	return _earlyCutoffAllowed;
+}
+
+void Node::setArrayGrainSize(int size){
+	_arrayGrainSize = size;
+}
+
+unsigned int Node::arrayGrainSize(){
+	if(_arrayGrainSize < 0){
+		return ParallelArrays::grainSize();
+	}
+	
+	return (unsigned int)_arrayGrainSize;
+}
+
 bool Node::containsNode(Node *node){
 	return containerUtils::elementInContainer(node, _nodes);
 }
 
+bool Node::containsAttribute(Attribute *attribute){
+	return _attributesSet.find(attribute) != _attributesSet.end();
+}
+
 void Node::removeNode(Node *node){
 	if(containerUtils::elementInContainer(node, _nodes)){
 		containerUtils::eraseElementInContainer(node, _nodes);
@@ -135,7 +182,7 @@ void Node::removeNode(Node *node){
 			node->setParent(0);
 		}
 		
-		if(_removeNodeCallback && !isDeleted()){
+		if(_removeNodeCallback && !isDeleted() && !node->isDeleted()){
 			_removeNodeCallback(this, node);
 		}
 		
@@ -163,6 +210,7 @@ void Node::removeAttribute(Attribute *attribute){
 	}
 	
 	if(removed){
+		_attributesSet.erase(attribute);
 		removeObject(attribute);
 	}
 }
@@ -171,6 +219,7 @@ void Node::addInputAttribute(Attribute *attribute){
 	if(containerUtils::elementInContainer(attribute, _inputAttributes) == false){
 		attribute->setIsInput(true);
 		_inputAttributes.push_back(attribute);
+		_attributesSet.insert(attribute);
 		
 		if(attribute->parent() != this){
 			attribute->parent()->removeAttribute(attribute);
@@ -189,6 +238,7 @@ void Node::addOutputAttribute(Attribute *attribute){
 	if(containerUtils::elementInContainer(attribute, _outputAttributes) == false){
 		attribute->setIsOutput(true);
 		_outputAttributes.push_back(attribute);
+		_attributesSet.insert(attribute);
 		
 		if(attribute->parent() != this){
 			attribute->parent()->removeAttribute(attribute);
@@ -211,9 +261,24 @@ void Node::resizedSlices(unsigned int slices){
 }
 
 void Node::doUpdate(Attribute *attribute){
+	TraceScope traceScope(Tracer::eventTypeNodeUpdate, id(), attribute->id());
+	
 	boost::posix_time::ptime startTime = boost::posix_time::microsec_clock::universal_time();
 	
-	update(attribute);
+	OutputCache::Fingerprint fingerprint;
+	bool cached = _outputCacheEnabled && OutputCache::enabled() && OutputCache::computeFingerprint(this, attribute, fingerprint);
+	
+	if(cached && OutputCache::restore(fingerprint, attribute)){
+		// update() is skipped, the slices still need to be set as it would have
+		resizeSlicesFromSlicer();
+	}
+	else{
+		update(attribute);
+		
+		if(cached){
+			OutputCache::store(fingerprint, attribute);
+		}
+	}
 	
 	boost::posix_time::ptime endTime = boost::posix_time::microsec_clock::universal_time();
 	boost::posix_time::time_period enlapsed(startTime, endTime);
@@ -221,12 +286,21 @@ void Node::doUpdate(Attribute *attribute){
 	_computeTimeSeconds = enlapsed.length().total_seconds();
 	_computeTimeMilliseconds = enlapsed.length().total_milliseconds() % 1000;
 	_computeTimeTicks = enlapsed.length().ticks();
+	
+	if(Tracer::capturing()){
+		Tracer::recordEvent(Tracer::eventTypeValueSize, attribute->id(), Tracer::threadId(), Tracer::time(), 0, attribute->outValue()->sizeInBytes());
+	}
 }
 
 void Node::updateSlice(Attribute *attribute, unsigned int slice){
 }
 
 void Node::update(Attribute *attribute){
+	resizeSlicesFromSlicer();
+	updateSlices(attribute);
+}
+
+void Node::resizeSlicesFromSlicer(){
 	if(_slicer){ // this node is nested in a slicer node such as the ForLoop node and this node is supposed to be sliced
 		// here we resize the slices for the output attributes so that the node can put values in each slice.
 
@@ -239,11 +313,16 @@ void Node::update(Attribute *attribute){
 			_slices = slices;
 			resizedSlices(slices);
 		}
+	}
+}
 
+void Node::updateSlices(Attribute *attribute){
+	if(_slicer){
 		#ifdef CORAL_PARALLEL_TBB
 			tbb::parallel_for(tbb::blocked_range<size_t>(0, _slices), node_parallelUpdate(this, attribute));
 		#else
 			for(int i = 0; i < _slices; ++i){
+				TraceScope traceScope(Tracer::eventTypeNodeSlice, id(), i);
 				updateSlice(attribute, i);
 			}
 		#endif
@@ -253,6 +332,10 @@ void Node::update(Attribute *attribute){
 	}
 }
 
+bool Node::arrayFusionStage(Attribute *attribute, ArrayFusionStage &stage){
+	return false;
+}
+
 Node *Node::parent(){
 	return (Node*)parentObject();
 }
@@ -321,40 +404,11 @@ const std::vector<Attribute*> &Node::outputAttributes(){
 }
 
 Node *Node::findNode(const std::string &name){
-	Node *foundNode = 0;
-	for(std::vector<Node*>::iterator it = _nodes.begin(); it != _nodes.end(); ++it){
-		Node *node = *it;
-		if(node->name() == name){
-			foundNode = node;
-			break;
-		}
-	}
-	
-	return foundNode;
+	return dynamic_cast<Node*>(findObject(name));
 }
 
 Attribute *Node::findAttribute(const std::string &name){
-	Attribute *foundAttribute = 0;
-	
-	for(std::vector<Attribute*>::iterator it = _inputAttributes.begin(); it != _inputAttributes.end(); ++it){
-		Attribute *attribute = *it;
-		if(attribute->name() == name){
-			foundAttribute = attribute;
-			break;
-		}
-	}
-	
-	if(foundAttribute == 0){
-		for(std::vector<Attribute*>::iterator it = _outputAttributes.begin(); it != _outputAttributes.end(); ++it){
-			Attribute *attribute = *it;
-			if(attribute->name() == name){
-				foundAttribute = attribute;
-				break;
-			}
-		}
-	}
-	
-	return foundAttribute;
+	return dynamic_cast<Attribute*>(findObject(name));
 }
 
 void Node::deleteIt(){
@@ -428,7 +482,7 @@ void Node::setAttributeIsClean(Attribute *attribute, bool value){
 
 void Node::addDynamicAttribute(Attribute *attribute){
 	if(_allowDynamicAttributes){
-		if(containerUtils::elementInContainer(attribute, attributes()) && containerUtils::elementInContainer(attribute, _dynamicAttributes) == false){
+		if(containsAttribute(attribute) && containerUtils::elementInContainer(attribute, _dynamicAttributes) == false){
 	        _dynamicAttributes.push_back(attribute);
 		}
 	}
@@ -33,6 +33,7 @@
 #include <vector>
 #include <map>
 #include <iostream>
+#include <boost/unordered_set.hpp>
 #include "NestedObject.h"
 #include "Value.h"
 
@@ -41,6 +42,7 @@ class Attribute;
 class NodeAccessor;
 class SpecializationLink;
 class node_parallelUpdate;
+struct ArrayFusionStage;
 
 
 //! The base class to all nodes.
@@ -60,6 +62,7 @@ public:
 	void removeNode(Node *node);
 	void removeAttribute(Attribute *attribute);
 	bool containsNode(Node *node);
+	bool containsAttribute(Attribute *attribute);
 	std::vector <Node*> nodes();
 	const std::vector<Attribute*> &inputAttributes();
 	const std::vector<Attribute*> &outputAttributes();
@@ -93,6 +96,27 @@ public:
 	//! Returns the specialization for attribute should this node be set on preset.
 	std::string attributeSpecializationPreset(const std::string &preset, Attribute *attribute);	
 
+	//! Allows the outputs of this node to be restored from the OutputCache rather than calling update() when its inputs match an already computed state.
+	//! Only nodes whose outputs depend exclusively on their inputs should enable this, the OutputCache must be enabled too for this to have any effect.
+	void setOutputCacheEnabled(bool value);
+	bool outputCacheEnabled();
+	
+	//! Allows this node to skip its update when none of the values affecting an output changed since the output was last computed, 
+	//! only nodes whose outputs depend exclusively on their inputs should enable this, builtin nodes computing pure functions of their inputs do so in their constructor. 
+	//! Values that don't track their changes get a new version from every update, see Value::version().
+	//! A change of specialization always updates the node again.
+	void setEarlyCutoffEnabled(bool value);
+	bool earlyCutoffEnabled();
+	
+	//! Turns the early cutoff off for every node regardless of the per node setting, it's allowed by default.
+	static void setEarlyCutoffAllowed(bool value);
+	static bool earlyCutoffAllowed();
+	
+	//! Arrays larger than this are split in ranges processed in parallel by the array kernels of this node, see ParallelArrays.
+	//! -1, the default, uses ParallelArrays::grainSize(), 0 processes the arrays of this node in a single range.
+	void setArrayGrainSize(int size);
+	unsigned int arrayGrainSize();
+
 	//! Returns a python script to recreate all the nodes contained within this node.
 	//! This method will invoke the asScript() virtual method for each contained node, in order to recreate the content of this node.
 	std::string contentAsScript();
@@ -116,6 +140,15 @@ public:
 	virtual void addDynamicAttribute(Attribute *attribute);
 	virtual void removeDynamicAttribute(Attribute *attribute);
 	virtual void updateSlice(Attribute *attribute, unsigned int slice);
+	
+	//! This method is invoked by update() once the slices are resized, to compute all the slices of an attribute.
+	//! The default implementation invokes updateSlice() for each slice, reimplement it to compute the slices all at once.
+	virtual void updateSlices(Attribute *attribute);
+	
+	//! Element wise array nodes reimplement this method to describe the operation computing attribute and return true, see ArrayFusion.
+	//! Such nodes must then call ArrayFusion::update(this, attribute) at the start of their update and compute attribute only if it returns false.
+	//! The default implementation returns false, the node never takes part in fusion.
+	virtual bool arrayFusionStage(Attribute *attribute, ArrayFusionStage &stage);
 
 	//! This method is invoked before updateSlice if there is a change in the number of slices imposed by the slicer.
 	//! Overriding this method is often handy when a node has some internal data that needs to be sliced accordingly. 
@@ -157,12 +190,14 @@ protected:
 private:
 	friend class NodeAccessor;
 	friend class NetworkManager;
+	friend class NetworkFile;
 	friend class Attribute;
 	friend class node_parallelUpdate;
 	
 	std::string saveContentRecursive(bool thisIsRoot);
 	std::string saveNodeConnectionsScript(Node *node);
 	void doUpdate(Attribute *attribute);
+	void resizeSlicesFromSlicer();
 	std::string attrsVectorToStr(const std::vector<Attribute*> &vec);
 	void _attributeConnectionChanged(Attribute *attribute);
 	Node *findParentSlicer();
@@ -170,6 +205,7 @@ private:
 	std::vector<Attribute*> _outputAttributes;
 	std::vector<Attribute*> _inputAttributes;
 	std::vector<Attribute*> _dynamicAttributes;
+	boost::unordered_set<Attribute*> _attributesSet;
 	std::vector<Node*> _nodes;
 	std::map<std::string, std::map<int, std::string> > _specializationPresets; // _specializationPresets["presetName"][attr->id()] = "Int"
 	bool _isInvalid;
@@ -185,6 +221,11 @@ private:
 	bool _isSlicer;
 	Node *_slicer;
 	bool _sliceable;
+	bool _outputCacheEnabled;
+	bool _earlyCutoffEnabled;
+	int _arrayGrainSize;
+	
+	static bool _earlyCutoffAllowed;
 
 	Node();
 	Node(const Node &other);
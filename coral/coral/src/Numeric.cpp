@@ -26,41 +26,189 @@
 // SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 // </license>
 
+#include <cstring>
 #include <ImathMatrixAlgo.h>
+#include <boost/functional/hash.hpp>
 
 #include "Numeric.h"
 #include "stringUtils.h"
 
 using namespace coral;
 
-Numeric::Numeric():
-	_type(numericTypeAny),
-	_isArray(false),
-	_slices(1){
+namespace {
+	unsigned int valuesTypeSize(Numeric::Type valuesType){
+		if(valuesType == Numeric::numericTypeInt){
+			return sizeof(int);
+		}
+		else if(valuesType == Numeric::numericTypeFloat){
+			return sizeof(float);
+		}
+		else if(valuesType == Numeric::numericTypeVec3){
+			return sizeof(Imath::V3f);
+		}
+		else if(valuesType == Numeric::numericTypeCol4){
+			return sizeof(Imath::Color4f);
+		}
+		else if(valuesType == Numeric::numericTypeQuat){
+			return sizeof(Imath::Quatf);
+		}
+		else if(valuesType == Numeric::numericTypeMatrix44){
+			return sizeof(Imath::M44f);
+		}
+		
+		return 0;
+	}
+	
+	// arrays and single values of the same kind share the same values type
+	Numeric::Type valuesTypeOf(Numeric::Type type){
+		if(type == Numeric::numericTypeInt || type == Numeric::numericTypeIntArray){
+			return Numeric::numericTypeInt;
+		}
+		else if(type == Numeric::numericTypeFloat || type == Numeric::numericTypeFloatArray){
+			return Numeric::numericTypeFloat;
+		}
+		else if(type == Numeric::numericTypeVec3 || type == Numeric::numericTypeVec3Array){
+			return Numeric::numericTypeVec3;
+		}
+		else if(type == Numeric::numericTypeCol4 || type == Numeric::numericTypeCol4Array){
+			return Numeric::numericTypeCol4;
+		}
+		else if(type == Numeric::numericTypeQuat || type == Numeric::numericTypeQuatArray){
+			return Numeric::numericTypeQuat;
+		}
+		else if(type == Numeric::numericTypeMatrix44 || type == Numeric::numericTypeMatrix44Array){
+			return Numeric::numericTypeMatrix44;
+		}
+		
+		return Numeric::numericTypeAny;
+	}
+	
+	template<class T>
+	T defaultValue(){
+		return T(0);
+	}
+	
+	template<>
+	Imath::V3f defaultValue<Imath::V3f>(){
+		return Imath::V3f(0.0, 0.0, 0.0);
+	}
+	
+	template<>
+	Imath::Color4f defaultValue<Imath::Color4f>(){
+		return Imath::Color4f(1.0, 1.0, 1.0, 1.0);
+	}
 	
-	_intValuesSliced.resize(1);
-	_intValuesSliced[0].resize(1);
-	_intValuesSliced[0][0] = 0;
+	template<>
+	Imath::Quatf defaultValue<Imath::Quatf>(){
+		return Imath::Quatf(0.0, 0.0, 0.0, 1.0);
+	}
+	
+	template<>
+	Imath::M44f defaultValue<Imath::M44f>(){
+		return Imath::identity44f;
+	}
+	
+	template<class T>
+	void fillDefaultValues(char *values, unsigned int size){
+		T *typedValues = (T*)values;
+		T value = defaultValue<T>();
+		for(unsigned int i = 0; i < size; ++i){
+			typedValues[i] = value;
+		}
+	}
+	
+	void fillDefaultValues(Numeric::Type valuesType, char *values, unsigned int size){
+		if(valuesType == Numeric::numericTypeInt){
+			fillDefaultValues<int>(values, size);
+		}
+		else if(valuesType == Numeric::numericTypeFloat){
+			fillDefaultValues<float>(values, size);
+		}
+		else if(valuesType == Numeric::numericTypeVec3){
+			fillDefaultValues<Imath::V3f>(values, size);
+		}
+		else if(valuesType == Numeric::numericTypeCol4){
+			fillDefaultValues<Imath::Color4f>(values, size);
+		}
+		else if(valuesType == Numeric::numericTypeQuat){
+			fillDefaultValues<Imath::Quatf>(values, size);
+		}
+		else if(valuesType == Numeric::numericTypeMatrix44){
+			fillDefaultValues<Imath::M44f>(values, size);
+		}
+	}
+	
+	// Imath types are plain arrays of floats, serialize them as such.
+	void appendFloatComponents(std::string &data, const char *values, unsigned int size, unsigned int valueSize){
+		unsigned int components = valueSize / sizeof(float);
+		stringUtils::appendUInt32(data, size);
+		stringUtils::appendWords32(data, values, size * components);
+	}
+}
 
-	_floatValuesSliced.resize(1);
-	_floatValuesSliced[0].resize(1);
-	_floatValuesSliced[0][0] = 0.0;
+template<class T>
+T Numeric::valueAtSlice(unsigned int slice, unsigned int id){
+	NumericSpan<const T> values = valuesSpanSlice<T>(slice);
+	
+	int size = values.size();
+	if(id < size){
+		return values[id];
+	}
+	else if(size){
+		return values[size - 1];
+	}
+	
+	return defaultValue<T>();
+}
 
-	_vec3ValuesSliced.resize(1);
-	_vec3ValuesSliced[0].resize(1);
-	_vec3ValuesSliced[0][0] = Imath::V3f(0.0, 0.0, 0.0);
+template<class T>
+void Numeric::setValueAtSlice(unsigned int slice, unsigned int id, const T &value){
+	if(slice < storedSlices() && _valuesType == NumericValuesType<T>::type){
+		unsigned int size = 0;
+		const T *currentValues = (const T*)sliceValues(slice, size);
+		if(id < size && memcmp(&currentValues[id], &value, sizeof(T)) != 0){
+			T *values = (T*)resizeSliceValues(slice, size);
+			values[id] = value;
+			changed();
+		}
+	}
+}
 
-	_quatValuesSliced.resize(1);
-	_quatValuesSliced[0].resize(1);
-	_quatValuesSliced[0][0] = Imath::Quatf(0.0, 0.0, 0.0, 1.0);
+template<class T>
+std::vector<T> Numeric::valuesSlice(unsigned int slice){
+	if(_valuesType != NumericValuesType<T>::type){
+		return std::vector<T>(1, defaultValue<T>());
+	}
+	
+	NumericSpan<const T> values = valuesSpanSlice<T>(slice);
+	return std::vector<T>(values.data(), values.data() + values.size());
+}
 
-	_matrix44ValuesSliced.resize(1);
-	_matrix44ValuesSliced[0].resize(1);
-	_matrix44ValuesSliced[0][0] = Imath::identity44f;
+template<class T>
+void Numeric::setValuesSlice(unsigned int slice, const std::vector<T> &values){
+	// writing the same values again leaves the version of this value untouched
+	if(_valuesType == NumericValuesType<T>::type && slice < storedSlices()){
+		NumericSpan<const T> currentValues = valuesSpanSlice<T>(slice);
+		if(currentValues.size() == values.size() && (values.empty() || memcmp(currentValues.data(), &values[0], values.size() * sizeof(T)) == 0)){
+			return;
+		}
+	}
+	
+	NumericSpan<T> slicevec = resizeValuesSpanSlice<T>(slice, values.size());
+	if(slicevec.size()){
+		memcpy(slicevec.data(), &values[0], values.size() * sizeof(T));
+	}
+}
 
-	_col4ValuesSliced.resize(1);
-	_col4ValuesSliced[0].resize(1);
-	_col4ValuesSliced[0][0] = Imath::Color4f(1.0, 1.0, 1.0, 1.0);
+Numeric::Numeric():
+	_type(numericTypeAny),
+	_isArray(false),
+	_slices(1),
+	_valuesType(numericTypeAny),
+	_values(new std::vector<char>()){
+	
+	_sliceOffsets.resize(1, 0);
+	setTracksChanges(true);
 }
 
 void Numeric::copy(const Value *other){
@@ -69,160 +217,252 @@ void Numeric::copy(const Value *other){
 	if(otherNum){
 		_type = otherNum->_type;
 		_isArray = otherNum->_isArray;
+		_slices = otherNum->_slices;
 
-		_intValuesSliced = otherNum->_intValuesSliced;
-		_floatValuesSliced = otherNum->_floatValuesSliced;
-		_vec3ValuesSliced = otherNum->_vec3ValuesSliced;
-		_quatValuesSliced = otherNum->_quatValuesSliced;
-		_matrix44ValuesSliced = otherNum->_matrix44ValuesSliced;
-		_col4ValuesSliced = otherNum->_col4ValuesSliced;
+		_valuesType = otherNum->_valuesType;
+		_values = otherNum->_values;
+		_sliceOffsets = otherNum->_sliceOffsets;
+		_spilledValues = otherNum->_spilledValues;
+		_spilled = otherNum->_spilled;
+
+		packSlices(storedSlices());
+		changed();
 	}
 }
 
-bool Numeric::isArray(){
-	return _isArray;
+unsigned int Numeric::storedSlices() const{
+	return _sliceOffsets.size() - 1;
 }
 
-unsigned int Numeric::size(){
-	return sizeSlice(0);
-}
-
-unsigned int Numeric::sizeSlice(unsigned int slice){
-	if(slice >= _slices){
-		slice = _slices - 1;
-	}
-
-	if(_type == numericTypeAny){
+const char *Numeric::sliceValues(unsigned int slice, unsigned int &size) const{
+	size = 0;
+	
+	unsigned int slices = storedSlices();
+	if(slices == 0){
 		return 0;
 	}
-	else if(_type == numericTypeIntArray || _type == numericTypeInt){
-		return _intValuesSliced[slice].size();
+	
+	if(slice >= slices){
+		slice = slices - 1;
 	}
-	else if(_type == numericTypeFloatArray || _type == numericTypeFloat){
-		return _floatValuesSliced[slice].size();
+	
+	unsigned int valueSize = valuesTypeSize(_valuesType);
+	if(_spilled.size() && _spilled[slice]){
+		const std::vector<char> &spilledValues = _spilledValues[slice];
+		size = spilledValues.size() / valueSize;
+		
+		return size ? &spilledValues[0] : 0;
 	}
-	else if(_type == numericTypeVec3Array || _type == numericTypeVec3){
-		return _vec3ValuesSliced[slice].size();
+	
+	size = _sliceOffsets[slice + 1] - _sliceOffsets[slice];
+	
+	return size ? &(*_values)[std::size_t(_sliceOffsets[slice]) * valueSize] : 0;
+}
+
+bool Numeric::ownsValues() const{
+	return _values.unique();
+}
+
+char *Numeric::resizeSliceValues(unsigned int slice, unsigned int size){
+	unsigned int oldSize = 0;
+	char *oldValues = (char*)sliceValues(slice, oldSize);
+	bool spilled = _spilled.size() && _spilled[slice];
+	if(size == oldSize && (spilled || ownsValues())){
+		return oldValues;
 	}
-	else if(_type == numericTypeQuatArray || _type == numericTypeQuat){
-		return _quatValuesSliced[slice].size();
+	
+	if(size != oldSize){
+		changed();
+	}
+	
+	unsigned int valueSize = valuesTypeSize(_valuesType);
+	unsigned int keptSize = oldSize < size ? oldSize : size;
+	if(storedSlices() == 1){
+		if(!ownsValues()){
+			_values.reset(new std::vector<char>(oldValues, oldValues + std::size_t(keptSize) * valueSize));
+		}
+		
+		_values->resize(std::size_t(size) * valueSize);
+		_sliceOffsets[1] = size;
+		if(size > oldSize){
+			fillDefaultValues(_valuesType, &(*_values)[std::size_t(oldSize) * valueSize], size - oldSize);
+		}
+		
+		return size ? &(*_values)[0] : 0;
 	}
-	else if(_type == numericTypeMatrix44Array || _type == numericTypeMatrix44){
-		return _matrix44ValuesSliced[slice].size();
+	
+	// Sibling slices might be computed concurrently by a sliced node and the buffer might be shared with another Numeric, 
+	// rather than moving or copying the whole buffer this slice is kept aside until the next packSlices().
+	std::vector<char> &spilledValues = _spilledValues[slice];
+	if(!spilled){
+		spilledValues.assign(oldValues, oldValues + std::size_t(keptSize) * valueSize);
+		_spilled[slice] = 1;
 	}
-	else if(_type == numericTypeCol4Array || _type == numericTypeCol4){
-		return _col4ValuesSliced[slice].size();
+	
+	spilledValues.resize(std::size_t(size) * valueSize);
+	if(size > oldSize){
+		fillDefaultValues(_valuesType, &spilledValues[std::size_t(oldSize) * valueSize], size - oldSize);
 	}
-
-	return 0;
-}
-
-Numeric::Type Numeric::type(){
-	return _type;
+	
+	return size ? &spilledValues[0] : 0;
 }
 
-void Numeric::setType(Numeric::Type type){
-	_type = type;
-	_isArray = false;
+void Numeric::packSlices(unsigned int slices, unsigned int minimumSize, unsigned int maximumSize){
+	unsigned int valueSize = valuesTypeSize(_valuesType);
+	if(valueSize == 0){
+		return;
+	}
 	
-	if(type == numericTypeInt){
-		_intValuesSliced.resize(_slices);
-		for(int i = 0; i < _slices; ++i){
-			_intValuesSliced[i].resize(1);
+	if(slices == storedSlices()){
+		bool packed = true;
+		for(int i = 0; i < slices; ++i){
+			unsigned int size = _sliceOffsets[i + 1] - _sliceOffsets[i];
+			if((_spilled.size() && _spilled[i]) || size < minimumSize || size > maximumSize){
+				packed = false;
+				break;
+			}
+		}
+		
+		if(packed){
+			return;
 		}
 	}
-	else if(type == numericTypeIntArray){
-		_intValuesSliced.resize(_slices);
-		_isArray = true;
-	}
-	else if(type == numericTypeFloat){
-		_floatValuesSliced.resize(_slices);
-		for(int i = 0; i < _slices; ++i){
-			_floatValuesSliced[i].resize(1);
+	
+	bool resized = slices != storedSlices();
+	std::vector<unsigned int> sliceOffsets(slices + 1, 0);
+	for(int i = 0; i < slices; ++i){
+		unsigned int size = 0;
+		if(i < storedSlices()){
+			sliceValues(i, size);
+		}
+		
+		unsigned int newSize = size;
+		if(newSize < minimumSize){
+			newSize = minimumSize;
 		}
+		else if(newSize > maximumSize){
+			newSize = maximumSize;
+		}
+		
+		if(newSize != size){
+			resized = true;
+		}
+		
+		sliceOffsets[i + 1] = sliceOffsets[i] + newSize;
 	}
-	else if(type == numericTypeFloatArray){
-		_floatValuesSliced.resize(_slices);
-		_isArray = true;
+	
+	if(resized){
+		changed();
 	}
-	else if(type == numericTypeVec3){
-		_vec3ValuesSliced.resize(_slices);
-		for(int i = 0; i < _slices; ++i){
-			_vec3ValuesSliced[i].resize(1);
+	
+	boost::shared_ptr<std::vector<char> > values(new std::vector<char>(std::size_t(sliceOffsets[slices]) * valueSize));
+	for(int i = 0; i < slices; ++i){
+		unsigned int newSize = sliceOffsets[i + 1] - sliceOffsets[i];
+		if(newSize == 0){
+			continue;
+		}
+		
+		unsigned int size = 0;
+		const char *oldValues = 0;
+		if(i < storedSlices()){
+			oldValues = sliceValues(i, size);
+		}
+		
+		char *newValues = &(*values)[std::size_t(sliceOffsets[i]) * valueSize];
+		unsigned int keptSize = size < newSize ? size : newSize;
+		if(keptSize){
+			memcpy(newValues, oldValues, std::size_t(keptSize) * valueSize);
+		}
+		
+		if(newSize > keptSize){
+			fillDefaultValues(_valuesType, newValues + std::size_t(keptSize) * valueSize, newSize - keptSize);
 		}
 	}
-	else if(type == numericTypeVec3Array){
-		_vec3ValuesSliced.resize(_slices);
-		_isArray = true;
+	
+	_values = values;
+	_sliceOffsets.swap(sliceOffsets);
+	
+	std::vector<std::vector<char> >().swap(_spilledValues);
+	_spilled.clear();
+	if(slices > 1){
+		_spilledValues.resize(slices);
+		_spilled.resize(slices, 0);
 	}
-	else if(type == numericTypeQuat){
-		_quatValuesSliced.resize(_slices);
-		for(int i = 0; i < _slices; ++i){
-			_quatValuesSliced[i].resize(1);
-		}
+}
+
+void Numeric::resetValues(Type valuesType){
+	_valuesType = valuesType;
+	_values.reset(new std::vector<char>());
+	_sliceOffsets.assign(1, 0);
+	std::vector<std::vector<char> >().swap(_spilledValues);
+	_spilled.clear();
+	changed();
+}
+
+void Numeric::prepareSingleSlice(Type valuesType){
+	if(valuesType != _valuesType){
+		resetValues(valuesType);
 	}
-	else if(type == numericTypeQuatArray){
-		_quatValuesSliced.resize(_slices);
-		_isArray = true;
+	
+	packSlices(1);
+}
+
+bool Numeric::isArray(){
+	return _isArray;
+}
+
+unsigned int Numeric::size(){
+	return sizeSlice(0);
+}
+
+unsigned int Numeric::sizeSlice(unsigned int slice){
+	if(_type == numericTypeAny || valuesTypeOf(_type) != _valuesType){
+		return 0;
 	}
-	else if(type == numericTypeMatrix44){
-		_matrix44ValuesSliced.resize(_slices);
-		for(int i = 0; i < _slices; ++i){
-			_matrix44ValuesSliced[i].resize(1);
-		}
+	
+	unsigned int size = 0;
+	sliceValues(slice, size);
+	
+	return size;
+}
+
+Numeric::Type Numeric::type(){
+	return _type;
+}
+
+void Numeric::setType(Numeric::Type type){
+	if(type != _type){
+		changed();
 	}
-	else if(type == numericTypeMatrix44Array){
-		_matrix44ValuesSliced.resize(_slices);
-		_isArray = true;
+	
+	_type = type;
+	_isArray = isArrayType(type);
+	
+	Type valuesType = valuesTypeOf(type);
+	if(valuesType == numericTypeAny){
+		return;
 	}
-	else if(type == numericTypeCol4){
-		_col4ValuesSliced.resize(_slices);
-		for(int i = 0; i < _slices; ++i){
-			_col4ValuesSliced[i].resize(1);
-		}
+	
+	if(valuesType != _valuesType){
+		resetValues(valuesType);
+		packSlices(1, 1);
 	}
-	else if(type == numericTypeCol4Array){
-		_col4ValuesSliced.resize(_slices);
-		_isArray = true;
+	
+	if(_isArray){
+		packSlices(_slices);
+	}
+	else{
+		packSlices(_slices, 1, 1);
 	}
 }
 
 void Numeric::resize(unsigned int newSize){
-	resizeSlice(0, newSize);
+	packSlices(storedSlices(), newSize, newSize);
 }
 
 void Numeric::resizeSlice(unsigned int slice, unsigned int newSize){
-	if(_type != numericTypeAny){
-		if(_type == numericTypeInt || _type == numericTypeIntArray){
-			for(int i = 0; i < _intValuesSliced.size(); ++i){
-				_intValuesSliced[i].resize(newSize);
-			}
-		}
-		else if(_type == numericTypeFloat || _type == numericTypeFloatArray){
-			for(int i = 0; i < _floatValuesSliced.size(); ++i){
-				_floatValuesSliced[i].resize(newSize);
-			}
-		}
-		else if(_type == numericTypeVec3 || _type == numericTypeVec3Array){
-			for(int i = 0; i < _vec3ValuesSliced.size(); ++i){
-				_vec3ValuesSliced[i].resize(newSize);
-			}
-		}
-		else if(_type == numericTypeQuat || _type == numericTypeQuatArray){
-			for(int i = 0; i < _quatValuesSliced.size(); ++i){
-				_quatValuesSliced[i].resize(newSize);
-			}
-		}
-		else if(_type == numericTypeMatrix44 || _type == numericTypeMatrix44Array){
-			for(int i = 0; i < _matrix44ValuesSliced.size(); ++i){
-				_matrix44ValuesSliced[i].resize(newSize);
-			}
-		}
-		else if(_type == numericTypeCol4 || _type == numericTypeCol4Array){
-			for(int i = 0; i < _col4ValuesSliced.size(); ++i){
-				_col4ValuesSliced[i].resize(newSize);
-			}
-		}
+	if(_type != numericTypeAny && slice < storedSlices()){
+		resizeSliceValues(slice, newSize);
 	}
 }
 
@@ -267,28 +507,28 @@ void Numeric::setMatrix44ValueAt(unsigned int id, const Imath::M44f &value){
 	setMatrix44ValueAtSlice(0, id, value);
 }
 
-const std::vector<int> &Numeric::intValues(){
-	return _intValuesSliced[0];
+std::vector<int> Numeric::intValues(){
+	return intValuesSlice(0);
 }
 
-const std::vector<float> &Numeric::floatValues(){
-	return _floatValuesSliced[0];
+std::vector<float> Numeric::floatValues(){
+	return floatValuesSlice(0);
 }
 
-const std::vector<Imath::V3f> &Numeric::vec3Values(){
-	return _vec3ValuesSliced[0];
+std::vector<Imath::V3f> Numeric::vec3Values(){
+	return vec3ValuesSlice(0);
 }
 
-const std::vector<Imath::Color4f> &Numeric::col4Values(){
-	return _col4ValuesSliced[0];
+std::vector<Imath::Color4f> Numeric::col4Values(){
+	return col4ValuesSlice(0);
 }
 
-const std::vector<Imath::Quatf> &Numeric::quatValues(){
-	return _quatValuesSliced[0];
+std::vector<Imath::Quatf> Numeric::quatValues(){
+	return quatValuesSlice(0);
 }
 
-const std::vector<Imath::M44f> &Numeric::matrix44Values(){
-	return _matrix44ValuesSliced[0];
+std::vector<Imath::M44f> Numeric::matrix44Values(){
+	return matrix44ValuesSlice(0);
 }
 
 int Numeric::intValueAt(unsigned int id){
@@ -344,16 +584,13 @@ std::string Numeric::sliceAsString(unsigned int slice){
 
 	if(_type != numericTypeAny){
 		std::ostringstream stream;
-		
-		if(slice >= _slices){
-			slice = _slices - 1;
-		}
 
 		if(_type == numericTypeInt || _type == numericTypeIntArray){
-			for(int i = 0; i < _intValuesSliced[slice].size(); ++i){
-				stream << _intValuesSliced[slice][i];
+			NumericSpan<const int> values = valuesSpanSlice<int>(slice);
+			for(int i = 0; i < values.size(); ++i){
+				stream << values[i];
 				
-				if(i < _intValuesSliced[slice].size() - 1){
+				if(i < values.size() - 1){
 					stream << ",";
 				}
 				
@@ -362,10 +599,11 @@ std::string Numeric::sliceAsString(unsigned int slice){
 			}
 		}
 		else if(_type == numericTypeFloat || _type == numericTypeFloatArray){
-			for(int i = 0; i < _floatValuesSliced[slice].size(); ++i){
-				stream << _floatValuesSliced[slice][i];
+			NumericSpan<const float> values = valuesSpanSlice<float>(slice);
+			for(int i = 0; i < values.size(); ++i){
+				stream << values[i];
 				
-				if(i < _floatValuesSliced[slice].size() - 1){
+				if(i < values.size() - 1){
 					stream << ",";
 				}
 				
@@ -374,15 +612,16 @@ std::string Numeric::sliceAsString(unsigned int slice){
 			}
 		}
 		else if(_type == numericTypeVec3 || _type == numericTypeVec3Array){
-			for(int i = 0; i < _vec3ValuesSliced[slice].size(); ++i){
+			NumericSpan<const Imath::V3f> values = valuesSpanSlice<Imath::V3f>(slice);
+			for(int i = 0; i < values.size(); ++i){
 				stream << "(";
-				Imath::V3f *vec = &_vec3ValuesSliced[slice][i];
+				const Imath::V3f *vec = &values[i];
 
 				stream << vec->x << ",";
 				stream << vec->y << ",";
 				stream << vec->z << ")";
 				
-				if(i < _vec3ValuesSliced[slice].size() - 1){
+				if(i < values.size() - 1){
 					stream << ",";
 				}
 				
@@ -391,16 +630,17 @@ std::string Numeric::sliceAsString(unsigned int slice){
 			}
 		}
 		else if(_type == numericTypeCol4 || _type == numericTypeCol4Array){
-			for(int i = 0; i < _col4ValuesSliced[slice].size(); ++i){
+			NumericSpan<const Imath::Color4f> values = valuesSpanSlice<Imath::Color4f>(slice);
+			for(int i = 0; i < values.size(); ++i){
 				stream << "(";
-				Imath::Color4f *col = &_col4ValuesSliced[slice][i];
+				const Imath::Color4f *col = &values[i];
 
 				stream << col->r << ",";
 				stream << col->g << ",";
 				stream << col->b << ",";
 				stream << col->a << ")";
 
-				if(i < _col4ValuesSliced[slice].size() - 1){
+				if(i < values.size() - 1){
 					stream << ",";
 				}
 
@@ -409,16 +649,17 @@ std::string Numeric::sliceAsString(unsigned int slice){
 			}
 		}
 		else if(_type == numericTypeQuat || _type == numericTypeQuatArray){
-			for(int i = 0; i < _quatValuesSliced[slice].size(); ++i){
+			NumericSpan<const Imath::Quatf> values = valuesSpanSlice<Imath::Quatf>(slice);
+			for(int i = 0; i < values.size(); ++i){
 				stream << "(";
-				Imath::Quatf *quat = &_quatValuesSliced[slice][i];
+				const Imath::Quatf *quat = &values[i];
 
 				stream << quat->r << ",";
 				stream << quat->v.x << ",";
 				stream << quat->v.y << ",";
 				stream << quat->v.z << ")";
 
-				if(i < _quatValuesSliced[slice].size() - 1){
+				if(i < values.size() - 1){
 					stream << ",";
 				}
 
@@ -427,9 +668,10 @@ std::string Numeric::sliceAsString(unsigned int slice){
 			}
 		}
 		else if(_type == numericTypeMatrix44 || _type == numericTypeMatrix44Array){
-			for(int i = 0; i < _matrix44ValuesSliced[slice].size(); ++i){
+			NumericSpan<const Imath::M44f> values = valuesSpanSlice<Imath::M44f>(slice);
+			for(int i = 0; i < values.size(); ++i){
 				stream << "(";
-				Imath::M44f *mat = &_matrix44ValuesSliced[slice][i];
+				const Imath::M44f *mat = &values[i];
 				
 				stream << mat->x[0][0] << ",";
 				stream << mat->x[0][1] << ",";
@@ -448,7 +690,7 @@ std::string Numeric::sliceAsString(unsigned int slice){
 				stream << mat->x[3][2] << ",";
 				stream << mat->x[3][3] << ")";
 				
-				if(i < _matrix44ValuesSliced.size() - 1){
+				if(i < values.size() - 1){
 					stream << ",";
 				}
 				
@@ -466,6 +708,28 @@ std::string Numeric::sliceAsString(unsigned int slice){
 	return script;
 }
 
+void Numeric::copySlice(unsigned int slice, const Numeric *other){
+	if(other == this || _valuesType == numericTypeAny || _valuesType != other->_valuesType || slice >= storedSlices()){
+		return;
+	}
+	
+	if(storedSlices() == 1 && other->storedSlices() == 1){
+		_values = other->_values;
+		_sliceOffsets = other->_sliceOffsets;
+		
+		return;
+	}
+	
+	unsigned int size = 0;
+	const char *values = other->sliceValues(slice, size);
+	char *copiedValues = resizeSliceValues(slice, size);
+	if(size){
+		memcpy(copiedValues, values, std::size_t(size) * valuesTypeSize(_valuesType));
+	}
+	
+	changed();
+}
+
 std::string Numeric::asString(){
 	return sliceAsString(0);
 }
@@ -480,30 +744,33 @@ void Numeric::setFromString(const std::string &value){
 		Numeric::Type type = Numeric::Type(stringUtils::parseInt(fields[1]));
 		
 		if(type == Numeric::numericTypeInt || type == Numeric::numericTypeIntArray){
-			_intValuesSliced.resize(1);
-			_intValuesSliced[0].clear();
+			std::vector<int> parsedValues;
 
 			std::vector<std::string> values;
 			stringUtils::split(valuesStr, values, ",");
 			for(int i = 0; i < values.size(); ++i){
 				int value = stringUtils::parseInt(values[i]);
-				_intValuesSliced[0].push_back(value);
+				parsedValues.push_back(value);
 			}
+
+			prepareSingleSlice(numericTypeInt);
+			setValuesSlice(0, parsedValues);
 		}
 		else if(type == Numeric::numericTypeFloat || type == Numeric::numericTypeFloatArray){
-			_floatValuesSliced.resize(1);
-			_floatValuesSliced[0].clear();
+			std::vector<float> parsedValues;
 
 			std::vector<std::string> values;
 			stringUtils::split(valuesStr, values, ",");
 			for(int i = 0; i < values.size(); ++i){
 				float value = stringUtils::parseFloat(values[i]);
-				_floatValuesSliced[0].push_back(value);
+				parsedValues.push_back(value);
 			}
+
+			prepareSingleSlice(numericTypeFloat);
+			setValuesSlice(0, parsedValues);
 		}
 		else if(type == Numeric::numericTypeVec3 || type == Numeric::numericTypeVec3Array){
-			_vec3ValuesSliced.resize(1);
-			_vec3ValuesSliced[0].clear();
+			std::vector<Imath::V3f> parsedValues;
 			
 			std::vector<std::string> values;
 			stringUtils::split(valuesStr, values, "),(");
@@ -519,13 +786,15 @@ void Numeric::setFromString(const std::string &value){
 					float z = stringUtils::parseFloat(numericValues[2]);
 					
 					Imath::V3f vec(x, y, z);
-					_vec3ValuesSliced[0].push_back(vec);
+					parsedValues.push_back(vec);
 				}
 			}
+
+			prepareSingleSlice(numericTypeVec3);
+			setValuesSlice(0, parsedValues);
 		}
 		else if(type == Numeric::numericTypeQuat || type == Numeric::numericTypeQuatArray){
-			_quatValuesSliced.resize(1);
-			_quatValuesSliced[0].clear();
+			std::vector<Imath::Quatf> parsedValues;
 
 			std::vector<std::string> values;
 			stringUtils::split(valuesStr, values, "),(");
@@ -542,13 +811,15 @@ void Numeric::setFromString(const std::string &value){
 					float z = stringUtils::parseFloat(numericValues[3]);
 
 					Imath::Quatf vec(r, x, y, z);
-					_quatValuesSliced[0].push_back(vec);
+					parsedValues.push_back(vec);
 				}
 			}
+
+			prepareSingleSlice(numericTypeQuat);
+			setValuesSlice(0, parsedValues);
 		}
 		else if(type == Numeric::numericTypeMatrix44 || type == Numeric::numericTypeMatrix44Array){
-			_matrix44ValuesSliced.resize(1);
-			_matrix44ValuesSliced[0].clear();
+			std::vector<Imath::M44f> parsedValues;
 			
 			std::vector<std::string> values;
 			stringUtils::split(valuesStr, values, "),(");
@@ -565,13 +836,15 @@ void Numeric::setFromString(const std::string &value){
 						stringUtils::parseFloat(numericValues[8]), stringUtils::parseFloat(numericValues[9]), stringUtils::parseFloat(numericValues[10]), stringUtils::parseFloat(numericValues[11]), 
 						stringUtils::parseFloat(numericValues[12]), stringUtils::parseFloat(numericValues[13]), stringUtils::parseFloat(numericValues[14]), stringUtils::parseFloat(numericValues[15]));
 					
-					_matrix44ValuesSliced[0].push_back(matrix);
+					parsedValues.push_back(matrix);
 				}
 			}
+
+			prepareSingleSlice(numericTypeMatrix44);
+			setValuesSlice(0, parsedValues);
 		}
 		else if(type == Numeric::numericTypeCol4 || type == Numeric::numericTypeCol4Array){
-			_col4ValuesSliced.resize(1);
-			_col4ValuesSliced[0].clear();
+			std::vector<Imath::Color4f> parsedValues;
 			
 			std::vector<std::string> values;
 			stringUtils::split(valuesStr, values, "),(");
@@ -588,257 +861,110 @@ void Numeric::setFromString(const std::string &value){
 					float a = stringUtils::parseFloat(numericValues[3]);
 					
 					Imath::Color4f col(r, g, b, a);
-					_col4ValuesSliced[0].push_back(col);
+					parsedValues.push_back(col);
 				}
 			}
+
+			prepareSingleSlice(numericTypeCol4);
+			setValuesSlice(0, parsedValues);
 		}
 	}
 }
 
 void Numeric::setIntValueAtSlice(unsigned int slice, unsigned int id, int value){
-	if(slice < _intValuesSliced.size()){
-		std::vector<int> &slicevec = _intValuesSliced[slice];
-		if(id < slicevec.size()){
-			slicevec[id] = value;
-		}
-	}
+	setValueAtSlice(slice, id, value);
 }
 
 void Numeric::setFloatValueAtSlice(unsigned int slice, unsigned int id, float value){
-	if(slice < _floatValuesSliced.size()){
-		std::vector<float> &slicevec = _floatValuesSliced[slice];
-		if(id < slicevec.size()){
-			slicevec[id] = value;
-		}
-	}
+	setValueAtSlice(slice, id, value);
 }
 
 void Numeric::setVec3ValueAtSlice(unsigned int slice, unsigned int id, const Imath::V3f &value){
-	if(slice < _vec3ValuesSliced.size()){
-		std::vector<Imath::V3f> &slicevec = _vec3ValuesSliced[slice];
-		if(id < slicevec.size()){
-			slicevec[id] = value;
-		}
-	}
+	setValueAtSlice(slice, id, value);
 }
 
 void Numeric::setMatrix44ValueAtSlice(unsigned int slice, unsigned int id, const Imath::M44f &value){
-	if(slice < _matrix44ValuesSliced.size()){
-		std::vector<Imath::M44f> &slicevec = _matrix44ValuesSliced[slice];
-		if(id < slicevec.size()){
-			slicevec[id] = value;
-		}
-	}
+	setValueAtSlice(slice, id, value);
 }
 
 void Numeric::setCol4ValueAtSlice(unsigned int slice, unsigned int id, const Imath::Color4f &value){
-	if(slice < _col4ValuesSliced.size()){
-		std::vector<Imath::Color4f> &slicevec = _col4ValuesSliced[slice];
-		if(id < slicevec.size()){
-			slicevec[id] = value;
-		}
-	}
+	setValueAtSlice(slice, id, value);
 }
 
 void Numeric::setQuatValueAtSlice(unsigned int slice, unsigned int id, const Imath::Quatf &value){
-	if(slice < _quatValuesSliced.size()){
-		std::vector<Imath::Quatf> &slicevec = _quatValuesSliced[slice];
-		if(id < slicevec.size()){
-			slicevec[id] = value;
-		}
-	}
+	setValueAtSlice(slice, id, value);
 }
 
 int Numeric::intValueAtSlice(unsigned int slice, unsigned int id){
-	if(slice >= _intValuesSliced.size()){
-		slice = _intValuesSliced.size() - 1;
-	}
-
-	std::vector<int> &slicevec = _intValuesSliced[slice];
-
-	int size = slicevec.size();
-	if(id < size){
-		return slicevec[id];
-	}
-	else if(size){
-		return slicevec[size - 1];
-	}
-	
-	return 0;
+	return valueAtSlice<int>(slice, id);
 }
 
 float Numeric::floatValueAtSlice(unsigned int slice, unsigned int id){
-	if(slice >= _floatValuesSliced.size()){
-		slice = _floatValuesSliced.size() - 1;
-	}
-
-	std::vector<float> &slicevec = _floatValuesSliced[slice];
-
-	int size = slicevec.size();
-	if(id < size){
-		return slicevec[id];
-	}
-	else if(size){
-		return slicevec[size - 1];
-	}
-	
-	return 0.0;
+	return valueAtSlice<float>(slice, id);
 }
 
 Imath::V3f Numeric::vec3ValueAtSlice(unsigned int slice, unsigned int id){
-	if(slice >= _vec3ValuesSliced.size()){
-		slice = _vec3ValuesSliced.size() - 1;
-	}
-
-	std::vector<Imath::V3f> &slicevec = _vec3ValuesSliced[slice];
-
-	int size = slicevec.size();
-	if(id < size){
-		return slicevec[id];
-	}
-	else if(size){
-		return slicevec[size - 1];
-	}
-	
-	return Imath::V3f(0.0, 0.0, 0.0);
+	return valueAtSlice<Imath::V3f>(slice, id);
 }
 
 Imath::Color4f Numeric::col4ValueAtSlice(unsigned int slice, unsigned int id){
-	if(slice >= _col4ValuesSliced.size()){
-		slice = _col4ValuesSliced.size() - 1;
-	}
-
-	std::vector<Imath::Color4f> &slicevec = _col4ValuesSliced[slice];
-
-	int size = slicevec.size();
-	if(id < size){
-		return slicevec[id];
-	}
-	else if(size){
-		return slicevec[size - 1];
-	}
-	
-	return Imath::Color4f(1.0, 1.0, 1.0, 1.0);
+	return valueAtSlice<Imath::Color4f>(slice, id);
 }
 
 Imath::Quatf Numeric::quatValueAtSlice(unsigned int slice, unsigned int id){
-	if(slice >= _quatValuesSliced.size()){
-		slice = _quatValuesSliced.size() - 1;
-	}
-
-	std::vector<Imath::Quatf> &slicevec = _quatValuesSliced[slice];
-
-	int size = slicevec.size();
-	if(id < size){
-		return slicevec[id];
-	}
-	else if(size){
-		return slicevec[size - 1];
-	}
-	
-	return Imath::Quatf(0.0, 0.0, 0.0, 1.0);
+	return valueAtSlice<Imath::Quatf>(slice, id);
 }
 
 Imath::M44f Numeric::matrix44ValueAtSlice(unsigned int slice, unsigned int id){
-	if(slice >= _matrix44ValuesSliced.size()){
-		slice = _matrix44ValuesSliced.size() - 1;
-	}
-
-	std::vector<Imath::M44f> &slicevec = _matrix44ValuesSliced[slice];
-
-	int size = slicevec.size();
-	if(id < size){
-		return slicevec[id];
-	}
-	else if(size){
-		return slicevec[size - 1];
-	}
-	
-	return Imath::identity44f;
+	return valueAtSlice<Imath::M44f>(slice, id);
 }
 
 void Numeric::setIntValuesSlice(unsigned int slice, const std::vector<int> &values){
-	if(slice < _intValuesSliced.size()){
-		_intValuesSliced[slice] = values;
-	}
+	setValuesSlice(slice, values);
 }
 
 void Numeric::setFloatValuesSlice(unsigned int slice, const std::vector<float> &values){
-	if(slice < _floatValuesSliced.size()){
-		_floatValuesSliced[slice] = values;
-	}
+	setValuesSlice(slice, values);
 }
 
 void Numeric::setVec3ValuesSlice(unsigned int slice, const std::vector<Imath::V3f> &values){
-	if(slice < _vec3ValuesSliced.size()){
-		_vec3ValuesSliced[slice] = values;
-	}
+	setValuesSlice(slice, values);
 }
 
 void Numeric::setQuatValuesSlice(unsigned int slice, const std::vector<Imath::Quatf> &values){
-	if(slice < _quatValuesSliced.size()){
-		_quatValuesSliced[slice] = values;
-	}
+	setValuesSlice(slice, values);
 }
 
 void Numeric::setCol4ValuesSlice(unsigned int slice, const std::vector<Imath::Color4f> &values){
-	if(slice < _col4ValuesSliced.size()){
-		_col4ValuesSliced[slice] = values;
-	}
+	setValuesSlice(slice, values);
 }
 
 void Numeric::setMatrix44ValuesSlice(unsigned int slice, const std::vector<Imath::M44f> &values){
-	if(slice < _matrix44ValuesSliced.size()){
-		_matrix44ValuesSliced[slice] = values;
-	}
+	setValuesSlice(slice, values);
 }
 
-const std::vector<int> &Numeric::intValuesSlice(unsigned int slice){
-	if(slice >= _intValuesSliced.size()){
-		slice = _intValuesSliced.size() - 1;
-	}
-
-	return _intValuesSliced[slice];
+std::vector<int> Numeric::intValuesSlice(unsigned int slice){
+	return valuesSlice<int>(slice);
 }
 
-const std::vector<float> &Numeric::floatValuesSlice(unsigned int slice){
-	if(slice >= _floatValuesSliced.size()){
-		slice = _floatValuesSliced.size() - 1;
-	}
-
-	return _floatValuesSliced[slice];
+std::vector<float> Numeric::floatValuesSlice(unsigned int slice){
+	return valuesSlice<float>(slice);
 }
 
-const std::vector<Imath::V3f> &Numeric::vec3ValuesSlice(unsigned int slice){
-	if(slice >= _vec3ValuesSliced.size()){
-		slice = _vec3ValuesSliced.size() - 1;
-	}
-
-	return _vec3ValuesSliced[slice];
+std::vector<Imath::V3f> Numeric::vec3ValuesSlice(unsigned int slice){
+	return valuesSlice<Imath::V3f>(slice);
 }
 
-const std::vector<Imath::Color4f> &Numeric::col4ValuesSlice(unsigned int slice){
-	if(slice >= _col4ValuesSliced.size()){
-		slice = _col4ValuesSliced.size() - 1;
-	}
-
-	return _col4ValuesSliced[slice];
+std::vector<Imath::Color4f> Numeric::col4ValuesSlice(unsigned int slice){
+	return valuesSlice<Imath::Color4f>(slice);
 }
 
-const std::vector<Imath::Quatf> &Numeric::quatValuesSlice(unsigned int slice){
-	if(slice >= _quatValuesSliced.size()){
-		slice = _quatValuesSliced.size() - 1;
-	}
-
-	return _quatValuesSliced[slice];
+std::vector<Imath::Quatf> Numeric::quatValuesSlice(unsigned int slice){
+	return valuesSlice<Imath::Quatf>(slice);
 }
 
-const std::vector<Imath::M44f> &Numeric::matrix44ValuesSlice(unsigned int slice){
-	if(slice >= _matrix44ValuesSliced.size()){
-		slice = _matrix44ValuesSliced.size() - 1;
-	}
-
-	return _matrix44ValuesSliced[slice];
+std::vector<Imath::M44f> Numeric::matrix44ValuesSlice(unsigned int slice){
+	return valuesSlice<Imath::M44f>(slice);
 }
 
 void Numeric::resizeSlices(unsigned int slices){
@@ -846,80 +972,143 @@ void Numeric::resizeSlices(unsigned int slices){
 		slices = 1;
 	}
 
-	if(slices != _slices && _type != numericTypeAny){
-		if(_type == numericTypeInt){
-			_intValuesSliced.resize(slices);
-			for(int i = 0; i < slices; ++i){
-				std::vector<int> &slicevec = _intValuesSliced[i];
-				if(!slicevec.size()){
-					slicevec.resize(1);
-				}
-			}
-		}
-		else if(_type == numericTypeIntArray){
-			_intValuesSliced.resize(slices);
-		}
-		else if(_type == numericTypeFloat){
-			_floatValuesSliced.resize(slices);
-			for(int i = 0; i < slices; ++i){
-				std::vector<float> &slicevec = _floatValuesSliced[i];
-				if(!slicevec.size()){
-					slicevec.resize(1);
-				}
-			}
-		}
-		else if(_type == numericTypeFloatArray){
-			_floatValuesSliced.resize(slices);
-		}
-		else if(_type == numericTypeVec3){
-			_vec3ValuesSliced.resize(slices);
-			for(int i = 0; i < slices; ++i){
-				std::vector<Imath::V3f> &slicevec = _vec3ValuesSliced[i];
-				if(!slicevec.size()){
-					slicevec.resize(1);
-				}
-			}
+	// this is invoked before each sliced update, a good time to pack the slices that were resized during the previous one
+	if(_type != numericTypeAny){
+		if(_isArray){
+			packSlices(slices);
 		}
-		else if(_type == numericTypeVec3Array){
-			_vec3ValuesSliced.resize(slices);
+		else{
+			packSlices(slices, 1);
 		}
-		else if(_type == numericTypeQuat){
-			_quatValuesSliced.resize(slices);
-			for(int i = 0; i < slices; ++i){
-				std::vector<Imath::Quatf> &slicevec = _quatValuesSliced[i];
-				if(!slicevec.size()){
-					slicevec.resize(1);
+
+		_slices = slices;
+	}
+}
+
+Value *Numeric::duplicate(){
+	Numeric *value = new Numeric();
+	value->copy(this);
+	
+	return value;
+}
+
+bool Numeric::isHashable(){
+	return true;
+}
+
+std::size_t Numeric::hash(){
+	std::size_t seed = 0;
+	boost::hash_combine(seed, (int)_type);
+	boost::hash_combine(seed, _isArray);
+	
+	if(_type != numericTypeAny && valuesTypeOf(_type) == _valuesType){
+		// Imath types are plain arrays of floats, hash them as such.
+		unsigned int components = valuesTypeSize(_valuesType) / sizeof(float);
+		for(int i = 0; i < storedSlices(); ++i){
+			unsigned int size = 0;
+			const char *values = sliceValues(i, size);
+			boost::hash_combine(seed, size);
+			if(size){
+				if(_valuesType == numericTypeInt){
+					const int *ints = (const int*)values;
+					boost::hash_range(seed, ints, ints + size);
 				}
-			}
-		}
-		else if(_type == numericTypeQuatArray){
-			_quatValuesSliced.resize(slices);
-		}
-		else if(_type == numericTypeMatrix44){
-			_matrix44ValuesSliced.resize(slices);
-			for(int i = 0; i < slices; ++i){
-				std::vector<Imath::M44f> &slicevec = _matrix44ValuesSliced[i];
-				if(!slicevec.size()){
-					slicevec.resize(1);
+				else{
+					const float *floats = (const float*)values;
+					boost::hash_range(seed, floats, floats + size * components);
 				}
 			}
 		}
-		else if(_type == numericTypeMatrix44Array){
-			_matrix44ValuesSliced.resize(slices);
+	}
+	
+	return seed;
+}
+
+bool Numeric::isEqual(Value *other){
+	Numeric *otherNumeric = dynamic_cast<Numeric*>(other);
+	if(otherNumeric == 0 || otherNumeric->_type != _type || otherNumeric->_isArray != _isArray){
+		return false;
+	}
+	
+	bool hasValues = _type != numericTypeAny && valuesTypeOf(_type) == _valuesType;
+	bool otherHasValues = _type != numericTypeAny && valuesTypeOf(_type) == otherNumeric->_valuesType;
+	if(hasValues != otherHasValues){
+		return false;
+	}
+	
+	if(hasValues){
+		if(storedSlices() != otherNumeric->storedSlices()){
+			return false;
 		}
-		else if(_type == numericTypeCol4){
-			_col4ValuesSliced.resize(slices);
-			for(int i = 0; i < slices; ++i){
-				std::vector<Imath::Color4f> &slicevec = _col4ValuesSliced[i];
-				if(!slicevec.size()){
-					slicevec.resize(1);
-				}
+		
+		unsigned int typeSize = valuesTypeSize(_valuesType);
+		for(int i = 0; i < storedSlices(); ++i){
+			unsigned int size = 0;
+			unsigned int otherSize = 0;
+			const char *values = sliceValues(i, size);
+			const char *otherValues = otherNumeric->sliceValues(i, otherSize);
+			if(size != otherSize || (size && values != otherValues && memcmp(values, otherValues, size * typeSize) != 0)){
+				return false;
 			}
 		}
-		else if(_type == numericTypeCol4Array){
-			_col4ValuesSliced.resize(slices);
-		}
+	}
+	
+	return true;
+}
 
-		_slices = slices;
+unsigned int Numeric::sizeInBytes(){
+	unsigned int size = sizeof(Numeric) + _values->size() + _sliceOffsets.size() * sizeof(unsigned int);
+	for(int i = 0; i < _spilledValues.size(); ++i){
+		size += _spilledValues[i].size();
+	}
+	
+	return size;
+}
+
+std::string Numeric::asBinary(){
+	std::string data;
+	if(_type == numericTypeAny || valuesTypeOf(_type) != _valuesType){
+		return data;
+	}
+	
+	stringUtils::appendUInt32(data, (unsigned int)_type);
+	
+	unsigned int size = 0;
+	const char *values = sliceValues(0, size);
+	if(_valuesType == numericTypeInt){
+		stringUtils::appendUInt32(data, size);
+		stringUtils::appendWords32(data, values, size);
+	}
+	else{
+		appendFloatComponents(data, values, size, valuesTypeSize(_valuesType));
 	}
+	
+	return data;
+}
+
+void Numeric::setFromBinary(const std::string &data){
+	unsigned int position = 0;
+	unsigned int typeValue = 0;
+	if(!stringUtils::readUInt32(data, position, typeValue)){
+		return;
+	}
+	
+	Numeric::Type valuesType = valuesTypeOf(Numeric::Type(typeValue));
+	unsigned int valueSize = valuesTypeSize(valuesType);
+	unsigned int size = 0;
+	if(valueSize == 0 || !stringUtils::readUInt32(data, position, size)){
+		return;
+	}
+	
+	// checked by division, a multiplication could wrap and let a huge size through
+	if(size > (data.size() - position) / valueSize){
+		return;
+	}
+	
+	prepareSingleSlice(valuesType);
+	char *values = resizeSliceValues(0, size);
+	changed();
+	
+	// ints and the float components of the other types are all 32 bit words
+	stringUtils::readWords32(data, position, values, size * (valueSize / 4));
 }
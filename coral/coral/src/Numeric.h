@@ -26,13 +26,12 @@
 // SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 // </license>
 
-
-
 #ifndef NUMERIC_H
 #define NUMERIC_H
 
 #include <cstdio> 
 #include <vector>
+#include <boost/shared_ptr.hpp>
 
 #include <ImathVec.h>
 #include <ImathColor.h>
@@ -43,9 +42,28 @@
 
 namespace coral{
 
-class NumericOperation;
+//! A typed view on the values stored in one slice of a Numeric, see Numeric::valuesSpanSlice().
+//! The view points inside the Numeric's own storage, it is invalidated by any call that resizes the Numeric or changes its type or slices.
+template<class T>
+class NumericSpan{
+public:
+	NumericSpan(): _data(0), _size(0){}
+	NumericSpan(T *data, unsigned int size): _data(data), _size(size){}
+	
+	T *data() const{return _data;}
+	unsigned int size() const{return _size;}
+	T &operator[](unsigned int id) const{return _data[id];}
+
+private:
+	T *_data;
+	unsigned int _size;
+};
 
 //! A dynamic class that wraps all the available numerical types, used by NumericAttribute.
+//
+//! Values of every slice are packed one after the other in a single buffer of the active type,
+//! _sliceOffsets tells where each slice starts and ends in that buffer.
+//! The buffer is shared by copy() and copySlice() and only copied when one of the Numerics sharing it is modified.
 class CORAL_EXPORT Numeric : public Value{
 
 public:
@@ -78,12 +96,14 @@ public:
 	void setCol4ValueAt(unsigned int id, const Imath::Color4f &value);
 	void setQuatValueAt(unsigned int id, const Imath::Quatf &value);
 	void setMatrix44ValueAt(unsigned int id, const Imath::M44f &value);
-	const std::vector<int> &intValues();
-	const std::vector<float> &floatValues();
-	const std::vector<Imath::V3f> &vec3Values();
-	const std::vector<Imath::Color4f> &col4Values();
-	const std::vector<Imath::Quatf> &quatValues();
-	const std::vector<Imath::M44f> &matrix44Values();
+
+	/*! The following methods return a copy of the values, use valuesSpanSlice() to read the values in place.*/
+	std::vector<int> intValues();
+	std::vector<float> floatValues();
+	std::vector<Imath::V3f> vec3Values();
+	std::vector<Imath::Color4f> col4Values();
+	std::vector<Imath::Quatf> quatValues();
+	std::vector<Imath::M44f> matrix44Values();
 	int intValueAt(unsigned int id);
 	float floatValueAt(unsigned int id);
 	Imath::V3f vec3ValueAt(unsigned int id);
@@ -99,9 +119,16 @@ public:
 	bool isArrayType(Numeric::Type type);
 	std::string asString();
 	void setFromString(const std::string &value);
+	Value *duplicate();
+	bool isHashable();
+	std::size_t hash();
+	bool isEqual(Value *other);
+	unsigned int sizeInBytes();
+	std::string asBinary();
+	void setFromBinary(const std::string &data);
 
 	unsigned int sizeSlice(unsigned int slice);
-	void resizeSlice(unsigned int slices, unsigned int newSize);
+	void resizeSlice(unsigned int slice, unsigned int newSize);
 	void resizeSlices(unsigned int slices);
 	unsigned int slices(){return _slices;}
 	void setIntValueAtSlice(unsigned int slice, unsigned int id, int value);
@@ -122,28 +149,133 @@ public:
 	void setMatrix44ValuesSlice(unsigned int slice, const std::vector<Imath::M44f> &values);
 	void setCol4ValuesSlice(unsigned int slice, const std::vector<Imath::Color4f> &values);
 	void setQuatValuesSlice(unsigned int slice, const std::vector<Imath::Quatf> &values);
-	const std::vector<int> &intValuesSlice(unsigned int slice);
-	const std::vector<float> &floatValuesSlice(unsigned int slice);
-	const std::vector<Imath::V3f> &vec3ValuesSlice(unsigned int slice);
-	const std::vector<Imath::M44f> &matrix44ValuesSlice(unsigned int slice);
-	const std::vector<Imath::Quatf> &quatValuesSlice(unsigned int slice);
-	const std::vector<Imath::Color4f> &col4ValuesSlice(unsigned int slice);
+	std::vector<int> intValuesSlice(unsigned int slice);
+	std::vector<float> floatValuesSlice(unsigned int slice);
+	std::vector<Imath::V3f> vec3ValuesSlice(unsigned int slice);
+	std::vector<Imath::M44f> matrix44ValuesSlice(unsigned int slice);
+	std::vector<Imath::Quatf> quatValuesSlice(unsigned int slice);
+	std::vector<Imath::Color4f> col4ValuesSlice(unsigned int slice);
 	std::string sliceAsString(unsigned int slice);
+	
+	//! Copies the values of a slice from another Numeric storing the same type of values.
+	//! When neither Numeric is sliced the values are shared rather than copied.
+	void copySlice(unsigned int slice, const Numeric *other);
+
+	//! Returns the values of a slice without copying them, T must be one of int, float, Imath::V3f, Imath::Color4f, Imath::Quatf, Imath::M44f.
+	//! The span is empty if T doesn't match the type of this Numeric, slices out of range are clamped to the last slice like the other accessors.
+	template<class T>
+	NumericSpan<const T> valuesSpanSlice(unsigned int slice);
+
+	//! Resizes a slice and returns its values for writing, new values are set to the default value of the type.
+	//! Each slice can be resized concurrently by a sliced node, the span is empty if T doesn't match the type of this Numeric.
+	template<class T>
+	NumericSpan<T> resizeValuesSpanSlice(unsigned int slice, unsigned int size);
+	
+	//! Like valuesSpanSlice(), but also shares the buffer storing the values so that the span outlives any change to this Numeric.
+	//! A Numeric never writes a buffer while it's shared, the values stay valid and unchanged for as long as the returned buffer is held.
+	//! Must not be called while the slices are being computed.
+	template<class T>
+	boost::shared_ptr<const std::vector<char> > sharedValuesSlice(unsigned int slice, NumericSpan<const T> &values);
 
 private:
-	friend class NumericOperation;
+	template<class T>
+	T valueAtSlice(unsigned int slice, unsigned int id);
+	template<class T>
+	void setValueAtSlice(unsigned int slice, unsigned int id, const T &value);
+	template<class T>
+	std::vector<T> valuesSlice(unsigned int slice);
+	template<class T>
+	void setValuesSlice(unsigned int slice, const std::vector<T> &values);
+	unsigned int storedSlices() const;
+	const char *sliceValues(unsigned int slice, unsigned int &size) const;
+	char *resizeSliceValues(unsigned int slice, unsigned int size);
+	void packSlices(unsigned int slices, unsigned int minimumSize = 0, unsigned int maximumSize = (unsigned int)-1);
+	void resetValues(Type valuesType);
+	void prepareSingleSlice(Type valuesType);
+	bool ownsValues() const;
 	
-	std::vector<std::vector<int> > _intValuesSliced;
-	std::vector<std::vector<float> > _floatValuesSliced;
-	std::vector<std::vector<Imath::V3f> > _vec3ValuesSliced;
-	std::vector<std::vector<Imath::Color4f> > _col4ValuesSliced;
-	std::vector<std::vector<Imath::M44f> > _matrix44ValuesSliced;
-	std::vector<std::vector<Imath::Quatf> > _quatValuesSliced;
 	bool _isArray;
 	Type _type;	
 	unsigned int _slices;
+	Type _valuesType; // the single type of the values stored in _values, numericTypeAny while nothing is stored
+	boost::shared_ptr<std::vector<char> > _values; // copy on write, see ownsValues()
+	std::vector<unsigned int> _sliceOffsets; // slice i holds the values in [_sliceOffsets[i], _sliceOffsets[i + 1])
+	std::vector<std::vector<char> > _spilledValues; // slices resized while their siblings are being computed, packed back by packSlices()
+	std::vector<char> _spilled;
+};
+
+template<class T>
+struct NumericValuesType{
+};
+
+template<>
+struct NumericValuesType<int>{
+	static const Numeric::Type type = Numeric::numericTypeInt;
+};
+
+template<>
+struct NumericValuesType<float>{
+	static const Numeric::Type type = Numeric::numericTypeFloat;
+};
+
+template<>
+struct NumericValuesType<Imath::V3f>{
+	static const Numeric::Type type = Numeric::numericTypeVec3;
 };
 
+template<>
+struct NumericValuesType<Imath::Color4f>{
+	static const Numeric::Type type = Numeric::numericTypeCol4;
+};
+
+template<>
+struct NumericValuesType<Imath::Quatf>{
+	static const Numeric::Type type = Numeric::numericTypeQuat;
+};
+
+template<>
+struct NumericValuesType<Imath::M44f>{
+	static const Numeric::Type type = Numeric::numericTypeMatrix44;
+};
+
+template<class T>
+NumericSpan<const T> Numeric::valuesSpanSlice(unsigned int slice){
+	unsigned int size = 0;
+	const char *values = 0;
+	if(_valuesType == NumericValuesType<T>::type){
+		values = sliceValues(slice, size);
+	}
+	
+	return NumericSpan<const T>((const T*)values, size);
 }
-#endif
 
+template<class T>
+NumericSpan<T> Numeric::resizeValuesSpanSlice(unsigned int slice, unsigned int size){
+	if(_valuesType != NumericValuesType<T>::type || slice >= storedSlices()){
+		return NumericSpan<T>();
+	}
+	
+	changed(); // the values are written through the span
+	
+	return NumericSpan<T>((T*)resizeSliceValues(slice, size), size);
+}
+
+template<class T>
+boost::shared_ptr<const std::vector<char> > Numeric::sharedValuesSlice(unsigned int slice, NumericSpan<const T> &values){
+	unsigned int slices = storedSlices();
+	if(slices && slice >= slices){
+		slice = slices - 1;
+	}
+	
+	// spilled slices live outside the shared buffer until packed
+	if(_valuesType == NumericValuesType<T>::type && _spilled.size() && _spilled[slice]){
+		packSlices(slices);
+	}
+	
+	values = valuesSpanSlice<T>(slice);
+	
+	return _values;
+}
+
+}
+#endif
@@ -0,0 +1,283 @@
+// <license>
+// Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+// This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+// 
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are
+// met:
+// 
+//    * Redistributions of source code must retain the above copyright
+//      notice, this list of conditions and the following disclaimer.
+// 
+//    * Redistributions in binary form must reproduce the above copyright
+//      notice, this list of conditions and the following disclaimer in the
+//      documentation and/or other materials provided with the distribution.
+// 
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+// IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+// PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+// LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+// NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+// SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// </license>
+
+
+#ifdef CORAL_PARALLEL_TBB
+	#include <tbb/mutex.h>
+#endif
+
+#include <map>
+#include <list>
+#include <vector>
+#include <string>
+#include <boost/functional/hash.hpp>
+
+#include "OutputCache.h"
+#include "Node.h"
+#include "Attribute.h"
+#include "Value.h"
+
+using namespace coral;
+
+bool OutputCache::_enabled = false;
+std::size_t OutputCache::_memoryBudget = 256 * 1024 * 1024;
+std::size_t OutputCache::_memoryUsed = 0;
+int OutputCache::_hits = 0;
+int OutputCache::_misses = 0;
+
+namespace {
+	struct CacheEntry{
+		OutputCache::Fingerprint fingerprint;
+		Value *value;
+		std::vector<Value*> inputs;
+		std::size_t size;
+		std::list<std::size_t>::iterator lruPosition;
+	};
+	
+	std::map<std::size_t, CacheEntry> _entries;
+	std::list<std::size_t> _lru; // most recently used first
+	
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex _cacheMutex;
+	#endif
+	
+	bool outputCache_sameInputs(const CacheEntry &entry, const OutputCache::Fingerprint &fingerprint){
+		for(int i = 0; i < entry.inputs.size(); ++i){
+			if(!entry.inputs[i]->isEqual(fingerprint.inputValues[i])){
+				return false;
+			}
+		}
+		
+		return true;
+	}
+	
+	void outputCache_deleteValues(CacheEntry &entry){
+		delete entry.value;
+		for(int i = 0; i < entry.inputs.size(); ++i){
+			delete entry.inputs[i];
+		}
+	}
+	
+	void outputCache_addSpecialization(OutputCache::Fingerprint &fingerprint, Attribute *attribute){
+		fingerprint.specializations.push_back(attribute->specialization());
+		
+		const std::vector<std::string> &specialization = fingerprint.specializations.back();
+		for(int i = 0; i < specialization.size(); ++i){
+			boost::hash_combine(fingerprint.key, specialization[i]);
+		}
+	}
+}
+
+bool OutputCache::Fingerprint::operator==(const Fingerprint &other) const{
+	return 
+		key == other.key && 
+		slices == other.slices && 
+		className == other.className && 
+		attributeName == other.attributeName && 
+		inputHashes == other.inputHashes && 
+		specializations == other.specializations;
+}
+
+void OutputCache::setEnabled(bool value){
+	_enabled = value;
+}
+
+bool OutputCache::enabled(){
+	return _enabled;
+}
+
+void OutputCache::setMemoryBudget(std::size_t bytes){
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex::scoped_lock lock(_cacheMutex);
+	#endif
+	
+	_memoryBudget = bytes;
+	evict(_memoryBudget);
+}
+
+std::size_t OutputCache::memoryBudget(){
+	return _memoryBudget;
+}
+
+std::size_t OutputCache::memoryUsed(){
+	return _memoryUsed;
+}
+
+int OutputCache::entriesCount(){
+	return (int)_entries.size();
+}
+
+int OutputCache::hits(){
+	return _hits;
+}
+
+int OutputCache::misses(){
+	return _misses;
+}
+
+void OutputCache::resetStats(){
+	_hits = 0;
+	_misses = 0;
+}
+
+void OutputCache::clear(){
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex::scoped_lock lock(_cacheMutex);
+	#endif
+	
+	evict(0);
+}
+
+bool OutputCache::computeFingerprint(Node *node, Attribute *attribute, Fingerprint &fingerprint){
+	fingerprint.className = node->className();
+	fingerprint.attributeName = attribute->name();
+	fingerprint.slices = 1;
+	fingerprint.key = 0;
+	
+	// the slices are imposed by the slicer rather than by the inputs, outputs computed with a different count can't be restored
+	Node *slicer = node->slicer();
+	if(slicer){
+		fingerprint.slices = slicer->computeSlices();
+	}
+	
+	boost::hash_combine(fingerprint.key, fingerprint.className);
+	boost::hash_combine(fingerprint.key, fingerprint.attributeName);
+	boost::hash_combine(fingerprint.key, fingerprint.slices);
+	
+	const std::vector<Attribute*> &inputs = node->inputAttributes();
+	for(int i = 0; i < inputs.size(); ++i){
+		Attribute *input = inputs[i];
+		
+		Value *value = input->value();
+		if(!value->isHashable()){ // this node has inputs that can't be hashed, don't cache it
+			return false;
+		}
+		
+		std::size_t valueHash = value->hash();
+		fingerprint.inputHashes.push_back(valueHash);
+		fingerprint.inputValues.push_back(value);
+		boost::hash_combine(fingerprint.key, valueHash);
+		outputCache_addSpecialization(fingerprint, input);
+	}
+	
+	const std::vector<Attribute*> &outputs = node->outputAttributes();
+	for(int i = 0; i < outputs.size(); ++i){
+		outputCache_addSpecialization(fingerprint, outputs[i]);
+	}
+	
+	return true;
+}
+
+bool OutputCache::restore(const Fingerprint &fingerprint, Attribute *attribute){
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex::scoped_lock lock(_cacheMutex);
+	#endif
+	
+	std::map<std::size_t, CacheEntry>::iterator it = _entries.find(fingerprint.key);
+	// a colliding key or colliding input hashes are a miss, not somebody else's output
+	if(it == _entries.end() || !(it->second.fingerprint == fingerprint) || !outputCache_sameInputs(it->second, fingerprint)){
+		_misses++;
+		return false;
+	}
+	
+	CacheEntry &entry = it->second;
+	_lru.splice(_lru.begin(), _lru, entry.lruPosition);
+	attribute->outValue()->copy(entry.value);
+	_hits++;
+	
+	return true;
+}
+
+void OutputCache::store(const Fingerprint &fingerprint, Attribute *attribute){
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::mutex::scoped_lock lock(_cacheMutex); // Values can't be created concurrently
+	#endif
+	
+	std::map<std::size_t, CacheEntry>::iterator it = _entries.find(fingerprint.key);
+	if(it != _entries.end()){
+		if(it->second.fingerprint == fingerprint && outputCache_sameInputs(it->second, fingerprint)){
+			return;
+		}
+		
+		// the key collides with a different input state, the most recent one takes the entry
+		_memoryUsed -= it->second.size;
+		outputCache_deleteValues(it->second);
+		
+		_lru.erase(it->second.lruPosition);
+		_entries.erase(it);
+	}
+	
+	CacheEntry newEntry;
+	newEntry.value = attribute->outValue()->duplicate();
+	if(newEntry.value == 0){
+		return;
+	}
+	
+	std::size_t size = newEntry.value->sizeInBytes();
+	for(int i = 0; i < fingerprint.inputValues.size(); ++i){
+		Value *input = fingerprint.inputValues[i]->duplicate();
+		if(input == 0){
+			outputCache_deleteValues(newEntry);
+			return;
+		}
+		
+		newEntry.inputs.push_back(input);
+		size += input->sizeInBytes();
+	}
+	
+	if(size > _memoryBudget){
+		outputCache_deleteValues(newEntry);
+		return;
+	}
+	
+	evict(_memoryBudget - size);
+	
+	_lru.push_front(fingerprint.key);
+	
+	CacheEntry &entry = _entries[fingerprint.key];
+	entry.fingerprint = fingerprint;
+	entry.fingerprint.inputValues.clear();
+	entry.value = newEntry.value;
+	entry.inputs = newEntry.inputs;
+	entry.size = size;
+	entry.lruPosition = _lru.begin();
+	
+	_memoryUsed += size;
+}
+
+void OutputCache::evict(std::size_t budget){
+	while(_memoryUsed > budget && _lru.size()){
+		std::map<std::size_t, CacheEntry>::iterator it = _entries.find(_lru.back());
+		
+		_memoryUsed -= it->second.size;
+		outputCache_deleteValues(it->second);
+		
+		_entries.erase(it);
+		_lru.pop_back();
+	}
+}
@@ -0,0 +1,100 @@
+// <license>
+// Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+// This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+// 
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are
+// met:
+// 
+//    * Redistributions of source code must retain the above copyright
+//      notice, this list of conditions and the following disclaimer.
+// 
+//    * Redistributions in binary form must reproduce the above copyright
+//      notice, this list of conditions and the following disclaimer in the
+//      documentation and/or other materials provided with the distribution.
+// 
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+// IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+// PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+// LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+// NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+// SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// </license>
+
+
+#ifndef CORAL_OUTPUTCACHE_H
+#define CORAL_OUTPUTCACHE_H
+
+#include <cstddef>
+#include <string>
+#include <vector>
+#include "coralDefinitions.h"
+
+namespace coral{
+
+class Node;
+class Attribute;
+class Value;
+
+//! A content-addressed cache of node outputs.
+//
+//! Outputs are stored along with a fingerprint of the node class, the specialization of its attributes, the slices imposed by its slicer 
+//! and the hash of each of its input values, plus a copy of the input values themselves. 
+//! The fingerprint is looked up through its own hash, compared in full and the copied inputs are compared with Value::isEqual() before restoring, 
+//! when a node that opted in with Node::setOutputCacheEnabled(true) is about to update with a known input state 
+//! the cached output is restored instead of invoking Node::update(). Only nodes whose inputs are all Value::isHashable() are cached.
+//! Least recently used outputs are evicted first once the memory budget, which accounts for the copied inputs too, is exceeded.
+class CORAL_EXPORT OutputCache{
+public:
+	//! The cache is disabled by default, when disabled no output is restored or stored regardless of the per node setting.
+	static void setEnabled(bool value);
+	static bool enabled();
+	
+	//! The maximum amount of memory in bytes used by the cached outputs.
+	static void setMemoryBudget(std::size_t bytes);
+	static std::size_t memoryBudget();
+	static std::size_t memoryUsed();
+	static int entriesCount();
+	static int hits();
+	static int misses();
+	static void resetStats();
+	
+	//! Removes all the cached outputs.
+	static void clear();
+	
+	//! The input state an output was computed from.
+	struct Fingerprint{
+		std::string className;
+		std::string attributeName;
+		unsigned int slices;
+		std::vector<std::size_t> inputHashes;
+		std::vector<Value*> inputValues; // the live input values, only valid until the node updates and never stored
+		std::vector<std::vector<std::string> > specializations;
+		std::size_t key;
+		
+		bool operator==(const Fingerprint &other) const;
+	};
+
+private:
+	friend class Node;
+	
+	//! Returns false if the node has inputs that can't be hashed and shouldn't be cached.
+	static bool computeFingerprint(Node *node, Attribute *attribute, Fingerprint &fingerprint);
+	static bool restore(const Fingerprint &fingerprint, Attribute *attribute);
+	static void store(const Fingerprint &fingerprint, Attribute *attribute);
+	static void evict(std::size_t budget);
+	
+	static bool _enabled;
+	static std::size_t _memoryBudget;
+	static std::size_t _memoryUsed;
+	static int _hits;
+	static int _misses;
+};
+
+}
+#endif
@@ -0,0 +1,97 @@
+// <license>
+// Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+// This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+// 
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are
+// met:
+// 
+//    * Redistributions of source code must retain the above copyright
+//      notice, this list of conditions and the following disclaimer.
+// 
+//    * Redistributions in binary form must reproduce the above copyright
+//      notice, this list of conditions and the following disclaimer in the
+//      documentation and/or other materials provided with the distribution.
+// 
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+// IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+// PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+// LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+// NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+// SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// </license>
+
+#ifndef CORAL_PARALLELARRAYS_H
+#define CORAL_PARALLELARRAYS_H
+
+#ifdef CORAL_PARALLEL_TBB
+	#include <tbb/blocked_range.h>
+	#include <tbb/parallel_for.h>
+#endif
+
+#include "coralDefinitions.h"
+
+// Tells the compiler that the arrays read and written by a kernel don't overlap, so that its loop can be vectorized.
+#ifndef CORAL_RESTRICT
+	#define CORAL_RESTRICT __restrict
+#endif
+
+namespace coral{
+
+#ifdef CORAL_PARALLEL_TBB
+template<class Kernel>
+class parallelArrays_range{
+public:
+	parallelArrays_range(const Kernel &kernel): _kernel(kernel){
+	}
+	
+	void operator() (const tbb::blocked_range<unsigned int> &range) const{
+		_kernel(range.begin(), range.end());
+	}
+
+private:
+	const Kernel &_kernel;
+};
+#endif
+
+//! Splits the elements of large arrays in ranges processed in parallel.
+//
+//! Array kernels, like the ones used by NumericOperation and the math nodes, are functors invoked as kernel(begin, end) on a range of elements.
+//! Arrays larger than the grain size are split in ranges of about grain size elements that the tbb scheduler processes in parallel,
+//! smaller arrays, or any array when coral is built without CORAL_PARALLEL_TBB, are processed in a single range by the calling thread.
+//! Nodes sliced by a ForLoop node already update their slices in parallel, tbb balances the nested ranges with the slices.
+class CORAL_EXPORT ParallelArrays{
+public:
+	//! The grain size used by nodes that don't set their own with Node::setArrayGrainSize(), 0 processes every array in a single range.
+	static void setGrainSize(unsigned int size);
+	static unsigned int grainSize();
+	
+	//! Invokes kernel(begin, end) on ranges covering the elements from 0 to size.
+	template<class Kernel>
+	static void forEachRange(unsigned int size, unsigned int grainSize, const Kernel &kernel){
+		if(size == 0){
+			return;
+		}
+		
+		#ifdef CORAL_PARALLEL_TBB
+			if(grainSize && size > grainSize){
+				tbb::parallel_for(tbb::blocked_range<unsigned int>(0, size, grainSize), parallelArrays_range<Kernel>(kernel));
+				return;
+			}
+		#endif
+		
+		kernel(0, size);
+	}
+
+private:
+	static unsigned int _grainSize;
+};
+
+}
+
+#endif
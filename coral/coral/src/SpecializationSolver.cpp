@@ -0,0 +1,345 @@
+// <license>
+// Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+// This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+// 
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are
+// met:
+// 
+//    * Redistributions of source code must retain the above copyright
+//      notice, this list of conditions and the following disclaimer.
+// 
+//    * Redistributions in binary form must reproduce the above copyright
+//      notice, this list of conditions and the following disclaimer in the
+//      documentation and/or other materials provided with the distribution.
+// 
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+// IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+// PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+// LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+// NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+// SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// </license>
+
+#include <iostream>
+
+#include "SpecializationSolver.h"
+#include "Attribute.h"
+#include "Node.h"
+#include "NetworkManager.h"
+
+using namespace coral;
+
+std::vector<std::string> SpecializationSolver::_names;
+boost::unordered_map<std::string, int> SpecializationSolver::_nameIds;
+
+SpecializationSolver::SpecializationSolver():
+	_reset(false){
+}
+
+int SpecializationSolver::intern(const std::string &specialization){
+	boost::unordered_map<std::string, int>::iterator it = _nameIds.find(specialization);
+	if(it != _nameIds.end()){
+		return it->second;
+	}
+	
+	int nameId = _names.size();
+	_names.push_back(specialization);
+	_nameIds[specialization] = nameId;
+	
+	return nameId;
+}
+
+void SpecializationSolver::fit(SpecializationSet &set){
+	// new names might have been interned since the set was made
+	if(set.size() < _names.size()){
+		set.resize(_names.size());
+	}
+}
+
+SpecializationSolver::SpecializationSet SpecializationSolver::toSet(const std::vector<std::string> &specialization){
+	std::vector<int> nameIds(specialization.size());
+	for(int i = 0; i < specialization.size(); ++i){
+		nameIds[i] = intern(specialization[i]);
+	}
+	
+	SpecializationSet set(_names.size());
+	for(int i = 0; i < nameIds.size(); ++i){
+		set.set(nameIds[i]);
+	}
+	
+	return set;
+}
+
+std::vector<std::string> SpecializationSolver::toSpecialization(const SpecializationSet &set, Attribute *attribute){
+	// names keep the order of the attribute's allowed specialization, names it doesn't allow come last
+	std::vector<std::string> specialization;
+	SpecializationSet remaining = set;
+	fit(remaining);
+	
+	const std::vector<std::string> &allowed = attribute->_allowedSpecialization;
+	for(int i = 0; i < allowed.size(); ++i){
+		int nameId = intern(allowed[i]);
+		fit(remaining);
+		if(remaining.test(nameId)){
+			specialization.push_back(allowed[i]);
+			remaining.reset(nameId);
+		}
+	}
+	
+	for(SpecializationSet::size_type nameId = remaining.find_first(); nameId != SpecializationSet::npos; nameId = remaining.find_next(nameId)){
+		specialization.push_back(_names[nameId]);
+	}
+	
+	return specialization;
+}
+
+bool SpecializationSolver::isWildcard(int index){
+	return _attributes[index]->_passThrough && _memberSets[index].none();
+}
+
+int SpecializationSolver::addAttribute(Attribute *attribute){
+	int index = _attributes.size();
+	_attributes.push_back(attribute);
+	_attributeIds.push_back(attribute->id());
+	_indices[attribute] = index;
+	_parents.push_back(index);
+	_ranks.push_back(0);
+	_groupSets.push_back(SpecializationSet());
+	_groupMembers.push_back(std::vector<int>(1, index));
+	
+	if(_reset){
+		if(attribute->_specializationOverride.size() == 1){
+			_memberSets.push_back(toSet(attribute->_specializationOverride));
+		}
+		else{
+			_memberSets.push_back(toSet(attribute->_allowedSpecialization));
+		}
+	}
+	else{
+		_memberSets.push_back(toSet(attribute->_specialization));
+	}
+	
+	return index;
+}
+
+int SpecializationSolver::findGroup(int index){
+	int root = index;
+	while(_parents[root] != root){
+		root = _parents[root];
+	}
+	
+	while(_parents[index] != root){
+		int next = _parents[index];
+		_parents[index] = root;
+		index = next;
+	}
+	
+	return root;
+}
+
+void SpecializationSolver::unite(int indexA, int indexB){
+	int rootA = findGroup(indexA);
+	int rootB = findGroup(indexB);
+	if(rootA == rootB){
+		return;
+	}
+	
+	if(_ranks[rootA] < _ranks[rootB]){
+		std::swap(rootA, rootB);
+	}
+	else if(_ranks[rootA] == _ranks[rootB]){
+		_ranks[rootA] += 1;
+	}
+	
+	_parents[rootB] = rootA;
+	_groupMembers[rootA].insert(_groupMembers[rootA].end(), _groupMembers[rootB].begin(), _groupMembers[rootB].end());
+	_groupMembers[rootB].clear();
+}
+
+bool SpecializationSolver::updateGroup(int group){
+	// connected attributes end up with the intersection of their specializations
+	SpecializationSet groupSet;
+	bool first = true;
+	const std::vector<int> &members = _groupMembers[group];
+	for(int i = 0; i < members.size(); ++i){
+		int member = members[i];
+		if(!isWildcard(member)){
+			fit(_memberSets[member]);
+			if(first){
+				groupSet = _memberSets[member];
+				first = false;
+			}
+			else{
+				groupSet &= _memberSets[member];
+			}
+		}
+	}
+	
+	fit(groupSet);
+	fit(_groupSets[group]);
+	
+	bool changed = groupSet != _groupSets[group];
+	_groupSets[group] = groupSet;
+	
+	return changed;
+}
+
+void SpecializationSolver::queueGroupLinks(int group){
+	const std::vector<int> &members = _groupMembers[group];
+	for(int i = 0; i < members.size(); ++i){
+		const std::vector<SpecializationLink*> &links = _attributes[members[i]]->_specializationLinks;
+		for(int j = 0; j < links.size(); ++j){
+			SpecializationLink *link = links[j];
+			_links.insert(link);
+			if(_queuedLinks.insert(link).second){
+				_pendingLinks.push_back(link);
+			}
+		}
+	}
+}
+
+int SpecializationSolver::addComponent(Attribute *attribute){
+	boost::unordered_map<Attribute*, int>::iterator found = _indices.find(attribute);
+	if(found != _indices.end()){
+		return found->second;
+	}
+	
+	int index = addAttribute(attribute);
+	
+	std::vector<Attribute*> stack(1, attribute);
+	while(!stack.empty()){
+		Attribute *attr = stack.back();
+		stack.pop_back();
+		
+		std::vector<Attribute*> connected = attr->_outputs;
+		if(attr->_input){
+			connected.push_back(attr->_input);
+		}
+		
+		for(int i = 0; i < connected.size(); ++i){
+			Attribute *connectedAttr = connected[i];
+			if(_indices.find(connectedAttr) == _indices.end()){
+				addAttribute(connectedAttr);
+				stack.push_back(connectedAttr);
+			}
+			
+			unite(_indices[attr], _indices[connectedAttr]);
+		}
+	}
+	
+	int group = findGroup(index);
+	updateGroup(group);
+	
+	// a group that doesn't match what its members currently have is a change the linked groups need to hear about
+	const std::vector<int> &members = _groupMembers[group];
+	for(int i = 0; i < members.size(); ++i){
+		SpecializationSet currentSet = toSet(_attributes[members[i]]->_specialization);
+		fit(_groupSets[group]);
+		if(currentSet != _groupSets[group]){
+			queueGroupLinks(group);
+			break;
+		}
+	}
+	
+	return index;
+}
+
+bool SpecializationSolver::solveLinks(){
+	int iterations = 0;
+	while(!_pendingLinks.empty()){
+		if(iterations > 100 * int(_links.size() + 1)){
+			std::cout << "Maximum recursion reached during specialization." << std::endl;
+			return false;
+		}
+		iterations++;
+		
+		SpecializationLink *link = _pendingLinks.front();
+		_pendingLinks.pop_front();
+		_queuedLinks.erase(link);
+		
+		Attribute *attributeA = link->attributeA;
+		Attribute *attributeB = link->attributeB;
+		int indexA = addComponent(attributeA);
+		int indexB = addComponent(attributeB);
+		
+		std::vector<std::string> specializationA = toSpecialization(_groupSets[findGroup(indexA)], attributeA);
+		std::vector<std::string> specializationB = toSpecialization(_groupSets[findGroup(indexB)], attributeB);
+		
+		if(specializationA.size() > 1 || specializationB.size() > 1){
+			Node *parentNode = attributeA->parent();
+			if(parentNode){
+				parentNode->updateSpecializationLink(attributeA, attributeB, specializationA, specializationB);
+				
+				_memberSets[indexA] = toSet(specializationA);
+				_memberSets[indexB] = toSet(specializationB);
+				
+				int groupA = findGroup(indexA);
+				int groupB = findGroup(indexB);
+				if(updateGroup(groupA)){
+					queueGroupLinks(groupA);
+				}
+				
+				if(groupB != groupA && updateGroup(groupB)){
+					queueGroupLinks(groupB);
+				}
+			}
+		}
+	}
+	
+	return true;
+}
+
+void SpecializationSolver::apply(){
+	std::vector<std::vector<std::string> > specializations(_attributes.size());
+	for(int i = 0; i < _attributes.size(); ++i){
+		specializations[i] = toSpecialization(_groupSets[findGroup(i)], _attributes[i]);
+	}
+	
+	// setting a specialization calls back into the nodes, an attribute deleted by one of them is skipped
+	for(int i = 0; i < _attributes.size(); ++i){
+		Attribute *attribute = (Attribute*)NetworkManager::findObjectById(_attributeIds[i]);
+		if(attribute){
+			attribute->setSpecialization(specializations[i]);
+		}
+	}
+}
+
+bool SpecializationSolver::solveBranch(Attribute *attribute){
+	_reset = true;
+	addComponent(attribute);
+	
+	// the branch is reached through the links, each of them is solved at least once
+	for(int i = 0; i < _attributes.size(); ++i){
+		Attribute *attr = _attributes[i];
+		for(int j = 0; j < attr->_specializationLinks.size(); ++j){
+			SpecializationLink *link = attr->_specializationLinks[j];
+			addComponent(link->attributeA == attr ? link->attributeB : link->attributeA);
+			
+			_links.insert(link);
+			if(_queuedLinks.insert(link).second){
+				_pendingLinks.push_back(link);
+			}
+		}
+	}
+	
+	bool success = solveLinks();
+	apply();
+	
+	return success;
+}
+
+bool SpecializationSolver::solveNarrowing(Attribute *attribute){
+	_reset = false;
+	addComponent(attribute);
+	
+	bool success = solveLinks();
+	apply();
+	
+	return success;
+}
@@ -0,0 +1,96 @@
+// <license>
+// Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+// This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+// 
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are
+// met:
+// 
+//    * Redistributions of source code must retain the above copyright
+//      notice, this list of conditions and the following disclaimer.
+// 
+//    * Redistributions in binary form must reproduce the above copyright
+//      notice, this list of conditions and the following disclaimer in the
+//      documentation and/or other materials provided with the distribution.
+// 
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+// IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+// PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+// LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+// NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+// SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// </license>
+
+
+#ifndef CORAL_SPECIALIZATIONSOLVER_H
+#define CORAL_SPECIALIZATIONSOLVER_H
+
+#include <string>
+#include <vector>
+#include <deque>
+#include <set>
+#include <boost/dynamic_bitset.hpp>
+#include <boost/unordered_map.hpp>
+
+namespace coral{
+class Attribute;
+struct SpecializationLink;
+
+//! Resolves the specialization of a branch of attributes, not exposed to public API.
+//
+//! Connected attributes share one specialization, they are kept in union-find groups holding the intersection of their members' specializations,
+//! a passThrough with no specialization accepts any. Attributes linked by a node are solved by the node through Node::updateSpecializationLink 
+//! and only the links of a group whose specialization changed are visited again.
+//! Specialization names are interned so that sets are stored and intersected as bitsets.
+class SpecializationSolver{
+public:
+	SpecializationSolver();
+	
+	//! Solves the whole branch of attribute starting from the allowed specializations, needed when the branch might widen such as after a disconnection.
+	bool solveBranch(Attribute *attribute);
+	
+	//! Narrows the branch of attribute starting from the current specializations, only the groups that change are visited.
+	bool solveNarrowing(Attribute *attribute);
+
+private:
+	typedef boost::dynamic_bitset<> SpecializationSet;
+	
+	int addAttribute(Attribute *attribute);
+	int addComponent(Attribute *attribute);
+	int findGroup(int index);
+	void unite(int indexA, int indexB);
+	bool updateGroup(int group);
+	void queueGroupLinks(int group);
+	bool solveLinks();
+	void apply();
+	bool isWildcard(int index);
+	SpecializationSet toSet(const std::vector<std::string> &specialization);
+	std::vector<std::string> toSpecialization(const SpecializationSet &set, Attribute *attribute);
+	void fit(SpecializationSet &set);
+	
+	static int intern(const std::string &specialization);
+	
+	bool _reset;
+	std::vector<Attribute*> _attributes;
+	std::vector<int> _attributeIds;
+	boost::unordered_map<Attribute*, int> _indices;
+	std::vector<int> _parents;
+	std::vector<int> _ranks;
+	std::vector<SpecializationSet> _memberSets;
+	std::vector<SpecializationSet> _groupSets;
+	std::vector<std::vector<int> > _groupMembers;
+	std::deque<SpecializationLink*> _pendingLinks;
+	std::set<SpecializationLink*> _queuedLinks;
+	std::set<SpecializationLink*> _links;
+	
+	static std::vector<std::string> _names;
+	static boost::unordered_map<std::string, int> _nameIds;
+};
+
+}
+#endif
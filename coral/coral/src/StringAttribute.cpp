@@ -26,13 +26,23 @@
 // SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 // </license>
 
+#include <boost/functional/hash.hpp>
 #include "StringAttribute.h"
 
 using namespace coral;
 
+String::String()
+{
+	setTracksChanges(true);
+}
+
 void String::setStringValue(std::string value)
 {
-	_value = value;
+	if(value != _value)
+	{
+		_value = value;
+		changed();
+	}
 }
 
 const std::string& String::stringValue()
@@ -48,7 +58,50 @@ std::string String::asString()
 
 void String::setFromString(const std::string &value)
 {
-	_value = value;
+	setStringValue(value);
+}
+
+void String::copy(const Value *other)
+{
+	const String *otherString = dynamic_cast<const String*>(other);
+	if(otherString)
+	{
+		setStringValue(otherString->_value);
+	}
+}
+
+Value* String::duplicate()
+{
+	String *value = new String();
+	value->copy(this);
+	
+	return value;
+}
+
+bool String::isHashable()
+{
+	return true;
+}
+
+std::size_t String::hash()
+{
+	return boost::hash<std::string>()(_value);
+}
+
+bool String::isEqual(Value *other)
+{
+	String *otherString = dynamic_cast<String*>(other);
+	if(otherString == 0)
+	{
+		return false;
+	}
+	
+	return _value == otherString->_value;
+}
+
+unsigned int String::sizeInBytes()
+{
+	return sizeof(String) + _value.size();
 }
 
 StringAttribute::StringAttribute(const std::string &name, Node *parent)
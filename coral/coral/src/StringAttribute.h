@@ -39,6 +39,8 @@ namespace coral{
 	//! Wraps an std::string, used by StringAttribute.
 	class CORAL_EXPORT String : public Value{
 	public:
+		String();
+		
 		void setStringValue(std::string value);
 
 		const std::string &stringValue();
@@ -46,6 +48,18 @@ namespace coral{
 		std::string asString();
 	
 		void setFromString(const std::string &value);
+		
+		void copy(const Value *other);
+		
+		Value *duplicate();
+		
+		bool isHashable();
+		
+		std::size_t hash();
+		
+		bool isEqual(Value *other);
+		
+		unsigned int sizeInBytes();
 
 	private:
 		std::string _value;
@@ -0,0 +1,284 @@
+// <license>
+// Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+// This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+// 
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are
+// met:
+// 
+//    * Redistributions of source code must retain the above copyright
+//      notice, this list of conditions and the following disclaimer.
+// 
+//    * Redistributions in binary form must reproduce the above copyright
+//      notice, this list of conditions and the following disclaimer in the
+//      documentation and/or other materials provided with the distribution.
+// 
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+// IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+// PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+// LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+// NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+// SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// </license>
+
+
+#ifdef CORAL_PARALLEL_TBB
+	#include <tbb/atomic.h>
+	#include <tbb/enumerable_thread_specific.h>
+#endif
+
+#include <map>
+#include <fstream>
+#include <sstream>
+#include <boost/date_time/posix_time/posix_time.hpp>
+
+#include "Tracer.h"
+#include "NetworkManager.h"
+#include "NestedObject.h"
+#include "stringUtils.h"
+
+using namespace coral;
+
+bool Tracer::_capturing = false;
+
+namespace {
+	struct TraceEvent{
+		int type;
+		int objectId;
+		int threadId;
+		int detail;
+		int detailEnd;
+		long long beginTime;
+		long long duration;
+	};
+	
+	std::vector<TraceEvent> _events;
+	boost::posix_time::ptime _captureStart;
+	
+	#ifdef CORAL_PARALLEL_TBB
+		tbb::atomic<unsigned int> _nextEvent;
+		tbb::atomic<int> _nextThreadId;
+		tbb::enumerable_thread_specific<int> _threadIds(-1);
+	#else
+		unsigned int _nextEvent = 0;
+	#endif
+	
+	std::string objectName(int id){
+		NestedObject *object = dynamic_cast<NestedObject*>(NetworkManager::findObjectById(id));
+		if(object){
+			return stringUtils::replace(object->fullName(), "\"", "\\\"");
+		}
+		
+		return "deleted object " + stringUtils::intToString(id);
+	}
+	
+	std::string longToString(long long value){
+		std::ostringstream stream;
+		stream << value;
+		
+		return stream.str();
+	}
+	
+	// the recorded events from the oldest to the newest
+	void collectEvents(std::vector<TraceEvent> &events){
+		unsigned int recorded = _nextEvent;
+		unsigned int capacity = _events.size();
+		
+		if(recorded <= capacity){
+			events.assign(_events.begin(), _events.begin() + recorded);
+		}
+		else{
+			unsigned int oldest = recorded % capacity;
+			events.assign(_events.begin() + oldest, _events.end());
+			events.insert(events.end(), _events.begin(), _events.begin() + oldest);
+		}
+	}
+}
+
+void Tracer::startCapture(unsigned int maxEvents){
+	if(maxEvents == 0){
+		maxEvents = 1;
+	}
+	
+	_capturing = false;
+	_events.resize(maxEvents);
+	_nextEvent = 0;
+	_captureStart = boost::posix_time::microsec_clock::universal_time();
+	_capturing = true;
+}
+
+void Tracer::stopCapture(){
+	_capturing = false;
+}
+
+bool Tracer::capturing(){
+	return _capturing;
+}
+
+unsigned int Tracer::eventsCount(){
+	unsigned int recorded = _nextEvent;
+	if(recorded > _events.size()){
+		recorded = _events.size();
+	}
+	
+	return recorded;
+}
+
+long long Tracer::time(){
+	return (boost::posix_time::microsec_clock::universal_time() - _captureStart).total_microseconds();
+}
+
+int Tracer::threadId(){
+	#ifdef CORAL_PARALLEL_TBB
+		int &id = _threadIds.local();
+		if(id == -1){
+			id = _nextThreadId.fetch_and_increment();
+		}
+		
+		return id;
+	#else
+		return 0;
+	#endif
+}
+
+void Tracer::recordEvent(EventType type, int objectId, int threadId, long long beginTime, long long duration, int detail, int detailEnd){
+	if(_capturing){
+		// each writer reserves its own slot, no lock needed.
+		#ifdef CORAL_PARALLEL_TBB
+			unsigned int slot = _nextEvent.fetch_and_increment();
+		#else
+			unsigned int slot = _nextEvent++;
+		#endif
+		
+		TraceEvent &event = _events[slot % _events.size()];
+		event.type = type;
+		event.objectId = objectId;
+		event.threadId = threadId;
+		event.detail = detail;
+		event.detailEnd = detailEnd;
+		event.beginTime = beginTime;
+		event.duration = duration;
+	}
+}
+
+std::vector<TraceNodeStats> Tracer::nodeStats(){
+	std::vector<TraceEvent> events;
+	collectEvents(events);
+	
+	std::map<int, TraceNodeStats> statsMap;
+	for(int i = 0; i < events.size(); ++i){
+		TraceEvent &event = events[i];
+		if(event.type == eventTypeNodeUpdate || event.type == eventTypeNodeSlice){
+			std::map<int, TraceNodeStats>::iterator it = statsMap.find(event.objectId);
+			if(it == statsMap.end()){
+				TraceNodeStats newStats = {event.objectId, 0, 0, 0, 0};
+				it = statsMap.insert(std::make_pair(event.objectId, newStats)).first;
+			}
+			
+			TraceNodeStats &stats = it->second;
+			if(event.type == eventTypeNodeUpdate){
+				stats.updates++;
+				stats.totalTime += event.duration;
+				if(event.duration > stats.maxTime){
+					stats.maxTime = event.duration;
+				}
+			}
+			else{
+				stats.slices++;
+			}
+		}
+	}
+	
+	std::vector<TraceNodeStats> nodeStats;
+	for(std::map<int, TraceNodeStats>::iterator it = statsMap.begin(); it != statsMap.end(); ++it){
+		nodeStats.push_back(it->second);
+	}
+	
+	return nodeStats;
+}
+
+std::string Tracer::chromeTrace(){
+	std::vector<TraceEvent> events;
+	collectEvents(events);
+	
+	std::map<int, std::string> names;
+	
+	std::string trace = "{\"traceEvents\": [\n";
+	for(int i = 0; i < events.size(); ++i){
+		TraceEvent &event = events[i];
+		
+		std::map<int, std::string>::iterator nameIt = names.find(event.objectId);
+		if(nameIt == names.end()){
+			nameIt = names.insert(std::make_pair(event.objectId, objectName(event.objectId))).first;
+		}
+		const std::string &name = nameIt->second;
+		
+		std::string common = "\"pid\": 0, \"tid\": " + stringUtils::intToString(event.threadId) + ", \"ts\": " + longToString(event.beginTime);
+		
+		if(i){
+			trace += ",\n";
+		}
+		
+		if(event.type == eventTypeValueSize){
+			trace += "{\"name\": \"" + name + "\", \"cat\": \"value\", \"ph\": \"C\", " + common + 
+				", \"args\": {\"bytes\": " + stringUtils::intToString(event.detail) + "}}";
+		}
+		else{
+			std::string category = "evaluation";
+			std::string args = "";
+			if(event.type == eventTypeNodeUpdate){
+				category = "node";
+			}
+			else if(event.type == eventTypeNodeSlice){
+				category = "slice";
+				args = ", \"args\": {\"slice\": " + stringUtils::intToString(event.detail) + "}";
+			}
+			else if(event.type == eventTypeParallelRange){
+				category = "parallel";
+				args = ", \"args\": {\"begin\": " + stringUtils::intToString(event.detail) + ", \"end\": " + stringUtils::intToString(event.detailEnd) + "}";
+			}
+			
+			trace += "{\"name\": \"" + name + "\", \"cat\": \"" + category + "\", \"ph\": \"X\", " + common + 
+				", \"dur\": " + longToString(event.duration) + args + "}";
+		}
+	}
+	trace += "\n], \"displayTimeUnit\": \"ms\"}\n";
+	
+	return trace;
+}
+
+bool Tracer::saveChromeTrace(const std::string &filename){
+	std::ofstream file(filename.data());
+	if(!file.is_open()){
+		return false;
+	}
+	
+	file << chromeTrace();
+	file.close();
+	
+	return true;
+}
+
+TraceScope::TraceScope(Tracer::EventType type, int objectId, int detail, int detailEnd):
+	_active(Tracer::capturing()),
+	_type(type),
+	_objectId(objectId),
+	_detail(detail),
+	_detailEnd(detailEnd),
+	_beginTime(0){
+	
+	if(_active){
+		_beginTime = Tracer::time();
+	}
+}
+
+TraceScope::~TraceScope(){
+	if(_active){
+		Tracer::recordEvent(_type, _objectId, Tracer::threadId(), _beginTime, Tracer::time() - _beginTime, _detail, _detailEnd);
+	}
+}
@@ -0,0 +1,104 @@
+// <license>
+// Copyright (C) 2011 Andrea Interguglielmi, All rights reserved.
+// This file is part of the coral repository downloaded from http://code.google.com/p/coral-repo.
+// 
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are
+// met:
+// 
+//    * Redistributions of source code must retain the above copyright
+//      notice, this list of conditions and the following disclaimer.
+// 
+//    * Redistributions in binary form must reproduce the above copyright
+//      notice, this list of conditions and the following disclaimer in the
+//      documentation and/or other materials provided with the distribution.
+// 
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS
+// IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR
+// PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+// LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+// NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+// SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// </license>
+
+
+#ifndef CORAL_TRACER_H
+#define CORAL_TRACER_H
+
+#include <string>
+#include <vector>
+#include "coralDefinitions.h"
+
+namespace coral{
+
+//! Aggregated timings of a node collected during a capture, times are in microseconds.
+struct TraceNodeStats{
+	int nodeId;
+	int updates;
+	int slices;
+	long long totalTime;
+	long long maxTime;
+};
+
+//! Records evaluation events to profile a network.
+//
+//! While a capture is running node updates, slices, parallel ranges and output sizes are recorded along with the thread they ran on,
+//! events are stored in a fixed size ring buffer that threads write to without locking, once full the oldest events get overwritten.
+//! The capture can be exported as a Chrome trace (chrome://tracing or Perfetto) or aggregated per node.
+class CORAL_EXPORT Tracer{
+public:
+	enum EventType{
+		eventTypeEvaluation = 0,
+		eventTypeNodeUpdate,
+		eventTypeNodeSlice,
+		eventTypeParallelRange,
+		eventTypeValueSize
+	};
+	
+	//! Starts a new capture discarding any previously recorded event, maxEvents is the size of the ring buffer.
+	static void startCapture(unsigned int maxEvents = 65536);
+	static void stopCapture();
+	static bool capturing();
+	
+	//! The number of events currently held by the ring buffer.
+	static unsigned int eventsCount();
+	static std::vector<TraceNodeStats> nodeStats();
+	
+	//! Returns the recorded events as Chrome trace event JSON.
+	static std::string chromeTrace();
+	static bool saveChromeTrace(const std::string &filename);
+	
+	static void recordEvent(EventType type, int objectId, int threadId, long long beginTime, long long duration, int detail = 0, int detailEnd = 0);
+	
+	//! Time in microseconds since the capture was started.
+	static long long time();
+	
+	//! A small integer identifying the calling thread.
+	static int threadId();
+
+private:
+	static bool _capturing;
+};
+
+//! Records an event spanning the lifetime of this object if a capture is running.
+class TraceScope{
+public:
+	TraceScope(Tracer::EventType type, int objectId, int detail = 0, int detailEnd = 0);
+	~TraceScope();
+
+private:
+	bool _active;
+	Tracer::EventType _type;
+	int _objectId;
+	int _detail;
+	int _detailEnd;
+	long long _beginTime;
+};
+
+}
+#endif
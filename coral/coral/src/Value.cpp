@@ -29,12 +29,27 @@
 
 using namespace coral;
 
-Value::Value(){
+Value::Value():
+	_version(0),
+	_tracksChanges(false),
+	_changed(false){
 }
 
 Value::~Value(){
 }
 
+unsigned int Value::version(){
+	return _version;
+}
+
+void Value::setTracksChanges(bool value){
+	_tracksChanges = value;
+}
+
+void Value::changed(){
+	_changed = true;
+}
+
 std::string Value::asString(){
 	return "";
 }
@@ -47,3 +62,30 @@ void Value::copy(const Value *other){
 
 void Value::resizeSlices(unsigned int slices){
 }
+
+Value *Value::duplicate(){
+	return 0;
+}
+
+bool Value::isHashable(){
+	return false;
+}
+
+std::size_t Value::hash(){
+	return 0;
+}
+
+bool Value::isEqual(Value *other){
+	return false;
+}
+
+unsigned int Value::sizeInBytes(){
+	return 0;
+}
+
+std::string Value::asBinary(){
+	return "";
+}
+
+void Value::setFromBinary(const std::string &data){
+}
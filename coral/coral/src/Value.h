@@ -30,6 +30,7 @@
 #define CORAL_VALUE_H
 
 #include <string>
+#include <cstddef>
 #include "Object.h"
 
 namespace coral{
@@ -40,10 +41,50 @@ public:
 	Value();
 	virtual ~Value();
 	
+	//! A stamp incremented whenever the data of this value changes, either notified through Attribute::valueChanged() or by the update of the node owning this value.
+	//! Values tracking their changes only get a new version from the updates that wrote different data, any other value gets one from every update.
+	unsigned int version();
+	
 	virtual void copy(const Value *other);
 	virtual std::string asString();
 	virtual void setFromString(const std::string &value);
 	virtual void resizeSlices(unsigned int slices);
+	
+	//! Returns a new Value of the same type holding a copy of this value's data, NULL if this value can't be duplicated.
+	virtual Value *duplicate();
+	
+	//! Returns true if this value implements hash(), isEqual() and duplicate(), only hashable values can be inputs of a cached output.
+	//! The default implementation returns false.
+	virtual bool isHashable();
+	
+	//! Returns a hash of the data held by this value, values holding the same data return the same hash.
+	virtual std::size_t hash();
+	
+	//! Returns true if other is a value of the same type holding the same data as this value.
+	virtual bool isEqual(Value *other);
+	
+	//! An estimate of the memory used by the data of this value, in bytes.
+	virtual unsigned int sizeInBytes();
+	
+	//! Returns the data of this value as raw little-endian bytes, used by the binary network format instead of asString().
+	//! The default implementation returns an empty string, meaning this value can only be saved through asString().
+	virtual std::string asBinary();
+	virtual void setFromBinary(const std::string &data);
+
+protected:
+	//! Subclasses invoking changed() from every method writing their data should enable this in their constructor.
+	void setTracksChanges(bool value);
+	
+	//! Reports that the data of this value might have been written with different data, 
+	//! writes known to leave the data unchanged can skip it so that nothing downstream is updated again.
+	void changed();
+
+private:
+	friend class Attribute;
+	
+	unsigned int _version;
+	bool _tracksChanges;
+	bool _changed;
 
 };
 
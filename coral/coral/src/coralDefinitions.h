@@ -43,4 +43,13 @@
 	#endif
 #endif
 
+// thread local storage for builds without TBB
+#ifndef CORAL_THREAD_LOCAL
+	#if defined(WIN64) || defined(_WIN64) || defined(WIN32) || defined(_WIN32)
+		#define CORAL_THREAD_LOCAL __declspec(thread)
+	#else
+		#define CORAL_THREAD_LOCAL __thread
+	#endif
+#endif
+
 #endif
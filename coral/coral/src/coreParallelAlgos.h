@@ -32,34 +32,53 @@
 #ifdef CORAL_PARALLEL_TBB
 
 #include <tbb/blocked_range.h>
+#include <tbb/parallel_do.h>
+#include <tbb/atomic.h>
 #include <vector>
 #include "Attribute.h"
 #include "Node.h"
+#include "EvaluationContext.h"
+#include "EvaluationState.h"
+#include "Tracer.h"
 
 namespace coral{
 	
-class attribute_parallelClean{
+class attribute_scheduledClean{
 public:
-	attribute_parallelClean(std::vector<Attribute*> *cleanChain): _cleanChain(cleanChain){ 
+	attribute_scheduledClean(CleanSchedule *cleanSchedule, std::vector<tbb::atomic<int> > *pendingPredecessors, EvaluationContext *context): 
+		_cleanSchedule(cleanSchedule), 
+		_pendingPredecessors(pendingPredecessors),
+		_context(context){ 
 	}
 	
-	void operator() (const tbb::blocked_range<size_t> &r) const{
-		for(size_t i = r.begin(); i != r.end(); ++i){
-			_cleanChain->at(i)->cleanSelf();
+	void operator() (int task, tbb::parallel_do_feeder<int> &feeder) const{
+		_context->clean(_cleanSchedule->attributes[task]);
+		
+		const std::vector<int> &successors = _cleanSchedule->successors[task];
+		for(int i = 0; i < successors.size(); ++i){
+			int successor = successors[i];
+			if(--(*_pendingPredecessors)[successor] == 0){
+				feeder.add(successor);
+			}
 		}
 	}
 
 private:
-	std::vector<Attribute*> *_cleanChain;
+	CleanSchedule *_cleanSchedule;
+	std::vector<tbb::atomic<int> > *_pendingPredecessors;
+	EvaluationContext *_context;
 };
 
 class node_parallelUpdate{
 public:
-	node_parallelUpdate(Node *node, Attribute* attribute): _node(node), _attribute(attribute){ 
+	node_parallelUpdate(Node *node, Attribute* attribute): _node(node), _attribute(attribute), _context(EvaluationContext::current()){ 
 	}
 	
 	void operator() (const tbb::blocked_range<size_t> &r) const{
+		EvaluationScope scope(_context); // slices pull their inputs within the evaluation that's updating the node
+		TraceScope rangeTraceScope(Tracer::eventTypeParallelRange, _node->id(), r.begin(), r.end());
 		for(size_t i = r.begin(); i != r.end(); ++i){
+			TraceScope traceScope(Tracer::eventTypeNodeSlice, _node->id(), i);
 			_node->updateSlice(_attribute, i);
 		}
 	}
@@ -67,6 +86,24 @@ public:
 private:
 	Node *_node;
 	Attribute *_attribute;
+	EvaluationContext *_context;
+};
+
+class evaluationState_parallelEvaluate{
+public:
+	evaluationState_parallelEvaluate(Attribute *attribute, const std::vector<EvaluationState*> *states): _attribute(attribute), _states(states){
+	}
+	
+	void operator() (const tbb::blocked_range<size_t> &r) const{
+		for(size_t i = r.begin(); i != r.end(); ++i){
+			EvaluationStateScope scope((*_states)[i]);
+			_attribute->value();
+		}
+	}
+
+private:
+	Attribute *_attribute;
+	const std::vector<EvaluationState*> *_states;
 };
 
 }
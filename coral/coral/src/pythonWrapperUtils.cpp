@@ -26,7 +26,261 @@
 // SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 // </license>
 
+#include <cstring>
 #include "pythonWrapperUtils.h"
 
 //CORAL_EXPORT
 bool coral::pythonWrapperUtils::pyGILEnsured = false;
+
+coral::pythonWrapperUtils::GILRelease::GILRelease():
+	_state(0){
+	#ifdef CORAL_PARALLEL_TBB
+		if(!pyGILEnsured){
+			_state = PyEval_SaveThread();
+		}
+	#endif
+}
+
+coral::pythonWrapperUtils::GILRelease::~GILRelease(){
+	if(_state){
+		PyEval_RestoreThread(_state);
+	}
+}
+
+coral::pythonWrapperUtils::GILEnsure::GILEnsure():
+	_ensured(false){
+	if(!pyGILEnsured){
+		_state = PyGILState_Ensure();
+		_ensured = true;
+	}
+}
+
+coral::pythonWrapperUtils::GILEnsure::~GILEnsure(){
+	if(_ensured){
+		PyGILState_Release(_state);
+	}
+}
+
+namespace{
+
+struct ArrayBufferObject{
+	PyObject_HEAD
+	boost::shared_ptr<const void> *owner;
+	void *data;
+	char format[2];
+	int ndim;
+	Py_ssize_t itemsize;
+	Py_ssize_t len;
+	Py_ssize_t shape[3];
+	Py_ssize_t strides[3];
+};
+
+void arrayBuffer_dealloc(PyObject *self){
+	delete ((ArrayBufferObject*)self)->owner;
+	Py_TYPE(self)->tp_free(self);
+}
+
+Py_ssize_t arrayBuffer_getReadBuffer(PyObject *self, Py_ssize_t segment, void **ptr){
+	if(segment != 0){
+		PyErr_SetString(PyExc_SystemError, "accessing non-existent ArrayBuffer segment");
+		return -1;
+	}
+	
+	ArrayBufferObject *buffer = (ArrayBufferObject*)self;
+	*ptr = buffer->data;
+	
+	return buffer->len;
+}
+
+Py_ssize_t arrayBuffer_getSegCount(PyObject *self, Py_ssize_t *len){
+	if(len){
+		*len = ((ArrayBufferObject*)self)->len;
+	}
+	
+	return 1;
+}
+
+int arrayBuffer_getBuffer(PyObject *self, Py_buffer *view, int flags){
+	if(flags & PyBUF_WRITABLE){
+		PyErr_SetString(PyExc_BufferError, "ArrayBuffer is read-only");
+		return -1;
+	}
+	
+	ArrayBufferObject *buffer = (ArrayBufferObject*)self;
+	view->buf = buffer->data;
+	view->obj = self;
+	Py_INCREF(self);
+	view->len = buffer->len;
+	view->readonly = 1;
+	view->itemsize = buffer->itemsize;
+	view->format = (flags & PyBUF_FORMAT) ? buffer->format : 0;
+	view->ndim = buffer->ndim;
+	view->shape = (flags & PyBUF_ND) ? buffer->shape : 0;
+	view->strides = (flags & PyBUF_STRIDES) == PyBUF_STRIDES ? buffer->strides : 0;
+	view->suboffsets = 0;
+	view->internal = 0;
+	
+	return 0;
+}
+
+PyBufferProcs arrayBuffer_bufferProcs = {
+	arrayBuffer_getReadBuffer,
+	0,
+	arrayBuffer_getSegCount,
+	0,
+	arrayBuffer_getBuffer,
+	0
+};
+
+PyTypeObject arrayBuffer_type = {
+	PyVarObject_HEAD_INIT(0, 0)
+	"_coral.ArrayBuffer"
+};
+
+char arrayBuffer_emptyData = 0;
+
+}
+
+boost::python::object coral::pythonWrapperUtils::arrayBuffer(const boost::shared_ptr<const void> &owner, const void *data, char format, const std::vector<Py_ssize_t> &shape){
+	if(arrayBuffer_type.tp_basicsize == 0){
+		arrayBuffer_type.tp_basicsize = sizeof(ArrayBufferObject);
+		arrayBuffer_type.tp_dealloc = arrayBuffer_dealloc;
+		arrayBuffer_type.tp_as_buffer = &arrayBuffer_bufferProcs;
+		arrayBuffer_type.tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_NEWBUFFER;
+		arrayBuffer_type.tp_doc = "Read-only view on values owned by coral, see the numpy arrays returned by Numeric.valuesArray() and the like.";
+		PyType_Ready(&arrayBuffer_type);
+	}
+	
+	ArrayBufferObject *buffer = PyObject_New(ArrayBufferObject, &arrayBuffer_type);
+	if(!buffer){
+		boost::python::throw_error_already_set();
+	}
+	
+	buffer->owner = new boost::shared_ptr<const void>(owner);
+	buffer->format[0] = format;
+	buffer->format[1] = 0;
+	buffer->itemsize = format == 'i' ? sizeof(int) : sizeof(float);
+	buffer->ndim = shape.size();
+	
+	// C contiguous strides, from the last dimension to the first
+	buffer->len = buffer->itemsize;
+	for(int i = buffer->ndim - 1; i >= 0; --i){
+		buffer->shape[i] = shape[i];
+		buffer->strides[i] = buffer->len;
+		buffer->len *= shape[i];
+	}
+	
+	// an empty buffer still needs a valid address
+	buffer->data = buffer->len ? (void*)data : (void*)&arrayBuffer_emptyData;
+	
+	return boost::python::object(boost::python::handle<>((PyObject*)buffer));
+}
+
+namespace{
+	// int32 items can come with any integer code of the right size, numpy on windows reports them as 'l'
+	bool pythonWrapperUtils_matchingItems(const char *itemFormat, Py_ssize_t itemSize, char format, Py_ssize_t expectedItemSize){
+		if(itemFormat[0] == 0 || itemFormat[1] != 0 || itemSize != expectedItemSize){
+			return false;
+		}
+		
+		if(format == 'i'){
+			return strchr("bBhHiIlLqQnN", itemFormat[0]) != 0;
+		}
+		
+		return itemFormat[0] == format;
+	}
+}
+
+coral::pythonWrapperUtils::BufferValues::BufferValues(boost::python::object object, char format, const std::vector<Py_ssize_t> &valueShape):
+	_object(object),
+	_hasView(false),
+	_isBuffer(false),
+	_data(0),
+	_size(0){
+	
+	PyObject *pyObject = object.ptr();
+	Py_ssize_t itemSize = format == 'i' ? sizeof(int) : sizeof(float);
+	
+	unsigned int components = 1;
+	for(int i = 0; i < valueShape.size(); ++i){
+		components *= valueShape[i];
+	}
+	
+	bool matchingItems = true;
+	bool matchingShape = true;
+	Py_ssize_t length = 0;
+	if(PyObject_CheckBuffer(pyObject)){
+		if(PyObject_GetBuffer(pyObject, &_view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) == -1){
+			boost::python::throw_error_already_set();
+		}
+		_hasView = true;
+		
+		// skip the byte order when native
+		const char *viewFormat = _view.format ? _view.format : "B";
+		short endianness = 1;
+		char nativeByteOrder = *(char*)&endianness ? '<' : '>';
+		if(*viewFormat == '@' || *viewFormat == '=' || *viewFormat == nativeByteOrder){
+			++viewFormat;
+		}
+		
+		matchingItems = pythonWrapperUtils_matchingItems(viewFormat, _view.itemsize, format, itemSize);
+		
+		if(_view.ndim > 1){
+			matchingShape = _view.ndim == valueShape.size() + 1;
+			for(int i = 0; matchingShape && i < valueShape.size(); ++i){
+				matchingShape = _view.shape[i + 1] == valueShape[i];
+			}
+		}
+		
+		_data = _view.buf;
+		length = _view.len;
+	}
+	else if(PyObject_HasAttrString(pyObject, "typecode") && PyObject_CheckReadBuffer(pyObject)){
+		// array.array only implements the old buffer protocol in python 2, its typecode tells the items
+		std::string typeCode = boost::python::extract<std::string>(object.attr("typecode"));
+		int arrayItemSize = boost::python::extract<int>(object.attr("itemsize"));
+		matchingItems = pythonWrapperUtils_matchingItems(typeCode.c_str(), arrayItemSize, format, itemSize);
+		
+		if(PyObject_AsReadBuffer(pyObject, &_data, &length) == -1){
+			boost::python::throw_error_already_set();
+		}
+	}
+	else{
+		return;
+	}
+	
+	Py_ssize_t items = length / itemSize;
+	if(!matchingItems || !matchingShape || items % components){
+		if(_hasView){
+			PyBuffer_Release(&_view);
+			_hasView = false;
+		}
+		
+		if(!matchingItems){
+			PyErr_Format(PyExc_TypeError, "expected a buffer of %s items", format == 'i' ? "int32" : "float32");
+		}
+		else if(!matchingShape){
+			PyErr_SetString(PyExc_ValueError, "the buffer dimensions don't match the shape of the values");
+		}
+		else{
+			PyErr_SetString(PyExc_ValueError, "the buffer size isn't a multiple of the size of the values");
+		}
+		
+		boost::python::throw_error_already_set();
+	}
+	
+	_isBuffer = true;
+	_size = items / components;
+}
+
+coral::pythonWrapperUtils::BufferValues::~BufferValues(){
+	if(_hasView){
+		PyBuffer_Release(&_view);
+	}
+}
+
+boost::python::object coral::pythonWrapperUtils::numpyArray(const boost::shared_ptr<const void> &owner, const void *data, char format, const std::vector<Py_ssize_t> &shape){
+	boost::python::object buffer = arrayBuffer(owner, data, format, shape);
+	
+	return boost::python::import("numpy").attr("asarray")(buffer);
+}
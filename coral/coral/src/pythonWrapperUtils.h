@@ -38,7 +38,81 @@
 namespace coral{
 
 namespace pythonWrapperUtils{
+	//! Set by hosts already holding the GIL around an evaluation, GILRelease and GILEnsure then leave the GIL alone.
 	extern bool pyGILEnsured;
+	
+	//! Releases the GIL for the lifetime of the object, to be used by bindings running C++ evaluation when invoked from python,
+	//! so that pure C++ graphs don't block the interpreter and other threads can dispatch into python nodes.
+	//! Builds without TBB have no lock of their own and keep the GIL, see EvaluationContext::_waitCallback.
+	class GILRelease{
+	public:
+		GILRelease();
+		~GILRelease();
+	
+	private:
+		GILRelease(const GILRelease &);
+		GILRelease &operator=(const GILRelease &);
+		
+		PyThreadState *_state;
+	};
+	
+	//! Takes the GIL for the lifetime of the object, from any thread, to be used before dispatching into python.
+	class GILEnsure{
+	public:
+		GILEnsure();
+		~GILEnsure();
+	
+	private:
+		GILEnsure(const GILEnsure &);
+		GILEnsure &operator=(const GILEnsure &);
+		
+		PyGILState_STATE _state;
+		bool _ensured;
+	};
+	
+	//! Returns a read-only python buffer on values owned by C++, without copying them.
+	//! The buffer holds owner, and so do the numpy arrays viewing it, the values stay valid as long as any of them is alive.
+	//! format is a struct module character, 'i' or 'f', and shape tells the extent of each of the 1 to 3 dimensions.
+	boost::python::object arrayBuffer(const boost::shared_ptr<const void> &owner, const void *data, char format, const std::vector<Py_ssize_t> &shape);
+	
+	//! Returns a numpy array viewing an arrayBuffer(), numpy is only imported when an array is requested.
+	boost::python::object numpyArray(const boost::shared_ptr<const void> &owner, const void *data, char format, const std::vector<Py_ssize_t> &shape);
+	
+	//! Reads values in place from a contiguous python buffer: numpy arrays, memoryviews, array.array...
+	//! Items must be of the given format, 'i' or 'f', and laid out either flat or with valueShape as trailing dimensions,
+	//! a python TypeError or ValueError is raised otherwise. Objects not implementing the buffer protocol aren't read, see isBuffer().
+	class BufferValues{
+	public:
+		BufferValues(boost::python::object object, char format, const std::vector<Py_ssize_t> &valueShape);
+		~BufferValues();
+		
+		bool isBuffer() const{return _isBuffer;}
+		const void *data() const{return _data;}
+		
+		//! The number of values, each made of the items of one valueShape.
+		unsigned int size() const{return _size;}
+	
+	private:
+		BufferValues(const BufferValues &);
+		BufferValues &operator=(const BufferValues &);
+		
+		boost::python::object _object;
+		Py_buffer _view;
+		bool _hasView;
+		bool _isBuffer;
+		const void *_data;
+		unsigned int _size;
+	};
+	
+	template <class T>
+	std::vector<T> pythonSequenceToStdVector(boost::python::object sequence){
+		std::vector<T> convertedVector(boost::python::len(sequence));
+		for(unsigned int i = 0; i < convertedVector.size(); ++i){
+			convertedVector[i] = boost::python::extract<T>(sequence[i]);
+		}
+		
+		return convertedVector;
+	}
 
 	template <class T>
 	struct stdVectorToPythonList
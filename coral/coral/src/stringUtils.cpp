@@ -43,6 +43,12 @@ namespace stringUtils
 
 	namespace {
 
+		bool hostIsLittleEndian()
+		{
+			unsigned short endianness = 1;
+			return *(unsigned char*)&endianness == 1;
+		}
+
 		//////////////////////////////////////////////////////////////////////////////////////////////
 		/// why doesn't the std::reverse work?
 		///
@@ -1064,7 +1070,7 @@ namespace stringUtils
 	}
 	
 	std::string intToString(int value){
-		char buffer[sizeof(int)];
+		char buffer[16]; // room for the sign, ten digits and the terminator
 		sprintf(buffer, "%i", value);
 		
 		std::string str(buffer);
@@ -1072,12 +1078,140 @@ namespace stringUtils
 	}
 	
 	std::string floatToString(float value){
-		char buffer[sizeof(float)];
+		char buffer[64]; // %f writes every integer digit, up to 39 of them for the largest float
 		sprintf(buffer, "%f", value);
 		
 		std::string str(buffer);
 		return str;
 	}
+	
+	void appendUInt32(std::string &data, unsigned int value){
+		data += char(value & 0xff);
+		data += char((value >> 8) & 0xff);
+		data += char((value >> 16) & 0xff);
+		data += char((value >> 24) & 0xff);
+	}
+	
+	void appendFloat32(std::string &data, float value){
+		unsigned int bits = 0;
+		memcpy(&bits, &value, sizeof(float));
+		appendUInt32(data, bits);
+	}
+	
+	void appendFloat64(std::string &data, double value){
+		unsigned char bytes[sizeof(double)];
+		memcpy(bytes, &value, sizeof(double));
+		
+		// doubles share the byte order of ints on every supported host, written low word first
+		unsigned int low = 0;
+		unsigned int high = 0;
+		if(hostIsLittleEndian()){
+			memcpy(&low, bytes, 4);
+			memcpy(&high, bytes + 4, 4);
+		}
+		else{
+			memcpy(&high, bytes, 4);
+			memcpy(&low, bytes + 4, 4);
+		}
+		
+		appendUInt32(data, low);
+		appendUInt32(data, high);
+	}
+	
+	void appendSizedString(std::string &data, const std::string &value){
+		appendUInt32(data, value.size());
+		data += value;
+	}
+	
+	bool readUInt32(const std::string &data, unsigned int &position, unsigned int &value){
+		if(position + 4 > data.size()){
+			return false;
+		}
+		
+		const unsigned char *bytes = (const unsigned char*)data.data() + position;
+		value = (unsigned int)bytes[0] | ((unsigned int)bytes[1] << 8) | ((unsigned int)bytes[2] << 16) | ((unsigned int)bytes[3] << 24);
+		position += 4;
+		
+		return true;
+	}
+	
+	bool readFloat32(const std::string &data, unsigned int &position, float &value){
+		unsigned int bits = 0;
+		if(!readUInt32(data, position, bits)){
+			return false;
+		}
+		
+		memcpy(&value, &bits, sizeof(float));
+		
+		return true;
+	}
+	
+	bool readFloat64(const std::string &data, unsigned int &position, double &value){
+		unsigned int low = 0;
+		unsigned int high = 0;
+		if(position + 8 > data.size() || !readUInt32(data, position, low) || !readUInt32(data, position, high)){
+			return false;
+		}
+		
+		unsigned char bytes[sizeof(double)];
+		if(hostIsLittleEndian()){
+			memcpy(bytes, &low, 4);
+			memcpy(bytes + 4, &high, 4);
+		}
+		else{
+			memcpy(bytes, &high, 4);
+			memcpy(bytes + 4, &low, 4);
+		}
+		
+		memcpy(&value, bytes, sizeof(double));
+		
+		return true;
+	}
+	
+	bool readSizedString(const std::string &data, unsigned int &position, std::string &value){
+		unsigned int size = 0;
+		if(!readUInt32(data, position, size) || size > data.size() - position){
+			return false;
+		}
+		
+		value = data.substr(position, size);
+		position += size;
+		
+		return true;
+	}
+	
+	void appendWords32(std::string &data, const void *words, unsigned int count){
+		if(hostIsLittleEndian()){
+			data.append((const char*)words, std::size_t(count) * 4);
+		}
+		else{
+			data.reserve(data.size() + std::size_t(count) * 4);
+			
+			const unsigned int *values = (const unsigned int*)words;
+			for(unsigned int i = 0; i < count; ++i){
+				appendUInt32(data, values[i]);
+			}
+		}
+	}
+	
+	bool readWords32(const std::string &data, unsigned int &position, void *words, unsigned int count){
+		if(position > data.size() || count > (data.size() - position) / 4){
+			return false;
+		}
+		
+		if(hostIsLittleEndian()){
+			memcpy(words, data.data() + position, std::size_t(count) * 4);
+			position += count * 4;
+		}
+		else{
+			unsigned int *values = (unsigned int*)words;
+			for(unsigned int i = 0; i < count; ++i){
+				readUInt32(data, position, values[i]);
+			}
+		}
+		
+		return true;
+	}
 }
 
 
@@ -289,6 +289,20 @@ namespace stringUtils
 	CORAL_EXPORT std::string intToString(int value);
 	CORAL_EXPORT std::string floatToString(float value);
 	
+	// little-endian regardless of the host, the read functions return false when data is too short.
+	CORAL_EXPORT void appendUInt32(std::string &data, unsigned int value);
+	CORAL_EXPORT void appendFloat32(std::string &data, float value);
+	CORAL_EXPORT void appendFloat64(std::string &data, double value);
+	CORAL_EXPORT void appendSizedString(std::string &data, const std::string &value);
+	CORAL_EXPORT bool readUInt32(const std::string &data, unsigned int &position, unsigned int &value);
+	CORAL_EXPORT bool readFloat32(const std::string &data, unsigned int &position, float &value);
+	CORAL_EXPORT bool readFloat64(const std::string &data, unsigned int &position, double &value);
+	CORAL_EXPORT bool readSizedString(const std::string &data, unsigned int &position, std::string &value);
+	
+	// count 32 bit words (ints or floats), copied as a single block on little-endian hosts.
+	CORAL_EXPORT void appendWords32(std::string &data, const void *words, unsigned int count);
+	CORAL_EXPORT bool readWords32(const std::string &data, unsigned int &position, void *words, unsigned int count);
+	
 	template <class T>
 	std::string vectorToString(const std::vector<T> &vec){
 		std::ostringstream stream;
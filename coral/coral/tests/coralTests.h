@@ -31,16 +31,1877 @@
 #define CORALTESTS_H
 
 #include <string>
+#include <algorithm>
+#include <stdexcept>
 #include <assert.h>
 #include <iostream>
 
+#ifdef CORAL_PARALLEL_TBB
+	#include <tbb/tbb_thread.h>
+#endif
+
 #include "../src/Object.h"
 #include "../src/NetworkManager.h"
+#include "../src/Node.h"
+#include "../src/Attribute.h"
+#include "../src/Value.h"
+#include "../src/EvaluationContext.h"
+#include "../src/EvaluationState.h"
+#include "../src/OutputCache.h"
+#include "../src/Tracer.h"
+#include "../src/NetworkFile.h"
+#include "../src/Command.h"
+#include "../src/ErrorObject.h"
+#include "../src/stringUtils.h"
+#include "../src/Numeric.h"
+#include "../src/Geo.h"
+#include "../src/ParallelArrays.h"
+#include "../src/ArrayFusion.h"
+#include "../src/NumericAttribute.h"
+#include "../builtinNodes/MathNodes.h"
 
 using namespace coral;
 
 namespace coralTests{
 
+	class TestValue: public Value{
+	public:
+		TestValue(): value(0), hashable(true){
+		}
+		
+		void copy(const Value *other){
+			value = ((TestValue*)other)->value;
+		}
+		
+		Value *duplicate(){
+			TestValue *newValue = new TestValue();
+			newValue->value = value;
+			
+			return newValue;
+		}
+		
+		bool isHashable(){
+			return hashable;
+		}
+		
+		// a weak hash, values 16 apart collide
+		std::size_t hash(){
+			return value % 16;
+		}
+		
+		bool isEqual(Value *other){
+			return value == ((TestValue*)other)->value;
+		}
+		
+		// writes through setValue() are reported, a value tracking its changes is only given a new version when it's written a different value
+		void trackChanges(){
+			setTracksChanges(true);
+		}
+		
+		void setValue(int newValue){
+			if(newValue != value){
+				value = newValue;
+				changed();
+			}
+		}
+		
+		unsigned int sizeInBytes(){
+			return sizeof(TestValue);
+		}
+		
+		std::string asString(){
+			return stringUtils::intToString(value);
+		}
+		
+		std::string asBinary(){
+			std::string data;
+			stringUtils::appendUInt32(data, (unsigned int)value);
+			
+			return data;
+		}
+		
+		void setFromBinary(const std::string &data){
+			unsigned int position = 0;
+			unsigned int binaryValue = 0;
+			if(stringUtils::readUInt32(data, position, binaryValue)){
+				value = (int)binaryValue;
+			}
+		}
+		
+		int value;
+		bool hashable;
+	};
+	
+	class TestAttribute: public Attribute{
+	public:
+		TestAttribute(const std::string &name, Node *parent): Attribute(name, parent){
+			setValuePtr(new TestValue());
+		}
+		
+		int intValue(){
+			return ((TestValue*)value())->value;
+		}
+		
+		void setIntValue(int value){
+			((TestValue*)outValue())->value = value;
+			valueChanged();
+		}
+	};
+	
+	// counts the dirty notifications reaching it
+	class TestObservingAttribute: public TestAttribute{
+	public:
+		TestObservingAttribute(const std::string &name, Node *parent): TestAttribute(name, parent), dirtied(0){
+			setNotifyOnDirty(true);
+		}
+		
+		void onDirtied(){
+			dirtied++;
+		}
+		
+		int dirtied;
+	};
+	
+	// out = in + 1
+	class TestNode: public Node{
+	public:
+		TestNode(const std::string &name, Node *parent): Node(name, parent), updates(0){
+			in = new TestAttribute("in", this);
+			out = new TestAttribute("out", this);
+			addInputAttribute(in);
+			addOutputAttribute(out);
+			setAttributeAffect(in, out);
+		}
+		
+		void update(Attribute *attribute){
+			((TestValue*)out->outValue())->value = in->intValue() + 1;
+			updates++;
+		}
+		
+		TestAttribute *in;
+		TestAttribute *out;
+		int updates;
+	};
+	
+	// out = in1 + in2
+	class TestSumNode: public Node{
+	public:
+		TestSumNode(const std::string &name, Node *parent): Node(name, parent), updates(0){
+			in1 = new TestAttribute("in1", this);
+			in2 = new TestAttribute("in2", this);
+			out = new TestAttribute("out", this);
+			addInputAttribute(in1);
+			addInputAttribute(in2);
+			addOutputAttribute(out);
+			setAttributeAffect(in1, out);
+			setAttributeAffect(in2, out);
+		}
+		
+		void update(Attribute *attribute){
+			((TestValue*)out->outValue())->value = in1->intValue() + in2->intValue();
+			updates++;
+		}
+		
+		TestAttribute *in1;
+		TestAttribute *in2;
+		TestAttribute *out;
+		int updates;
+	};
+	
+	// out = in + 1, the output is set through valueChanged() from within the update
+	class TestNotifyingNode: public TestNode{
+	public:
+		TestNotifyingNode(const std::string &name, Node *parent): TestNode(name, parent), evaluating(false){
+		}
+		
+		void update(Attribute *attribute){
+			evaluating = EvaluationContext::current() != 0;
+			out->setIntValue(in->intValue() + 1);
+			updates++;
+		}
+		
+		bool evaluating;
+	};
+	
+	// out = in + 1, throws instead while throwing is set
+	class TestThrowingNode: public TestNode{
+	public:
+		TestThrowingNode(const std::string &name, Node *parent): TestNode(name, parent), throwing(false){
+		}
+		
+		void update(Attribute *attribute){
+			updates++;
+			if(throwing){
+				throw std::runtime_error("update failed");
+			}
+			
+			((TestValue*)out->outValue())->value = in->intValue() + 1;
+		}
+		
+		bool throwing;
+	};
+	
+	// out = in + 1, takes a while to update so that concurrent pulls overlap
+	class TestSlowNode: public TestNode{
+	public:
+		TestSlowNode(const std::string &name, Node *parent): TestNode(name, parent){
+		}
+		
+		void update(Attribute *attribute){
+			volatile int spin = 0;
+			while(spin < 1000000){
+				spin++;
+			}
+			
+			TestNode::update(attribute);
+		}
+	};
+	
+	// out = min(in, 5)
+	class TestClampNode: public TestNode{
+	public:
+		TestClampNode(const std::string &name, Node *parent): TestNode(name, parent){
+			((TestValue*)out->outValue())->trackChanges();
+		}
+		
+		void update(Attribute *attribute){
+			((TestValue*)out->outValue())->setValue(std::min(in->intValue(), 5));
+			updates++;
+		}
+	};
+	
+	// out = in, both specialized and linked to each other
+	class TestSpecializedNode: public TestNode{
+	public:
+		TestSpecializedNode(const std::string &name, Node *parent, const std::vector<std::string> &specializations): TestNode(name, parent){
+			setAttributeAllowedSpecializations(in, specializations);
+			setAttributeAllowedSpecializations(out, specializations);
+			addAttributeSpecializationLink(in, out);
+		}
+		
+		void update(Attribute *attribute){
+			((TestValue*)out->outValue())->value = in->intValue();
+			updates++;
+		}
+	};
+	
+	// imposes sliceCount slices on its children
+	class TestSlicerNode: public Node{
+	public:
+		TestSlicerNode(const std::string &name, Node *parent): Node(name, parent), sliceCount(1){
+			setIsSlicer(true);
+		}
+		
+		unsigned int computeSlices(){
+			return sliceCount;
+		}
+		
+		unsigned int sliceCount;
+	};
+	
+	// out = in + 1, computed through the default sliced update
+	class TestSlicedNode: public TestNode{
+	public:
+		TestSlicedNode(const std::string &name, Node *parent): TestNode(name, parent), resizedTo(0){
+			setSliceable(true);
+		}
+		
+		void update(Attribute *attribute){
+			Node::update(attribute);
+			updates++;
+		}
+		
+		void updateSlice(Attribute *attribute, unsigned int slice){
+			((TestValue*)out->outValue())->value = in->intValue() + 1;
+		}
+		
+		void resizedSlices(unsigned int slices){
+			resizedTo = slices;
+		}
+		
+		unsigned int resizedTo;
+	};
+	
+	TestNode *createTestNode(const std::string &name, Node *parent){
+		TestNode *node = new TestNode(name, parent);
+		parent->addNode(node);
+		
+		return node;
+	}
+	
+	void testEditTransaction(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		std::vector<TestNode*> nodes;
+		NetworkManager::beginEditTransaction();
+		NetworkManager::beginEditTransaction();
+		for(int i = 0; i < 100; ++i){
+			nodes.push_back(createTestNode("node", root));
+			if(i){
+				NetworkManager::connect(nodes[i - 1]->out, nodes[i]->in);
+			}
+		}
+		NetworkManager::commitEditTransaction();
+		assert(NetworkManager::editTransactionOpen());
+		
+		// pulling a value within a transaction flushes the queued edits
+		assert(nodes.back()->out->intValue() == 100);
+		
+		nodes[0]->in->setIntValue(10);
+		NetworkManager::commitEditTransaction();
+		assert(!NetworkManager::editTransactionOpen());
+		assert(nodes.back()->out->intValue() == 110);
+		assert(nodes[50]->updates == 2);
+		
+		root->removeReference();
+	}
+
+	void testCleanSchedule(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		// diamond: top feeds left and right, both feeding bottom
+		TestNode *top = createTestNode("top", root);
+		TestNode *left = createTestNode("left", root);
+		TestNode *right = createTestNode("right", root);
+		TestSumNode *bottom = new TestSumNode("bottom", root);
+		root->addNode(bottom);
+		
+		NetworkManager::connect(top->out, left->in);
+		NetworkManager::connect(top->out, right->in);
+		NetworkManager::connect(left->out, bottom->in1);
+		NetworkManager::connect(right->out, bottom->in2);
+		
+		assert(bottom->out->intValue() == 4);
+		assert(top->updates == 1);
+		
+		top->in->setIntValue(5);
+		assert(bottom->out->intValue() == 14);
+		assert(top->updates == 2 && left->updates == 2 && right->updates == 2 && bottom->updates == 2);
+		
+		root->removeReference();
+	}
+
+	void testEvaluationContext(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		TestNode *first = createTestNode("first", root);
+		TestNotifyingNode *second = new TestNotifyingNode("second", root);
+		root->addNode(second);
+		TestNode *third = createTestNode("third", root);
+		
+		NetworkManager::connect(first->out, second->in);
+		NetworkManager::connect(second->out, third->in);
+		
+		assert(third->out->intValue() == 3);
+		assert(second->evaluating);
+		assert(EvaluationContext::current() == 0);
+		
+		// setting a value from within an update doesn't dirty the chain being evaluated
+		assert(third->out->intValue() == 3);
+		assert(second->updates == 1 && third->updates == 1);
+		
+		first->in->setIntValue(1);
+		assert(third->out->intValue() == 4);
+		assert(second->updates == 2 && third->updates == 2);
+		
+		root->removeReference();
+	}
+	
+	void testEvaluationFailure(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		TestThrowingNode *failing = new TestThrowingNode("failing", root);
+		root->addNode(failing);
+		TestNode *last = createTestNode("last", root);
+		NetworkManager::connect(failing->out, last->in);
+		
+		failing->throwing = true;
+		bool thrown = false;
+		try{
+			last->out->intValue();
+		}
+		catch(...){
+			thrown = true;
+		}
+		
+		assert(thrown);
+		assert(EvaluationContext::current() == 0);
+		
+		// the failed evaluation doesn't keep its attributes claimed
+		failing->throwing = false;
+		failing->in->setIntValue(1);
+		assert(last->out->intValue() == 3);
+		assert(failing->updates == 2);
+		
+		root->removeReference();
+	}
+	
+	#ifdef CORAL_PARALLEL_TBB
+		struct TestPull{
+			TestPull(TestAttribute *attribute, int *result): attribute(attribute), result(result){
+			}
+			
+			void operator()(){
+				*result = attribute->intValue();
+			}
+			
+			TestAttribute *attribute;
+			int *result;
+		};
+		
+		void testConcurrentPulls(){
+			Node *root = new Node("root", 0);
+			root->addReference();
+			
+			TestSlowNode *shared = new TestSlowNode("shared", root);
+			root->addNode(shared);
+			TestNode *left = createTestNode("left", root);
+			TestNode *right = createTestNode("right", root);
+			NetworkManager::connect(shared->out, left->in);
+			NetworkManager::connect(shared->out, right->in);
+			
+			// two threads pull overlapping subgraphs, the shared node is computed once and both read its new value
+			for(int i = 0; i < 20; ++i){
+				shared->in->setIntValue(i);
+				
+				int leftValue = 0;
+				int rightValue = 0;
+				tbb::tbb_thread leftThread(TestPull(left->out, &leftValue));
+				tbb::tbb_thread rightThread(TestPull(right->out, &rightValue));
+				leftThread.join();
+				rightThread.join();
+				
+				assert(leftValue == i + 2 && rightValue == i + 2);
+				assert(shared->updates == i + 1);
+			}
+			
+			// pulling the shared output itself from both threads, the one not computing it waits for the update instead of reading the old value
+			for(int i = 0; i < 20; ++i){
+				shared->in->setIntValue(100 + i);
+				
+				int firstValue = 0;
+				int secondValue = 0;
+				tbb::tbb_thread firstThread(TestPull(shared->out, &firstValue));
+				tbb::tbb_thread secondThread(TestPull(shared->out, &secondValue));
+				firstThread.join();
+				secondThread.join();
+				
+				assert(firstValue == 101 + i && secondValue == 101 + i);
+				assert(shared->updates == 21 + i);
+			}
+			
+			root->removeReference();
+		}
+		
+		struct TestWalk{
+			TestWalk(Attribute *attribute, bool downstream, int expectedSize, int *mismatches): attribute(attribute), downstream(downstream), expectedSize(expectedSize), mismatches(mismatches){
+			}
+			
+			void operator()(){
+				std::vector<Attribute*> chain;
+				for(int i = 0; i < 2000; ++i){
+					if(downstream){
+						NetworkManager::getDownstreamChain(attribute, chain);
+					}
+					else{
+						NetworkManager::getUpstreamChain(attribute, chain);
+					}
+					
+					if(chain.size() != expectedSize){
+						*mismatches += 1;
+					}
+				}
+			}
+			
+			Attribute *attribute;
+			bool downstream;
+			int expectedSize;
+			int *mismatches;
+		};
+		
+		void testConcurrentWalks(){
+			Node *root = new Node("root", 0);
+			root->addReference();
+			
+			std::vector<TestNode*> nodes;
+			for(int i = 0; i < 100; ++i){
+				nodes.push_back(createTestNode("node" + stringUtils::intToString(i), root));
+				if(i > 0){
+					NetworkManager::connect(nodes[i - 1]->out, nodes[i]->in);
+				}
+			}
+			
+			// walks running from separate threads each keep their own visit marks and reach every attribute of the chain once
+			int downstreamMismatches = 0;
+			int upstreamMismatches = 0;
+			tbb::tbb_thread downstreamThread(TestWalk(nodes.front()->in, true, 200, &downstreamMismatches));
+			tbb::tbb_thread upstreamThread(TestWalk(nodes.back()->out, false, 200, &upstreamMismatches));
+			downstreamThread.join();
+			upstreamThread.join();
+			
+			assert(downstreamMismatches == 0 && upstreamMismatches == 0);
+			
+			root->removeReference();
+		}
+		
+		struct TestEdit{
+			TestEdit(Node *root, int *mismatches): root(root), mismatches(mismatches){
+			}
+			
+			void operator()(){
+				for(int i = 0; i < 50; ++i){
+					std::vector<TestNode*> nodes;
+					for(int j = 0; j < 10; ++j){
+						nodes.push_back(createTestNode("edit" + stringUtils::intToString(i) + "_" + stringUtils::intToString(j), root));
+						if(j > 0){
+							NetworkManager::connect(nodes[j - 1]->out, nodes[j]->in);
+						}
+					}
+					
+					if(nodes.back()->out->intValue() != 10){
+						*mismatches += 1;
+					}
+				}
+			}
+			
+			Node *root;
+			int *mismatches;
+		};
+		
+		struct TestPulls{
+			TestPulls(TestNode *first, TestNode *last, int *mismatches): first(first), last(last), mismatches(mismatches){
+			}
+			
+			void operator()(){
+				for(int i = 0; i < 200; ++i){
+					first->in->setIntValue(i);
+					if(last->out->intValue() != i + 10){
+						*mismatches += 1;
+					}
+				}
+			}
+			
+			TestNode *first;
+			TestNode *last;
+			int *mismatches;
+		};
+		
+		void testConcurrentEdits(){
+			Node *root = new Node("root", 0);
+			root->addReference();
+			Node *editRoot = new Node("editRoot", 0);
+			editRoot->addReference();
+			
+			std::vector<TestNode*> nodes;
+			for(int i = 0; i < 10; ++i){
+				nodes.push_back(createTestNode("node" + stringUtils::intToString(i), root));
+				if(i > 0){
+					NetworkManager::connect(nodes[i - 1]->out, nodes[i]->in);
+				}
+			}
+			
+			// a thread creates and connects nodes while another one evaluates, the shared slots, graph and schedules stay consistent
+			int editMismatches = 0;
+			int pullMismatches = 0;
+			tbb::tbb_thread editThread(TestEdit(editRoot, &editMismatches));
+			tbb::tbb_thread pullThread(TestPulls(nodes.front(), nodes.back(), &pullMismatches));
+			editThread.join();
+			pullThread.join();
+			
+			assert(editMismatches == 0 && pullMismatches == 0);
+			assert(NetworkManager::findObjectByFullName("editRoot.edit49_9") != 0);
+			
+			editRoot->removeReference();
+			root->removeReference();
+		}
+	#endif
+
+	void testOutputCache(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		TestNode *first = createTestNode("first", root);
+		TestNode *second = createTestNode("second", root);
+		NetworkManager::connect(first->out, second->in);
+		first->setOutputCacheEnabled(true);
+		second->setOutputCacheEnabled(true);
+		
+		OutputCache::setEnabled(true);
+		OutputCache::resetStats();
+		
+		assert(second->out->intValue() == 2);
+		first->in->setIntValue(5);
+		assert(second->out->intValue() == 7);
+		assert(OutputCache::misses() == 4 && OutputCache::hits() == 0);
+		assert(OutputCache::entriesCount() == 4);
+		
+		// a known input state restores the outputs without updating
+		first->in->setIntValue(0);
+		assert(second->out->intValue() == 2);
+		assert(OutputCache::hits() == 2);
+		assert(first->updates == 2 && second->updates == 2);
+		
+		// least recently used outputs are evicted first, each entry holds a copy of the output and of the input
+		OutputCache::setMemoryBudget(sizeof(TestValue) * 4);
+		assert(OutputCache::entriesCount() == 2);
+		first->in->setIntValue(5);
+		assert(second->out->intValue() == 7);
+		assert(first->updates == 3 && second->updates == 3);
+		
+		OutputCache::setMemoryBudget(256 * 1024 * 1024);
+		OutputCache::setEnabled(false);
+		OutputCache::clear();
+		assert(OutputCache::entriesCount() == 0 && OutputCache::memoryUsed() == 0);
+		
+		root->removeReference();
+	}
+	
+	void testOutputCacheInputs(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		TestNode *node = createTestNode("node", root);
+		node->setOutputCacheEnabled(true);
+		
+		OutputCache::setEnabled(true);
+		OutputCache::resetStats();
+		
+		node->in->setIntValue(3);
+		assert(node->out->intValue() == 4);
+		
+		// inputs with the same hash but different values are not a known state
+		node->in->setIntValue(19);
+		assert(node->out->intValue() == 20);
+		assert(node->updates == 2 && OutputCache::hits() == 0);
+		
+		node->in->setIntValue(3);
+		assert(node->out->intValue() == 4);
+		assert(node->updates == 3 && OutputCache::hits() == 0);
+		
+		node->in->setIntValue(3);
+		assert(node->out->intValue() == 4);
+		assert(node->updates == 3 && OutputCache::hits() == 1);
+		
+		// nodes with inputs that can't be hashed are never cached
+		OutputCache::clear();
+		((TestValue*)node->in->value())->hashable = false;
+		node->in->setIntValue(3);
+		assert(node->out->intValue() == 4);
+		assert(node->updates == 4 && OutputCache::entriesCount() == 0);
+		
+		OutputCache::setEnabled(false);
+		
+		root->removeReference();
+	}
+	
+	void testOutputCacheSlices(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		TestSlicerNode *slicer = new TestSlicerNode("slicer", root);
+		root->addNode(slicer);
+		TestSlicedNode *sliced = new TestSlicedNode("sliced", slicer);
+		slicer->addNode(sliced);
+		sliced->setOutputCacheEnabled(true);
+		
+		OutputCache::setEnabled(true);
+		OutputCache::resetStats();
+		
+		slicer->sliceCount = 3;
+		assert(sliced->out->intValue() == 1);
+		assert(sliced->updates == 1 && sliced->resizedTo == 3 && sliced->slices() == 3);
+		
+		// the same inputs under a different slicing are not a known state
+		slicer->sliceCount = 2;
+		sliced->in->setIntValue(0);
+		assert(sliced->out->intValue() == 1);
+		assert(sliced->updates == 2 && sliced->resizedTo == 2 && sliced->slices() == 2);
+		
+		// a restored output still resizes the slices of its node
+		slicer->sliceCount = 3;
+		sliced->in->setIntValue(0);
+		assert(sliced->out->intValue() == 1);
+		assert(OutputCache::hits() == 1);
+		assert(sliced->updates == 2 && sliced->resizedTo == 3 && sliced->slices() == 3);
+		
+		OutputCache::setEnabled(false);
+		OutputCache::clear();
+		
+		root->removeReference();
+	}
+
+	void testEarlyCutoff(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		TestNode *first = createTestNode("first", root);
+		TestClampNode *clamp = new TestClampNode("clamp", root);
+		root->addNode(clamp);
+		TestNode *last = createTestNode("last", root);
+		
+		NetworkManager::connect(first->out, clamp->in);
+		NetworkManager::connect(clamp->out, last->in);
+		
+		first->in->setIntValue(10);
+		assert(last->out->intValue() == 6);
+		assert(last->updates == 1);
+		
+		// nodes that didn't opt in are always updated
+		first->in->setIntValue(20);
+		assert(last->out->intValue() == 6);
+		assert(clamp->updates == 2 && last->updates == 2);
+		
+		// the clamped value doesn't change, last is marked clean without updating
+		last->setEarlyCutoffEnabled(true);
+		first->in->setIntValue(30);
+		assert(last->out->intValue() == 6);
+		assert(clamp->updates == 3 && last->updates == 2);
+		
+		first->in->setIntValue(0);
+		assert(last->out->intValue() == 2);
+		assert(last->updates == 3);
+		
+		// forcing dirty updates everything downstream
+		first->in->forceDirty();
+		assert(last->out->intValue() == 2);
+		assert(last->updates == 4);
+		
+		// the global switch turns it off for every node
+		Node::setEarlyCutoffAllowed(false);
+		first->in->setIntValue(30);
+		assert(last->out->intValue() == 6);
+		assert(last->updates == 5);
+		first->in->setIntValue(40);
+		assert(last->out->intValue() == 6);
+		assert(last->updates == 6);
+		Node::setEarlyCutoffAllowed(true);
+		
+		// a new specialization can change what the node computes, it's updated even though its input didn't change
+		last->out->setSpecializationOverride("Float");
+		assert(last->out->intValue() == 6);
+		assert(last->updates == 7);
+		
+		root->removeReference();
+	}
+
+	void testTracer(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		TestNode *first = createTestNode("first", root);
+		TestNode *second = createTestNode("second", root);
+		NetworkManager::connect(first->out, second->in);
+		
+		Tracer::startCapture();
+		assert(second->out->intValue() == 2);
+		first->in->setIntValue(1);
+		assert(second->out->intValue() == 3);
+		Tracer::stopCapture();
+		
+		std::vector<TraceNodeStats> stats = Tracer::nodeStats();
+		assert(stats.size() == 2);
+		for(int i = 0; i < stats.size(); ++i){
+			assert(stats[i].updates == 2);
+		}
+		
+		std::string trace = Tracer::chromeTrace();
+		assert(trace.find("\"traceEvents\"") != std::string::npos);
+		assert(trace.find("\"root.second\"") != std::string::npos);
+		
+		// once the ring buffer is full the oldest events are overwritten
+		Tracer::startCapture(3);
+		first->in->setIntValue(2);
+		assert(second->out->intValue() == 4);
+		Tracer::stopCapture();
+		assert(Tracer::eventsCount() == 3);
+		
+		root->removeReference();
+	}
+	
+	// stands in for the python layer instantiating the registered node classes
+	Node *createFileTestNode(const std::string &className, const std::string &name, Node *parent){
+		if(className != "TestNode"){
+			return 0;
+		}
+		
+		TestNode *node = createTestNode(name, parent);
+		node->setClassName(className);
+		
+		return node;
+	}
+	
+	void testNetworkFile(){
+		Command command;
+		assert(command.setFromScript("executeCommand('Test', flag = True, count = -2, ratio = 0.500000, name = 'root.a', list = ['root.a','root.b'])"));
+		assert(command.name() == "Test");
+		assert(command.argAsBool("flag"));
+		assert(command.argAsInt("count") == -2);
+		assert(command.argAsFloat("ratio") == 0.5);
+		assert(command.argAsString("name") == "root.a");
+		assert(command.argType("list") == Command::undefinedType);
+		assert(command.argAsString("list") == "['root.a','root.b']");
+		assert(command.setFromScript(command.asScript()));
+		assert(command.argNames().size() == 5);
+		assert(command.setFromScript("print 'hello'") == false);
+		
+		// string literals are read the way python reads them
+		assert(command.setFromScript("executeCommand(\"Test\", a = \"it's (x, y)\", b = 'say \\'hi\\'\\n\\x41', c = r'\\d)', d = u'\\u00e9', e = 'a' + 'b', f = ['x)', \"y,\"], g = 010)"));
+		assert(command.name() == "Test");
+		assert(command.argAsString("a") == "it's (x, y)");
+		assert(command.argAsString("b") == "say 'hi'\nA");
+		assert(command.argAsString("c") == "\\d)");
+		assert(command.argAsString("d") == "\xc3\xa9");
+		assert(command.argType("e") == Command::undefinedType && command.argAsString("e") == "'a' + 'b'");
+		assert(command.argType("f") == Command::undefinedType && command.argAsString("f") == "['x)', \"y,\"]");
+		assert(command.argType("g") == Command::undefinedType);
+		
+		// strings are escaped and floats keep every digit of their double when written back
+		Command escaped;
+		escaped.setName("Test");
+		escaped.setArgString("text", "quote ' backslash \\ newline \n tab \t");
+		escaped.setArgFloat("precise", 0.1);
+		escaped.setArgFloat("round", 2.5);
+		escaped.setArgFloat("tiny", 1e-20);
+		std::string escapedScript = escaped.asScript();
+		assert(escapedScript.find("round = 2.500000") != std::string::npos);
+		assert(command.setFromScript(escapedScript));
+		assert(command.argAsString("text") == "quote ' backslash \\ newline \n tab \t");
+		assert(command.argAsFloat("precise") == 0.1);
+		assert(command.argAsFloat("round") == 2.5);
+		assert(command.argAsFloat("tiny") == 1e-20);
+		
+		std::size_t position = 0;
+		std::string twoCommands = "executeCommand('A', x = 1)\nexecuteCommand('B')";
+		assert(command.setFromScript(twoCommands, position) && command.name() == "A" && position == twoCommands.find("\n"));
+		assert(command.setFromScript(twoCommands) == false);
+		
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		TestNode *first = (TestNode*)createFileTestNode("TestNode", "first", root);
+		TestNode *second = (TestNode*)createFileTestNode("TestNode", "second", root);
+		TestNode *inner = (TestNode*)createFileTestNode("TestNode", "inner", first);
+		NetworkManager::connect(first->out, second->in);
+		NetworkManager::connect(first->out, inner->in);
+		first->in->setIntValue(3);
+		
+		NetworkFile file;
+		file.setFromNode(root);
+		file.addCommandsFromScript("# extra data\nexecuteCommand('Custom', node = 'root.first', label = \"it's (a, b)\",\n\tratio = 0.1)\nprint 'hello'\n");
+		assert(file.errors().size() == 1);
+		std::string data = file.data();
+		assert(NetworkFile::isNetworkFileData(data));
+		
+		NetworkFile truncated;
+		assert(truncated.setFromData(data.substr(0, data.size() - 1)) == false);
+		
+		std::string olderVersion = data.substr(0, 4);
+		stringUtils::appendUInt32(olderVersion, NetworkFile::version() - 1);
+		assert(truncated.setFromData(olderVersion + data.substr(8)) == false);
+		
+		// nodes are instantiated through the callback set by the python layer
+		Node *(*oldCallback)(const std::string &, const std::string &, Node *) = NetworkFile::_createNodeCallback;
+		NetworkFile::_createNodeCallback = createFileTestNode;
+		
+		Node *other = new Node("other", 0);
+		other->addReference();
+		
+		NetworkFile loaded;
+		assert(loaded.setFromData(data));
+		
+		int record = loaded.applyRecords(0, other);
+		assert(record == loaded.recordsCount() - 1);
+		assert(loaded.recordType(record) == NetworkFile::commandRecord);
+		
+		Command loadedCommand = loaded.command(record, other);
+		assert(loadedCommand.name() == "Custom");
+		assert(loadedCommand.argAsString("node") == "other.first");
+		assert(loadedCommand.argAsString("label") == "it's (a, b)");
+		assert(loadedCommand.argAsFloat("ratio") == 0.1);
+		
+		assert(loaded.applyRecords(record + 1, other) == loaded.recordsCount());
+		assert(loaded.errors().empty());
+		
+		NetworkFile::_createNodeCallback = oldCallback;
+		
+		TestNode *otherFirst = (TestNode*)other->findNode("first");
+		TestNode *otherSecond = (TestNode*)other->findNode("second");
+		TestNode *otherInner = (TestNode*)otherFirst->findNode("inner");
+		assert(otherFirst && otherSecond && otherInner);
+		assert(otherFirst->className() == "TestNode");
+		assert(otherSecond->in->input() == otherFirst->out);
+		assert(otherInner->in->input() == otherFirst->out);
+		assert(otherFirst->in->intValue() == 3);
+		assert(otherSecond->out->intValue() == 5);
+		assert(otherInner->out->intValue() == 5);
+		
+		other->removeReference();
+		root->removeReference();
+	}
+
+	void testFullNameIndex(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		Node *parent = new Node("parent", root);
+		root->addNode(parent);
+		TestNode *child = createTestNode("child", parent);
+		
+		assert(NetworkManager::findObjectByFullName("root.parent.child") == child);
+		assert(NetworkManager::findObjectByFullName("root.parent.child.in") == child->in);
+		assert(parent->findNode("child") == child);
+		assert(child->findAttribute("out") == child->out);
+		assert(parent->findNode("missing") == 0);
+		
+		// renaming a node renames the whole hierarchy below it
+		parent->setName("renamed");
+		assert(NetworkManager::findObjectByFullName("root.parent.child") == 0);
+		assert(NetworkManager::findObjectByFullName("root.renamed.child.out") == child->out);
+		
+		// an homonymous hierarchy doesn't shadow the first one
+		Node *otherRoot = new Node("root", 0);
+		otherRoot->addReference();
+		Node *otherParent = new Node("renamed", otherRoot);
+		otherRoot->addNode(otherParent);
+		TestNode *otherChild = createTestNode("child", otherParent);
+		
+		assert(parent->findNode("child") == child);
+		assert(otherParent->findNode("child") == otherChild);
+		
+		otherRoot->removeReference();
+		assert(parent->findNode("child") == child);
+		
+		parent->removeNode(child);
+		assert(NetworkManager::findObjectByFullName("root.renamed.child") == 0);
+		assert(parent->findNode("child") == 0);
+		
+		root->removeReference();
+	}
+
+	void testSlotMapRegistry(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		TestNode *nodeA = createTestNode("nodeA", root);
+		TestNode *nodeB = createTestNode("nodeB", root);
+		NetworkManager::connect(nodeA->out, nodeB->in);
+		
+		int staleId = nodeB->id();
+		int staleInId = nodeB->in->id();
+		assert(NetworkManager::findObjectById(staleId) == nodeB);
+		
+		// deleted ids stop resolving and their slots are handed out again with a new generation
+		root->removeNode(nodeB);
+		assert(NetworkManager::findObjectById(staleId) == 0);
+		assert(NetworkManager::findObjectById(staleInId) == 0);
+		
+		TestNode *nodeC = createTestNode("nodeC", root);
+		assert(NetworkManager::findObjectById(staleId) == 0);
+		assert(NetworkManager::findObjectById(staleInId) == 0);
+		assert(NetworkManager::findObjectById(nodeC->id()) == nodeC);
+		assert(NetworkManager::findObjectById(nodeC->in->id()) == nodeC->in);
+		
+		// the recycled vertices don't inherit the edges of the deleted attributes
+		std::vector<Attribute*> chain;
+		NetworkManager::getDownstreamChain(nodeA->out, chain);
+		assert(chain.size() == 1);
+		NetworkManager::getUpstreamChain(nodeC->out, chain);
+		assert(chain.size() == 2);
+		
+		NetworkManager::connect(nodeA->out, nodeC->in);
+		NetworkManager::getDownstreamChain(nodeA->out, chain);
+		assert(chain.size() == 3);
+		assert(chain.back() == nodeC->out);
+		
+		// a slot recycled over and over is retired once its generations run out, its old ids never resolve again
+		ErrorObject *first = new ErrorObject();
+		first->addReference();
+		int firstId = first->id();
+		first->removeReference();
+		for(int i = 0; i < 5000; ++i){
+			ErrorObject *object = new ErrorObject();
+			object->addReference();
+			assert(object->id() != firstId && NetworkManager::findObjectById(firstId) == 0);
+			assert(NetworkManager::findObjectById(object->id()) == object);
+			object->removeReference();
+		}
+		
+		root->removeReference();
+	}
+
+	void testCycleDetection(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		// a ladder of diamonds, walking every path upstream would take 2^levels steps
+		int levels = 40;
+		TestNode *first = createTestNode("first", root);
+		Attribute *previous = first->out;
+		for(int i = 0; i < levels; ++i){
+			TestNode *left = createTestNode("left", root);
+			TestNode *right = createTestNode("right", root);
+			TestSumNode *sum = new TestSumNode("sum", root);
+			root->addNode(sum);
+			
+			NetworkManager::connect(previous, left->in);
+			NetworkManager::connect(previous, right->in);
+			NetworkManager::connect(left->out, sum->in1);
+			NetworkManager::connect(right->out, sum->in2);
+			previous = sum->out;
+		}
+		
+		TestNode *last = createTestNode("last", root);
+		assert(NetworkManager::isCycle(previous, first->in));
+		assert(NetworkManager::connect(previous, first->in) == false);
+		assert(NetworkManager::connect(previous, last->in));
+		
+		// nodes created after the ladder come later in the order and get moved upstream when they feed it
+		TestNode *head = createTestNode("head", root);
+		assert(NetworkManager::connect(head->out, first->in));
+		assert(NetworkManager::isCycle(last->out, head->in));
+		assert(NetworkManager::isCycle(head->out, last->in) == false);
+		assert(NetworkManager::connect(last->out, head->in) == false);
+		
+		// removing an edge breaks the cycle
+		first->in->disconnectInput();
+		assert(NetworkManager::isCycle(last->out, head->in) == false);
+		assert(NetworkManager::connect(last->out, head->in));
+		assert(NetworkManager::isCycle(head->out, first->in));
+		
+		root->removeReference();
+	}
+
+	void testDirtyPropagation(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		TestNode *top = createTestNode("top", root);
+		TestNode *left = createTestNode("left", root);
+		TestNode *right = createTestNode("right", root);
+		TestSumNode *bottom = new TestSumNode("bottom", root);
+		root->addNode(bottom);
+		
+		NetworkManager::connect(top->out, left->in);
+		NetworkManager::connect(top->out, right->in);
+		NetworkManager::connect(left->out, bottom->in1);
+		NetworkManager::connect(right->out, bottom->in2);
+		
+		top->in->setIntValue(1);
+		assert(bottom->out->intValue() == 6);
+		assert(left->out->isClean() && bottom->out->isClean());
+		
+		// the diamond's downstream is reached once per attribute
+		std::vector<Attribute*> chain;
+		NetworkManager::getDownstreamChain(top->in, chain);
+		assert(chain.size() == 9);
+		
+		top->in->setIntValue(2);
+		assert(left->out->isClean() == false && right->out->isClean() == false && bottom->out->isClean() == false);
+		assert(bottom->out->intValue() == 8);
+		
+		// a node connected after the last pull is dirtied through the live graph
+		TestNode *tail = createTestNode("tail", root);
+		NetworkManager::connect(bottom->out, tail->in);
+		assert(tail->out->intValue() == 9);
+		top->in->setIntValue(3);
+		assert(tail->out->isClean() == false);
+		assert(tail->out->intValue() == 11);
+		
+		// dirtying only stamps the source, the flags downstream are validated when they're read
+		top->in->setIntValue(4);
+		top->in->setIntValue(5);
+		assert(left->out->isClean() == false && tail->out->isClean() == false);
+		assert(left->out->intValue() == 7);
+		assert(left->out->isClean() && tail->out->isClean() == false);
+		assert(tail->out->intValue() == 15);
+		assert(tail->out->isClean());
+		
+		// observers downstream are still notified
+		Node *observer = new Node("observer", root);
+		root->addNode(observer);
+		TestObservingAttribute *observing = new TestObservingAttribute("observing", observer);
+		observer->addInputAttribute(observing);
+		NetworkManager::connect(tail->out, observing);
+		assert(observing->intValue() == 15);
+		
+		observing->dirtied = 0;
+		top->in->setIntValue(6);
+		assert(observing->dirtied == 1);
+		assert(observing->intValue() == 17);
+		
+		root->removeReference();
+	}
+
+	void testEvaluationState(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		TestNode *first = createTestNode("first", root);
+		TestNode *second = createTestNode("second", root);
+		NetworkManager::connect(first->out, second->in);
+		
+		first->in->setIntValue(1);
+		assert(second->out->intValue() == 3);
+		
+		// each state sets its own input, the network keeps its value
+		std::vector<EvaluationState*> states;
+		for(int i = 0; i < 4; ++i){
+			EvaluationState *state = new EvaluationState();
+			EvaluationStateScope scope(state);
+			first->in->setIntValue(10 * i);
+			assert(second->out->isClean() == false);
+			
+			states.push_back(state);
+		}
+		assert(second->out->isClean());
+		assert(first->in->intValue() == 1);
+		
+		EvaluationState::evaluate(second->out, states);
+		for(int i = 0; i < states.size(); ++i){
+			EvaluationStateScope scope(states[i]);
+			assert(second->out->isClean());
+			assert(second->out->intValue() == 10 * i + 2);
+			assert(first->out->intValue() == 10 * i + 1);
+		}
+		
+		assert(second->out->intValue() == 3);
+		assert(((TestValue*)second->out->outValue())->value == 3);
+		
+		// a cleared state reads the network again
+		states[3]->clear();
+		assert(states[3]->valuesCount() == 0);
+		{
+			EvaluationStateScope scope(states[3]);
+			assert(second->out->intValue() == 3);
+		}
+		
+		for(int i = 0; i < states.size(); ++i){
+			delete states[i];
+		}
+		
+		root->removeReference();
+	}
+	
+	void testConcurrentStates(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		TestSlowNode *first = new TestSlowNode("first", root);
+		root->addNode(first);
+		TestSlicerNode *slicer = new TestSlicerNode("slicer", root);
+		root->addNode(slicer);
+		TestSlicedNode *sliced = new TestSlicedNode("sliced", slicer);
+		slicer->addNode(sliced);
+		TestSlowNode *second = new TestSlowNode("second", root);
+		root->addNode(second);
+		NetworkManager::connect(first->out, sliced->in);
+		NetworkManager::connect(sliced->out, second->in);
+		slicer->sliceCount = 4;
+		
+		// the states are pulled at once, the slices of each update run nested within the evaluation of its state
+		std::vector<EvaluationState*> states;
+		for(int i = 0; i < 8; ++i){
+			states.push_back(new EvaluationState());
+		}
+		
+		for(int pass = 0; pass < 5; ++pass){
+			for(int i = 0; i < states.size(); ++i){
+				EvaluationStateScope scope(states[i]);
+				first->in->setIntValue(10 * i + pass);
+			}
+			
+			EvaluationState::evaluate(second->out, states);
+			for(int i = 0; i < states.size(); ++i){
+				EvaluationStateScope scope(states[i]);
+				assert(first->out->intValue() == 10 * i + pass + 1);
+				assert(sliced->out->intValue() == 10 * i + pass + 2);
+				assert(second->out->intValue() == 10 * i + pass + 3);
+			}
+		}
+		
+		assert(second->out->intValue() == 3);
+		
+		for(int i = 0; i < states.size(); ++i){
+			delete states[i];
+		}
+		
+		root->removeReference();
+	}
+
+	void testSpecializationSolver(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		std::vector<std::string> numbers;
+		numbers.push_back("Int");
+		numbers.push_back("Float");
+		numbers.push_back("IntArray");
+		std::vector<std::string> floats;
+		floats.push_back("FloatArray");
+		floats.push_back("Float");
+		
+		TestSpecializedNode *source = new TestSpecializedNode("source", root, numbers);
+		root->addNode(source);
+		TestSpecializedNode *target = new TestSpecializedNode("target", root, floats);
+		root->addNode(target);
+		
+		// connected attributes narrow to their intersection and the links carry it through each node
+		NetworkManager::connect(source->out, target->in);
+		assert(source->out->specialization() == std::vector<std::string>(1, "Float"));
+		assert(target->in->specialization() == std::vector<std::string>(1, "Float"));
+		assert(source->in->specialization() == std::vector<std::string>(1, "Float"));
+		assert(target->out->specialization() == std::vector<std::string>(1, "Float"));
+		
+		// a disconnection widens the branch back to the allowed specializations
+		target->in->disconnectInput();
+		assert(source->in->specialization() == numbers);
+		assert(source->out->specialization() == numbers);
+		assert(target->out->specialization() == floats);
+		
+		// an override is carried through the links when the branch is solved again
+		source->in->setSpecializationOverride("IntArray");
+		source->in->forceSpecializationUpdate();
+		assert(source->out->specialization() == std::vector<std::string>(1, "IntArray"));
+		source->in->removeSpecializationOverride();
+		source->in->forceSpecializationUpdate();
+		assert(source->out->specialization() == numbers);
+		
+		root->removeReference();
+	}
+
+	void testFanOutMembership(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		TestNode *source = createTestNode("source", root);
+		std::vector<TestNode*> targets;
+		for(int i = 0; i < 2000; ++i){
+			TestNode *target = createTestNode("target", root);
+			NetworkManager::connect(source->out, target->in);
+			targets.push_back(target);
+		}
+		
+		assert(source->containsAttribute(source->out) && source->containsAttribute(targets[0]->in) == false);
+		assert(source->out->outputs().size() == 2000);
+		assert(source->out->isConnectedTo(targets[1999]->in));
+		assert(targets[0]->out->isAffectedBy(targets[0]->in));
+		
+		// outputs keep their connection order while leaving
+		for(int i = 0; i < targets.size(); i += 2){
+			targets[i]->in->disconnectInput();
+		}
+		
+		const std::vector<Attribute*> &outputs = source->out->outputs();
+		assert(outputs.size() == 1000);
+		for(int i = 0; i < outputs.size(); ++i){
+			assert(outputs[i] == targets[i * 2 + 1]->in);
+		}
+		
+		assert(source->out->isConnectedTo(targets[0]->in) == false);
+		assert(source->out->isConnectedTo(targets[1]->in));
+		
+		NetworkManager::connect(source->out, targets[0]->in);
+		assert(source->out->outputs().back() == targets[0]->in);
+		
+		source->in->setIntValue(1);
+		assert(targets[0]->out->intValue() == 3 && targets[1999]->out->intValue() == 3);
+		
+		root->removeReference();
+	}
+
+	int deletedNodesCount = 0;
+	int deleteNodesNotifications = 0;
+	void countDeletedNodes(const std::vector<Node*> &nodes){
+		deletedNodesCount += nodes.size();
+		deleteNodesNotifications += 1;
+	}
+	
+	void testBulkDeletion(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		TestNode *source = createTestNode("source", root);
+		TestNode *sink = createTestNode("sink", root);
+		Node *group = new Node("group", root);
+		root->addNode(group);
+		
+		// source -> first -> ... -> last -> sink, with the chain nested under group
+		std::vector<Node*> chain;
+		Attribute *previous = source->out;
+		for(int i = 0; i < 100; ++i){
+			TestNode *node = createTestNode("node", group);
+			NetworkManager::connect(previous, node->in);
+			previous = node->out;
+			chain.push_back(node);
+		}
+		NetworkManager::connect(previous, sink->in);
+		
+		source->in->setIntValue(1);
+		assert(sink->out->intValue() == 103);
+		
+		void(*oldCallback)(const std::vector<Node*> &) = NetworkManager::_deleteNodesCallback;
+		NetworkManager::_deleteNodesCallback = countDeletedNodes;
+		deletedNodesCount = 0;
+		deleteNodesNotifications = 0;
+		
+		int objectsBefore = NetworkManager::objectCount();
+		int groupId = group->id();
+		int nestedId = chain[50]->id();
+		
+		std::vector<Node*> nodes(1, group);
+		NetworkManager::deleteNodes(nodes);
+		
+		NetworkManager::_deleteNodesCallback = oldCallback;
+		
+		// one notification listing the nested nodes too
+		assert(deleteNodesNotifications == 1 && deletedNodesCount == 101);
+		assert(NetworkManager::findObjectById(groupId) == 0 && NetworkManager::findObjectById(nestedId) == 0);
+		assert(root->nodes().size() == 2);
+		// group plus every nested node with its two attributes and their values
+		assert(NetworkManager::objectCount() == objectsBefore - (1 + 100 * 5));
+		
+		// the nodes left behind got disconnected and their chains rebuilt
+		assert(source->out->outputs().size() == 0);
+		assert(sink->in->input() == 0);
+		NetworkManager::connect(source->out, sink->in);
+		source->in->setIntValue(2);
+		assert(sink->out->intValue() == 4);
+		
+		root->removeReference();
+	}
+
+	void testNumericSlices(){
+		Numeric *numeric = new Numeric();
+		numeric->addReference();
+		
+		numeric->setType(Numeric::numericTypeFloatArray);
+		numeric->resizeSlices(4);
+		assert(numeric->slices() == 4 && numeric->sizeSlice(0) == 1 && numeric->sizeSlice(3) == 0);
+		
+		// slices resized while their siblings are computed are kept aside until the next resizeSlices
+		for(int i = 0; i < 4; ++i){
+			numeric->setFloatValuesSlice(i, std::vector<float>(i + 1, float(i)));
+		}
+		
+		for(int i = 0; i < 4; ++i){
+			NumericSpan<const float> values = numeric->valuesSpanSlice<float>(i);
+			assert(values.size() == i + 1 && values[i] == float(i));
+			assert(numeric->floatValuesSlice(i) == std::vector<float>(i + 1, float(i)));
+		}
+		
+		numeric->resizeSlices(4);
+		NumericSpan<const float> first = numeric->valuesSpanSlice<float>(0);
+		NumericSpan<const float> last = numeric->valuesSpanSlice<float>(3);
+		assert(last.data() == first.data() + 6 && last.size() == 4 && last[3] == 3.0);
+		
+		// out of range slices and ids read the last ones, a mismatching type reads nothing
+		assert(numeric->floatValueAtSlice(10, 10) == 3.0);
+		assert(numeric->valuesSpanSlice<int>(0).size() == 0);
+		numeric->setIntValueAtSlice(0, 0, 5);
+		assert(numeric->floatValueAtSlice(0, 0) == 0.0);
+		
+		NumericSpan<float> written = numeric->resizeValuesSpanSlice<float>(1, 3);
+		written[2] = 7.0;
+		assert(numeric->sizeSlice(1) == 3 && numeric->floatValueAtSlice(1, 2) == 7.0 && numeric->floatValueAtSlice(1, 0) == 1.0);
+		
+		Numeric *copied = (Numeric*)numeric->duplicate();
+		copied->addReference();
+		assert(copied->hash() == numeric->hash());
+		assert(copied->valuesSpanSlice<float>(2).data() == copied->valuesSpanSlice<float>(1).data() + 3);
+		
+		// single values keep exactly one value per slice
+		numeric->setType(Numeric::numericTypeFloat);
+		assert(numeric->sizeSlice(0) == 1 && numeric->sizeSlice(2) == 1 && numeric->floatValueAtSlice(3, 0) == 3.0);
+		
+		numeric->setType(Numeric::numericTypeVec3Array);
+		numeric->resizeSlices(1);
+		std::vector<Imath::V3f> points;
+		points.push_back(Imath::V3f(1.0, 2.0, 3.0));
+		points.push_back(Imath::V3f(4.0, 5.0, 6.0));
+		numeric->setVec3Values(points);
+		
+		copied->setFromString(numeric->asString());
+		copied->setType(Numeric::numericTypeVec3Array);
+		assert(copied->vec3Values() == points);
+		
+		copied->setFromBinary(numeric->asBinary());
+		assert(copied->vec3ValueAt(1) == points[1] && copied->hash() == numeric->hash());
+		
+		// a size whose byte count wraps 32 bits is rejected rather than allocated short
+		std::string truncated;
+		stringUtils::appendUInt32(truncated, (unsigned int)Numeric::numericTypeMatrix44Array);
+		stringUtils::appendUInt32(truncated, 0x04000001);
+		truncated.append(64, 0);
+		copied->setFromBinary(truncated);
+		assert(copied->vec3ValueAt(1) == points[1]);
+		
+		copied->removeReference();
+		numeric->removeReference();
+	}
+	
+	void testCopyOnWrite(){
+		Numeric *source = new Numeric();
+		source->addReference();
+		source->setType(Numeric::numericTypeFloatArray);
+		source->setFloatValues(std::vector<float>(3, 1.0));
+		
+		// copies share the values until one of them is modified
+		Numeric *shared = (Numeric*)source->duplicate();
+		shared->addReference();
+		assert(shared->valuesSpanSlice<float>(0).data() == source->valuesSpanSlice<float>(0).data());
+		
+		shared->setFloatValueAt(1, 2.0);
+		assert(shared->valuesSpanSlice<float>(0).data() != source->valuesSpanSlice<float>(0).data());
+		assert(source->floatValueAt(1) == 1.0 && shared->floatValueAt(1) == 2.0);
+		
+		Numeric *passed = new Numeric();
+		passed->addReference();
+		passed->setType(Numeric::numericTypeFloatArray);
+		passed->copySlice(0, source);
+		assert(passed->valuesSpanSlice<float>(0).data() == source->valuesSpanSlice<float>(0).data());
+		
+		source->resize(5);
+		assert(source->size() == 5 && passed->size() == 3);
+		
+		// sliced values are copied slice by slice, a shared buffer is never written
+		shared->resizeSlices(3);
+		shared->setFloatValuesSlice(2, std::vector<float>(2, 4.0));
+		passed->copy(shared);
+		passed->resizeValuesSpanSlice<float>(2, 2)[0] = 5.0;
+		assert(shared->floatValueAtSlice(2, 0) == 4.0 && passed->floatValueAtSlice(2, 0) == 5.0);
+		
+		source->resizeSlices(3);
+		source->copySlice(2, shared);
+		assert(source->floatValuesSlice(2) == std::vector<float>(2, 4.0) && source->sizeSlice(0) == 5);
+		
+		// a mismatching type copies nothing
+		Numeric *ints = new Numeric();
+		ints->addReference();
+		ints->setType(Numeric::numericTypeIntArray);
+		ints->copySlice(0, source);
+		assert(ints->size() == 1 && ints->intValueAt(0) == 0);
+		
+		std::vector<Imath::V3f> points;
+		points.push_back(Imath::V3f(0.0, 0.0, 0.0));
+		points.push_back(Imath::V3f(1.0, 0.0, 0.0));
+		points.push_back(Imath::V3f(0.0, 1.0, 0.0));
+		std::vector<std::vector<int> > faces(1);
+		faces[0].push_back(0);
+		faces[0].push_back(1);
+		faces[0].push_back(2);
+		
+		Geo *geo = new Geo();
+		geo->addReference();
+		geo->build(points, faces);
+		geo->vertices();
+		
+		Geo *deformed = (Geo*)geo->duplicate();
+		deformed->addReference();
+		assert(&deformed->points()[0] == &geo->points()[0]);
+		assert(deformed->vertices()[2]->point() == points[2]);
+		
+		std::vector<Imath::V3f> displaced(2, Imath::V3f(0.0, 0.0, 1.0));
+		deformed->displacePoints(displaced);
+		assert(geo->points() == points && geo->vertices()[0]->point() == points[0]);
+		assert(deformed->points()[1] == displaced[1] && deformed->points()[2] == points[2]);
+		assert(deformed->vertices()[1]->point() == displaced[1] && deformed->faces()[0]->points()[2] == points[2]);
+		
+		deformed->removeReference();
+		geo->removeReference();
+		ints->removeReference();
+		passed->removeReference();
+		shared->removeReference();
+		source->removeReference();
+	}
+
+	void testSharedValues(){
+		Numeric *numeric = new Numeric();
+		numeric->addReference();
+		numeric->setType(Numeric::numericTypeVec3Array);
+		numeric->setVec3Values(std::vector<Imath::V3f>(3, Imath::V3f(1.0, 2.0, 3.0)));
+		
+		// a shared buffer outlives any change to the Numeric
+		NumericSpan<const Imath::V3f> values;
+		boost::shared_ptr<const std::vector<char> > buffer = numeric->sharedValuesSlice<Imath::V3f>(0, values);
+		assert(values.size() == 3 && values[2] == Imath::V3f(1.0, 2.0, 3.0));
+		
+		numeric->setVec3ValueAt(2, Imath::V3f(0.0, 0.0, 0.0));
+		numeric->resize(10);
+		assert(values[2] == Imath::V3f(1.0, 2.0, 3.0) && numeric->vec3ValueAt(2) == Imath::V3f(0.0, 0.0, 0.0));
+		
+		// mismatching types share nothing
+		NumericSpan<const float> floats;
+		numeric->sharedValuesSlice<float>(0, floats);
+		assert(floats.size() == 0);
+		
+		// spilled slices are packed before being shared
+		numeric->resizeSlices(3);
+		numeric->resizeValuesSpanSlice<Imath::V3f>(1, 2)[1] = Imath::V3f(4.0, 5.0, 6.0);
+		buffer = numeric->sharedValuesSlice<Imath::V3f>(1, values);
+		assert(values.size() == 2 && values[1] == Imath::V3f(4.0, 5.0, 6.0));
+		assert(values.data() >= (const Imath::V3f*)&(*buffer)[0] && values.data() + 2 <= (const Imath::V3f*)(&(*buffer)[0] + buffer->size()));
+		
+		numeric->resizeValuesSpanSlice<Imath::V3f>(1, 2)[1] = Imath::V3f(0.0, 0.0, 0.0);
+		assert(values[1] == Imath::V3f(4.0, 5.0, 6.0) && numeric->vec3ValueAtSlice(1, 1) == Imath::V3f(0.0, 0.0, 0.0));
+		
+		std::vector<Imath::V3f> points;
+		points.push_back(Imath::V3f(0.0, 0.0, 0.0));
+		points.push_back(Imath::V3f(1.0, 0.0, 0.0));
+		points.push_back(Imath::V3f(0.0, 1.0, 0.0));
+		std::vector<std::vector<int> > faces(1);
+		faces[0].push_back(0);
+		faces[0].push_back(1);
+		faces[0].push_back(2);
+		
+		Geo *geo = new Geo();
+		geo->addReference();
+		geo->build(points, faces);
+		
+		boost::shared_ptr<const std::vector<Imath::V3f> > sharedPoints = geo->sharedPoints();
+		boost::shared_ptr<const std::vector<Imath::V3f> > normals = geo->sharedFaceNormals();
+		boost::shared_ptr<const std::vector<int> > indices = geo->sharedRawIndices();
+		assert(*sharedPoints == points && (*normals)[0] == Imath::V3f(0.0, 0.0, 1.0));
+		assert(*indices == faces[0] && *geo->sharedRawIndexCounts() == std::vector<int>(1, 3));
+		
+		// the points and normals are recomputed in new storage while shared
+		std::vector<Imath::V3f> flipped(points);
+		flipped[1] = Imath::V3f(0.0, 1.0, 0.0);
+		flipped[2] = Imath::V3f(1.0, 0.0, 0.0);
+		geo->setPoints(flipped);
+		assert(geo->faceNormals()[0] == Imath::V3f(0.0, 0.0, -1.0) && geo->points() == flipped);
+		assert(*sharedPoints == points && (*normals)[0] == Imath::V3f(0.0, 0.0, 1.0));
+		
+		geo->clear();
+		assert(*indices == faces[0]);
+		
+		// points read from plain arrays, in place or in new storage while shared
+		geo->build(&points[0], points.size(), faces);
+		geo->setPoints(&flipped[0], flipped.size());
+		assert(geo->points() == flipped && geo->faceNormals()[0] == Imath::V3f(0.0, 0.0, -1.0));
+		
+		sharedPoints = geo->sharedPoints();
+		geo->setPoints(&points[0], points.size());
+		assert(geo->points() == points && *sharedPoints == flipped && geo->vertices()[1]->point() == points[1]);
+		
+		// mismatching sizes are ignored
+		geo->setPoints(&points[0], 2);
+		assert(geo->points() == points);
+		
+		geo->removeReference();
+		numeric->removeReference();
+	}
+	
+	class FillRangesKernel{
+	public:
+		FillRangesKernel(std::vector<int> &visits): _visits(visits){
+		}
+		
+		void operator() (unsigned int begin, unsigned int end) const{
+			for(unsigned int i = begin; i < end; ++i){
+				_visits[i] += 1;
+			}
+		}
+	
+	private:
+		std::vector<int> &_visits;
+	};
+	
+	void testParallelArrays(){
+		// every element is visited once, whatever the grain size
+		unsigned int grainSizes[] = {0, 1, 7, 1000, 5000};
+		for(int i = 0; i < 5; ++i){
+			std::vector<int> visits(1000, 0);
+			ParallelArrays::forEachRange(visits.size(), grainSizes[i], FillRangesKernel(visits));
+			assert(visits == std::vector<int>(1000, 1));
+		}
+		
+		std::vector<int> empty;
+		ParallelArrays::forEachRange(0, 1, FillRangesKernel(empty));
+		
+		// nodes use the global grain size unless they set their own
+		unsigned int oldGrainSize = ParallelArrays::grainSize();
+		Node *node = new Node("node", 0);
+		node->addReference();
+		
+		ParallelArrays::setGrainSize(64);
+		assert(node->arrayGrainSize() == 64);
+		
+		node->setArrayGrainSize(0);
+		ParallelArrays::setGrainSize(128);
+		assert(node->arrayGrainSize() == 0);
+		
+		node->setArrayGrainSize(-1);
+		assert(node->arrayGrainSize() == 128);
+		
+		ParallelArrays::setGrainSize(oldGrainSize);
+		node->removeReference();
+	}
+	
+	class TestNumericAttribute: public Attribute{
+	public:
+		TestNumericAttribute(const std::string &name, Node *parent, Numeric::Type type): Attribute(name, parent){
+			Numeric *numeric = new Numeric();
+			numeric->setType(type);
+			setValuePtr(numeric);
+		}
+		
+		std::vector<float> floatValues(){
+			return ((Numeric*)value())->floatValues();
+		}
+		
+		void setFloatValues(const std::vector<float> &values){
+			((Numeric*)outValue())->setFloatValues(values);
+			valueChanged();
+		}
+	};
+	
+	struct TestAddFunction{
+		float operator() (float valueA, float valueB) const{
+			return valueA + valueB;
+		}
+	};
+	
+	// out = in0 + in1, in0 is a float array while in1 is either a float array or a single float
+	class TestArrayAddNode: public Node{
+	public:
+		TestArrayAddNode(const std::string &name, Node *parent, Numeric::Type in1Type): Node(name, parent), updates(0){
+			in0 = new TestNumericAttribute("in0", this, Numeric::numericTypeFloatArray);
+			in1 = new TestNumericAttribute("in1", this, in1Type);
+			out = new TestNumericAttribute("out", this, Numeric::numericTypeFloatArray);
+			addInputAttribute(in0);
+			addInputAttribute(in1);
+			addOutputAttribute(out);
+			setAttributeAffect(in0, out);
+			setAttributeAffect(in1, out);
+		}
+		
+		bool arrayFusionStage(Attribute *attribute, ArrayFusionStage &stage){
+			if(attribute != out){
+				return false;
+			}
+			
+			stage.inputA = in0;
+			stage.inputB = in1;
+			stage.kernel = &arrayFusion_binaryKernel<float, float, float, TestAddFunction>;
+			
+			return true;
+		}
+		
+		void update(Attribute *attribute){
+			updates++;
+			if(ArrayFusion::update(this, attribute)){
+				return;
+			}
+			
+			std::vector<float> result = in0->floatValues();
+			std::vector<float> values1 = in1->floatValues();
+			bool single = ((Numeric*)in1->value())->isArray() == false;
+			if(single && values1.empty()){
+				return;
+			}
+			else if(single == false){
+				result.resize(std::min(result.size(), values1.size()));
+			}
+			
+			for(int i = 0; i < result.size(); ++i){
+				result[i] += single ? values1[0] : values1[i];
+			}
+			
+			((Numeric*)out->outValue())->setFloatValues(result);
+		}
+		
+		TestNumericAttribute *in0;
+		TestNumericAttribute *in1;
+		TestNumericAttribute *out;
+		int updates;
+	};
+	
+	void testArrayFusion(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		TestArrayAddNode *n1 = new TestArrayAddNode("n1", root, Numeric::numericTypeFloatArray);
+		TestArrayAddNode *n2 = new TestArrayAddNode("n2", root, Numeric::numericTypeFloat);
+		TestArrayAddNode *n3 = new TestArrayAddNode("n3", root, Numeric::numericTypeFloatArray);
+		root->addNode(n1);
+		root->addNode(n2);
+		root->addNode(n3);
+		
+		NetworkManager::connect(n1->out, n2->in0);
+		NetworkManager::connect(n2->out, n3->in0);
+		
+		float values0[] = {1.0, 2.0, 3.0, 4.0};
+		float values1[] = {10.0, 20.0, 30.0, 40.0};
+		n1->in0->setFloatValues(std::vector<float>(values0, values0 + 4));
+		n1->in1->setFloatValues(std::vector<float>(values1, values1 + 4));
+		n2->in1->setFloatValues(std::vector<float>(1, 100.0));
+		n3->in1->setFloatValues(std::vector<float>(3, 1.0));
+		
+		// the last node computes the whole chain, the output gets as many elements as the shortest array
+		ArrayFusion::clearFusedChains();
+		std::vector<float> result = n3->out->floatValues();
+		assert(result.size() == 3 && result[0] == 112.0 && result[2] == 134.0);
+		assert(n1->updates == 0 && n2->updates == 0 && n3->updates == 1);
+		assert(ArrayFusion::fusedChains() == std::vector<std::string>(1, "root.n1 -> root.n2 -> root.n3"));
+		
+		n1->in0->setFloatValues(std::vector<float>(4, 0.0));
+		result = n3->out->floatValues();
+		assert(result.size() == 3 && result[0] == 111.0 && result[2] == 131.0);
+		assert(n3->updates == 2);
+		
+		// an output left dirty by the chain is computed when pulled directly
+		result = n2->out->floatValues();
+		assert(result.size() == 4 && result[3] == 140.0);
+		assert(n1->updates == 0 && n2->updates == 1);
+		
+		// an empty single value leaves its output untouched, as it does without fusion
+		n2->in1->setFloatValues(std::vector<float>());
+		result = n3->out->floatValues();
+		std::vector<float> unchanged = ((Numeric*)n2->out->outValue())->floatValues();
+		assert(result.size() == 3 && result[1] == unchanged[1] + 1.0);
+		n2->in1->setFloatValues(std::vector<float>(1, 100.0));
+		
+		// without fusion every node computes its own output
+		ArrayFusion::setEnabled(false);
+		int updates = n1->updates + n2->updates + n3->updates;
+		n1->in0->setFloatValues(std::vector<float>(values0, values0 + 4));
+		result = n3->out->floatValues();
+		assert(result.size() == 3 && result[0] == 112.0 && result[2] == 134.0);
+		assert(n1->updates + n2->updates + n3->updates == updates + 3);
+		ArrayFusion::setEnabled(true);
+		
+		// arrays spanning several blocks and parallel ranges
+		std::vector<float> ramp(1000);
+		for(int i = 0; i < ramp.size(); ++i){
+			ramp[i] = i;
+		}
+		
+		unsigned int grainSizes[] = {0, 100};
+		for(int i = 0; i < 2; ++i){
+			n3->setArrayGrainSize(grainSizes[i]);
+			n1->in0->setFloatValues(ramp);
+			n1->in1->setFloatValues(ramp);
+			n3->in1->setFloatValues(ramp);
+			
+			updates = n1->updates + n2->updates;
+			result = n3->out->floatValues();
+			assert(result.size() == 1000 && n1->updates + n2->updates == updates);
+			for(int j = 0; j < result.size(); ++j){
+				assert(result[j] == 3.0 * j + 100.0);
+			}
+		}
+		
+		root->removeReference();
+	}
+
+	// a source of values of a single numeric specialization, set them once it's connected
+	class TestNumericSourceNode: public Node{
+	public:
+		TestNumericSourceNode(const std::string &name, Node *parent, const std::string &specialization): Node(name, parent){
+			out = new NumericAttribute("out", this);
+			addOutputAttribute(out);
+			setAttributeAllowedSpecialization(out, specialization);
+		}
+		
+		NumericAttribute *out;
+	};
+	
+	template<class T>
+	T *createMathNode(const std::string &name, Node *parent, NumericAttribute *in0, NumericAttribute *in1){
+		T *node = new T(name, parent);
+		parent->addNode(node);
+		NetworkManager::connect(in0, node->inputAttributes()[0]);
+		NetworkManager::connect(in1, node->inputAttributes()[1]);
+		
+		return node;
+	}
+	
+	Numeric *mathNodeOutput(Node *node){
+		return ((NumericAttribute*)node->outputAttributes()[0])->value();
+	}
+	
+	void testMathNodesArrays(){
+		Node *root = new Node("root", 0);
+		root->addReference();
+		
+		TestNumericSourceNode *vectors0 = new TestNumericSourceNode("vectors0", root, "Vec3Array");
+		TestNumericSourceNode *vectors1 = new TestNumericSourceNode("vectors1", root, "Vec3Array");
+		TestNumericSourceNode *floats0 = new TestNumericSourceNode("floats0", root, "FloatArray");
+		TestNumericSourceNode *floats1 = new TestNumericSourceNode("floats1", root, "FloatArray");
+		TestNumericSourceNode *quats0 = new TestNumericSourceNode("quats0", root, "QuatArray");
+		TestNumericSourceNode *quats1 = new TestNumericSourceNode("quats1", root, "QuatArray");
+		TestNumericSourceNode *params = new TestNumericSourceNode("params", root, "FloatArray");
+		root->addNode(vectors0);
+		root->addNode(vectors1);
+		root->addNode(floats0);
+		root->addNode(floats1);
+		root->addNode(quats0);
+		root->addNode(quats1);
+		root->addNode(params);
+		
+		CrossProduct *cross = createMathNode<CrossProduct>("cross", root, vectors0->out, vectors1->out);
+		DotProduct *dot = createMathNode<DotProduct>("dot", root, vectors0->out, vectors1->out);
+		Pow *powNode = createMathNode<Pow>("pow", root, floats0->out, floats1->out);
+		Atan2 *atan2Node = createMathNode<Atan2>("atan2", root, floats0->out, floats1->out);
+		QuatMultiply *quatMultiply = createMathNode<QuatMultiply>("quatMultiply", root, quats0->out, quats1->out);
+		
+		vectors0->out->outValue()->setVec3Values(std::vector<Imath::V3f>(3, Imath::V3f(0.0, 1.0, 0.0)));
+		vectors0->out->valueChanged();
+		vectors1->out->outValue()->setVec3Values(std::vector<Imath::V3f>(1, Imath::V3f(1.0, 0.0, 0.0)));
+		vectors1->out->valueChanged();
+		
+		float bases[] = {2.0, 3.0, 4.0};
+		floats0->out->outValue()->setFloatValues(std::vector<float>(bases, bases + 3));
+		floats0->out->valueChanged();
+		floats1->out->outValue()->setFloatValues(std::vector<float>(1, 3.0));
+		floats1->out->valueChanged();
+		
+		Imath::Quatf rotation;
+		rotation.setAxisAngle(Imath::V3f(0.0, 0.0, 1.0), M_PI / 2.0);
+		quats0->out->outValue()->setQuatValues(std::vector<Imath::Quatf>(3, Imath::Quatf(0.0, 1.0, 0.0, 0.0)));
+		quats0->out->valueChanged();
+		quats1->out->outValue()->setQuatValues(std::vector<Imath::Quatf>(1, rotation));
+		quats1->out->valueChanged();
+		
+		params->out->outValue()->setFloatValues(std::vector<float>(1, 0.5));
+		params->out->valueChanged();
+		
+		// binary nodes output as many elements as their shortest input and never read past it
+		assert(mathNodeOutput(cross)->size() == 1 && mathNodeOutput(cross)->vec3ValueAt(0) == Imath::V3f(0.0, 0.0, -1.0));
+		assert(mathNodeOutput(dot)->size() == 1 && mathNodeOutput(dot)->floatValueAt(0) == 0.0);
+		assert(mathNodeOutput(powNode)->size() == 1 && mathNodeOutput(powNode)->floatValueAt(0) == 8.0);
+		assert(mathNodeOutput(atan2Node)->size() == 1 && mathNodeOutput(atan2Node)->floatValueAt(0) == std::atan2(2.0f, 3.0f));
+		assert(mathNodeOutput(quatMultiply)->size() == 1);
+		
+		// sliced nodes write the slice being updated
+		TestSlicerNode *slicer = new TestSlicerNode("slicer", root);
+		root->addNode(slicer);
+		slicer->sliceCount = 2;
+		
+		QuatMultiply *slicedMultiply = createMathNode<QuatMultiply>("slicedMultiply", slicer, quats0->out, quats1->out);
+		Slerp *slerp = createMathNode<Slerp>("slerp", slicer, quats0->out, quats1->out);
+		NetworkManager::connect(params->out, slerp->inputAttributes()[2]);
+		
+		Imath::Quatf rotated = rotation * Imath::Quatf(0.0, 1.0, 0.0, 0.0) * (~rotation);
+		Imath::Quatf interpolated = Imath::slerp(Imath::Quatf(0.0, 1.0, 0.0, 0.0), rotation, 0.5f);
+		
+		Numeric *multiplied = mathNodeOutput(slicedMultiply);
+		Numeric *slerped = mathNodeOutput(slerp);
+		assert(multiplied->slices() == 2 && slerped->slices() == 2);
+		for(int slice = 0; slice < 2; ++slice){
+			Imath::Quatf multipliedValue = multiplied->quatValueAtSlice(slice, 0);
+			Imath::Quatf slerpedValue = slerped->quatValueAtSlice(slice, 0);
+			assert(multiplied->sizeSlice(slice) == 1 && multipliedValue.r == rotated.r && multipliedValue.v == rotated.v);
+			assert(slerped->sizeSlice(slice) == 1 && slerpedValue.r == interpolated.r && slerpedValue.v == interpolated.v);
+		}
+		
+		root->removeReference();
+	}
+
 	#define RUNTEST(x)	std::cout << "* running " << #x << std::endl; \
 						x(); \
 						std::cout << "* " << #x << " done!" << std::endl; \
@@ -52,6 +1913,37 @@ namespace coralTests{
 		Object::_removeReferenceCallback = 0;
 		
 		std::cout << "* running c++ tests..." << std::endl;
+		
+		RUNTEST(testEditTransaction);
+		RUNTEST(testCleanSchedule);
+		RUNTEST(testEvaluationContext);
+		RUNTEST(testEvaluationFailure);
+		#ifdef CORAL_PARALLEL_TBB
+			RUNTEST(testConcurrentPulls);
+			RUNTEST(testConcurrentWalks);
+			RUNTEST(testConcurrentEdits);
+		#endif
+		RUNTEST(testOutputCache);
+		RUNTEST(testOutputCacheInputs);
+		RUNTEST(testOutputCacheSlices);
+		RUNTEST(testEarlyCutoff);
+		RUNTEST(testTracer);
+		RUNTEST(testNetworkFile);
+		RUNTEST(testFullNameIndex);
+		RUNTEST(testSlotMapRegistry);
+		RUNTEST(testCycleDetection);
+		RUNTEST(testDirtyPropagation);
+		RUNTEST(testEvaluationState);
+		RUNTEST(testConcurrentStates);
+		RUNTEST(testSpecializationSolver);
+		RUNTEST(testFanOutMembership);
+		RUNTEST(testBulkDeletion);
+		RUNTEST(testNumericSlices);
+		RUNTEST(testCopyOnWrite);
+		RUNTEST(testParallelArrays);
+		RUNTEST(testSharedValues);
+		RUNTEST(testArrayFusion);
+		RUNTEST(testMathNodesArrays);
 
 		std::cout << "* c++ tests done!" << std::endl;
 	}
@@ -73,7 +73,8 @@ public:
 	}
 	
 	/*
-	 You have to call this method in the onDirtied() method of the class inheriting from this.
+	 You have to call this method in the onDirtied() method of the class inheriting from this,
+ the constructor of that class must also call setNotifyOnDirty(true) for onDirtied() to be invoked.
 	*/
 	void dirtyMayaAttribute();
 	
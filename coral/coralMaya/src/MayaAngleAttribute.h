@@ -47,6 +47,7 @@ class CORAL_MAYA_EXPORT MayaAngleAttribute: public coral::NumericAttribute, publ
 public:
 	MayaAngleAttribute(const std::string &name, coral::Node *parent): coral::NumericAttribute(name, parent),CoralMayaAttribute(){
 		setClassName("MayaAngleAttribute");
+		setNotifyOnDirty(true);
 		std::vector<std::string> specialization;
 		specialization.push_back("Float");
 		setAllowedSpecialization(specialization);
@@ -72,6 +73,7 @@ class CORAL_MAYA_EXPORT MayaAngle3ArrayAttribute: public coral::NumericAttribute
 public:
 	MayaAngle3ArrayAttribute(const std::string &name, coral::Node *parent): coral::NumericAttribute(name, parent),CoralMayaAttribute(){
 		setClassName("MayaAngle3ArrayAttribute");
+		setNotifyOnDirty(true);
 		std::vector<std::string> specialization;
 		specialization.push_back("Vec3Array");
 		setAllowedSpecialization(specialization);
@@ -83,7 +85,7 @@ public:
 	
 	virtual void transferValueToMaya(MPlug &plug, MDataBlock &data){
 		MArrayDataHandle arrayHandle = data.outputArrayValue(plug);
-		const std::vector<Imath::V3f> &values = value()->vec3Values();
+		coral::NumericSpan<const Imath::V3f> values = value()->valuesSpanSlice<Imath::V3f>(0);
 		int minCount = arrayHandle.elementCount();
 		if(values.size() < minCount){
 			minCount = values.size();
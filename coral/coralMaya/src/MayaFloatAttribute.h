@@ -46,6 +46,7 @@ class CORAL_MAYA_EXPORT MayaFloatAttribute: public coral::NumericAttribute, publ
 public:
 	MayaFloatAttribute(const std::string &name, coral::Node *parent): coral::NumericAttribute(name, parent),CoralMayaAttribute(){
 		setClassName("MayaFloatAttribute");
+		setNotifyOnDirty(true);
 		std::vector<std::string> specialization;
 		specialization.push_back("Float");
 		setAllowedSpecialization(specialization);
@@ -71,6 +72,7 @@ class CORAL_MAYA_EXPORT MayaFloat3ArrayAttribute: public coral::NumericAttribute
 public:
 	MayaFloat3ArrayAttribute(const std::string &name, coral::Node *parent): coral::NumericAttribute(name, parent),CoralMayaAttribute(){
 		setClassName("MayaFloat3ArrayAttribute");
+		setNotifyOnDirty(true);
 		std::vector<std::string> specialization;
 		specialization.push_back("Vec3Array");
 		setAllowedSpecialization(specialization);
@@ -82,7 +84,7 @@ public:
 	
 	virtual void transferValueToMaya(MPlug &plug, MDataBlock &data){
 		MArrayDataHandle arrayHandle = data.outputArrayValue(plug);
-		const std::vector<Imath::V3f> &values = value()->vec3Values();
+		coral::NumericSpan<const Imath::V3f> values = value()->valuesSpanSlice<Imath::V3f>(0);
 		int minCount = arrayHandle.elementCount();
 		if(values.size() < minCount){
 			minCount = values.size();
@@ -52,6 +52,7 @@ public:
 		coral::GeoAttribute(name, parent),
 		CoralMayaAttribute(){
 		setClassName("MayaGeoAttribute");
+		setNotifyOnDirty(true);
 	}
 	
 	virtual void onDirtied();
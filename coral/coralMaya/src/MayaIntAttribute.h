@@ -47,6 +47,7 @@ public:
 		coral::NumericAttribute(name, parent),
 		CoralMayaAttribute(){
 		setClassName("MayaIntAttribute");
+		setNotifyOnDirty(true);
 	}
 	
 	virtual void onDirtied(){
@@ -61,7 +61,7 @@ void MayaMatrixAttribute::transferValueFromMaya(MPlug &plug, MDataBlock &data){
 
 void MayaMatrixArrayAttribute::transferValueToMaya(MPlug &plug, MDataBlock &data){
 	MArrayDataHandle arrayHandle = data.outputArrayValue(plug);
-	const std::vector<Imath::M44f> &values = value()->matrix44Values();
+	coral::NumericSpan<const Imath::M44f> values = value()->valuesSpanSlice<Imath::M44f>(0);
 	int minCount = arrayHandle.elementCount();
 	if(values.size() < minCount){
 		minCount = values.size();
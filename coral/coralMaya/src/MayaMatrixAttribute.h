@@ -47,6 +47,7 @@ class CORAL_MAYA_EXPORT MayaMatrixAttribute: public coral::NumericAttribute, pub
 public:
 	MayaMatrixAttribute(const std::string &name, coral::Node *parent): coral::NumericAttribute(name, parent),CoralMayaAttribute(){
 		setClassName("MayaMatrixAttribute");
+		setNotifyOnDirty(true);
 		std::vector<std::string> specialization;
 		specialization.push_back("Matrix44");
 		setAllowedSpecialization(specialization);
@@ -64,6 +65,7 @@ class CORAL_MAYA_EXPORT MayaMatrixArrayAttribute: public coral::NumericAttribute
 public:
 	MayaMatrixArrayAttribute(const std::string &name, coral::Node *parent): coral::NumericAttribute(name, parent),CoralMayaAttribute(){
 		setClassName("MayaMatrixArrayAttribute");
+		setNotifyOnDirty(true);
 		std::vector<std::string> specialization;
 		specialization.push_back("Matrix44Array");
 		setAllowedSpecialization(specialization);
@@ -62,6 +62,7 @@ class NodeEditor(QtGui.QWidget):
     _initializedNewNetworkObserver = Observer()
     _createdNodeObserver = Observer()
     _deletingNodeObserver = Observer()
+    _deletingNodesObserver = Observer()
     _connectedAttributesObserver = Observer()
     _createdAttributeObserver = Observer()
     _deletingAttributeObserver = Observer()
@@ -225,6 +226,7 @@ class NodeEditor(QtGui.QWidget):
         coralApp.addInitializedNewNetworkObserver(NodeEditor._initializedNewNetworkObserver, NodeEditor._coralInitializedNewNetwork)
         coralApp.addCreatedNodeObserver(NodeEditor._createdNodeObserver, NodeEditor._coralCreatedNodeCallback)
         coralApp.addDeletingNodeObserver(NodeEditor._deletingNodeObserver, NodeEditor._coralDeletingNodeCallback)
+        coralApp.addDeletingNodesObserver(NodeEditor._deletingNodesObserver, NodeEditor._coralDeletingNodesCallback)
         coralApp.addConnectedAttributesObserver(NodeEditor._connectedAttributesObserver, NodeEditor._coralConnectedAttributesCallback)
         coralApp.addCreatedAttributeObserver(NodeEditor._createdAttributeObserver, NodeEditor._coralCreatedAttributeCallback)
         coralApp.addDeletingAttributeObserver(NodeEditor._deletingAttributeObserver, NodeEditor._coralDeletingAttributeCallback)
@@ -389,6 +391,14 @@ class NodeEditor(QtGui.QWidget):
         nodeUi = NodeEditor.findNodeUi(nodeId)
         if nodeUi:
             nodeUi.deleteIt()
+    
+    @staticmethod
+    def _coralDeletingNodesCallback():
+        # nested nodeUis go away with their parent, the ones already gone are simply not found
+        for nodeId in NodeEditor._deletingNodesObserver.data("nodeIds"):
+            nodeUi = NodeEditor.findNodeUi(nodeId)
+            if nodeUi:
+                nodeUi.deleteIt()
         
     @staticmethod
     def _coralCreatedNodeCallback():
@@ -111,12 +111,14 @@ class Paste(Command):
         # execute save script
         coralApp.CoralAppData.lastCreatedNodes = []
         coralApp.CoralAppData.appendToLastCreatedNodes = True
-        coralApp.CoralAppData.loadingNetwork = True
+        coralApp._setLoadingNetwork(True)
         coralApp.setUndoLimit(0)
-        exec(script)
-        coralApp.setUndoLimit(100)
-        coralApp.CoralAppData.loadingNetwork = False
-        coralApp.CoralAppData.appendToLastCreatedNodes = False
+        try:
+            exec(script)
+        finally:
+            coralApp.setUndoLimit(100)
+            coralApp._setLoadingNetwork(False)
+            coralApp.CoralAppData.appendToLastCreatedNodes = False
         
         # return only the top nodes created
         outNodes = []
@@ -140,7 +140,7 @@ void DrawGeoInstance::draw(){
 	GeoInstanceArray *geoInstance = _geoInstance->value();
 	const std::vector<Geo*> &sourceGeos = geoInstance->sourceGeos();
 	const std::vector<std::vector<Imath::M44f> > &selectedLocations = geoInstance->selectedLocations();
-	const std::vector<Imath::Color4f> &colors = _colors->value()->col4Values();
+	NumericSpan<const Imath::Color4f> colors = _colors->value()->valuesSpanSlice<Imath::Color4f>(0);
 
 	int sourceGeosSize = sourceGeos.size();
 	int colorsSize = colors.size();
@@ -151,11 +151,11 @@ void DrawLineNode::initShader(){
 
 void DrawLineNode::updatePointValues(unsigned int slice){
 	Numeric *vec3Numeric = _points->value();
-	const std::vector<Imath::V3f> &vec3Values = vec3Numeric->vec3ValuesSlice(slice);
+	NumericSpan<const Imath::V3f> vec3Values = vec3Numeric->valuesSpanSlice<Imath::V3f>(slice);
 
 	// vertex buffer
 	glBindBuffer(GL_ARRAY_BUFFER, _pointBuffer);
-	glBufferData(GL_ARRAY_BUFFER, 3*sizeof(GLfloat)*vec3Values.size(), (GLvoid*)&vec3Values[0].x, GL_STATIC_DRAW);
+	glBufferData(GL_ARRAY_BUFFER, 3*sizeof(GLfloat)*vec3Values.size(), (GLvoid*)vec3Values.data(), GL_STATIC_DRAW);
 	
 	// clean OpenGL states
 	glBindBuffer(GL_ARRAY_BUFFER, 0);
@@ -163,18 +163,18 @@ void DrawLineNode::updatePointValues(unsigned int slice){
 
 void DrawLineNode::updateColorValues(unsigned int slice){
 	Numeric *col4Numeric = _colors->value();
-	const std::vector<Imath::Color4f> &col4Values = col4Numeric->col4ValuesSlice(slice);
+	NumericSpan<const Imath::Color4f> col4Values = col4Numeric->valuesSpanSlice<Imath::Color4f>(slice);
 
 	// color buffer
 	if(col4Numeric->isArray() && col4Values.size() > 0){
 		// avoid empty color (and maybe crashs)
 		Numeric *vec3Numeric = _points->value();
-		const std::vector<Imath::V3f> &vec3Values = vec3Numeric->vec3ValuesSlice(slice);
+		NumericSpan<const Imath::V3f> vec3Values = vec3Numeric->valuesSpanSlice<Imath::V3f>(slice);
 		int pointCount = (int)vec3Values.size();
 		int colorCount = (int)col4Values.size();
 
 		glBindBuffer(GL_ARRAY_BUFFER, _colorBuffer);
-		glBufferData(GL_ARRAY_BUFFER, 4*sizeof(GLfloat)*pointCount, (GLvoid*)&col4Values[0].r, GL_STATIC_DRAW);
+		glBufferData(GL_ARRAY_BUFFER, 4*sizeof(GLfloat)*pointCount, (GLvoid*)col4Values.data(), GL_STATIC_DRAW);
 
 		if(colorCount < pointCount){
 			int emptyColCount = pointCount - colorCount;	// get the number of empty color to create in the buffer to match the number of vertex
@@ -200,12 +200,10 @@ void DrawLineNode::drawLines(unsigned int slice){
 	Numeric *thicknessNumeric = _thickness->value();
 	GLfloat lineWith = 1.0;
 	if(thicknessNumeric->type() == Numeric::numericTypeInt){
-		const std::vector<int> &intValues = thicknessNumeric->intValuesSlice(slice);
-		lineWith = (GLfloat) intValues[0];
+		lineWith = (GLfloat) thicknessNumeric->intValueAtSlice(slice, 0);
 	}
 	else if (thicknessNumeric->type() == Numeric::numericTypeFloat){
-		const std::vector<float> &floatValues = thicknessNumeric->floatValuesSlice(slice);
-		lineWith = (GLfloat) floatValues[0];
+		lineWith = (GLfloat) thicknessNumeric->floatValueAtSlice(slice, 0);
 	}
 
 	Numeric *colors = _colors->value();
@@ -227,7 +225,7 @@ void DrawLineNode::drawLines(unsigned int slice){
 
 	// do not set pointer if it use a single value. The value is already send via VBO
 	if(useSingleColor){
-		const Imath::Color4f &color = colors->col4ValuesSlice(slice)[0];
+		Imath::Color4f color = colors->col4ValueAtSlice(slice, 0);
 		GLint locSingleColor = glGetUniformLocation(_shaderProgram, "un_singleColor");
 		glUniform4f(locSingleColor, color.r, color.g, color.b, color.a);
 	}
@@ -240,7 +238,7 @@ void DrawLineNode::drawLines(unsigned int slice){
 	glEnableClientState(GL_VERTEX_ARRAY);
 
 	// render
-	const std::vector<Imath::V3f> &points = _points->value()->vec3ValuesSlice(slice);
+	NumericSpan<const Imath::V3f> points = _points->value()->valuesSpanSlice<Imath::V3f>(slice);
 	glDrawArrays(GL_LINE_STRIP, 0, points.size());
 	
 	// clean OpenGL statement
@@ -255,7 +253,7 @@ void DrawLineNode::drawLines(unsigned int slice){
 
 void DrawLineNode::drawSlice(unsigned int slice){
 	Numeric *points = _points->value();
-	const std::vector<Imath::V3f> &vec3Values = points->vec3ValuesSlice(slice);
+	NumericSpan<const Imath::V3f> vec3Values = points->valuesSpanSlice<Imath::V3f>(slice);
 
 	if(vec3Values.size() == 0)
 		return;
@@ -141,9 +141,9 @@ void DrawMatrixNode::initShader(){
 	_matrixAttrLoc = glGetAttribLocation(_shaderProgram, "gizmoMatrixAttr");
 }
 
-void DrawMatrixNode::updateMat44Values(unsigned int slice, const std::vector<Imath::M44f> &matrix){
+void DrawMatrixNode::updateMat44Values(unsigned int slice, NumericSpan<const Imath::M44f> matrix){
 	glBindBuffer(GL_ARRAY_BUFFER, _matrixBuffer);
-	glBufferData(GL_ARRAY_BUFFER, 16*sizeof(GLfloat)*matrix.size(), (GLvoid*)&matrix[0].x, GL_STATIC_DRAW);
+	glBufferData(GL_ARRAY_BUFFER, 16*sizeof(GLfloat)*matrix.size(), (GLvoid*)matrix.data(), GL_STATIC_DRAW);
 }
 
 void DrawMatrixNode::updateMatrixGizmo(unsigned int slice){
@@ -161,7 +161,7 @@ void DrawMatrixNode::updateMatrixGizmo(unsigned int slice){
 	glBufferData(GL_ARRAY_BUFFER, sizeof(gizmoArray), (GLvoid*)&gizmoArray, GL_STATIC_DRAW);
 }
 
-void DrawMatrixNode::drawMatrix(unsigned int slice, const std::vector<Imath::M44f> &matrix){
+void DrawMatrixNode::drawMatrix(unsigned int slice, NumericSpan<const Imath::M44f> matrix){
 	glLineWidth(2.0);
 
 	glUseProgram(_shaderProgram);
@@ -217,7 +217,7 @@ void DrawMatrixNode::drawMatrix(unsigned int slice, const std::vector<Imath::M44
 }
 
 void DrawMatrixNode::drawSlice(unsigned int slice){
-	const std::vector<Imath::M44f> &matrix = _matrix->value()->matrix44ValuesSlice(slice);
+	NumericSpan<const Imath::M44f> matrix = _matrix->value()->valuesSpanSlice<Imath::M44f>(slice);
 
 	if(matrix.size() == 0){
 		return;
@@ -53,9 +53,9 @@ private:
 	coral::NumericAttribute *_matrix;
 	coral::NumericAttribute *_size;
 
-	void updateMat44Values(unsigned int slice, const std::vector<Imath::M44f> &matrix);
+	void updateMat44Values(unsigned int slice, coral::NumericSpan<const Imath::M44f> matrix);
 	void updateMatrixGizmo(unsigned int slice);
-	void drawMatrix(unsigned int slice, const std::vector<Imath::M44f> &matrix);
+	void drawMatrix(unsigned int slice, coral::NumericSpan<const Imath::M44f> matrix);
 
 	// OpenGL
 	GLuint _gizmoBuffer;	// the gizmo geometry + color
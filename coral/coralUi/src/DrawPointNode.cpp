@@ -161,19 +161,19 @@ void DrawPointNode::initShader(){
 	_colorIndexAttr = glGetAttribLocation(_shaderProgram, "in_Color");
 }
 
-void DrawPointNode::updatePointValues(unsigned int slice, const std::vector<Imath::V3f> &points){
+void DrawPointNode::updatePointValues(unsigned int slice, NumericSpan<const Imath::V3f> points){
 	glBindBuffer(GL_ARRAY_BUFFER, _pointBuffer);
-	glBufferData(GL_ARRAY_BUFFER, 3*sizeof(GLfloat)*points.size(), (GLvoid*)&points[0].x, GL_STATIC_DRAW);
+	glBufferData(GL_ARRAY_BUFFER, 3*sizeof(GLfloat)*points.size(), (GLvoid*)points.data(), GL_STATIC_DRAW);
 	
 	glBindBuffer(GL_ARRAY_BUFFER, 0);
 }
 
-void DrawPointNode::updateSizeValues(unsigned int slice, const std::vector<Imath::V3f> &points, const std::vector<float> &sizes){
+void DrawPointNode::updateSizeValues(unsigned int slice, NumericSpan<const Imath::V3f> points, NumericSpan<const float> sizes){
 	int sizeCount = sizes.size();
 	int pointCount = points.size();
 
 	glBindBuffer(GL_ARRAY_BUFFER, _sizeBuffer);
-	glBufferData(GL_ARRAY_BUFFER, sizeof(GLfloat)*pointCount, (GLvoid*)&sizes[0], GL_STATIC_DRAW);
+	glBufferData(GL_ARRAY_BUFFER, sizeof(GLfloat)*pointCount, (GLvoid*)sizes.data(), GL_STATIC_DRAW);
 
 	if(sizeCount < pointCount){
 		GLfloat defaultSize = 3.0;
@@ -196,12 +196,12 @@ void DrawPointNode::updateSizeValues(unsigned int slice, const std::vector<Imath
 	glBindBuffer(GL_ARRAY_BUFFER, 0);
 }
 
-void DrawPointNode::updateColorValues(unsigned int slice, const std::vector<Imath::V3f> &points, const std::vector<Imath::Color4f> &colors){
+void DrawPointNode::updateColorValues(unsigned int slice, NumericSpan<const Imath::V3f> points, NumericSpan<const Imath::Color4f> colors){
 	int colorCount = colors.size();
 	int pointCount = points.size();
 
 	glBindBuffer(GL_ARRAY_BUFFER, _colorBuffer);
-	glBufferData(GL_ARRAY_BUFFER, 4*sizeof(GLfloat)*pointCount, (GLvoid*)&colors[0].r, GL_STATIC_DRAW);
+	glBufferData(GL_ARRAY_BUFFER, 4*sizeof(GLfloat)*pointCount, (GLvoid*)colors.data(), GL_STATIC_DRAW);
 	
 	if(colorCount < pointCount){
 		Imath::Color4f defaultColor(1.0, 1.0, 1.0, 1.0);
@@ -224,7 +224,7 @@ void DrawPointNode::updateColorValues(unsigned int slice, const std::vector<Imat
 	glBindBuffer(GL_ARRAY_BUFFER, 0);
 }
 
-void DrawPointNode::drawPoints(unsigned int slice, const std::vector<Imath::V3f> &points){
+void DrawPointNode::drawPoints(unsigned int slice, NumericSpan<const Imath::V3f> points){
 	int pointCount = points.size();
 
 	glUseProgram(_shaderProgram);
@@ -256,13 +256,13 @@ void DrawPointNode::drawPoints(unsigned int slice, const std::vector<Imath::V3f>
 }
 
 void DrawPointNode::drawSlice(unsigned int slice){
-	const std::vector<Imath::V3f> &points = _points->value()->vec3ValuesSlice(slice);
+	NumericSpan<const Imath::V3f> points = _points->value()->valuesSpanSlice<Imath::V3f>(slice);
 	unsigned int pointsCount = points.size();
 	if(pointsCount == 0)
 		return;
 
-	const std::vector<Imath::Color4f> &colors = _colors->value()->col4ValuesSlice(slice);
-	const std::vector<float> &sizes = _sizes->value()->floatValuesSlice(slice);
+	NumericSpan<const Imath::Color4f> colors = _colors->value()->valuesSpanSlice<Imath::Color4f>(slice);
+	NumericSpan<const float> sizes = _sizes->value()->valuesSpanSlice<float>(slice);
 
 	updatePointValues(slice, points);
 	updateSizeValues(slice, points, sizes);
@@ -54,10 +54,10 @@ private:
 	coral::NumericAttribute *_sizes;
 	coral::NumericAttribute *_colors;
 
-	void updatePointValues(unsigned int slice, const std::vector<Imath::V3f> &points);
-	void updateSizeValues(unsigned int slice, const std::vector<Imath::V3f> &points, const std::vector<float> &sizes);
-	void updateColorValues(unsigned int slice, const std::vector<Imath::V3f> &points, const std::vector<Imath::Color4f> &colors);
-	void drawPoints(unsigned int slice, const std::vector<Imath::V3f> &points);
+	void updatePointValues(unsigned int slice, coral::NumericSpan<const Imath::V3f> points);
+	void updateSizeValues(unsigned int slice, coral::NumericSpan<const Imath::V3f> points, coral::NumericSpan<const float> sizes);
+	void updateColorValues(unsigned int slice, coral::NumericSpan<const Imath::V3f> points, coral::NumericSpan<const Imath::Color4f> colors);
+	void drawPoints(unsigned int slice, coral::NumericSpan<const Imath::V3f> points);
 
 	// OpenGL
 	GLuint _pointBuffer;	// buffer of vertices: {0.35, 0.76, 0.48, 0.56, 0.37, etc...}
@@ -231,12 +231,12 @@ void GeoDrawNode::updateGeoVBO(){
 
 void GeoDrawNode::updateColorVBO(){
 	Numeric *col4Numeric = _colors->value();
-	const std::vector<Imath::Color4f> &col4Values = col4Numeric->col4Values();
+	NumericSpan<const Imath::Color4f> col4Values = col4Numeric->valuesSpanSlice<Imath::Color4f>(0);
 
 	/////////////////////////
 	// color buffer
 	/////////////////////////
-	if((col4Numeric->isArray()) && (col4Values.empty() == false)){
+	if((col4Numeric->isArray()) && (col4Values.size() > 0)){
 
 		// avoid empty color (and maybe crashs)
 		Geo *geo = _geo->value();
@@ -255,10 +255,10 @@ void GeoDrawNode::updateColorVBO(){
 		glBindBuffer(GL_ARRAY_BUFFER, _colBuffer);
 		if(newColAlloc){
 			// we need to alloc the whole number of point, that's why we use pointCount here.
-			glBufferData(GL_ARRAY_BUFFER, 4*sizeof(GLfloat)*pointCount, (GLvoid*)&col4Values[0].r, GL_STATIC_DRAW);
+			glBufferData(GL_ARRAY_BUFFER, 4*sizeof(GLfloat)*pointCount, (GLvoid*)col4Values.data(), GL_STATIC_DRAW);
 		}
 		else {
-			glBufferSubData(GL_ARRAY_BUFFER, 0, 4*sizeof(GLfloat)*_colCount, &col4Values[0].r);
+			glBufferSubData(GL_ARRAY_BUFFER, 0, 4*sizeof(GLfloat)*_colCount, col4Values.data());
 		}
 
 		if(_colCount < pointCount){
@@ -335,7 +335,7 @@ void GeoDrawNode::drawSurface(Geo *geo, bool smooth){
 	}
 
 	Numeric *col4Numeric = _colors->value();
-	const std::vector<Imath::Color4f> &col4Values = col4Numeric->col4Values();
+	NumericSpan<const Imath::Color4f> col4Values = col4Numeric->valuesSpanSlice<Imath::Color4f>(0);
 
 	bool useColVbo = false;
 	if(col4Numeric->type() == Numeric::numericTypeCol4Array){
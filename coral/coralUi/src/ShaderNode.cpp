@@ -19,7 +19,7 @@ namespace {
 	}
 
 	template <class T>
-	void fillIfEmptyValuesInBuffer(const std::vector<T> &values, int pointsCount, const T &filler){
+	void fillIfEmptyValuesInBuffer(NumericSpan<const T> values, int pointsCount, const T &filler){
 		int valuesCount = values.size();
 		if(valuesCount < pointsCount){
 			int emptyCount = pointsCount - valuesCount;
@@ -46,10 +46,10 @@ namespace {
 		}
 
 		void update(int pointsCount){
-			const std::vector<float> &values = _attribute->value()->floatValues();
+			NumericSpan<const float> values = _attribute->value()->valuesSpanSlice<float>(0);
 
 			glBindBuffer(GL_ARRAY_BUFFER, _vbo);
-			glBufferData(GL_ARRAY_BUFFER, sizeof(GLfloat)*pointsCount, (GLvoid*)&values[0], GL_STATIC_DRAW);
+			glBufferData(GL_ARRAY_BUFFER, sizeof(GLfloat)*pointsCount, (GLvoid*)values.data(), GL_STATIC_DRAW);
 
 			float filler = 0.0;
 			fillIfEmptyValuesInBuffer<float>(values, pointsCount, filler);
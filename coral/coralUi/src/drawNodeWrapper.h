@@ -45,6 +45,8 @@ public:
 
 	void draw(){
 		// return boost::python::call<void>(get_override("draw").ptr());
+		pythonWrapperUtils::GILEnsure ensureGIL;
+		
 		boost::python::object self = PythonDataCollector::findPyObject(id());
 
 		return boost::python::call_method<void>(self.ptr(), "draw");
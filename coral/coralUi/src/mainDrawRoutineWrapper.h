@@ -38,6 +38,8 @@
 using namespace coralUi;
 
 void mainDrawRoutine_viewportRefreshCallback(){
+	coral::pythonWrapperUtils::GILEnsure ensureGIL;
+	
 	if(coral::PythonDataCollector::hasCallback("mainDrawRoutine_viewportRefresh")){
 		coral::PythonDataCollector::findCallback("mainDrawRoutine_viewportRefresh")();
 	}
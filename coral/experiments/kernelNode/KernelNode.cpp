@@ -110,19 +110,19 @@ namespace {
 	void createInputIntBuffer(Numeric *value, cl::Buffer &buffer, int size, cl::Context &context, cl::CommandQueue &queue, cl::Event &event){
 		size_t bufferSize = sizeof(int) * size;
 		buffer = cl::Buffer(context, CL_MEM_READ_WRITE, bufferSize, NULL);
-		queue.enqueueWriteBuffer(buffer, CL_TRUE, 0, bufferSize, &value->intValues()[0], NULL, &event);
+		queue.enqueueWriteBuffer(buffer, CL_TRUE, 0, bufferSize, value->valuesSpanSlice<int>(0).data(), NULL, &event);
 	}
 
 	void createInputFloatBuffer(Numeric *value, cl::Buffer &buffer, int size, cl::Context &context, cl::CommandQueue &queue, cl::Event &event){
 		size_t bufferSize = sizeof(float) * size;
 		buffer = cl::Buffer(context, CL_MEM_READ_WRITE, bufferSize, NULL);
-		queue.enqueueWriteBuffer(buffer, CL_TRUE, 0, bufferSize, &value->floatValues()[0], NULL, &event);
+		queue.enqueueWriteBuffer(buffer, CL_TRUE, 0, bufferSize, value->valuesSpanSlice<float>(0).data(), NULL, &event);
 	}
 
 	void createInputVec3Buffer(Numeric *value, cl::Buffer &buffer, int size, cl::Context &context, cl::CommandQueue &queue, cl::Event &event){
 		size_t bufferSize = sizeof(CLVec3) * size;
 		buffer = cl::Buffer(context, CL_MEM_READ_WRITE, bufferSize, NULL);
-		queue.enqueueWriteBuffer(buffer, CL_TRUE, 0, bufferSize, &value->vec3Values()[0], NULL, &event);
+		queue.enqueueWriteBuffer(buffer, CL_TRUE, 0, bufferSize, value->valuesSpanSlice<Imath::V3f>(0).data(), NULL, &event);
 	}
 
 	void createOutputIntBuffer(Numeric *value, cl::Buffer &buffer, int size, cl::Context &context, cl::CommandQueue &queue, cl::Event &event){